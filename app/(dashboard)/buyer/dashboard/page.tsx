@@ -1,6 +1,6 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 import { redirect } from 'next/navigation';
@@ -48,7 +48,7 @@ async function getDashboardData(userId: string) {
 
         // Order stats by status (using CASE for D1 compatibility)
         console.log('[Dashboard] Fetching order stats...');
-        const orderStatsResult = await sql`
+        const orderStatsResult = await sqlAt('q62f4d2e17c83')`
             SELECT
                 COALESCE(SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END), 0) as not_started,
                 COALESCE(SUM(CASE WHEN status IN ('accepted', 'writing') THEN 1 ELSE 0 END), 0) as in_progress,
@@ -65,7 +65,7 @@ async function getDashboardData(userId: string) {
 
         // Recent orders
         console.log('[Dashboard] Fetching recent orders...');
-        const recentOrdersResult = await sql`
+        const recentOrdersResult = await sqlAt('q5245ebebacb2')`
             SELECT
                 o.id, o.order_number, o.order_type, o.status, o.total_amount, o.created_at,
                 w.domain as website_domain,
@@ -81,7 +81,7 @@ async function getDashboardData(userId: string) {
 
         // Balance and user info
         console.log('[Dashboard] Fetching balance...');
-        const balanceResult = await sql`
+        const balanceResult = await sqlAt('q81224b457375')`
             SELECT
                 buyer_balance as main,
                 created_at
@@ -94,7 +94,7 @@ async function getDashboardData(userId: string) {
         let projectsCount = 0;
         try {
             console.log('[Dashboard] Fetching projects count...');
-            const projectsResult = await sql`
+            const projectsResult = await sqlAt('q01bc676ec46b')`
                 SELECT COUNT(*) as count FROM projects WHERE user_id = ${userId} AND is_active = TRUE
             `;
             projectsCount = parseInt(projectsResult.rows[0]?.count as string) || 0;
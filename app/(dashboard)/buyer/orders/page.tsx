@@ -1,22 +1,10 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
-import { cookies } from 'next/headers';
+import { sqlAt } from '@/lib/db';
 import Link from 'next/link';
 import { Button } from '@/components/ui/button';
 import BuyerOrdersClient from '@/components/dashboard/buyer-orders-client';
-
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > NOW()
-  `;
-    return result.rows[0] || null;
-}
+import { getSession } from '@/lib/auth';
 
 interface Order {
     id: string;
@@ -41,7 +29,7 @@ interface Order {
 
 async function getBuyerOrders(userId: string) {
     try {
-        const result = await sql`
+        const result = await sqlAt('q84f5f0b1e76b')`
             SELECT 
                 o.id, o.order_type, o.status, o.total_amount, o.created_at, 
                 o.deadline_at, o.completed_at, o.article_url, o.anchor_text, o.target_url,
@@ -1,24 +1,12 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
-import { cookies } from 'next/headers';
+import { sqlAt } from '@/lib/db';
 import Link from 'next/link';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Globe, Heart, ShoppingCart, ArrowRight } from 'lucide-react';
 import { WebsiteCard } from '@/components/marketplace/website-card';
-
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > NOW()
-  `;
-    return result.rows[0] || null;
-}
+import { getSession } from '@/lib/auth';
 
 interface SavedWebsite {
     id: string;
@@ -33,7 +21,7 @@ interface SavedWebsite {
 
 async function getSavedWebsites(userId: string): Promise<SavedWebsite[]> {
     try {
-        const result = await sql`
+        const result = await sqlAt('q3dd9265f8f94')`
       SELECT w.*, sw.created_at as saved_at
       FROM saved_websites sw
       JOIN websites w ON sw.website_id = w.id
@@ -1,6 +1,6 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { validateRequest } from '@/lib/auth';
 import { redirect } from 'next/navigation';
 import Link from 'next/link';
@@ -38,7 +38,7 @@ const statusColors: Record<string, string> = {
 
 async function getConversation(id: string, userId: string): Promise<Conversation | null> {
     try {
-        const result = await sql`
+        const result = await sqlAt('q51d3e9c93fba')`
             SELECT 
                 c.*,
                 o.id as order_id,
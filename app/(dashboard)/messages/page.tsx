@@ -1,6 +1,6 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { validateRequest } from '@/lib/auth';
 import Link from 'next/link';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
@@ -43,7 +43,7 @@ const formatTimeAgo = (dateString: string) => {
 
 async function getConversations(userId: string): Promise<Conversation[]> {
     try {
-        const result = await sql`
+        const result = await sqlAt('q8f976f82fa12')`
             SELECT 
                 c.*,
                 o.order_number,
@@ -1,7 +1,6 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
-import { cookies } from 'next/headers';
+import { sqlAt } from '@/lib/db';
 import Link from 'next/link';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
@@ -13,18 +12,7 @@ import {
     Plus,
     ArrowRight,
 } from 'lucide-react';
-
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > NOW()
-  `;
-    return result.rows[0] || null;
-}
+import { getSession } from '@/lib/auth';
 
 interface Stats {
     earnings: number;
@@ -53,13 +41,13 @@ interface Order {
 async function getPublisherStats(userId: string): Promise<Stats> {
     try {
         // Get earnings balance
-        const balanceResult = await sql`
+        const balanceResult = await sqlAt('qa34b863d5ae2')`
       SELECT publisher_balance FROM users WHERE id = ${userId}
     `;
         const earnings = (balanceResult.rows[0] as { publisher_balance: number })?.publisher_balance || 0;
 
         // Get order counts
-        const ordersResult = await sql`
+        const ordersResult = await sqlAt('q1e3d8c04f88c')`
       SELECT 
         COUNT(*) FILTER (WHERE status IN ('pending', 'in_progress')) as pending,
         COUNT(*) FILTER (WHERE status = 'completed' AND created_at >= date_trunc('month', NOW())) as this_month
@@ -68,7 +56,7 @@ async function getPublisherStats(userId: string): Promise<Stats> {
         const counts = ordersResult.rows[0] as { pending: string; this_month: string };
 
         // Get website count
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('qcfae2ecf5a47')`
       SELECT COUNT(*) as count FROM websites WHERE owner_id = ${userId}
     `;
         const websiteCount = parseInt((websiteResult.rows[0] as { count: string })?.count) || 0;
@@ -87,7 +75,7 @@ async function getPublisherStats(userId: string): Promise<Stats> {
 
 async function getWebsites(userId: string): Promise<Website[]> {
     try {
-        const result = await sql`
+        const result = await sqlAt('q5a27dab7da75')`
       SELECT id, domain, domain_authority as da, price_guest_post as price, 
              CASE WHEN is_active AND verification_status = 'approved' THEN 'active' ELSE 'pending' END as status
       FROM websites 
@@ -104,7 +92,7 @@ async function getWebsites(userId: string): Promise<Website[]> {
 
 async function getRecentOrders(userId: string): Promise<Order[]> {
     try {
-        const result = await sql`
+        const result = await sqlAt('qe55699459731')`
       SELECT o.id, o.order_type, o.total_amount, o.status, o.created_at, w.domain as website_domain
       FROM orders o
       JOIN websites w ON o.website_id = w.id
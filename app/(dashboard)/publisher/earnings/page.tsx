@@ -1,7 +1,6 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
-import { cookies } from 'next/headers';
+import { sqlAt } from '@/lib/db';
 import Link from 'next/link';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
@@ -14,18 +13,7 @@ import {
     Calendar,
     Wallet,
 } from 'lucide-react';
-
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > NOW()
-  `;
-    return result.rows[0] || null;
-}
+import { getSession } from '@/lib/auth';
 
 interface EarningStats {
     total_earned: number;
@@ -36,7 +24,7 @@ interface EarningStats {
 
 async function getEarningsStats(userId: string): Promise<EarningStats> {
     try {
-        const result = await sql`
+        const result = await sqlAt('q4a22588ad4c5')`
             SELECT 
                 COALESCE(SUM(publisher_earnings) FILTER (WHERE status = 'completed'), 0) as total_earned,
                 COALESCE(SUM(publisher_earnings) FILTER (WHERE status IN ('pending', 'accepted', 'writing', 'content_submitted', 'revision_needed', 'approved')), 0) as pending_amount,
@@ -60,7 +48,7 @@ async function getEarningsStats(userId: string): Promise<EarningStats> {
 
 async function getMonthlyEarnings(userId: string) {
     try {
-        const result = await sql`
+        const result = await sqlAt('q6a208dbbcb09')`
             SELECT 
                 to_char(created_at, 'Month') as month,
                 SUM(publisher_earnings) as amount,
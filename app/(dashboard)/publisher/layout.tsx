@@ -2,7 +2,7 @@ export const runtime = 'edge';
 
 import { redirect } from 'next/navigation';
 import { validateRequest } from '@/lib/auth';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { DashboardHeader } from '@/components/dashboard/header';
 import { DashboardSidebar } from '@/components/dashboard/sidebar';
 import { Footer } from '@/components/layouts/footer';
@@ -19,7 +19,7 @@ export default async function PublisherLayout({
     }
 
     // Fetch real role flags from database
-    const userResult = await sql`
+    const userResult = await sqlAt('q3a107b2a6af3')`
         SELECT is_buyer, is_publisher, is_affiliate FROM users WHERE id = ${user.id}
     `;
     const userData = userResult.rows[0] as {
@@ -1,7 +1,6 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
-import { cookies } from 'next/headers';
+import { sqlAt } from '@/lib/db';
 import { notFound, redirect } from 'next/navigation';
 import Link from 'next/link';
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/components/ui/card';
@@ -22,21 +21,10 @@ import {
     ExternalLink,
 } from 'lucide-react';
 import MessageButton from '@/components/messaging/message-button';
-
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-        SELECT s.*, u.* FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > NOW()
-    `;
-    return result.rows[0] || null;
-}
+import { getSession } from '@/lib/auth';
 
 async function getOrderDetails(orderId: string, publisherId: string) {
-    const result = await sql`
+    const result = await sqlAt('q93b8d5908f5f')`
         SELECT 
             o.*,
             w.domain as website_domain,
@@ -1,7 +1,6 @@
 export const runtime = 'edge';
 
-import { sql } from '@/lib/db';
-import { cookies } from 'next/headers';
+import { sqlAt } from '@/lib/db';
 import Link from 'next/link';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
@@ -17,18 +16,7 @@ import {
     ChevronRight,
     AlertCircle,
 } from 'lucide-react';
-
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > NOW()
-  `;
-    return result.rows[0] || null;
-}
+import { getSession } from '@/lib/auth';
 
 interface Order {
     id: string;
@@ -47,7 +35,7 @@ interface Order {
 
 async function getPublisherOrders(userId: string) {
     try {
-        const result = await sql`
+        const result = await sqlAt('qbc8e33d837b2')`
             SELECT 
                 o.id, o.order_type, o.status, o.total_amount, o.publisher_earnings, o.created_at, 
                 o.deadline_at, o.completed_at, o.article_url, o.anchor_text,
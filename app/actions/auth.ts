@@ -1,6 +1,6 @@
 'use server';
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { verifyPassword } from '@/lib/password';
 import { createToken } from '@/lib/jwt';
@@ -24,7 +24,7 @@ export async function loginAction(prevState: any, formData: FormData) {
         }
 
         // Find user
-        const userResult = await sql`
+        const userResult = await sqlAt('q004457345846')`
             SELECT id, email, name, password_hash, is_buyer, is_publisher, is_affiliate, is_active, is_banned
             FROM users
             WHERE email = ${email}
@@ -54,7 +54,7 @@ export async function loginAction(prevState: any, formData: FormData) {
         }
 
         // Update last login
-        await sql`UPDATE users SET last_login_at = ${now} WHERE id = ${user.id as string}`;
+        await sqlAt('q78f2b634034f')`UPDATE users SET last_login_at = ${now} WHERE id = ${user.id as string}`;
 
         // Create JWT token
         console.log('[Login] Creating JWT token for user:', user.id);
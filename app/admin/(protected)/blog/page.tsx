@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { FileText, Plus, Edit, Trash2, Eye, EyeOff } from 'lucide-react';
@@ -10,7 +10,7 @@ import Link from 'next/link';
 
 async function getBlogPosts() {
     try {
-        const result = await sql`
+        const result = await sqlAt('q58cd9ad9f05e')`
       SELECT bp.*, au.name as author_name
       FROM blog_posts bp
       JOIN admin_users au ON bp.author_id = au.id
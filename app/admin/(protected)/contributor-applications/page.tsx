@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { validateAdminRequest } from '@/lib/admin-auth';
 import Link from 'next/link';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
@@ -11,7 +11,7 @@ import { Clock, CheckCircle, XCircle, User, Globe, ExternalLink } from 'lucide-r
 
 async function getContributorApplications() {
     try {
-        const result = await sql`
+        const result = await sqlAt('qff1b9f86cc61')`
             SELECT 
                 w.id,
                 w.domain,
@@ -48,7 +48,7 @@ interface ApplicationStats {
 
 async function getApplicationStats(): Promise<ApplicationStats> {
     try {
-        const result = await sql`
+        const result = await sqlAt('q992542e4a108')`
             SELECT 
                 COUNT(*) FILTER (WHERE verification_status = 'pending') as pending_count,
                 COUNT(*) FILTER (WHERE verification_status = 'verified') as approved_count,
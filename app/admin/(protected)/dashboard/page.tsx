@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { validateAdminRequest } from '@/lib/admin-auth';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import {
@@ -19,13 +19,13 @@ import {
 async function getStats() {
     try {
         const [usersResult, websitesResult, ordersResult] = await Promise.all([
-            sql`SELECT COUNT(*) as count FROM users`,
-            sql`SELECT 
+            sqlAt('q0245ea18ca88')`SELECT COUNT(*) as count FROM users`,
+            sqlAt('q37402f0163bb')`SELECT 
             COUNT(*) as total,
             COUNT(*) FILTER (WHERE verification_status = 'pending') as pending,
             COUNT(*) FILTER (WHERE verification_status = 'approved') as approved
           FROM websites`,
-            sql`SELECT 
+            sqlAt('q3ab58bee3b69')`SELECT 
             COUNT(*) as total,
             COUNT(*) FILTER (WHERE status = 'pending') as pending,
             COUNT(*) FILTER (WHERE status = 'completed') as completed,
@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Mail, Plus, Trash2, Ban } from 'lucide-react';
@@ -9,7 +9,7 @@ import { Mail, Plus, Trash2, Ban } from 'lucide-react';
 
 async function getBannedEmails() {
     try {
-        const result = await sql`
+        const result = await sqlAt('qe516b97cf3db')`
       SELECT be.*, au.name as banned_by_name
       FROM banned_emails be
       LEFT JOIN admin_users au ON be.banned_by = au.id
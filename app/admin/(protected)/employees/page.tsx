@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { validateAdminRequest } from '@/lib/admin-auth';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
@@ -10,7 +10,7 @@ import { UserCog, Plus, Edit, Ban, Shield, Briefcase, FileText, Headphones, PenT
 
 async function getEmployees() {
     try {
-        const result = await sql`
+        const result = await sqlAt('q73107c769746')`
       SELECT id, email, name, role, is_active, last_login_at, created_at
       FROM admin_users
       ORDER BY 
@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { getAdminSession } from '@/lib/admin-auth';
 import { redirect } from 'next/navigation';
 import Link from 'next/link';
@@ -41,7 +41,7 @@ const statusColors: Record<string, string> = {
 
 async function getConversation(id: string): Promise<Conversation | null> {
     try {
-        const result = await sql`
+        const result = await sqlAt('q5c2b33ae949e')`
             SELECT 
                 c.*,
                 o.id as order_id,
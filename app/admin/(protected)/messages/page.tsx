@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { getAdminSession } from '@/lib/admin-auth';
 import { redirect } from 'next/navigation';
 import Link from 'next/link';
@@ -45,7 +45,7 @@ const formatTimeAgo = (dateString: string) => {
 
 async function getAllConversations(): Promise<Conversation[]> {
     try {
-        const result = await sql`
+        const result = await sqlAt('qce396639af25')`
             SELECT 
                 c.*,
                 o.order_number,
@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { PackageOpen, Search, Clock, CheckCircle, XCircle, Eye } from 'lucide-react';
@@ -9,7 +9,7 @@ import { PackageOpen, Search, Clock, CheckCircle, XCircle, Eye } from 'lucide-re
 
 async function getOrders() {
     try {
-        const result = await sql`
+        const result = await sqlAt('qe38c711204ba')`
       SELECT o.*, 
              b.name as buyer_name, b.email as buyer_email,
              w.domain as website_domain,
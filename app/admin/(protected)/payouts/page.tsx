@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { validateAdminRequest } from '@/lib/admin-auth';
 import Link from 'next/link';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
@@ -11,7 +11,7 @@ import { DollarSign, Clock, CheckCircle, XCircle } from 'lucide-react';
 
 async function getPayoutRequests() {
     try {
-        const result = await sql`
+        const result = await sqlAt('q9e037513aa39')`
             SELECT 
                 pr.*,
                 u.name as publisher_name,
@@ -45,7 +45,7 @@ interface PayoutStats {
 
 async function getPayoutStats(): Promise<PayoutStats> {
     try {
-        const result = await sql`
+        const result = await sqlAt('qd95d7dea5fa5')`
             SELECT 
                 COUNT(*) FILTER (WHERE status = 'pending') as pending_count,
                 COUNT(*) FILTER (WHERE status = 'processing') as processing_count,
@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { DollarSign, CheckCircle, XCircle, Clock, Eye } from 'lucide-react';
@@ -9,7 +9,7 @@ import { DollarSign, CheckCircle, XCircle, Clock, Eye } from 'lucide-react';
 
 async function getRefundRequests() {
     try {
-        const result = await sql`
+        const result = await sqlAt('qd7fb0b8b0539')`
       SELECT rr.*, 
              o.order_number, o.total_amount as order_total,
              u.name as buyer_name, u.email as buyer_email
@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Users, Search, Ban, CheckCircle, MoreHorizontal } from 'lucide-react';
@@ -9,7 +9,7 @@ import { Users, Search, Ban, CheckCircle, MoreHorizontal } from 'lucide-react';
 
 async function getUsers() {
     try {
-        const result = await sql`
+        const result = await sqlAt('q8a21c83ae833')`
       SELECT id, email, name, is_buyer, is_publisher, is_affiliate, 
              is_active, is_banned, created_at, last_login_at
       FROM users
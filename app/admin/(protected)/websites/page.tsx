@@ -1,6 +1,6 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Globe, Search, CheckCircle, XCircle, Clock, ExternalLink, Plus, Upload } from 'lucide-react';
@@ -10,7 +10,7 @@ import Link from 'next/link';
 
 async function getWebsites() {
     try {
-        const result = await sql`
+        const result = await sqlAt('q0416d96d96e6')`
       SELECT w.*, u.name as owner_name, u.email as owner_email
       FROM websites w
       JOIN users u ON w.owner_id = u.id
@@ -168,8 +168,25 @@ export default function ApiDocsPage() {
                                         <td className="py-2 font-mono text-blue-400">status</td>
                                         <td>pending, accepted, writing, published, completed</td>
                                     </tr>
+                                    <tr className="border-b border-gray-700/50">
+                                        <td className="py-2 font-mono text-blue-400">limit</td>
+                                        <td>Items per page (1-50, default: 20)</td>
+                                    </tr>
+                                    <tr className="border-b border-gray-700/50">
+                                        <td className="py-2 font-mono text-blue-400">cursor</td>
+                                        <td><code>pagination.nextCursor</code> from the previous response</td>
+                                    </tr>
+                                    <tr>
+                                        <td className="py-2 font-mono text-blue-400">page</td>
+                                        <td>Page number (default: 1). Ignored when <code>cursor</code> is sent</td>
+                                    </tr>
                                 </tbody>
                             </table>
+                            <p className="text-gray-400 text-sm">
+                                To page through orders, pass <code className="text-blue-400">pagination.nextCursor</code> as{' '}
+                                <code className="text-blue-400">cursor</code> until <code className="text-blue-400">hasMore</code> is false.
+                                Numbered pages still work but get slower the deeper they go.
+                            </p>
                         </div>
                     </div>
 
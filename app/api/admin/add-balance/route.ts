@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 
 
@@ -17,7 +17,7 @@ export async function GET(request: NextRequest) {
         const amount = parseInt(searchParams.get('amount') || '100000'); // Default $1000 in cents
 
         // Check if user exists
-        const userResult = await sql`
+        const userResult = await sqlAt('qbd240ce8e783')`
             SELECT id, email, name, buyer_balance, is_buyer 
             FROM users 
             WHERE email = ${email}
@@ -33,7 +33,7 @@ export async function GET(request: NextRequest) {
         const user = userResult.rows[0];
 
         // Update buyer balance and ensure is_buyer is true
-        await sql`
+        await sqlAt('q17e58658a739')`
             UPDATE users SET 
                 buyer_balance = buyer_balance + ${amount},
                 is_buyer = true,
@@ -42,7 +42,7 @@ export async function GET(request: NextRequest) {
         `;
 
         // Get updated balance
-        const updatedUser = await sql`
+        const updatedUser = await sqlAt('qc7651c8d43f4')`
             SELECT buyer_balance FROM users WHERE email = ${email}
         `;
 
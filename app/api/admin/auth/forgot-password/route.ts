@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { sendPasswordResetEmail } from '@/lib/email';
 import { z } from 'zod';
@@ -51,7 +51,7 @@ export async function POST(request: NextRequest) {
         const { email } = result.data;
 
         // Find admin user
-        const adminResult = await sql`
+        const adminResult = await sqlAt('q01702e88ea4c')`
       SELECT id, email, name FROM admin_users WHERE email = ${email} AND is_active = true
     `;
 
@@ -67,10 +67,10 @@ export async function POST(request: NextRequest) {
         const expiresAt = new Date(Date.now() + 60 * 60 * 1000); // 1 hour
 
         // Delete any existing tokens for this admin
-        await sql`DELETE FROM admin_password_reset_tokens WHERE admin_id = ${admin.id as string}`;
+        await sqlAt('qed9059884862')`DELETE FROM admin_password_reset_tokens WHERE admin_id = ${admin.id as string}`;
 
         // Save token
-        await sql`
+        await sqlAt('qbc1d450f96fd')`
       INSERT INTO admin_password_reset_tokens (admin_id, token, expires_at)
       VALUES (${admin.id as string}, ${token}, ${expiresAt.toISOString()})
     `;
@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { hashPassword, verifyPassword } from '@/lib/password';
 import { createAdminSession } from '@/lib/admin-auth';
@@ -33,7 +33,7 @@ export async function POST(request: NextRequest) {
         const { email, password } = result.data;
 
         // Find admin user (use LOWER for case-insensitive match)
-        const adminResult = await sql`
+        const adminResult = await sqlAt('q9af9492f2f5f')`
       SELECT id, email, name, password_hash, role, is_active
       FROM admin_users 
       WHERE LOWER(email) = LOWER(${email})
@@ -65,7 +65,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Update last login
-        await sql`UPDATE admin_users SET last_login_at = ${now} WHERE id = ${admin.id as string}`;
+        await sqlAt('q33667d9c15d6')`UPDATE admin_users SET last_login_at = ${now} WHERE id = ${admin.id as string}`;
 
         // Create session
         await createAdminSession(admin.id as string);
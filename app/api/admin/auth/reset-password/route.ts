@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { sendPasswordChangedEmail } from '@/lib/email';
 import { hashPassword, verifyPassword } from '@/lib/password';
@@ -33,7 +33,7 @@ export async function POST(request: NextRequest) {
         const { token, password } = result.data;
 
         // Find valid token
-        const tokenResult = await sql`
+        const tokenResult = await sqlAt('q6dabd038cbe0')`
       SELECT prt.*, a.email, a.name
       FROM admin_password_reset_tokens prt
       JOIN admin_users a ON prt.admin_id = a.id
@@ -55,19 +55,19 @@ export async function POST(request: NextRequest) {
         const passwordHash = await hashPassword(password);
 
         // Update admin password
-        await sql`
+        await sqlAt('q58ab3e8582fe')`
       UPDATE admin_users SET password_hash = ${passwordHash}, updated_at = ${now}
       WHERE id = ${tokenData.admin_id as string}
     `;
 
         // Mark token as used
-        await sql`
+        await sqlAt('qbe919fd96f99')`
       UPDATE admin_password_reset_tokens SET used_at = ${now}
       WHERE id = ${tokenData.id as string}
     `;
 
         // Delete all sessions for this admin (security)
-        await sql`DELETE FROM admin_sessions WHERE admin_id = ${tokenData.admin_id as string}`;
+        await sqlAt('qb44b0c8b8ddd')`DELETE FROM admin_sessions WHERE admin_id = ${tokenData.admin_id as string}`;
 
         // Send confirmation email
         await sendPasswordChangedEmail(
@@ -1,9 +1,10 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
@@ -18,7 +19,7 @@ export async function GET(
 
         const { id } = await params;
 
-        const result = await sql`
+        const result = await sqlAt('qdae8291ec8f8')`
             SELECT bp.*, au.name as author_name, au.email as author_email
             FROM blog_posts bp
             JOIN admin_users au ON bp.author_id = au.id
@@ -39,7 +40,7 @@ export async function GET(
     }
 }
 
-export async function PUT(
+async function handlePut(
     request: NextRequest,
     { params }: { params: Promise<{ id: string }> }
 ) {
@@ -79,7 +80,7 @@ export async function PUT(
         }
 
         // Check if slug is taken by another post
-        const existingPost = await sql`
+        const existingPost = await sqlAt('q448d1e036564')`
             SELECT id FROM blog_posts WHERE slug = ${slug} AND id != ${id}
         `;
 
@@ -91,12 +92,12 @@ export async function PUT(
         }
 
         // Get current post to check if status changed to published
-        const currentPost = await sql`SELECT status FROM blog_posts WHERE id = ${id}`;
+        const currentPost = await sqlAt('qbe1e0b897a79')`SELECT status FROM blog_posts WHERE id = ${id}`;
         const wasPublished = currentPost.rows[0]?.status === 'published';
         const isNowPublished = status === 'published';
 
         // Update blog post
-        const result = await sql`
+        const result = await sqlAt('q6ae98178c1ee')`
             UPDATE blog_posts
             SET
                 title = ${title},
@@ -133,7 +134,7 @@ export async function PUT(
     }
 }
 
-export async function DELETE(
+async function handleDelete(
     request: NextRequest,
     { params }: { params: Promise<{ id: string }> }
 ) {
@@ -150,7 +151,7 @@ export async function DELETE(
 
         const { id } = await params;
 
-        const result = await sql`
+        const result = await sqlAt('q04f6e6db33f4')`
             DELETE FROM blog_posts
             WHERE id = ${id}
             RETURNING id
@@ -169,3 +170,7 @@ export async function DELETE(
         );
     }
 }
+
+export const PUT = withCachePurge(['blog_posts'], handlePut);
+
+export const DELETE = withCachePurge(['blog_posts'], handleDelete);
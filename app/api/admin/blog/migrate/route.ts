@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 
 
@@ -12,7 +12,7 @@ export async function POST() {
         await initializeDatabaseFromContext();
 
         // Add SEO fields to blog_posts table if they don't exist
-        await sql`
+        await sqlAt('q4b87d8446546')`
             ALTER TABLE blog_posts 
             ADD COLUMN IF NOT EXISTS meta_title TEXT,
             ADD COLUMN IF NOT EXISTS meta_description TEXT,
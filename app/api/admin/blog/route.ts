@@ -1,13 +1,14 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt, ftsMatch, ftsShortTerm } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -42,7 +43,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Check if slug already exists
-        const existingPost = await sql`
+        const existingPost = await sqlAt('qeb106222a959')`
             SELECT id FROM blog_posts WHERE slug = ${slug}
         `;
 
@@ -54,7 +55,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Create blog post
-        const result = await sql`
+        const result = await sqlAt('qef51792e312f')`
             INSERT INTO blog_posts (
                 title, slug, content, excerpt, cover_image,
                 author_id, status, category, tags,
@@ -95,39 +96,27 @@ export async function GET(request: NextRequest) {
         const limit = parseInt(searchParams.get('limit') || '20');
         const category = searchParams.get('category');
         const status = searchParams.get('status');
-        const search = searchParams.get('search');
+        const search = searchParams.get('search') || '';
         const offset = (page - 1) * limit;
 
-        let query = sql`
+        const result = await sqlAt('qbf043bda5691')`
             SELECT bp.*, au.name as author_name
             FROM blog_posts bp
             JOIN admin_users au ON bp.author_id = au.id
-            WHERE 1=1
+            WHERE (${category} IS NULL OR bp.category = ${category})
+            AND (${status} IS NULL OR bp.status = ${status})
+            AND (${search} = '' OR bp.rowid IN (SELECT rowid FROM blog_posts_fts WHERE blog_posts_fts MATCH ${ftsMatch(search, ['title', 'content'])} UNION SELECT rowid FROM blog_posts WHERE ${ftsShortTerm(search)} AND (title LIKE ${`%${search}%`} OR content LIKE ${`%${search}%`})))
+            ORDER BY bp.created_at DESC
+            LIMIT ${limit} OFFSET ${offset}
         `;
 
-        if (category) {
-            query = sql`${query} AND bp.category = ${category}`;
-        }
-
-        if (status) {
-            query = sql`${query} AND bp.status = ${status}`;
-        }
-
-        if (search) {
-            query = sql`${query} AND (bp.title ILIKE ${`%${search}%`} OR bp.content ILIKE ${`%${search}%`})`;
-        }
-
-        query = sql`${query} ORDER BY bp.created_at DESC LIMIT ${limit} OFFSET ${offset}`;
-
-        const result = await query;
-
         // Get total count
-        let countQuery = sql`SELECT COUNT(*) as total FROM blog_posts WHERE 1=1`;
-        if (category) countQuery = sql`${countQuery} AND category = ${category}`;
-        if (status) countQuery = sql`${countQuery} AND status = ${status}`;
-        if (search) countQuery = sql`${countQuery} AND (title ILIKE ${`%${search}%`} OR content ILIKE ${`%${search}%`})`;
-
-        const countResult = await countQuery;
+        const countResult = await sqlAt('qa41ee12a0a75')`
+            SELECT COUNT(*) as total FROM blog_posts
+            WHERE (${category} IS NULL OR category = ${category})
+            AND (${status} IS NULL OR status = ${status})
+            AND (${search} = '' OR blog_posts.rowid IN (SELECT rowid FROM blog_posts_fts WHERE blog_posts_fts MATCH ${ftsMatch(search, ['title', 'content'])} UNION SELECT rowid FROM blog_posts WHERE ${ftsShortTerm(search)} AND (title LIKE ${`%${search}%`} OR content LIKE ${`%${search}%`})))
+        `;
         const total = parseInt(String((countResult.rows[0] as { total: unknown }).total));
 
         return NextResponse.json({
@@ -147,3 +136,5 @@ export async function GET(request: NextRequest) {
         );
     }
 }
+
+export const POST = withCachePurge(['blog_posts'], handlePost);
@@ -1,10 +1,11 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 import { z } from 'zod';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
@@ -12,7 +13,7 @@ const rejectSchema = z.object({
     reason: z.string().min(1, 'Rejection reason is required'),
 });
 
-export async function POST(
+async function handlePost(
     request: NextRequest,
     { params }: { params: Promise<{ id: string }> }
 ) {
@@ -39,7 +40,7 @@ export async function POST(
         const { reason } = result.data;
 
         // Get application
-        const appResult = await sql`
+        const appResult = await sqlAt('qeaf36c5b2901')`
             SELECT * FROM websites
             WHERE id = ${id}
             AND ownership_type = 'contributor'
@@ -56,7 +57,7 @@ export async function POST(
         }
 
         // Reject application
-        await sql`
+        await sqlAt('q55dbb614fdbc')`
             UPDATE websites
             SET 
                 verification_status = 'rejected',
@@ -79,3 +80,5 @@ export async function POST(
         );
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 import { NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { hashPassword, verifyPassword } from '@/lib/password';
 
@@ -22,11 +22,11 @@ export async function GET() {
         const passwordHash = await hashPassword(password);
 
         // Check if buyer already exists
-        const checkResult = await sql`SELECT id FROM users WHERE email = ${email}`;
+        const checkResult = await sqlAt('q3a99cfde2b9f')`SELECT id FROM users WHERE email = ${email}`;
 
         if (checkResult.rows.length > 0) {
             // Update existing user
-            await sql`
+            await sqlAt('q9375841239d2')`
                 UPDATE users SET 
                     password_hash = ${passwordHash}, 
                     is_buyer = true,
@@ -50,7 +50,7 @@ export async function GET() {
             });
         } else {
             // Create new user
-            await sql`
+            await sqlAt('qa6a7efb76b9d')`
                 INSERT INTO users (email, password_hash, name, is_buyer, buyer_balance, email_verified, is_active)
                 VALUES (${email}, ${passwordHash}, ${name}, true, 100000, true, true)
             `;
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { cookies } from 'next/headers';
 
@@ -12,7 +12,7 @@ async function getAdminSession() {
     const sessionId = cookieStore.get('admin_session')?.value;
     if (!sessionId) return null;
     const now = new Date().toISOString();
-    const result = await sql`
+    const result = await sqlAt('q70a0c3e8d498')`
     SELECT s.*, a.* FROM admin_sessions s
     JOIN admin_users a ON s.admin_id = a.id
     WHERE s.id = ${sessionId} AND s.expires_at > ${now}
@@ -39,7 +39,7 @@ export async function POST(request: NextRequest) {
 
         const newStatus = action === 'approve' ? 'approved' : 'rejected';
 
-        await sql`
+        await sqlAt('qb8e539ef42db')`
       UPDATE order_messages 
       SET 
         status = ${newStatus},
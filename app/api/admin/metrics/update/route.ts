@@ -4,6 +4,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { validateAdminRequest } from '@/lib/admin-auth';
 import { updateWebsiteMetrics, updateAllMetrics, getMetricsFreshness } from '@/lib/metrics';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
@@ -15,7 +16,7 @@ import { initializeDatabaseFromContext } from '@/lib/cloudflare';
  * - websiteId: Update single website
  * - batchSize: Number of websites to update in batch (default: 50)
  */
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -90,3 +91,5 @@ export async function GET() {
         }, { status: 500 });
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
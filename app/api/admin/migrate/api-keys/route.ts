@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 
@@ -23,7 +23,7 @@ export async function POST() {
         }
 
         // Create API keys table
-        await sql`
+        await sqlAt('q6a42a53fb687')`
             CREATE TABLE IF NOT EXISTS api_keys (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -41,7 +41,7 @@ export async function POST() {
         `;
 
         // Create rate limiting table
-        await sql`
+        await sqlAt('qb58940a97739')`
             CREATE TABLE IF NOT EXISTS api_rate_limits (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 api_key_id TEXT NOT NULL REFERENCES api_keys(id) ON DELETE CASCADE,
@@ -52,20 +52,20 @@ export async function POST() {
         `;
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_api_keys_user ON api_keys(user_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_api_keys_prefix ON api_keys(prefix)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_api_keys_active ON api_keys(is_active)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_api_rate_limits_key ON api_rate_limits(api_key_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_api_rate_limits_window ON api_rate_limits(window_start)`;
+        await sqlAt('q99ce652cb7ee')`CREATE INDEX IF NOT EXISTS idx_api_keys_user ON api_keys(user_id)`;
+        await sqlAt('q3d5406d73747')`CREATE INDEX IF NOT EXISTS idx_api_keys_prefix ON api_keys(prefix)`;
+        await sqlAt('q93e4cdf0d718')`CREATE INDEX IF NOT EXISTS idx_api_keys_active ON api_keys(is_active)`;
+        await sqlAt('qa2c0a160af48')`CREATE INDEX IF NOT EXISTS idx_api_rate_limits_key ON api_rate_limits(api_key_id)`;
+        await sqlAt('q239a6ff17cc4')`CREATE INDEX IF NOT EXISTS idx_api_rate_limits_window ON api_rate_limits(window_start)`;
 
         // Add metrics columns to websites table if they don't exist
         try {
-            await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS metrics_source TEXT DEFAULT 'manual'`;
-            await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS metrics_updated_at TIMESTAMPTZ`;
-            await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS referring_domains INTEGER`;
-            await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS spam_score INTEGER`;
-            await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS trust_flow INTEGER`;
-            await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS citation_flow INTEGER`;
+            await sqlAt('qbd6aca3c3399')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS metrics_source TEXT DEFAULT 'manual'`;
+            await sqlAt('q020bd63acc2f')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS metrics_updated_at TIMESTAMPTZ`;
+            await sqlAt('qcf7e41a93981')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS referring_domains INTEGER`;
+            await sqlAt('q41b70484a050')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS spam_score INTEGER`;
+            await sqlAt('q94b36378aa06')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS trust_flow INTEGER`;
+            await sqlAt('q402d7ca8c699')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS citation_flow INTEGER`;
         } catch (e) {
             console.log('Metrics columns may already exist:', e);
         }
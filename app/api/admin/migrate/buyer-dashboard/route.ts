@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 
 
@@ -13,7 +13,7 @@ export async function POST() {
         await initializeDatabaseFromContext();
 
         // Projects table
-        await sql`
+        await sqlAt('qf3ce300e7fbf')`
             CREATE TABLE IF NOT EXISTS projects (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -32,7 +32,7 @@ export async function POST() {
         `;
 
         // Notifications table
-        await sql`
+        await sqlAt('q36f6b4427fa6')`
             CREATE TABLE IF NOT EXISTS notifications (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -48,7 +48,7 @@ export async function POST() {
         `;
 
         // Activity logs table
-        await sql`
+        await sqlAt('q3373786bc347')`
             CREATE TABLE IF NOT EXISTS activity_logs (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -64,7 +64,7 @@ export async function POST() {
         `;
 
         // Favorites table
-        await sql`
+        await sqlAt('q64ef0412550b')`
             CREATE TABLE IF NOT EXISTS favorites (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -77,7 +77,7 @@ export async function POST() {
         `;
 
         // Blacklists table
-        await sql`
+        await sqlAt('qe0b9f5a67fee')`
             CREATE TABLE IF NOT EXISTS blacklists (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -91,31 +91,31 @@ export async function POST() {
 
         // Add balance_reserved column to users
         try {
-            await sql`ALTER TABLE users ADD COLUMN balance_reserved INTEGER DEFAULT 0`;
+            await sqlAt('qc6615d194458')`ALTER TABLE users ADD COLUMN balance_reserved INTEGER DEFAULT 0`;
         } catch (e: any) {
             if (!e.message?.includes('already exists')) throw e;
         }
 
         // Add balance_bonus column to users
         try {
-            await sql`ALTER TABLE users ADD COLUMN balance_bonus INTEGER DEFAULT 0`;
+            await sqlAt('q6cc2ad0a63d0')`ALTER TABLE users ADD COLUMN balance_bonus INTEGER DEFAULT 0`;
         } catch (e: any) {
             if (!e.message?.includes('already exists')) throw e;
         }
 
         // Add project_id to orders
         try {
-            await sql`ALTER TABLE orders ADD COLUMN project_id TEXT REFERENCES projects(id) ON DELETE SET NULL`;
+            await sqlAt('qb6d4d68512ab')`ALTER TABLE orders ADD COLUMN project_id TEXT REFERENCES projects(id) ON DELETE SET NULL`;
         } catch (e: any) {
             if (!e.message?.includes('already exists')) throw e;
         }
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_projects_user ON projects(user_id, is_active)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_notifications_user ON notifications(user_id, is_read, created_at DESC)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_activity_user ON activity_logs(user_id, created_at DESC)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_favorites_user ON favorites(user_id, project_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_blacklists_user ON blacklists(user_id, project_id)`;
+        await sqlAt('q7cd7b47f2cf9')`CREATE INDEX IF NOT EXISTS idx_projects_user ON projects(user_id, is_active)`;
+        await sqlAt('q17a619bb0073')`CREATE INDEX IF NOT EXISTS idx_notifications_user ON notifications(user_id, is_read, created_at DESC)`;
+        await sqlAt('qc302f1ac1b06')`CREATE INDEX IF NOT EXISTS idx_activity_user ON activity_logs(user_id, created_at DESC)`;
+        await sqlAt('qac3070c9ce7f')`CREATE INDEX IF NOT EXISTS idx_favorites_user ON favorites(user_id, project_id)`;
+        await sqlAt('qf45726883230')`CREATE INDEX IF NOT EXISTS idx_blacklists_user ON blacklists(user_id, project_id)`;
 
         return NextResponse.json({
             success: true,
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 
 
@@ -13,14 +13,14 @@ export async function GET(request: NextRequest) {
         await initializeDatabaseFromContext();
 
         // Add buyer confirmation columns to orders
-        await sql`ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_confirmation_deadline TIMESTAMPTZ`;
-        await sql`ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_confirmed_at TIMESTAMPTZ`;
-        await sql`ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_rejected_at TIMESTAMPTZ`;
-        await sql`ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_rejection_reason TEXT`;
-        await sql`ALTER TABLE orders ADD COLUMN IF NOT EXISTS dispute_protection_until TIMESTAMPTZ`;
+        await sqlAt('qb23566f5e8c9')`ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_confirmation_deadline TIMESTAMPTZ`;
+        await sqlAt('q964ce1b64d46')`ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_confirmed_at TIMESTAMPTZ`;
+        await sqlAt('q5551c31ce75c')`ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_rejected_at TIMESTAMPTZ`;
+        await sqlAt('q9a2202d057ed')`ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_rejection_reason TEXT`;
+        await sqlAt('q75e226251511')`ALTER TABLE orders ADD COLUMN IF NOT EXISTS dispute_protection_until TIMESTAMPTZ`;
 
         // Create disputes table
-        await sql`
+        await sqlAt('q0940954d7e51')`
             CREATE TABLE IF NOT EXISTS disputes (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 order_id TEXT NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
@@ -50,8 +50,8 @@ export async function GET(request: NextRequest) {
         `;
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_disputes_order_id ON disputes(order_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_disputes_status ON disputes(status)`;
+        await sqlAt('qb0f3ff91848f')`CREATE INDEX IF NOT EXISTS idx_disputes_order_id ON disputes(order_id)`;
+        await sqlAt('q42197dee0307')`CREATE INDEX IF NOT EXISTS idx_disputes_status ON disputes(status)`;
 
         return NextResponse.json({
             success: true,
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 
 
@@ -13,20 +13,20 @@ export async function POST() {
         await initializeDatabaseFromContext();
 
         // Add quality metrics columns to websites one by one using template literal syntax
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS completion_rate DECIMAL(5,2) DEFAULT 100`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS avg_delivery_days DECIMAL(4,1)`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS acceptance_rate DECIMAL(5,2) DEFAULT 100`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS revision_limit INTEGER DEFAULT 2`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS is_indexed BOOLEAN DEFAULT true`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS traffic_trend TEXT DEFAULT 'stable'`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS anchor_types_allowed TEXT[]`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS link_positions TEXT[]`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS admin_boost_score INTEGER DEFAULT 0`;
-        await sql`ALTER TABLE websites ADD COLUMN IF NOT EXISTS homepage_link_available BOOLEAN DEFAULT false`;
+        await sqlAt('qe9b9ad5d4571')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS completion_rate DECIMAL(5,2) DEFAULT 100`;
+        await sqlAt('q41faa77fa460')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS avg_delivery_days DECIMAL(4,1)`;
+        await sqlAt('q260a43831fd4')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS acceptance_rate DECIMAL(5,2) DEFAULT 100`;
+        await sqlAt('q336ea17ddf28')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS revision_limit INTEGER DEFAULT 2`;
+        await sqlAt('q8b0df686fe4d')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS is_indexed BOOLEAN DEFAULT true`;
+        await sqlAt('qc78b355b12ba')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS traffic_trend TEXT DEFAULT 'stable'`;
+        await sqlAt('q22617f02505c')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS anchor_types_allowed TEXT[]`;
+        await sqlAt('qc5874f51135d')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS link_positions TEXT[]`;
+        await sqlAt('qaf7a3315340b')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS admin_boost_score INTEGER DEFAULT 0`;
+        await sqlAt('q55ff307a39ca')`ALTER TABLE websites ADD COLUMN IF NOT EXISTS homepage_link_available BOOLEAN DEFAULT false`;
 
         // Create index for performance
-        await sql`CREATE INDEX IF NOT EXISTS idx_websites_quality ON websites(completion_rate DESC, average_rating DESC)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_websites_boost ON websites(admin_boost_score DESC, is_featured DESC)`;
+        await sqlAt('qa376035913fa')`CREATE INDEX IF NOT EXISTS idx_websites_quality ON websites(completion_rate DESC, average_rating DESC)`;
+        await sqlAt('q98427eb96c50')`CREATE INDEX IF NOT EXISTS idx_websites_boost ON websites(admin_boost_score DESC, is_featured DESC)`;
 
         return NextResponse.json({
             success: true,
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 
@@ -19,7 +19,7 @@ export async function POST() {
         }
 
         // Create conversations table
-        await sql`
+        await sqlAt('q11df90b9b38b')`
             CREATE TABLE IF NOT EXISTS conversations (
               id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
               order_id TEXT NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
@@ -32,7 +32,7 @@ export async function POST() {
         `;
 
         // Create messages table
-        await sql`
+        await sqlAt('q934c1b79efc6')`
             CREATE TABLE IF NOT EXISTS messages (
               id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
               conversation_id TEXT NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
@@ -45,12 +45,12 @@ export async function POST() {
         `;
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_conversations_order ON conversations(order_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_conversations_buyer ON conversations(buyer_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_conversations_publisher ON conversations(publisher_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id, created_at DESC)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_messages_unread ON messages(conversation_id, is_read) WHERE is_read = false`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_messages_sender ON messages(sender_id)`;
+        await sqlAt('qbcfda8b063d3')`CREATE INDEX IF NOT EXISTS idx_conversations_order ON conversations(order_id)`;
+        await sqlAt('q7ff3bd6a4995')`CREATE INDEX IF NOT EXISTS idx_conversations_buyer ON conversations(buyer_id)`;
+        await sqlAt('q6512acef0e21')`CREATE INDEX IF NOT EXISTS idx_conversations_publisher ON conversations(publisher_id)`;
+        await sqlAt('qaff059291937')`CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id, created_at DESC)`;
+        await sqlAt('q58cc8d6615ec')`CREATE INDEX IF NOT EXISTS idx_messages_unread ON messages(conversation_id, is_read) WHERE is_read = false`;
+        await sqlAt('qd774a295a453')`CREATE INDEX IF NOT EXISTS idx_messages_sender ON messages(sender_id)`;
 
         return NextResponse.json({
             success: true,
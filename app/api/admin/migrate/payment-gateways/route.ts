@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 
@@ -19,7 +19,7 @@ export async function POST() {
         }
 
         // Run migrations
-        await sql`
+        await sqlAt('q137f2cf0e316')`
             ALTER TABLE orders 
             ADD COLUMN IF NOT EXISTS payment_gateway TEXT DEFAULT 'stripe' CHECK (payment_gateway IN ('stripe', 'paypal', 'razorpay')),
             ADD COLUMN IF NOT EXISTS paypal_order_id TEXT,
@@ -27,7 +27,7 @@ export async function POST() {
             ADD COLUMN IF NOT EXISTS razorpay_payment_id TEXT
         `;
 
-        await sql`
+        await sqlAt('q76c419af8c4d')`
             CREATE TABLE IF NOT EXISTS payout_settings (
               id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
               user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -41,7 +41,7 @@ export async function POST() {
             )
         `;
 
-        await sql`
+        await sqlAt('qc86d21cea6ba')`
             CREATE TABLE IF NOT EXISTS payout_requests (
               id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
               user_id TEXT NOT NULL REFERENCES users(id),
@@ -58,13 +58,13 @@ export async function POST() {
         `;
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_orders_payment_gateway ON orders(payment_gateway)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_orders_paypal_order_id ON orders(paypal_order_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_orders_razorpay_order_id ON orders(razorpay_order_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_payout_settings_user_id ON payout_settings(user_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_payout_requests_user_id ON payout_requests(user_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_payout_requests_status ON payout_requests(status)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_payout_requests_created_at ON payout_requests(created_at DESC)`;
+        await sqlAt('qdf8ed9f3c2e0')`CREATE INDEX IF NOT EXISTS idx_orders_payment_gateway ON orders(payment_gateway)`;
+        await sqlAt('q91a396dfaed9')`CREATE INDEX IF NOT EXISTS idx_orders_paypal_order_id ON orders(paypal_order_id)`;
+        await sqlAt('qf564deaee6f2')`CREATE INDEX IF NOT EXISTS idx_orders_razorpay_order_id ON orders(razorpay_order_id)`;
+        await sqlAt('q9e81780e429b')`CREATE INDEX IF NOT EXISTS idx_payout_settings_user_id ON payout_settings(user_id)`;
+        await sqlAt('q856e8b01ded1')`CREATE INDEX IF NOT EXISTS idx_payout_requests_user_id ON payout_requests(user_id)`;
+        await sqlAt('q233f370f250e')`CREATE INDEX IF NOT EXISTS idx_payout_requests_status ON payout_requests(status)`;
+        await sqlAt('q75874d96e5ce')`CREATE INDEX IF NOT EXISTS idx_payout_requests_created_at ON payout_requests(created_at DESC)`;
 
         return NextResponse.json({
             success: true,
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 
@@ -23,7 +23,7 @@ export async function POST() {
         }
 
         // Create payouts table
-        await sql`
+        await sqlAt('q5ae1900b96c9')`
             CREATE TABLE IF NOT EXISTS payouts (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -40,17 +40,17 @@ export async function POST() {
         `;
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_payouts_user ON payouts(user_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_payouts_status ON payouts(status)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_payouts_created ON payouts(created_at)`;
+        await sqlAt('q17e8a456e902')`CREATE INDEX IF NOT EXISTS idx_payouts_user ON payouts(user_id)`;
+        await sqlAt('q8cda50348343')`CREATE INDEX IF NOT EXISTS idx_payouts_status ON payouts(status)`;
+        await sqlAt('q08f48e71fd32')`CREATE INDEX IF NOT EXISTS idx_payouts_created ON payouts(created_at)`;
 
         // Add payout columns to users if not exists
         try {
-            await sql`ALTER TABLE users ADD COLUMN IF NOT EXISTS paypal_email TEXT`;
+            await sqlAt('q4f9b31646af2')`ALTER TABLE users ADD COLUMN IF NOT EXISTS paypal_email TEXT`;
         } catch (e) { /* column may already exist */ }
 
         try {
-            await sql`ALTER TABLE users ADD COLUMN IF NOT EXISTS payoneer_email TEXT`;
+            await sqlAt('qa64f3f0483c6')`ALTER TABLE users ADD COLUMN IF NOT EXISTS payoneer_email TEXT`;
         } catch (e) { /* column may already exist */ }
 
         return NextResponse.json({
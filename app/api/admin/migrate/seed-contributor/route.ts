@@ -1,26 +1,27 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
 // POST /api/admin/migrate/seed-contributor - Seed an approved test contributor
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
         const now = new Date().toISOString();
 
         // Get a website from the marketplace (try approved first, then any website)
-        let websitesResult = await sql`
+        let websitesResult = await sqlAt('qdda6f745432b')`
       SELECT id, domain FROM websites WHERE verification_status = 'approved' AND is_active = true LIMIT 1
     `;
 
         // If no approved websites, try any website
         if (websitesResult.rows.length === 0) {
-            websitesResult = await sql`
+            websitesResult = await sqlAt('q914e06e499f6')`
         SELECT id, domain FROM websites LIMIT 1
       `;
         }
@@ -32,7 +33,7 @@ export async function POST(request: NextRequest) {
         const website = websitesResult.rows[0];
 
         // Get a user to be the contributor (not the website owner)
-        const usersResult = await sql`
+        const usersResult = await sqlAt('q2c29d575d005')`
       SELECT id, name, email FROM users 
       WHERE id != (SELECT owner_id FROM websites WHERE id = ${website.id})
       LIMIT 1
@@ -45,7 +46,7 @@ export async function POST(request: NextRequest) {
         const user = usersResult.rows[0];
 
         // Check if contributor already exists
-        const existingResult = await sql`
+        const existingResult = await sqlAt('qfd742864cd1a')`
       SELECT id FROM website_contributors 
       WHERE website_id = ${website.id} AND user_id = ${user.id}
     `;
@@ -54,7 +55,7 @@ export async function POST(request: NextRequest) {
 
         if (existingResult.rows.length > 0) {
             // Update existing to be approved
-            await sql`
+            await sqlAt('qa009c1444fc5')`
         UPDATE website_contributors 
         SET is_approved = true, 
             is_active = true, 
@@ -71,7 +72,7 @@ export async function POST(request: NextRequest) {
             contributorId = existingResult.rows[0].id;
         } else {
             // Insert new approved contributor
-            const insertResult = await sql`
+            const insertResult = await sqlAt('qbdcec222c24d')`
         INSERT INTO website_contributors (
           website_id, user_id, writing_price, display_name, bio, 
           specialties, is_active, is_approved, approved_at,
@@ -107,3 +108,5 @@ export async function POST(request: NextRequest) {
         }, { status: 500 });
     }
 }
+
+export const POST = withCachePurge(['website_contributors'], handlePost);
@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { hashPassword, verifyPassword } from '@/lib/password';
 
@@ -55,13 +55,13 @@ export async function POST(request: NextRequest) {
 
         for (const user of testUsers) {
             // Check if user exists
-            const existing = await sql`
+            const existing = await sqlAt('q5f02d1b79c59')`
         SELECT id, email FROM users WHERE email = ${user.email}
       `;
 
             if (existing.rows.length > 0) {
                 // Update password for existing user
-                await sql`
+                await sqlAt('q0e23719fb72d')`
           UPDATE users 
           SET password_hash = ${passwordHash},
               is_buyer = ${user.is_buyer},
@@ -81,7 +81,7 @@ export async function POST(request: NextRequest) {
                 // Create new user
                 const affiliateCode = user.is_affiliate ? `AFF${Date.now().toString(36).toUpperCase()}` : null;
 
-                const result = await sql`
+                const result = await sqlAt('q7edeffba6650')`
           INSERT INTO users (
             email, password_hash, name, 
             is_buyer, is_publisher, is_affiliate,
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 
 
@@ -13,7 +13,7 @@ export async function POST(request: NextRequest) {
         await initializeDatabaseFromContext();
 
         // Website Contributors table
-        await sql`
+        await sqlAt('q89340bb70ac3')`
       CREATE TABLE IF NOT EXISTS website_contributors (
         id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
         website_id TEXT NOT NULL REFERENCES websites(id) ON DELETE CASCADE,
@@ -46,20 +46,20 @@ export async function POST(request: NextRequest) {
     `;
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_website_contributors_website ON website_contributors(website_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_website_contributors_user ON website_contributors(user_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_website_contributors_active ON website_contributors(website_id, is_active, is_approved)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_website_contributors_rating ON website_contributors(website_id, average_rating DESC)`;
+        await sqlAt('q76fdcd9f307e')`CREATE INDEX IF NOT EXISTS idx_website_contributors_website ON website_contributors(website_id)`;
+        await sqlAt('q040d52afd788')`CREATE INDEX IF NOT EXISTS idx_website_contributors_user ON website_contributors(user_id)`;
+        await sqlAt('q40df02aa9afa')`CREATE INDEX IF NOT EXISTS idx_website_contributors_active ON website_contributors(website_id, is_active, is_approved)`;
+        await sqlAt('q6ef9c8519300')`CREATE INDEX IF NOT EXISTS idx_website_contributors_rating ON website_contributors(website_id, average_rating DESC)`;
 
         // Add selected_contributor_id to orders if not exists
         try {
-            await sql`ALTER TABLE orders ADD COLUMN IF NOT EXISTS selected_contributor_id TEXT REFERENCES website_contributors(id)`;
+            await sqlAt('q91d1fd18f3a0')`ALTER TABLE orders ADD COLUMN IF NOT EXISTS selected_contributor_id TEXT REFERENCES website_contributors(id)`;
         } catch {
             // Column may already exist
         }
 
         // Create index for contributor orders
-        await sql`CREATE INDEX IF NOT EXISTS idx_orders_contributor ON orders(selected_contributor_id) WHERE selected_contributor_id IS NOT NULL`;
+        await sqlAt('qd35bc88cd440')`CREATE INDEX IF NOT EXISTS idx_orders_contributor ON orders(selected_contributor_id) WHERE selected_contributor_id IS NOT NULL`;
 
         return NextResponse.json({
             success: true,
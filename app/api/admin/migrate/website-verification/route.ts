@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 
@@ -19,7 +19,7 @@ export async function POST() {
         }
 
         // Update websites table
-        await sql`
+        await sqlAt('q64daf48becf1')`
             ALTER TABLE websites
             ADD COLUMN IF NOT EXISTS ownership_type TEXT DEFAULT 'owner' CHECK (ownership_type IN ('owner', 'contributor')),
             ADD COLUMN IF NOT EXISTS verification_status TEXT DEFAULT 'pending' CHECK (verification_status IN ('pending', 'verified', 'rejected')),
@@ -32,9 +32,9 @@ export async function POST() {
         `;
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_websites_verification_status ON websites(verification_status)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_websites_ownership_type ON websites(ownership_type)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_websites_pending_verification ON websites(verification_status) WHERE verification_status = 'pending'`;
+        await sqlAt('q659e9240895f')`CREATE INDEX IF NOT EXISTS idx_websites_verification_status ON websites(verification_status)`;
+        await sqlAt('q221f8ed3e85b')`CREATE INDEX IF NOT EXISTS idx_websites_ownership_type ON websites(ownership_type)`;
+        await sqlAt('qaa3a72636051')`CREATE INDEX IF NOT EXISTS idx_websites_pending_verification ON websites(verification_status) WHERE verification_status = 'pending'`;
 
         return NextResponse.json({
             success: true,
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 import { z } from 'zod';
@@ -40,7 +40,7 @@ export async function POST(
         const { adminNotes } = result.data;
 
         // Get payout request
-        const payoutResult = await sql`
+        const payoutResult = await sqlAt('qe70875c2b799')`
             SELECT *
             FROM payout_requests
             WHERE id = ${id}
@@ -57,7 +57,7 @@ export async function POST(
         }
 
         // Update payout request
-        await sql`
+        await sqlAt('q8f49d1cad79f')`
             UPDATE payout_requests
             SET 
                 status = 'completed',
@@ -69,7 +69,7 @@ export async function POST(
         `;
 
         // Create transaction record
-        await sql`
+        await sqlAt('q63dad64f9bf6')`
             INSERT INTO transactions (
                 user_id, type, amount, status, description, created_at
             )
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 import { z } from 'zod';
@@ -40,7 +40,7 @@ export async function POST(
         const { reason } = result.data;
 
         // Get payout request
-        const payoutResult = await sql`
+        const payoutResult = await sqlAt('qe70875c2b799')`
             SELECT *
             FROM payout_requests
             WHERE id = ${id}
@@ -57,7 +57,7 @@ export async function POST(
         }
 
         // Update payout request
-        await sql`
+        await sqlAt('qb67bcc6fb734')`
             UPDATE payout_requests
             SET 
                 status = 'rejected',
@@ -69,7 +69,7 @@ export async function POST(
         `;
 
         // Return amount to publisher balance
-        await sql`
+        await sqlAt('qd163617722b0')`
             UPDATE users
             SET publisher_balance = publisher_balance + ${payout.amount}
             WHERE id = ${payout.user_id}
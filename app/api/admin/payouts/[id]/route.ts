@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest } from '@/lib/admin-auth';
 
@@ -22,7 +22,7 @@ export async function GET(
 
         const { id } = await params;
 
-        const result = await sql`
+        const result = await sqlAt('q7bffec26b99c')`
             SELECT 
                 pr.*,
                 u.name as publisher_name,
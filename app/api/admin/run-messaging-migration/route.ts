@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 
 
@@ -16,7 +16,7 @@ export async function GET() {
         await initializeDatabaseFromContext();
 
         // Create conversations table
-        await sql`
+        await sqlAt('qd86c0e6b5ff7')`
             CREATE TABLE IF NOT EXISTS conversations (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 order_id TEXT NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
@@ -29,7 +29,7 @@ export async function GET() {
         `;
 
         // Create messages table
-        await sql`
+        await sqlAt('qd77da72af234')`
             CREATE TABLE IF NOT EXISTS messages (
                 id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                 conversation_id TEXT NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
@@ -41,15 +41,15 @@ export async function GET() {
         `;
 
         // Create indexes
-        await sql`CREATE INDEX IF NOT EXISTS idx_conversations_order ON conversations(order_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_conversations_buyer ON conversations(buyer_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_conversations_publisher ON conversations(publisher_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_messages_sender ON messages(sender_id)`;
-        await sql`CREATE INDEX IF NOT EXISTS idx_messages_read ON messages(is_read)`;
+        await sqlAt('qbcfda8b063d3')`CREATE INDEX IF NOT EXISTS idx_conversations_order ON conversations(order_id)`;
+        await sqlAt('q7ff3bd6a4995')`CREATE INDEX IF NOT EXISTS idx_conversations_buyer ON conversations(buyer_id)`;
+        await sqlAt('q6512acef0e21')`CREATE INDEX IF NOT EXISTS idx_conversations_publisher ON conversations(publisher_id)`;
+        await sqlAt('q9ed721547d26')`CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id)`;
+        await sqlAt('qd774a295a453')`CREATE INDEX IF NOT EXISTS idx_messages_sender ON messages(sender_id)`;
+        await sqlAt('q4f42d3d9299d')`CREATE INDEX IF NOT EXISTS idx_messages_read ON messages(is_read)`;
 
         // Create conversations for existing orders
-        await sql`
+        await sqlAt('q30b9686bebe4')`
             INSERT INTO conversations (order_id, buyer_id, publisher_id)
             SELECT o.id, o.buyer_id, o.publisher_id
             FROM orders o
@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 import { NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { hashPassword, verifyPassword } from '@/lib/password';
 
@@ -23,7 +23,7 @@ export async function POST() {
         const passwordHash = await hashPassword(password);
 
         // Check if admin_users table exists
-        const tableCheck = await sql`
+        const tableCheck = await sqlAt('qd00e1b0e9371')`
             SELECT EXISTS (
                 SELECT FROM information_schema.tables 
                 WHERE table_name = 'admin_users'
@@ -32,7 +32,7 @@ export async function POST() {
 
         if (!tableCheck.rows[0].exists) {
             // Create the admin_users table first
-            await sql`
+            await sqlAt('q8ebf08b04fbb')`
                 CREATE TABLE IF NOT EXISTS admin_users (
                   id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
                   email TEXT UNIQUE NOT NULL,
@@ -50,7 +50,7 @@ export async function POST() {
                 )
             `;
 
-            await sql`
+            await sqlAt('qdff2a66c4a94')`
                 CREATE TABLE IF NOT EXISTS admin_sessions (
                   id TEXT PRIMARY KEY,
                   admin_id TEXT NOT NULL REFERENCES admin_users(id) ON DELETE CASCADE,
@@ -61,13 +61,13 @@ export async function POST() {
                 )
             `;
 
-            await sql`CREATE INDEX IF NOT EXISTS idx_admin_users_email ON admin_users(email)`;
-            await sql`CREATE INDEX IF NOT EXISTS idx_admin_users_role ON admin_users(role)`;
-            await sql`CREATE INDEX IF NOT EXISTS idx_admin_sessions_admin ON admin_sessions(admin_id)`;
+            await sqlAt('qed9b881b5f2f')`CREATE INDEX IF NOT EXISTS idx_admin_users_email ON admin_users(email)`;
+            await sqlAt('qbec084be01ca')`CREATE INDEX IF NOT EXISTS idx_admin_users_role ON admin_users(role)`;
+            await sqlAt('q195b337aa22a')`CREATE INDEX IF NOT EXISTS idx_admin_sessions_admin ON admin_sessions(admin_id)`;
         }
 
         // Use UPSERT to create or update admin user (handles race conditions)
-        const result = await sql`
+        const result = await sqlAt('qf27763a45796')`
             INSERT INTO admin_users (email, password_hash, name, role, is_active)
             VALUES (${email}, ${passwordHash}, ${name}, ${role}, true)
             ON CONFLICT (email) 
@@ -1,9 +1,10 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest, hasPermission } from '@/lib/admin-auth';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
@@ -34,7 +35,7 @@ function createSlug(domain: string): string {
     return domain.toLowerCase().replace(/\./g, '-').replace(/[^a-z0-9-]/g, '');
 }
 
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -71,7 +72,7 @@ export async function POST(request: NextRequest) {
                 }
 
                 // Find owner
-                const ownerResult = await sql`
+                const ownerResult = await sqlAt('q7eeca610e8e3')`
           SELECT id FROM users WHERE email = ${row.owner_email}
         `;
 
@@ -84,7 +85,7 @@ export async function POST(request: NextRequest) {
                 const ownerId = (ownerResult.rows[0] as Record<string, unknown>).id as string;
 
                 // Check if domain exists
-                const existingResult = await sql`
+                const existingResult = await sqlAt('qae9677e74ad5')`
           SELECT id FROM websites WHERE domain = ${row.domain}
         `;
 
@@ -97,7 +98,7 @@ export async function POST(request: NextRequest) {
                 // Get category
                 let categoryId = null;
                 if (row.category) {
-                    const catResult = await sql`
+                    const catResult = await sqlAt('qb18d8677657e')`
             SELECT id FROM categories WHERE slug = ${row.category} OR id = ${row.category}
           `;
                     if (catResult.rows.length > 0) {
@@ -108,7 +109,7 @@ export async function POST(request: NextRequest) {
                 const slug = createSlug(row.domain);
 
                 // Insert website
-                await sql`
+                await sqlAt('q36c5e4241e28')`
           INSERT INTO websites (
             domain, name, slug, owner_id, primary_category_id,
             domain_authority, domain_rating, organic_traffic,
@@ -132,7 +133,7 @@ export async function POST(request: NextRequest) {
         `;
 
                 // Update user to be publisher
-                await sql`
+                await sqlAt('q2c8088c3cc2a')`
           UPDATE users SET is_publisher = true WHERE id = ${ownerId} AND is_publisher = false
         `;
 
@@ -156,3 +157,5 @@ export async function POST(request: NextRequest) {
         );
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
@@ -1,10 +1,11 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateAdminRequest, hasPermission } from '@/lib/admin-auth';
 import { z } from 'zod';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
@@ -26,7 +27,7 @@ function createSlug(domain: string): string {
     return domain.toLowerCase().replace(/\./g, '-').replace(/[^a-z0-9-]/g, '');
 }
 
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -50,7 +51,7 @@ export async function POST(request: NextRequest) {
         const data = result.data;
 
         // Find owner by email
-        const ownerResult = await sql`
+        const ownerResult = await sqlAt('q8490d1ced3c4')`
       SELECT id FROM users WHERE email = ${data.ownerEmail}
     `;
 
@@ -64,7 +65,7 @@ export async function POST(request: NextRequest) {
         const ownerId = (ownerResult.rows[0] as Record<string, unknown>).id as string;
 
         // Check if domain already exists
-        const existingResult = await sql`
+        const existingResult = await sqlAt('qb00466d09968')`
       SELECT id FROM websites WHERE domain = ${data.domain}
     `;
 
@@ -78,7 +79,7 @@ export async function POST(request: NextRequest) {
         // Get category ID
         let categoryId = null;
         if (data.category) {
-            const catResult = await sql`
+            const catResult = await sqlAt('q344cd2ef0bfc')`
         SELECT id FROM categories WHERE slug = ${data.category} OR id = ${data.category}
       `;
             if (catResult.rows.length > 0) {
@@ -89,7 +90,7 @@ export async function POST(request: NextRequest) {
         const slug = createSlug(data.domain);
 
         // Insert website
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('q4f8fbaf1466d')`
       INSERT INTO websites (
         domain, name, slug, owner_id, primary_category_id,
         domain_authority, domain_rating, organic_traffic,
@@ -114,7 +115,7 @@ export async function POST(request: NextRequest) {
     `;
 
         // Update user to be a publisher if not already
-        await sql`
+        await sqlAt('q217b3feb1a94')`
       UPDATE users SET is_publisher = true WHERE id = ${ownerId} AND is_publisher = false
     `;
 
@@ -130,3 +131,5 @@ export async function POST(request: NextRequest) {
         );
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
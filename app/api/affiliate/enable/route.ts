@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -48,7 +48,7 @@ export async function POST() {
         }
 
         // Check if already an affiliate
-        const userResult = await sql`
+        const userResult = await sqlAt('qc2349f23ba74')`
             SELECT is_affiliate, affiliate_code, name FROM users WHERE id = ${user.id}
         `;
 
@@ -75,7 +75,7 @@ export async function POST() {
 
         // Ensure uniqueness
         while (attempts < 10) {
-            const existing = await sql`
+            const existing = await sqlAt('q86fe27a02ae6')`
                 SELECT id FROM users WHERE affiliate_code = ${affiliateCode}
             `;
             if (existing.rows.length === 0) break;
@@ -84,7 +84,7 @@ export async function POST() {
         }
 
         // Enable affiliate and set code
-        await sql`
+        await sqlAt('q2f8c64804af9')`
             UPDATE users 
             SET is_affiliate = true, affiliate_code = ${affiliateCode}, updated_at = ${now}
             WHERE id = ${user.id}
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -29,7 +29,7 @@ export async function GET() {
         }
 
         // Check if user is affiliate
-        const userResult = await sql`
+        const userResult = await sqlAt('q256a31aa3fdd')`
             SELECT is_affiliate FROM users WHERE id = ${user.id}
         `;
 
@@ -38,7 +38,7 @@ export async function GET() {
         }
 
         // Get all referrals with their order stats
-        const referrals = await sql`
+        const referrals = await sqlAt('q1a7e7582a666')`
             SELECT 
                 u.id,
                 u.name,
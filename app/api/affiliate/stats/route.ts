@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -19,7 +19,7 @@ export async function GET() {
         }
 
         // Get user's affiliate data
-        const userResult = await sql`
+        const userResult = await sqlAt('q6ac10f6cd4f0')`
             SELECT affiliate_code, affiliate_balance, is_affiliate, referred_by
             FROM users WHERE id = ${user.id}
         `;
@@ -35,14 +35,14 @@ export async function GET() {
         };
 
         // Count total referrals
-        const referralsResult = await sql`
+        const referralsResult = await sqlAt('qb361d9e321f8')`
             SELECT COUNT(*) as total FROM affiliate_referrals 
             WHERE affiliate_id = ${user.id}
         `;
         const totalReferrals = parseInt((referralsResult.rows[0] as { total: string }).total) || 0;
 
         // Count converted referrals (those who have placed orders)
-        const convertedResult = await sql`
+        const convertedResult = await sqlAt('qf21f156bb44f')`
             SELECT COUNT(DISTINCT ar.referred_user_id) as converted
             FROM affiliate_referrals ar
             JOIN orders o ON o.buyer_id = ar.referred_user_id
@@ -52,7 +52,7 @@ export async function GET() {
         const convertedReferrals = parseInt((convertedResult.rows[0] as { converted: string }).converted) || 0;
 
         // Calculate total earnings from completed orders
-        const earningsResult = await sql`
+        const earningsResult = await sqlAt('qd1b4863101d7')`
             SELECT COALESCE(SUM(o.affiliate_fee), 0) as total_earnings
             FROM orders o
             WHERE o.affiliate_id = ${user.id}
@@ -61,7 +61,7 @@ export async function GET() {
         const totalEarnings = parseInt((earningsResult.rows[0] as { total_earnings: string }).total_earnings) || 0;
 
         // Calculate pending commissions (from unpaid/processing orders)
-        const pendingResult = await sql`
+        const pendingResult = await sqlAt('q4fef2419a711')`
             SELECT COALESCE(SUM(o.affiliate_fee), 0) as pending
             FROM orders o
             WHERE o.affiliate_id = ${user.id}
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { sendPasswordResetEmail } from '@/lib/email';
 import { z } from 'zod';
@@ -51,7 +51,7 @@ export async function POST(request: NextRequest) {
         const { email } = result.data;
 
         // Find user
-        const userResult = await sql`
+        const userResult = await sqlAt('qb1a0f9d3cf60')`
       SELECT id, email, name FROM users WHERE email = ${email}
     `;
 
@@ -63,7 +63,7 @@ export async function POST(request: NextRequest) {
         const user = userResult.rows[0] as Record<string, unknown>;
 
         // Check if a token was created in the last 2 minutes to prevent duplicate emails
-        const recentTokenResult = await sql`
+        const recentTokenResult = await sqlAt('q94f4bd41e5f0')`
       SELECT created_at, token
       FROM password_reset_tokens
       WHERE user_id = ${user.id as string}
@@ -82,10 +82,10 @@ export async function POST(request: NextRequest) {
         const expiresAt = new Date(Date.now() + 60 * 60 * 1000); // 1 hour
 
         // Delete any existing tokens for this user (older than 2 minutes)
-        await sql`DELETE FROM password_reset_tokens WHERE user_id = ${user.id as string}`;
+        await sqlAt('qf30198651035')`DELETE FROM password_reset_tokens WHERE user_id = ${user.id as string}`;
 
         // Save token
-        await sql`
+        await sqlAt('qe0bf55c1700e')`
       INSERT INTO password_reset_tokens (user_id, token, expires_at)
       VALUES (${user.id as string}, ${token}, ${expiresAt.toISOString()})
     `;
@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { verifyPassword } from '@/lib/password';
 import { createToken } from '@/lib/jwt';
@@ -34,7 +34,7 @@ export async function POST(request: NextRequest) {
         const { email, password } = result.data;
 
         // Find user
-        const userResult = await sql`
+        const userResult = await sqlAt('q50e1fc608fb5')`
       SELECT id, email, name, password_hash, is_buyer, is_publisher, is_affiliate, is_active, is_banned
       FROM users 
       WHERE email = ${email}
@@ -80,7 +80,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Update last login
-        await sql`UPDATE users SET last_login_at = ${now} WHERE id = ${user.id as string}`;
+        await sqlAt('q78f2b634034f')`UPDATE users SET last_login_at = ${now} WHERE id = ${user.id as string}`;
 
         // Create JWT token
         console.log('[Login API] Creating JWT token for user:', user.id);
@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { sendPasswordChangedEmail } from '@/lib/email';
 import { hashPassword, verifyPassword } from '@/lib/password';
@@ -33,7 +33,7 @@ export async function POST(request: NextRequest) {
         const { token, password } = result.data;
 
         // Find valid token
-        const tokenResult = await sql`
+        const tokenResult = await sqlAt('qae44e9dd4979')`
       SELECT prt.*, u.email, u.name
       FROM password_reset_tokens prt
       JOIN users u ON prt.user_id = u.id
@@ -55,13 +55,13 @@ export async function POST(request: NextRequest) {
         const passwordHash = await hashPassword(password);
 
         // Update user password
-        await sql`
+        await sqlAt('q1e0ec32f1a4c')`
       UPDATE users SET password_hash = ${passwordHash}, updated_at = ${now}
       WHERE id = ${tokenData.user_id as string}
     `;
 
         // Mark token as used
-        await sql`
+        await sqlAt('q45e8fb4768a4')`
       UPDATE password_reset_tokens SET used_at = ${now}
       WHERE id = ${tokenData.id as string}
     `;
@@ -73,7 +73,7 @@ export async function POST(request: NextRequest) {
         );
 
         // Delete all sessions for this user (security)
-        await sql`DELETE FROM sessions WHERE user_id = ${tokenData.user_id as string}`;
+        await sqlAt('qbc9abd8d8dc4')`DELETE FROM sessions WHERE user_id = ${tokenData.user_id as string}`;
 
         return NextResponse.json({ success: true });
     } catch (error) {
@@ -1,7 +1,7 @@
 export const runtime = 'edge';
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId, boolToInt, intToBool } from '@/lib/db';
+import { sqlAt, generateId, boolToInt, intToBool } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { hashPassword, verifyPassword } from '@/lib/password';
 import { createToken } from '@/lib/jwt';
@@ -42,7 +42,7 @@ export async function POST(request: NextRequest) {
         const { name, email, password, roles } = result.data;
 
         // Check if user exists
-        const existingUser = await sql`SELECT id FROM users WHERE email = ${email}`;
+        const existingUser = await sqlAt('q3a99cfde2b9f')`SELECT id FROM users WHERE email = ${email}`;
         if (existingUser.rows.length > 0) {
             return NextResponse.json(
                 { error: 'An account with this email already exists' },
@@ -62,7 +62,7 @@ export async function POST(request: NextRequest) {
         let referrerId = null;
 
         if (referredBy) {
-            const referrer = await sql`SELECT id FROM users WHERE affiliate_code = ${referredBy}`;
+            const referrer = await sqlAt('qda26372caf89')`SELECT id FROM users WHERE affiliate_code = ${referredBy}`;
             if (referrer.rows.length > 0) {
                 referrerId = referrer.rows[0].id;
             }
@@ -72,7 +72,7 @@ export async function POST(request: NextRequest) {
         const userId = generateId();
 
         // Create user (D1 doesn't support RETURNING, so we insert then fetch)
-        await sql`
+        await sqlAt('qee16213f89a4')`
       INSERT INTO users (
         id, email, password_hash, name,
         is_buyer, is_publisher, is_affiliate,
@@ -86,7 +86,7 @@ export async function POST(request: NextRequest) {
     `;
 
         // Fetch the created user
-        const newUser = await sql`
+        const newUser = await sqlAt('qb403b7d71258')`
       SELECT id, email, name, is_buyer, is_publisher, is_affiliate
       FROM users WHERE id = ${userId}
     `;
@@ -104,7 +104,7 @@ export async function POST(request: NextRequest) {
         // Create affiliate referral record if referred
         if (referrerId) {
             const referralId = generateId();
-            await sql`
+            await sqlAt('qbb6e6f9190e3')`
         INSERT INTO affiliate_referrals (id, affiliate_id, referred_user_id, referral_code)
         VALUES (${referralId}, ${referrerId}, ${user.id}, ${referredBy})
       `;
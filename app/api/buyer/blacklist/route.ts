@@ -1,25 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const now = new Date().toISOString();
-
-    const result = await sql`
-        SELECT s.user_id FROM sessions s
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 // GET /api/buyer/blacklist - List user's blacklisted publishers
 export async function GET() {
     try {
@@ -32,7 +19,7 @@ export async function GET() {
             return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
         }
 
-        const result = await sql`
+        const result = await sqlAt('qdc58c6c45aae')`
             SELECT 
                 b.id,
                 b.website_id,
@@ -74,7 +61,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Check if already blacklisted
-        const existing = await sql`
+        const existing = await sqlAt('qba5e0e8adcd5')`
             SELECT id FROM blacklists 
             WHERE user_id = ${session.user_id} 
             AND (website_id = ${website_id || null} OR domain = ${domain || null})
@@ -87,18 +74,18 @@ export async function POST(request: NextRequest) {
         // Get domain from website if only ID provided
         let actualDomain = domain;
         if (website_id && !domain) {
-            const websiteResult = await sql`SELECT domain FROM websites WHERE id = ${website_id}`;
+            const websiteResult = await sqlAt('qcf886a765680')`SELECT domain FROM websites WHERE id = ${website_id}`;
             actualDomain = websiteResult.rows[0]?.domain;
         }
 
-        const result = await sql`
+        const result = await sqlAt('qd57c9cc990ef')`
             INSERT INTO blacklists (user_id, website_id, domain, reason)
             VALUES (${session.user_id}, ${website_id || null}, ${actualDomain || null}, ${reason || null})
             RETURNING id
         `;
 
         // Log activity
-        await sql`
+        await sqlAt('q1afac1c4ade4')`
             INSERT INTO activity_logs (user_id, action, description, model_type, model_id)
             VALUES (
                 ${session.user_id}, 
@@ -139,7 +126,7 @@ export async function DELETE(request: NextRequest) {
             return NextResponse.json({ error: 'ID or website_id required' }, { status: 400 });
         }
 
-        const result = await sql`
+        const result = await sqlAt('q91d2f3a5e148')`
             DELETE FROM blacklists 
             WHERE user_id = ${session.user_id} 
             AND (id = ${id || ''} OR website_id = ${website_id || ''})
@@ -1,25 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-  `;
-    return result.rows[0] || null;
-}
-
 export async function GET(
     request: NextRequest,
     { params }: { params: Promise<{ id: string }> }
@@ -37,7 +24,7 @@ export async function GET(
         const { id } = await params;
 
         // Get campaign details
-        const campaignResult = await sql`
+        const campaignResult = await sqlAt('q007c2c722a1e')`
       SELECT * FROM campaigns WHERE id = ${id} AND buyer_id = ${session.user_id as string}
     `;
 
@@ -46,7 +33,7 @@ export async function GET(
         }
 
         // Get orders in this campaign
-        const ordersResult = await sql`
+        const ordersResult = await sqlAt('qf6b160a57a72')`
         SELECT 
             o.id, o.order_type, o.status, o.total_amount, o.created_at, 
             w.domain as website_domain
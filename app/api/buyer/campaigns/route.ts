@@ -1,25 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > '${now}'
-  `;
-    return result.rows[0] || null;
-}
-
 export async function GET(request: NextRequest) {
     try {
         // Initialize D1 database
@@ -35,14 +22,14 @@ export async function GET(request: NextRequest) {
         const id = searchParams.get('id');
 
         if (id) {
-            const campaignResult = await sql`
+            const campaignResult = await sqlAt('q45ae8e65f76d')`
         SELECT * FROM campaigns WHERE id = ${id} AND buyer_id = ${session.user_id as string}
       `;
             if (campaignResult.rows.length === 0) return NextResponse.json({ error: 'Not found' }, { status: 404 });
             return NextResponse.json(campaignResult.rows[0]);
         }
 
-        const result = await sql`
+        const result = await sqlAt('q9044d089e234')`
       SELECT c.*, COUNT(o.id) as order_count 
       FROM campaigns c
       LEFT JOIN orders o ON c.id = o.campaign_id
@@ -75,7 +62,7 @@ export async function POST(request: NextRequest) {
             return NextResponse.json({ error: 'Campaign name is required' }, { status: 400 });
         }
 
-        const result = await sql`
+        const result = await sqlAt('qb52330215027')`
       INSERT INTO campaigns (buyer_id, name, url)
       VALUES (${session.user_id as string}, ${name}, ${url})
       RETURNING *
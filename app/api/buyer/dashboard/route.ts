@@ -1,28 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-// Helper to get session
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const now = new Date().toISOString();
-    const result = await sql`
-        SELECT s.user_id, u.name, u.email, u.is_buyer
-        FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 // GET /api/buyer/dashboard - Get dashboard data
 export async function GET() {
     try {
@@ -37,7 +21,7 @@ export async function GET() {
         const userId = session.user_id as string;
 
         // Get order stats by status (mapped to 6 simplified categories)
-        const orderStatsResult = await sql`
+        const orderStatsResult = await sqlAt('qac4db473e698')`
             SELECT 
                 COUNT(*) FILTER (WHERE status = 'pending') as not_started,
                 COUNT(*) FILTER (WHERE status IN ('accepted', 'writing')) as in_progress,
@@ -52,7 +36,7 @@ export async function GET() {
         `;
 
         // Get balance info
-        const balanceResult = await sql`
+        const balanceResult = await sqlAt('q16f82f0dfa2e')`
             SELECT 
                 buyer_balance as main,
                 COALESCE(balance_reserved, 0) as reserved,
@@ -62,7 +46,7 @@ export async function GET() {
         `;
 
         // Get recent activity (last 10 items)
-        const activityResult = await sql`
+        const activityResult = await sqlAt('q87639a2b5058')`
             SELECT id, action, description, model_type, model_id, created_at
             FROM activity_logs
             WHERE user_id = ${userId}
@@ -71,7 +55,7 @@ export async function GET() {
         `;
 
         // Get recent orders (last 5)
-        const recentOrdersResult = await sql`
+        const recentOrdersResult = await sqlAt('qf72a4e7e9feb')`
             SELECT 
                 o.id, o.order_number, o.order_type, o.status, o.total_amount, o.created_at,
                 w.domain as website_domain, w.domain_authority as website_da,
@@ -85,12 +69,12 @@ export async function GET() {
         `;
 
         // Get projects count
-        const projectsResult = await sql`
+        const projectsResult = await sqlAt('qcbc89bdf3b94')`
             SELECT COUNT(*) as count FROM projects WHERE user_id = ${userId} AND is_active = 1
         `;
 
         // Get unread notifications count
-        const notificationsResult = await sql`
+        const notificationsResult = await sqlAt('q4b551f14f500')`
             SELECT COUNT(*) as count FROM notifications WHERE user_id = ${userId} AND is_read = 0
         `;
 
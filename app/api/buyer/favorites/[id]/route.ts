@@ -1,25 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const result = await sql`
-        SELECT s.user_id FROM sessions s
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 // DELETE /api/buyer/favorites/[id] - Remove a favorite
 export async function DELETE(
     request: NextRequest,
@@ -38,7 +25,7 @@ export async function DELETE(
         const { id } = await params;
 
         // Check if it's a favorite ID or website ID and handle both
-        const result = await sql`
+        const result = await sqlAt('qd36bd792386f')`
             DELETE FROM favorites 
             WHERE user_id = ${session.user_id} 
             AND (id = ${id} OR website_id = ${id})
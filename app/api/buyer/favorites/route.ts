@@ -1,25 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const now = new Date().toISOString();
-    const result = await sql`
-        SELECT s.user_id FROM sessions s
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 // GET /api/buyer/favorites - List user's favorites
 export async function GET() {
     try {
@@ -31,7 +18,7 @@ export async function GET() {
             return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
         }
 
-        const result = await sql`
+        const result = await sqlAt('q220ca7d7aa2a')`
             SELECT 
                 f.id,
                 f.website_id,
@@ -75,7 +62,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Check if already exists
-        const existing = await sql`
+        const existing = await sqlAt('q123d833f01d4')`
             SELECT id FROM favorites 
             WHERE user_id = ${session.user_id} AND website_id = ${website_id}
         `;
@@ -85,7 +72,7 @@ export async function POST(request: NextRequest) {
         }
 
         const favoriteId = generateId();
-        await sql`
+        await sqlAt('q76aadc77bdc2')`
             INSERT INTO favorites (id, user_id, website_id, notes)
             VALUES (${favoriteId}, ${session.user_id}, ${website_id}, ${notes || null})
         `;
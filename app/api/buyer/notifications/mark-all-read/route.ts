@@ -1,28 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-// Helper to get session
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const result = await sql`
-        SELECT s.user_id, u.name, u.email
-        FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > '${now}'
-    `;
-    return result.rows[0] || null;
-}
-
 // PUT /api/buyer/notifications/mark-all-read - Mark all notifications as read
 export async function PUT() {
     try {
@@ -37,7 +21,7 @@ export async function PUT() {
 
         const userId = session.user_id as string;
 
-        const result = await sql`
+        const result = await sqlAt('qdaf3b8878d0a')`
             UPDATE notifications
             SET is_read = 1, read_at = ${now}
             WHERE user_id = ${userId} AND is_read = 0
@@ -1,28 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt, decodeCursor, nextCursor } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-// Helper to get session
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const result = await sql`
-        SELECT s.user_id, u.name, u.email
-        FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > '${now}'
-    `;
-    return result.rows[0] || null;
-}
-
 // GET /api/buyer/notifications - List notifications
 export async function GET(request: NextRequest) {
     try {
@@ -37,41 +21,42 @@ export async function GET(request: NextRequest) {
 
         const userId = session.user_id as string;
         const { searchParams } = new URL(request.url);
-        const page = parseInt(searchParams.get('page') || '1');
         const perPage = parseInt(searchParams.get('per_page') || '20');
         const unreadOnly = searchParams.get('unread_only') === 'true';
 
-        const offset = (page - 1) * perPage;
+        const after = decodeCursor(searchParams.get('cursor'));
 
         let notifications;
         let totalCount;
 
         if (unreadOnly) {
-            notifications = await sql`
+            notifications = await sqlAt('q03ef4337752a')`
                 SELECT * FROM notifications
                 WHERE user_id = ${userId} AND is_read = 0
-                ORDER BY created_at DESC
-                LIMIT ${perPage} OFFSET ${offset}
+                AND (created_at, id) < (COALESCE(${after.createdAt}, '~'), COALESCE(${after.id}, '~'))
+                ORDER BY created_at DESC, id DESC
+                LIMIT ${perPage}
             `;
-            totalCount = await sql`
+            totalCount = await sqlAt('qcdd4d93997db')`
                 SELECT COUNT(*) as count FROM notifications
                 WHERE user_id = ${userId} AND is_read = 0
             `;
         } else {
-            notifications = await sql`
+            notifications = await sqlAt('qc781bb84bba0')`
                 SELECT * FROM notifications
                 WHERE user_id = ${userId}
-                ORDER BY created_at DESC
-                LIMIT ${perPage} OFFSET ${offset}
+                AND (created_at, id) < (COALESCE(${after.createdAt}, '~'), COALESCE(${after.id}, '~'))
+                ORDER BY created_at DESC, id DESC
+                LIMIT ${perPage}
             `;
-            totalCount = await sql`
+            totalCount = await sqlAt('q02a4d06c1032')`
                 SELECT COUNT(*) as count FROM notifications
                 WHERE user_id = ${userId}
             `;
         }
 
         // Get unread count
-        const unreadResult = await sql`
+        const unreadResult = await sqlAt('qf3292119ef97')`
             SELECT COUNT(*) as count FROM notifications
             WHERE user_id = ${userId} AND is_read = 0
         `;
@@ -79,10 +64,10 @@ export async function GET(request: NextRequest) {
         return NextResponse.json({
             notifications: notifications.rows,
             pagination: {
-                page,
                 per_page: perPage,
                 total: parseInt(totalCount.rows[0]?.count as string) || 0,
                 total_pages: Math.ceil((parseInt(totalCount.rows[0]?.count as string) || 0) / perPage),
+                next_cursor: nextCursor(notifications.rows, perPage),
             },
             unread_count: parseInt(unreadResult.rows[0]?.count as string) || 0,
         });
@@ -1,29 +1,13 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
 import { z } from 'zod';
+import { getSession } from '@/lib/auth';
 
 
 
-// Helper to get session
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const result = await sql`
-        SELECT s.user_id, u.name, u.email, u.is_buyer
-        FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 // Validation schema
 const updateProjectSchema = z.object({
     name: z.string().min(1).max(100).optional(),
@@ -49,7 +33,7 @@ export async function GET(
         const { id } = await params;
         const userId = session.user_id as string;
 
-        const projectResult = await sql`
+        const projectResult = await sqlAt('qd1705e318fb6')`
             SELECT 
                 p.*,
                 COUNT(DISTINCT o.id) as order_count,
@@ -105,7 +89,7 @@ export async function PUT(
         }
 
         // Check ownership
-        const projectCheck = await sql`
+        const projectCheck = await sqlAt('q4da9a885c912')`
             SELECT id FROM projects WHERE id = ${id} AND user_id = ${userId}
         `;
         if (projectCheck.rows.length === 0) {
@@ -125,7 +109,7 @@ export async function PUT(
             }
         }
 
-        const updated = await sql`
+        const updated = await sqlAt('qce555d5fbeb2')`
             UPDATE projects
             SET 
                 name = COALESCE(${name || null}, name),
@@ -166,7 +150,7 @@ export async function DELETE(
         const userId = session.user_id as string;
 
         // Soft delete (set is_active = false)
-        const result = await sql`
+        const result = await sqlAt('q1f54fab14ae6')`
             UPDATE projects
             SET is_active = 0, updated_at = NOW()
             WHERE id = ${id} AND user_id = ${userId}
@@ -178,7 +162,7 @@ export async function DELETE(
         }
 
         // Log activity
-        await sql`
+        await sqlAt('qf7573b662da4')`
             INSERT INTO activity_logs (user_id, action, description, model_type, model_id)
             VALUES (${userId}, 'project_deleted', ${'Deleted project: ' + result.rows[0].name}, 'project', ${id})
         `;
@@ -1,29 +1,13 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
 import { z } from 'zod';
+import { getSession } from '@/lib/auth';
 
 
 
-// Helper to get session
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const result = await sql`
-        SELECT s.user_id, u.name, u.email, u.is_buyer
-        FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > '${now}'
-    `;
-    return result.rows[0] || null;
-}
-
 // Validation schema
 const createProjectSchema = z.object({
     name: z.string().min(1).max(100),
@@ -49,7 +33,7 @@ export async function GET(request: NextRequest) {
 
         let projects;
         if (includeStats) {
-            projects = await sql`
+            projects = await sqlAt('q5f77c79ea643')`
                 SELECT 
                     p.*,
                     COUNT(DISTINCT o.id) as order_count,
@@ -62,7 +46,7 @@ export async function GET(request: NextRequest) {
                 ORDER BY p.created_at DESC
             `;
         } else {
-            projects = await sql`
+            projects = await sqlAt('q12e32caac6dd')`
                 SELECT * FROM projects 
                 WHERE user_id = ${userId} AND is_active = 1
                 ORDER BY created_at DESC
@@ -115,14 +99,14 @@ export async function POST(request: NextRequest) {
         }
 
         // Create project
-        const project = await sql`
+        const project = await sqlAt('q16d922e61027')`
             INSERT INTO projects (user_id, name, url, description, favicon)
             VALUES (${userId}, ${name}, ${url}, ${description || null}, ${favicon})
             RETURNING *
         `;
 
         // Log activity
-        await sql`
+        await sqlAt('q91b903b8117a')`
             INSERT INTO activity_logs (user_id, action, description, model_type, model_id)
             VALUES (${userId}, 'project_created', ${'Created project: ' + name}, 'project', ${project.rows[0].id})
         `;
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -23,7 +23,7 @@ export async function POST(
         const { id } = await params;
 
         // Verify user has access to this conversation
-        const conversationCheck = await sql`
+        const conversationCheck = await sqlAt('q210a503ebddf')`
             SELECT buyer_id, publisher_id
             FROM conversations
             WHERE id = ${id}
@@ -39,7 +39,7 @@ export async function POST(
         }
 
         // Mark all messages in this conversation as read (except user's own messages)
-        await sql`
+        await sqlAt('qc8981e008b06')`
             UPDATE messages
             SET is_read = 1
             WHERE conversation_id = ${id}
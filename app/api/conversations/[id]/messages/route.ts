@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 import { z } from 'zod';
@@ -33,7 +33,7 @@ export async function GET(
         const before = searchParams.get('before'); // For pagination
 
         // Verify user has access to this conversation
-        const conversationCheck = await sql`
+        const conversationCheck = await sqlAt('q210a503ebddf')`
             SELECT buyer_id, publisher_id
             FROM conversations
             WHERE id = ${id}
@@ -50,7 +50,7 @@ export async function GET(
 
         // Get messages - build query based on pagination
         const result = before
-            ? await sql`
+            ? await sqlAt('q841a12704484')`
                 SELECT 
                     m.*,
                     u.name as sender_name,
@@ -62,7 +62,7 @@ export async function GET(
                 ORDER BY m.created_at DESC
                 LIMIT ${limit}
             `
-            : await sql`
+            : await sqlAt('qde19aa4b60e8')`
                 SELECT 
                     m.*,
                     u.name as sender_name,
@@ -118,7 +118,7 @@ export async function POST(
         const { message, attachments } = result.data;
 
         // Verify user has access to this conversation
-        const conversationCheck = await sql`
+        const conversationCheck = await sqlAt('q210a503ebddf')`
             SELECT buyer_id, publisher_id
             FROM conversations
             WHERE id = ${id}
@@ -137,7 +137,7 @@ export async function POST(
         const messageId = generateId();
         const now = new Date().toISOString();
 
-        await sql`
+        await sqlAt('q9bf3a93e94c8')`
             INSERT INTO messages (
                 id, conversation_id, sender_id, message, created_at
             )
@@ -147,10 +147,10 @@ export async function POST(
         `;
 
         // Fetch the created message
-        const messageResult = await sql`SELECT * FROM messages WHERE id = ${messageId}`;
+        const messageResult = await sqlAt('q9a1baef29607')`SELECT * FROM messages WHERE id = ${messageId}`;
 
         // Update conversation last_message_at
-        await sql`
+        await sqlAt('qa02dadc4c838')`
             UPDATE conversations
             SET last_message_at = ${now}
             WHERE id = ${id}
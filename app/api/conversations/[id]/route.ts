@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -23,7 +23,7 @@ export async function GET(
         const { id } = await params;
 
         // Get conversation with order details
-        const result = await sql`
+        const result = await sqlAt('q96fa5b12b428')`
             SELECT 
                 c.*,
                 o.order_number,
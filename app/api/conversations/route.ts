@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, intToBool } from '@/lib/db';
+import { sqlAt, intToBool } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -19,7 +19,7 @@ export async function GET(request: NextRequest) {
         }
 
         // Get conversations where user is buyer or publisher
-        const result = await sql`
+        const result = await sqlAt('qe19a03af1507')`
             SELECT 
                 c.*,
                 o.order_number,
@@ -79,7 +79,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Get order details
-        const orderResult = await sql`
+        const orderResult = await sqlAt('q88a1a15762e0')`
             SELECT buyer_id, publisher_id
             FROM orders
             WHERE id = ${orderId}
@@ -102,7 +102,7 @@ export async function POST(request: NextRequest) {
 
         // Try to insert, if conflict just select existing
         try {
-            await sql`
+            await sqlAt('q791c14524697')`
                 INSERT INTO conversations (
                     id, order_id, buyer_id, publisher_id, created_at
                 )
@@ -115,7 +115,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Fetch the conversation
-        const conversationResult = await sql`
+        const conversationResult = await sqlAt('qae1ff1ec1d53')`
             SELECT * FROM conversations WHERE order_id = ${orderId}
         `;
 
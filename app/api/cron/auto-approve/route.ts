@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 
 
@@ -31,7 +31,7 @@ export async function GET(request: NextRequest) {
         // 1. Status = 'published'
         // 2. buyer_confirmation_deadline has passed
         // 3. buyer hasn't confirmed or rejected
-        const ordersResult = await sql`
+        const ordersResult = await sqlAt('qe732a17fc01f')`
             SELECT 
                 o.*,
                 p.publisher_balance,
@@ -51,7 +51,7 @@ export async function GET(request: NextRequest) {
         for (const order of orders) {
             try {
                 // Auto-complete the order
-                await sql`
+                await sqlAt('q8f7b56697fa7')`
                     UPDATE orders 
                     SET 
                         status = 'completed',
@@ -69,14 +69,14 @@ export async function GET(request: NextRequest) {
                 const currentPublisherBalance = (order.publisher_balance as number) || 0;
                 const newPublisherBalance = currentPublisherBalance + publisherEarnings;
 
-                await sql`
+                await sqlAt('qb747fd6a8310')`
                     UPDATE users 
                     SET publisher_balance = ${newPublisherBalance}, updated_at = ${now}
                     WHERE id = ${publisherId}
                 `;
 
                 // Record publisher transaction
-                await sql`
+                await sqlAt('qee6f1f1e96c6')`
                     INSERT INTO transactions (
                         id, user_id, type, amount,
                         balance_type, balance_before, balance_after,
@@ -104,13 +104,13 @@ export async function GET(request: NextRequest) {
                     const currentContributorBalance = (order.contributor_balance as number) || 0;
                     const newContributorBalance = currentContributorBalance + contributorEarnings;
 
-                    await sql`
+                    await sqlAt('q7e6dec8b1cac')`
                         UPDATE users 
                         SET contributor_balance = ${newContributorBalance}, updated_at = ${now}
                         WHERE id = ${contributorId}
                     `;
 
-                    await sql`
+                    await sqlAt('q64791e3f02aa')`
                         INSERT INTO transactions (
                             id, user_id, type, amount,
                             balance_type, balance_before, balance_after,
@@ -1,12 +1,13 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
+import { withEdgeCache } from '@/lib/edge-cache';
 
 
 
-export async function GET(
+async function handleGet(
     request: NextRequest,
     { params }: { params: Promise<{ id: string }> }
 ) {
@@ -16,7 +17,7 @@ export async function GET(
 
         const { id } = await params;
 
-        const result = await sql`
+        const result = await sqlAt('q69b8ca70cebe')`
       SELECT 
         w.*,
         c.name as category
@@ -32,7 +33,7 @@ export async function GET(
         const website = result.rows[0];
 
         // Fetch active, approved contributors for this website
-        const contributorsResult = await sql`
+        const contributorsResult = await sqlAt('qc90d66b66223')`
           SELECT 
             wc.id,
             wc.user_id,
@@ -64,3 +65,5 @@ export async function GET(
         return NextResponse.json({ error: 'Failed to fetch website' }, { status: 500 });
     }
 }
+
+export const GET = withEdgeCache('/api/marketplace/[id]', handleGet);
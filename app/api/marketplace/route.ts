@@ -1,12 +1,13 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, intToBool } from '@/lib/db';
+import { sqlAt, intToBool, ftsMatch, ftsShortTerm } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
+import { withEdgeCache } from '@/lib/edge-cache';
 
 
 
-export async function GET(request: NextRequest) {
+async function handleGet(request: NextRequest) {
     // Initialize D1 database
     await initializeDatabaseFromContext();
 
@@ -33,7 +34,7 @@ export async function GET(request: NextRequest) {
 
         // Use a simpler approach that works with tagged template literals
         // Get websites with filters applied
-        const result = await sql`
+        const result = await sqlAt('qe330a8768870')`
             SELECT 
                 w.id, w.domain, w.name, w.description,
                 w.domain_authority, w.domain_rating, w.organic_traffic,
@@ -57,9 +58,7 @@ export async function GET(request: NextRequest) {
             WHERE w.is_active = true
             AND (
                 ${search} = '' 
-                OR w.domain ILIKE ${'%' + search + '%'} 
-                OR w.name ILIKE ${'%' + search + '%'}
-                OR c.name ILIKE ${'%' + search + '%'}
+                OR (w.rowid IN (SELECT rowid FROM websites_fts WHERE websites_fts MATCH ${ftsMatch(search, ['domain', 'name'])} UNION SELECT rowid FROM websites WHERE ${ftsShortTerm(search)} AND (domain LIKE ${'%' + search + '%'} OR name LIKE ${'%' + search + '%'})) OR c.rowid IN (SELECT rowid FROM categories_fts WHERE categories_fts MATCH ${ftsMatch(search, ['name'])} UNION SELECT rowid FROM categories WHERE ${ftsShortTerm(search)} AND name LIKE ${'%' + search + '%'}))
             )
             AND (${category} = '' OR c.slug = ${category})
             AND (${linkTypes.length === 0} OR w.link_type = ANY(${linkTypes.length > 0 ? linkTypes : ['dofollow', 'nofollow', 'sponsored']}))
@@ -98,16 +97,14 @@ export async function GET(request: NextRequest) {
         `;
 
         // Get total count
-        const countResult = await sql`
+        const countResult = await sqlAt('q799ac85e4690')`
             SELECT COUNT(*) as count
             FROM websites w
             LEFT JOIN categories c ON w.primary_category_id = c.id
             WHERE w.is_active = true
             AND (
                 ${search} = '' 
-                OR w.domain ILIKE ${'%' + search + '%'} 
-                OR w.name ILIKE ${'%' + search + '%'}
-                OR c.name ILIKE ${'%' + search + '%'}
+                OR (w.rowid IN (SELECT rowid FROM websites_fts WHERE websites_fts MATCH ${ftsMatch(search, ['domain', 'name'])} UNION SELECT rowid FROM websites WHERE ${ftsShortTerm(search)} AND (domain LIKE ${'%' + search + '%'} OR name LIKE ${'%' + search + '%'})) OR c.rowid IN (SELECT rowid FROM categories_fts WHERE categories_fts MATCH ${ftsMatch(search, ['name'])} UNION SELECT rowid FROM categories WHERE ${ftsShortTerm(search)} AND name LIKE ${'%' + search + '%'}))
             )
             AND (${category} = '' OR c.slug = ${category})
             AND (${linkTypes.length === 0} OR w.link_type = ANY(${linkTypes.length > 0 ? linkTypes : ['dofollow', 'nofollow', 'sponsored']}))
@@ -149,3 +146,5 @@ export async function GET(request: NextRequest) {
         }, { status: 500 });
     }
 }
+
+export const GET = withEdgeCache('/api/marketplace', handleGet);
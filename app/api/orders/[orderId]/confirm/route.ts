@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -24,7 +24,7 @@ export async function POST(
         const { orderId } = await params;
 
         // Get order and verify ownership
-        const orderResult = await sql`
+        const orderResult = await sqlAt('q11dc548e50d4')`
             SELECT * FROM orders 
             WHERE id = ${orderId} AND buyer_id = ${user.id}
         `;
@@ -45,7 +45,7 @@ export async function POST(
 
         // Update order to completed
         const now = new Date().toISOString();
-        await sql`
+        await sqlAt('q4f8ac3155a68')`
             UPDATE orders
             SET
                 status = 'completed',
@@ -62,14 +62,14 @@ export async function POST(
         const publisherId = order.publisher_id as string;
 
         // Get current publisher balance
-        const publisherResult = await sql`
+        const publisherResult = await sqlAt('q2c9c1657b075')`
             SELECT publisher_balance FROM users WHERE id = ${publisherId}
         `;
         const currentBalance = (publisherResult.rows[0]?.publisher_balance as number) || 0;
         const newBalance = currentBalance + publisherEarnings;
 
         // Update publisher balance
-        await sql`
+        await sqlAt('q3022e5a9bd71')`
             UPDATE users
             SET publisher_balance = ${newBalance}, updated_at = ${now}
             WHERE id = ${publisherId}
@@ -77,7 +77,7 @@ export async function POST(
 
         // Record transaction
         const transactionId = generateId();
-        await sql`
+        await sqlAt('q60acf35de6e5')`
             INSERT INTO transactions (
                 id, user_id, type, amount,
                 balance_type, balance_before, balance_after,
@@ -103,20 +103,20 @@ export async function POST(
             const contributorId = order.contributor_id as string;
             const contributorEarnings = order.contributor_earnings as number;
 
-            const contributorResult = await sql`
+            const contributorResult = await sqlAt('q00c038f9eeb1')`
                 SELECT contributor_balance FROM users WHERE id = ${contributorId}
             `;
             const contributorCurrentBalance = (contributorResult.rows[0]?.contributor_balance as number) || 0;
             const contributorNewBalance = contributorCurrentBalance + contributorEarnings;
 
-            await sql`
+            await sqlAt('q480819707865')`
                 UPDATE users
                 SET contributor_balance = ${contributorNewBalance}, updated_at = ${now}
                 WHERE id = ${contributorId}
             `;
 
             const contributorTransactionId = generateId();
-            await sql`
+            await sqlAt('q0b15777d2efa')`
                 INSERT INTO transactions (
                     id, user_id, type, amount,
                     balance_type, balance_before, balance_after,
@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -41,7 +41,7 @@ export async function POST(
         }
 
         // Get order and verify user is buyer or publisher
-        const orderResult = await sql`
+        const orderResult = await sqlAt('q0ada2b0bdfd8')`
             SELECT * FROM orders WHERE id = ${orderId}
         `;
 
@@ -89,7 +89,7 @@ export async function POST(
         }
 
         // Check if there's already an open dispute
-        const existingDispute = await sql`
+        const existingDispute = await sqlAt('qb7a00f126d40')`
             SELECT id FROM disputes 
             WHERE order_id = ${orderId} AND status IN ('open', 'under_review', 'awaiting_response')
         `;
@@ -106,7 +106,7 @@ export async function POST(
         const now = new Date().toISOString();
         const evidenceUrlsJson = JSON.stringify(evidenceUrls);
 
-        await sql`
+        await sqlAt('qb89982ca9509')`
             INSERT INTO disputes (
                 id, order_id, raised_by, raised_by_role,
                 reason, description, evidence_urls,
@@ -125,10 +125,10 @@ export async function POST(
         `;
 
         // Fetch the created dispute
-        const disputeResult = await sql`SELECT * FROM disputes WHERE id = ${disputeId}`;
+        const disputeResult = await sqlAt('qf46c5f32a854')`SELECT * FROM disputes WHERE id = ${disputeId}`;
 
         // Update order status to disputed
-        await sql`
+        await sqlAt('q6ef5eac99c17')`
             UPDATE orders
             SET status = 'disputed', updated_at = ${now}
             WHERE id = ${orderId}
@@ -165,7 +165,7 @@ export async function GET(
         const { orderId } = await params;
 
         // Verify user is buyer or publisher of this order
-        const orderResult = await sql`
+        const orderResult = await sqlAt('q20bf1fd04c20')`
             SELECT buyer_id, publisher_id FROM orders WHERE id = ${orderId}
         `;
 
@@ -179,7 +179,7 @@ export async function GET(
         }
 
         // Get disputes for this order
-        const disputesResult = await sql`
+        const disputesResult = await sqlAt('qff920ea52de0')`
             SELECT d.*, u.name as raised_by_name
             FROM disputes d
             JOIN users u ON d.raised_by = u.id
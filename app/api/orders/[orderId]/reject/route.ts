@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 
@@ -33,7 +33,7 @@ export async function POST(
         }
 
         // Get order and verify ownership
-        const orderResult = await sql`
+        const orderResult = await sqlAt('q11dc548e50d4')`
             SELECT * FROM orders 
             WHERE id = ${orderId} AND buyer_id = ${user.id}
         `;
@@ -54,7 +54,7 @@ export async function POST(
 
         // Update order to revision_needed
         const now = new Date().toISOString();
-        await sql`
+        await sqlAt('qc7b9d1a1c0cc')`
             UPDATE orders
             SET
                 status = 'revision_needed',
@@ -66,7 +66,7 @@ export async function POST(
         `;
 
         // Create a message in the conversation to notify publisher
-        const conversationResult = await sql`
+        const conversationResult = await sqlAt('q89e7127c0061')`
             SELECT id FROM conversations WHERE order_id = ${orderId}
         `;
 
@@ -74,7 +74,7 @@ export async function POST(
             const conversationId = conversationResult.rows[0].id;
             const messageId = generateId();
 
-            await sql`
+            await sqlAt('qb33c8e26c3de')`
                 INSERT INTO messages (
                     id, conversation_id, sender_id, message, created_at
                 ) VALUES (
@@ -86,7 +86,7 @@ export async function POST(
                 )
             `;
 
-            await sql`
+            await sqlAt('qa9996c7045dd')`
                 UPDATE conversations
                 SET last_message_at = ${now}
                 WHERE id = ${conversationId}
@@ -1,27 +1,15 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { cookies } from 'next/headers';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { sendEmail } from '@/lib/email';
+import { getSession } from '@/lib/auth';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const now = new Date().toISOString();
-    const result = await sql`
-        SELECT s.*, u.* FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
-export async function POST(
+async function handlePost(
     request: NextRequest,
     { params }: { params: Promise<{ orderId: string }> }
 ) {
@@ -46,7 +34,7 @@ export async function POST(
         }
 
         // Get order and verify ownership
-        const orderResult = await sql`
+        const orderResult = await sqlAt('qa2b6833630d7')`
             SELECT o.*, w.domain as website_domain, w.id as website_id,
                    p.email as publisher_email, p.name as publisher_name
             FROM orders o
@@ -84,7 +72,7 @@ export async function POST(
 
         // Update order with review
         const now = new Date().toISOString();
-        await sql`
+        await sqlAt('q560e502d9dda')`
             UPDATE orders
             SET buyer_rating = ${rating},
                 buyer_review = ${review || null},
@@ -93,7 +81,7 @@ export async function POST(
         `;
 
         // Get all ratings for this website to calculate average
-        const ratingsResult = await sql`
+        const ratingsResult = await sqlAt('qdf1282e3151d')`
             SELECT buyer_rating FROM orders
             WHERE website_id = ${order.website_id}
             AND buyer_rating IS NOT NULL
@@ -104,7 +92,7 @@ export async function POST(
         const ratingCount = ratings.length;
 
         // Update website average rating
-        await sql`
+        await sqlAt('q49c76820b850')`
             UPDATE websites
             SET average_rating = ${Math.round(avgRating * 10) / 10},
                 rating_count = ${ratingCount}
@@ -151,7 +139,7 @@ export async function GET(
 
         const { orderId } = await params;
 
-        const result = await sql`
+        const result = await sqlAt('q7cf17a262255')`
             SELECT buyer_rating, buyer_review, reviewed_at
             FROM orders
             WHERE id = ${orderId}
@@ -176,3 +164,5 @@ export async function GET(
         );
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
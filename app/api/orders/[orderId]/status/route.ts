@@ -1,31 +1,17 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
 import {
 
     sendOrderAcceptedBuyerEmail,
     sendOrderCompletedBuyerEmail,
     sendOrderCancelledPublisherEmail
 } from '@/lib/email';
+import { getSession } from '@/lib/auth';
 
 
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const now = new Date().toISOString();
-    const result = await sql`
-        SELECT s.*, u.* FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 /**
  * PATCH /api/orders/[orderId]/status
  * Update order status and send appropriate emails
@@ -57,7 +43,7 @@ export async function PATCH(
         }
 
         // Get order with buyer and publisher info
-        const orderResult = await sql`
+        const orderResult = await sqlAt('q5a0eef9b9992')`
             SELECT 
                 o.*,
                 buyer.email as buyer_email,
@@ -99,7 +85,7 @@ export async function PATCH(
         const now = new Date().toISOString();
 
         if (status === 'accepted') {
-            await sql`
+            await sqlAt('qe8b362e25a00')`
                 UPDATE orders SET status = ${status}, accepted_at = ${now}, updated_at = ${now}
                 WHERE id = ${orderId}
             `;
@@ -108,7 +94,7 @@ export async function PATCH(
             const confirmDeadline = new Date(Date.now() + 3 * 24 * 60 * 60 * 1000).toISOString();
             const disputeDeadline = new Date(Date.now() + 90 * 24 * 60 * 60 * 1000).toISOString();
 
-            await sql`
+            await sqlAt('q0c39c5db9039')`
                 UPDATE orders SET
                     status = ${status},
                     article_url = ${publishedUrl || null},
@@ -119,17 +105,17 @@ export async function PATCH(
                 WHERE id = ${orderId}
             `;
         } else if (status === 'completed') {
-            await sql`
+            await sqlAt('qe5a4d2a60888')`
                 UPDATE orders SET status = ${status}, completed_at = ${now}, updated_at = ${now}
                 WHERE id = ${orderId}
             `;
         } else if (status === 'cancelled') {
-            await sql`
+            await sqlAt('q638727f00aa5')`
                 UPDATE orders SET status = ${status}, cancellation_reason = ${reason || null}, cancelled_at = ${now}, updated_at = ${now}
                 WHERE id = ${orderId}
             `;
         } else {
-            await sql`
+            await sqlAt('qddad7bd78190')`
                 UPDATE orders SET status = ${status}, updated_at = ${now}
                 WHERE id = ${orderId}
             `;
@@ -1,10 +1,10 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { cookies } from 'next/headers';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { verifyLink } from '@/lib/verify-link';
+import { getSession } from '@/lib/auth';
 
 
 
@@ -18,19 +18,6 @@ interface Order {
     status: string;
 }
 
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const now = new Date().toISOString();
-    const result = await sql`
-        SELECT s.*, u.* FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 /**
  * POST: Trigger link verification for an order
  */
@@ -50,7 +37,7 @@ export async function POST(
         const { orderId } = await params;
 
         // Get order details
-        const orderResult = await sql`
+        const orderResult = await sqlAt('q1ffd035eda38')`
             SELECT id, buyer_id, publisher_id, article_url, target_url, anchor_text, status
             FROM orders
             WHERE id = ${orderId}
@@ -92,7 +79,7 @@ export async function POST(
 
         // Update order with verification result
         const now = new Date().toISOString();
-        await sql`
+        await sqlAt('qed0680875dd8')`
             UPDATE orders
             SET
                 link_verified = ${result.verified ? 1 : 0},
@@ -136,7 +123,7 @@ export async function GET(
 
         const { orderId } = await params;
 
-        const result = await sql`
+        const result = await sqlAt('q6825b3d45974')`
             SELECT
                 link_verified,
                 link_verified_at,
@@ -1,27 +1,13 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
 import { sendOrderPlacedBuyerEmail, sendNewOrderPublisherEmail } from '@/lib/email';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const now = new Date().toISOString();
-    const result = await sql`
-        SELECT s.*, u.* FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 /**
  * POST /api/orders/pay-wallet
  * Create and pay for an order using wallet balance
@@ -54,7 +40,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Get website details with publisher info
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('q24d42c99030f')`
             SELECT w.*, u.email as publisher_email, u.name as publisher_name
             FROM websites w
             JOIN users u ON w.owner_id = u.id
@@ -95,7 +81,7 @@ export async function POST(request: NextRequest) {
 
         // Deduct from wallet
         const newBalance = currentBalance - totalAmount;
-        await sql`
+        await sqlAt('q8f12db1f44df')`
             UPDATE users SET buyer_balance = ${newBalance} WHERE id = ${session.user_id}
         `;
 
@@ -104,7 +90,7 @@ export async function POST(request: NextRequest) {
         const orderNumber = 'PS-' + generateId().substring(0, 8);
         const now = new Date().toISOString();
 
-        await sql`
+        await sqlAt('qd76930c22760')`
             INSERT INTO orders (
                 id, order_number, buyer_id, website_id, publisher_id,
                 order_type, status, payment_status,
@@ -138,12 +124,12 @@ export async function POST(request: NextRequest) {
         `;
 
         // Fetch the created order
-        const orderResult = await sql`SELECT * FROM orders WHERE id = ${orderId}`;
+        const orderResult = await sqlAt('q56df6a643f4a')`SELECT * FROM orders WHERE id = ${orderId}`;
         const order = orderResult.rows[0] as Record<string, unknown>;
 
         // Create conversation thread for this order
         const conversationId = generateId();
-        await sql`
+        await sqlAt('qec5585a3c5d6')`
             INSERT INTO conversations (id, order_id, buyer_id, publisher_id)
             VALUES (
                 ${conversationId},
@@ -156,7 +142,7 @@ export async function POST(request: NextRequest) {
 
         // Log transaction using the existing transactions table
         const transactionId = generateId();
-        await sql`
+        await sqlAt('q2f2b0ae7f949')`
             INSERT INTO transactions (
                 id, user_id, type, amount,
                 balance_type, balance_before, balance_after,
@@ -1,27 +1,13 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId, intToBool } from '@/lib/db';
+import { sqlAt, generateId, intToBool } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
 import { sendOrderPlacedBuyerEmail, sendNewOrderPublisherEmail } from '@/lib/email';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-  const cookieStore = await cookies();
-  const sessionId = cookieStore.get('auth_session')?.value;
-  if (!sessionId) return null;
-
-  const now = new Date().toISOString();
-  const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-  `;
-  return result.rows[0] || null;
-}
-
 export async function POST(request: NextRequest) {
   try {
     // Initialize D1 database
@@ -52,7 +38,7 @@ export async function POST(request: NextRequest) {
     }
 
     // Get website details with owner info
-    const websiteResult = await sql`
+    const websiteResult = await sqlAt('q05824ebb03d2')`
       SELECT w.*, u.email as publisher_email, u.name as publisher_name
       FROM websites w
       JOIN users u ON w.owner_id = u.id
@@ -71,7 +57,7 @@ export async function POST(request: NextRequest) {
     let contentSource = 'buyer_provided';
 
     if (contributor_id) {
-      const contributorResult = await sql`
+      const contributorResult = await sqlAt('qfebc9c6ba7c8')`
         SELECT wc.*, u.name as contributor_name, u.email as contributor_email
         FROM website_contributors wc
         JOIN users u ON wc.user_id = u.id
@@ -104,7 +90,7 @@ export async function POST(request: NextRequest) {
     const orderNumber = 'PS-' + generateId().substring(0, 8);
     const now = new Date().toISOString();
 
-    await sql`
+    await sqlAt('qdd77dd39516e')`
       INSERT INTO orders (
         id, order_number, buyer_id, website_id, publisher_id,
         order_type, status, base_price, subtotal, platform_fee, total_amount, publisher_earnings,
@@ -139,7 +125,7 @@ export async function POST(request: NextRequest) {
     `;
 
     // Fetch the created order
-    const orderResult = await sql`SELECT * FROM orders WHERE id = ${orderId}`;
+    const orderResult = await sqlAt('q56df6a643f4a')`SELECT * FROM orders WHERE id = ${orderId}`;
     const order = orderResult.rows[0] as Record<string, unknown>;
 
     // Send email notifications (fire and forget)
@@ -2,26 +2,12 @@ export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
 import { createPaymentIntent } from '@/lib/stripe';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-  `;
-    return result.rows[0] || null;
-}
-
 export async function POST(request: NextRequest) {
     try {
         // Initialize D1 database
@@ -57,7 +43,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Get website to verify it exists and is active
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('qa662ad4715c4')`
       SELECT id, domain, owner_id FROM websites 
       WHERE id = ${website_id} AND is_active = true
     `;
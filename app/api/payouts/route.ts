@@ -1,26 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql , generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const result = await sql`
-        SELECT s.*, u.* FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 /**
  * GET /api/payouts
  * Get available balance for payout
@@ -113,14 +99,14 @@ export async function POST(request: NextRequest) {
 
             // Update balances based on balance type
             if (balance_type === 'publisher') {
-                await sql`
+                await sqlAt('q7ef324325ae1')`
                     UPDATE users SET 
                         publisher_balance = ${newBalance},
                         buyer_balance = ${newBuyerBalance}
                     WHERE id = ${session.user_id}
                 `;
             } else {
-                await sql`
+                await sqlAt('qc4590bdea8a6')`
                     UPDATE users SET 
                         affiliate_balance = ${newBalance},
                         buyer_balance = ${newBuyerBalance}
@@ -129,7 +115,7 @@ export async function POST(request: NextRequest) {
             }
 
             // Log both transactions
-            await sql`
+            await sqlAt('qe78e330b405f')`
                 INSERT INTO balance_transactions (id, user_id, balance_type, transaction_type, amount, balance_before, balance_after, description, created_at)
                 VALUES 
                     (gen_random_uuid()::text, ${session.user_id as string}, ${balance_type}, 'debit', ${amount}, ${currentBalance}, ${newBalance}, 'Transfer to buyer wallet', NOW()),
@@ -147,7 +133,7 @@ export async function POST(request: NextRequest) {
         } else {
             // External payout (PayPal/Payoneer)
             // Create payout request (to be processed by admin)
-            await sql`
+            await sqlAt('qf6ab07a6a6b8')`
                 INSERT INTO payouts (
                     id, user_id, amount, payout_method, payout_email,
                     balance_type, status, created_at
@@ -165,19 +151,19 @@ export async function POST(request: NextRequest) {
 
             // Deduct from balance based on type
             if (balance_type === 'publisher') {
-                await sql`
+                await sqlAt('q46092d717808')`
                     UPDATE users SET publisher_balance = ${newBalance}
                     WHERE id = ${session.user_id}
                 `;
             } else {
-                await sql`
+                await sqlAt('qd767a0047f7e')`
                     UPDATE users SET affiliate_balance = ${newBalance}
                     WHERE id = ${session.user_id}
                 `;
             }
 
             // Log transaction
-            await sql`
+            await sqlAt('q7fcd52a7d79a')`
                 INSERT INTO balance_transactions (id, user_id, balance_type, transaction_type, amount, balance_before, balance_after, description, created_at)
                 VALUES (gen_random_uuid()::text, ${session.user_id as string}, ${balance_type}, 'debit', ${amount}, ${currentBalance}, ${newBalance}, ${payout_method.toUpperCase() + ' payout request'}, NOW())
             `;
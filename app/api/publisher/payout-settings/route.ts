@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 import { z } from 'zod';
@@ -25,7 +25,7 @@ export async function GET(request: NextRequest) {
             return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
         }
 
-        const result = await sql`
+        const result = await sqlAt('q8c8658cec525')`
             SELECT *
             FROM payout_settings
             WHERE user_id = ${user.id}
@@ -82,7 +82,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Upsert payout settings
-        await sql`
+        await sqlAt('qa48c91b5f9b8')`
             INSERT INTO payout_settings (
                 user_id, payout_method, paypal_email, payoneer_email, updated_at
             )
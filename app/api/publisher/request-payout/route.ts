@@ -1,7 +1,7 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 import { z } from 'zod';
@@ -37,7 +37,7 @@ export async function POST(request: NextRequest) {
         const { amount } = result.data;
 
         // Get payout settings
-        const settingsResult = await sql`
+        const settingsResult = await sqlAt('q175ec6252533')`
             SELECT *
             FROM payout_settings
             WHERE user_id = ${user.id} AND is_active = 1 = true
@@ -63,7 +63,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Check user balance
-        const userResult = await sql`
+        const userResult = await sqlAt('q15af011c3d05')`
             SELECT publisher_balance
             FROM users
             WHERE id = ${user.id}
@@ -79,7 +79,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Check for pending payout requests
-        const pendingCheck = await sql`
+        const pendingCheck = await sqlAt('q921ea9733e6c')`
             SELECT COUNT(*) as count
             FROM payout_requests
             WHERE user_id = ${user.id} 
@@ -94,7 +94,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Create payout request
-        const payoutResult = await sql`
+        const payoutResult = await sqlAt('qf4f0f7761449')`
             INSERT INTO payout_requests (
                 user_id, amount, payout_method, payout_email, status, created_at
             )
@@ -107,7 +107,7 @@ export async function POST(request: NextRequest) {
         const payoutRequestId = (payoutResult.rows[0] as { id: string }).id;
 
         // Deduct from publisher balance (hold in escrow)
-        await sql`
+        await sqlAt('q47dae652e81f')`
             UPDATE users
             SET publisher_balance = publisher_balance - ${amount}
             WHERE id = ${user.id}
@@ -141,7 +141,7 @@ export async function GET(request: NextRequest) {
             return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
         }
 
-        const result = await sql`
+        const result = await sqlAt('q43d510dba7e2')`
             SELECT 
                 id, amount, payout_method, payout_email, status,
                 processed_at, created_at
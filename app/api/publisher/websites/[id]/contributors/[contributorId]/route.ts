@@ -1,14 +1,15 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
 // PATCH /api/publisher/websites/[id]/contributors/[contributorId] - Update contributor (approve, reject, update)
-export async function PATCH(
+async function handlePatch(
     request: NextRequest,
     { params }: { params: Promise<{ id: string; contributorId: string }> }
 ) {
@@ -26,7 +27,7 @@ export async function PATCH(
         const body = await request.json() as any;
 
         // Check if user owns this website
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('q9a7aed49422c')`
       SELECT owner_id FROM websites WHERE id = ${websiteId}
     `;
 
@@ -37,7 +38,7 @@ export async function PATCH(
         const isOwner = websiteResult.rows[0].owner_id === user.id;
 
         // Get the contributor
-        const contributorResult = await sql`
+        const contributorResult = await sqlAt('qc5c7d90df071')`
       SELECT * FROM website_contributors 
       WHERE id = ${contributorId} AND website_id = ${websiteId}
     `;
@@ -86,7 +87,7 @@ export async function PATCH(
 
         if (is_approved === true && isOwner) {
             // Approve contributor
-            result = await sql`
+            result = await sqlAt('qef2a9f330c9f')`
         UPDATE website_contributors 
         SET is_approved = true, approved_at = ${now}, rejected_at = NULL, rejection_reason = NULL, updated_at = ${now}
         WHERE id = ${contributorId} AND website_id = ${websiteId}
@@ -94,7 +95,7 @@ export async function PATCH(
       `;
         } else if (is_approved === false && isOwner) {
             // Reject contributor
-            result = await sql`
+            result = await sqlAt('qa5f1edc7f802')`
         UPDATE website_contributors 
         SET is_approved = false, rejected_at = ${now}, rejection_reason = ${rejection_reason || null}, updated_at = ${now}
         WHERE id = ${contributorId} AND website_id = ${websiteId}
@@ -102,7 +103,7 @@ export async function PATCH(
       `;
         } else {
             // Update other fields
-            result = await sql`
+            result = await sqlAt('q4361e8023a02')`
         UPDATE website_contributors 
         SET 
           is_active = COALESCE(${is_active}, is_active),
@@ -129,7 +130,7 @@ export async function PATCH(
 }
 
 // DELETE /api/publisher/websites/[id]/contributors/[contributorId] - Remove contributor
-export async function DELETE(
+async function handleDelete(
     request: NextRequest,
     { params }: { params: Promise<{ id: string; contributorId: string }> }
 ) {
@@ -146,7 +147,7 @@ export async function DELETE(
         const { id: websiteId, contributorId } = await params;
 
         // Check if user owns this website
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('q9a7aed49422c')`
       SELECT owner_id FROM websites WHERE id = ${websiteId}
     `;
 
@@ -157,7 +158,7 @@ export async function DELETE(
         const isOwner = websiteResult.rows[0].owner_id === user.id;
 
         // Get the contributor
-        const contributorResult = await sql`
+        const contributorResult = await sqlAt('q1c1cbaee560d')`
       SELECT user_id FROM website_contributors 
       WHERE id = ${contributorId} AND website_id = ${websiteId}
     `;
@@ -176,7 +177,7 @@ export async function DELETE(
         }
 
         // Check for pending orders
-        const pendingOrders = await sql`
+        const pendingOrders = await sqlAt('qc83bb96b5249')`
       SELECT COUNT(*) as count FROM orders 
       WHERE selected_contributor_id = ${contributorId}
       AND status NOT IN ('completed', 'cancelled', 'refunded')
@@ -189,7 +190,7 @@ export async function DELETE(
         }
 
         // Delete the contributor
-        await sql`
+        await sqlAt('qef94fed0fe57')`
       DELETE FROM website_contributors 
       WHERE id = ${contributorId} AND website_id = ${websiteId}
     `;
@@ -202,3 +203,7 @@ export async function DELETE(
         return NextResponse.json({ error: 'Failed to remove contributor' }, { status: 500 });
     }
 }
+
+export const PATCH = withCachePurge(['website_contributors'], handlePatch);
+
+export const DELETE = withCachePurge(['website_contributors'], handleDelete);
@@ -1,9 +1,10 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
@@ -24,7 +25,7 @@ export async function GET(
         const { id: websiteId } = await params;
 
         // Check if user owns this website
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('q9a7aed49422c')`
       SELECT owner_id FROM websites WHERE id = ${websiteId}
     `;
 
@@ -35,7 +36,7 @@ export async function GET(
         const isOwner = websiteResult.rows[0].owner_id === user.id;
 
         // Get contributors
-        const result = await sql`
+        const result = await sqlAt('q8efc7e0a3c50')`
       SELECT 
         wc.id,
         wc.user_id,
@@ -82,7 +83,7 @@ export async function GET(
 }
 
 // POST /api/publisher/websites/[id]/contributors - Apply as contributor or invite
-export async function POST(
+async function handlePost(
     request: NextRequest,
     { params }: { params: Promise<{ id: string }> }
 ) {
@@ -113,7 +114,7 @@ export async function POST(
         }
 
         // Check if website exists and get owner
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('q316ccd77042e')`
       SELECT owner_id, name, domain FROM websites WHERE id = ${websiteId}
     `;
 
@@ -135,7 +136,7 @@ export async function POST(
         }
 
         // Check if already a contributor
-        const existingResult = await sql`
+        const existingResult = await sqlAt('qfd742864cd1a')`
       SELECT id FROM website_contributors 
       WHERE website_id = ${websiteId} AND user_id = ${contributorUserId}
     `;
@@ -150,7 +151,7 @@ export async function POST(
         const isAutoApproved = isOwner && user_id;
 
         // Create contributor
-        const result = await sql`
+        const result = await sqlAt('q63c232c4ebf4')`
       INSERT INTO website_contributors (
         website_id,
         user_id,
@@ -188,3 +189,5 @@ export async function POST(
         return NextResponse.json({ error: 'Failed to create contributor' }, { status: 500 });
     }
 }
+
+export const POST = withCachePurge(['website_contributors'], handlePost);
@@ -1,10 +1,11 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 import { z } from 'zod';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
@@ -15,7 +16,7 @@ const applyContributorSchema = z.object({
     sampleArticles: z.array(z.string().url()).optional(),
 });
 
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -38,7 +39,7 @@ export async function POST(request: NextRequest) {
         const { websiteId, application, portfolioLinks, sampleArticles } = result.data;
 
         // Check if website exists
-        const websiteCheck = await sql`
+        const websiteCheck = await sqlAt('q828e1e2e69a3')`
             SELECT id FROM websites WHERE id = ${websiteId}
         `;
 
@@ -47,7 +48,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Check if user already has an application for this website
-        const existingCheck = await sql`
+        const existingCheck = await sqlAt('q1a6f25d89cc0')`
             SELECT id, verification_status 
             FROM websites 
             WHERE id = ${websiteId} 
@@ -62,7 +63,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Create contributor application by creating a new website entry
-        await sql`
+        await sqlAt('qf7cb0973dbd1')`
             INSERT INTO websites (
                 user_id,
                 domain,
@@ -101,3 +102,5 @@ export async function POST(request: NextRequest) {
         );
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
@@ -1,25 +1,14 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt, batch, execute, generateId } from '@/lib/db';
+import { slugify } from '@/lib/utils';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { withCachePurge } from '@/lib/edge-cache';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-  `;
-    return result.rows[0] || null;
-}
-
 function parseTraffic(traffic: string): number {
     if (!traffic) return 0;
     const cleaned = traffic.toString().replace(/[,\s]/g, '').toLowerCase();
@@ -49,7 +38,140 @@ function cleanDomain(url: string): string {
     }
 }
 
-export async function POST(request: NextRequest) {
+// D1 binds at most 100 parameters per statement
+const D1_MAX_PARAMS = 100;
+
+// Rows per existence probe; each probe binds one JSON array of domains and
+// one of slugs
+const PROBE_CHUNK_SIZE = 500;
+
+const INSERT_COLUMNS = `
+    INSERT INTO websites (
+        id, owner_id, domain, name, slug, domain_authority, domain_rating,
+        organic_traffic, link_type, turnaround_days, price_guest_post,
+        sample_post_url, is_active, verification_status, created_at
+    ) VALUES `;
+const INSERT_ROW = `(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, false, 'pending', ?)`;
+const INSERT_ROW_PARAMS = 13;
+const ROWS_PER_INSERT = Math.floor(D1_MAX_PARAMS / INSERT_ROW_PARAMS);
+
+interface PendingWebsite {
+    index: number;
+    domain: string;
+    slug: string;
+    params: unknown[];
+}
+
+// Parse one uploaded row into INSERT params, or null when it is incomplete
+function parseRow(row: any, ownerId: string, now: string): unknown[] | null {
+    const domain = cleanDomain(row['Domains'] || row['Domain'] || row['domain'] || '');
+    const da = parseInt(row['DA'] || row['da'] || '0');
+    const dr = parseInt(row['DR'] || row['dr'] || '0') || null;
+    const traffic = parseTraffic(row['Traffic'] || row['traffic'] || '');
+    const linkType = (row['Link'] || row['link_type'] || '').toLowerCase().includes('dofollow') ? 'dofollow' : 'nofollow';
+    const turnaround = parseTurnaround(row['TaT'] || row['turnaround'] || '');
+    const price = parsePrice(row['Price in USD'] || row['Price'] || row['price'] || '');
+    const samplePost = row['Sample Post'] || row['sample_post'] || null;
+
+    if (!domain || !da || !price) {
+        return null;
+    }
+
+    return [
+        generateId(), ownerId, domain, domain, slugify(domain.replace(/\./g, '-')),
+        da, dr, traffic, linkType, turnaround, price, samplePost, now,
+    ];
+}
+
+// Owners of the existing websites with any of the rows' domains, and the
+// slugs those websites and any others matching the rows' slugs hold
+async function findExisting(rows: PendingWebsite[]) {
+    const owners = new Map<string, string[]>();
+    const slugs = new Set<string>();
+    for (let i = 0; i < rows.length; i += PROBE_CHUNK_SIZE) {
+        const chunk = rows.slice(i, i + PROBE_CHUNK_SIZE);
+        const result = await sqlAt<{ domain: string; slug: string; owner_id: string }>('qc25180508c65')`
+            SELECT domain, slug, owner_id FROM websites
+            WHERE domain IN (SELECT value FROM json_each(${JSON.stringify(chunk.map((row) => row.domain))}))
+            OR slug IN (SELECT value FROM json_each(${JSON.stringify(chunk.map((row) => row.slug))}))
+        `;
+        for (const row of result.rows) {
+            owners.set(row.domain, [...(owners.get(row.domain) || []), row.owner_id]);
+            slugs.add(row.slug);
+        }
+    }
+    return { owners, slugs };
+}
+
+function insertStatement(rows: PendingWebsite[]) {
+    return {
+        query: INSERT_COLUMNS + rows.map(() => INSERT_ROW).join(', '),
+        params: rows.flatMap((row) => row.params),
+    };
+}
+
+// Insert rows one at a time so an error is reported against its own row
+async function insertOneByOne(
+    rows: PendingWebsite[],
+    rowErrors: (string | undefined)[]
+): Promise<number> {
+    let count = 0;
+    const inserted = new Set<string>();
+    for (const row of rows) {
+        if (inserted.has(row.domain)) {
+            rowErrors[row.index] = `${row.domain}: already exists`;
+            continue;
+        }
+        try {
+            const result = await execute(INSERT_COLUMNS + INSERT_ROW, row.params);
+            if (result.rowsAffected > 0) {
+                inserted.add(row.domain);
+                count++;
+            }
+        } catch (err) {
+            rowErrors[row.index] = `Error processing row: ${String(err)}`;
+        }
+    }
+    return count;
+}
+
+// Insert rows as multi-row INSERTs sent in one batch. D1 runs a batch as a
+// transaction, so when it fails nothing was written: the chunks are retried
+// on their own, and only a chunk that fails again is split into rows.
+async function insertWebsites(
+    rows: PendingWebsite[],
+    rowErrors: (string | undefined)[]
+): Promise<number> {
+    const chunks: PendingWebsite[][] = [];
+    for (let i = 0; i < rows.length; i += ROWS_PER_INSERT) {
+        chunks.push(rows.slice(i, i + ROWS_PER_INSERT));
+    }
+    if (chunks.length === 0) {
+        return 0;
+    }
+
+    try {
+        if (await batch(chunks.map(insertStatement))) {
+            return rows.length;
+        }
+        console.error('Batched website insert reported a failed statement, retrying per chunk');
+    } catch (err) {
+        console.error('Batched website insert failed, retrying per chunk:', err);
+    }
+
+    let count = 0;
+    for (const chunk of chunks) {
+        const { query, params } = insertStatement(chunk);
+        try {
+            count += (await execute(query, params)).rowsAffected;
+        } catch {
+            count += await insertOneByOne(chunk, rowErrors);
+        }
+    }
+    return count;
+}
+
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -66,64 +188,52 @@ export async function POST(request: NextRequest) {
             return NextResponse.json({ error: 'No websites provided' }, { status: 400 });
         }
 
+        const ownerId = session.user_id as string;
         let successCount = 0;
-        const errors: string[] = [];
+        // Errors are collected per row and reported in upload order
+        const rowErrors: (string | undefined)[] = new Array(websites.length);
 
-        for (const row of websites) {
+        const parsed: PendingWebsite[] = [];
+        websites.forEach((row: any, index: number) => {
             try {
-                const domain = cleanDomain(row['Domains'] || row['Domain'] || row['domain'] || '');
-                const da = parseInt(row['DA'] || row['da'] || '0');
-                const dr = parseInt(row['DR'] || row['dr'] || '0') || null;
-                const traffic = parseTraffic(row['Traffic'] || row['traffic'] || '');
-                const niche = row['Niche'] || row['niche'] || '';
-                const linkType = (row['Link'] || row['link_type'] || '').toLowerCase().includes('dofollow') ? 'dofollow' : 'nofollow';
-                const turnaround = parseTurnaround(row['TaT'] || row['turnaround'] || '');
-                const price = parsePrice(row['Price in USD'] || row['Price'] || row['price'] || '');
-                const samplePost = row['Sample Post'] || row['sample_post'] || null;
-
-                if (!domain || !da || !price) {
-                    errors.push(`Skipped row: missing domain, DA, or price`);
-                    continue;
+                const params = parseRow(row, ownerId, now);
+                if (!params) {
+                    rowErrors[index] = `Skipped row: missing domain, DA, or price`;
+                    return;
                 }
-
-                // Check if domain already exists for this user
-                const existing = await sql`
-          SELECT id FROM websites WHERE domain = ${domain} AND owner_id = ${session.user_id as string}
-        `;
-                if (existing.rows.length > 0) {
-                    errors.push(`${domain}: already exists`);
-                    continue;
-                }
-
-                // Insert website
-                await sql`
-          INSERT INTO websites (
-            id, owner_id, domain, name, domain_authority, domain_rating,
-            organic_traffic, link_type, turnaround_days, price_guest_post,
-            sample_post_url, is_active, verification_status, created_at
-          ) VALUES (
-            gen_random_uuid()::text,
-            ${session.user_id as string},
-            ${domain},
-            ${domain},
-            ${da},
-            ${dr},
-            ${traffic},
-            ${linkType},
-            ${turnaround},
-            ${price},
-            ${samplePost},
-            false,
-            'pending',
-            NOW()
-          )
-        `;
-                successCount++;
+                parsed.push({ index, domain: params[2] as string, slug: params[4] as string, params });
             } catch (err) {
-                errors.push(`Error processing row: ${String(err)}`);
+                rowErrors[index] = `Error processing row: ${String(err)}`;
+            }
+        });
+
+        // Check which domains and slugs are already taken, by this user or
+        // anyone else, so the batch only carries rows that can be inserted
+        const { owners, slugs } = await findExisting(parsed);
+        const batched: PendingWebsite[] = [];
+        const oneByOne: PendingWebsite[] = [];
+        const added = new Set<string>();
+        for (const row of parsed) {
+            const existingOwners = owners.get(row.domain) || [];
+            if (existingOwners.includes(ownerId) || added.has(row.domain)) {
+                rowErrors[row.index] = `${row.domain}: already exists`;
+            } else if (existingOwners.length > 0) {
+                // Owned by someone else: the insert fails on its own row
+                oneByOne.push(row);
+            } else if (slugs.has(row.slug)) {
+                // e.g. a-b.com and a.b.com both slugify to a-b-com
+                rowErrors[row.index] = `${row.domain}: slug ${row.slug} is already in use`;
+            } else {
+                added.add(row.domain);
+                slugs.add(row.slug);
+                batched.push(row);
             }
         }
 
+        successCount += await insertWebsites(batched, rowErrors);
+        successCount += await insertOneByOne(oneByOne, rowErrors);
+
+        const errors = rowErrors.filter((error): error is string => error !== undefined);
         return NextResponse.json({
             success: true,
             count: successCount,
@@ -134,3 +244,5 @@ export async function POST(request: NextRequest) {
         return NextResponse.json({ error: 'Failed to upload websites' }, { status: 500 });
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
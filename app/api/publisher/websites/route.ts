@@ -1,25 +1,13 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { withCachePurge } from '@/lib/edge-cache';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const now = new Date().toISOString();
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-    const result = await sql`
-    SELECT s.*, u.* FROM sessions s
-    JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-  `;
-    return result.rows[0] || null;
-}
-
 function parseTraffic(traffic: string): number {
     if (!traffic) return 0;
     const cleaned = traffic.toString().replace(/[,\s]/g, '').toLowerCase();
@@ -37,7 +25,7 @@ function cleanDomain(url: string): string {
     }
 }
 
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -58,7 +46,7 @@ export async function POST(request: NextRequest) {
         const cleanedDomain = cleanDomain(domain);
 
         // Check if domain already exists for this user
-        const existing = await sql`
+        const existing = await sqlAt('q5a78d2716f0a')`
       SELECT id FROM websites WHERE domain = ${cleanedDomain} AND owner_id = ${session.user_id as string}
     `;
         if (existing.rows.length > 0) {
@@ -66,7 +54,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Insert website
-        await sql`
+        await sqlAt('q5f8360504b05')`
       INSERT INTO websites (
         id, owner_id, domain, name, domain_authority, domain_rating,
         organic_traffic, link_type, turnaround_days, price_guest_post,
@@ -95,3 +83,5 @@ export async function POST(request: NextRequest) {
         return NextResponse.json({ error: 'Failed to add website' }, { status: 500 });
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
@@ -1,14 +1,15 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 import { verifyHtmlFile } from '@/lib/html-file-verify';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -27,7 +28,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Get website with token
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('q36f1ab1537e6')`
             SELECT id, domain, verification_token
             FROM websites
             WHERE id = ${websiteId} AND user_id = ${user.id}
@@ -60,7 +61,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Update verification status
-        await sql`
+        await sqlAt('q4bced88e011f')`
             UPDATE websites
             SET 
                 verification_status = 'verified',
@@ -80,3 +81,5 @@ export async function POST(request: NextRequest) {
         );
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
@@ -1,14 +1,15 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { validateRequest } from '@/lib/auth';
 import { generateVerificationToken, generateVerificationHtml } from '@/lib/html-file-verify';
+import { withCachePurge } from '@/lib/edge-cache';
 
 
 
-export async function POST(request: NextRequest) {
+async function handlePost(request: NextRequest) {
     try {
         // Initialize D1 database
         await initializeDatabaseFromContext();
@@ -26,7 +27,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Verify user owns this website
-        const websiteCheck = await sql`
+        const websiteCheck = await sqlAt('qde384d2f9fba')`
             SELECT id, domain FROM websites
             WHERE id = ${websiteId} AND user_id = ${user.id}
         `;
@@ -39,7 +40,7 @@ export async function POST(request: NextRequest) {
         const token = generateVerificationToken();
 
         // Store token in database
-        await sql`
+        await sqlAt('q073d515cc5fc')`
             UPDATE websites
             SET 
                 verification_token = ${token},
@@ -71,3 +72,5 @@ export async function POST(request: NextRequest) {
         );
     }
 }
+
+export const POST = withCachePurge(['websites'], handlePost);
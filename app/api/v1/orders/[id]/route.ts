@@ -4,7 +4,7 @@ export const runtime = 'edge';
 // export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { getApiKeyFromRequest, checkRateLimit } from '@/lib/api-auth';
 
@@ -52,7 +52,7 @@ export async function GET(
         }
 
         // Get order details (only if owned by the authenticated user)
-        const result = await sql`
+        const result = await sqlAt('q73b37e2008cb')`
             SELECT 
                 o.id,
                 o.order_number,
@@ -4,7 +4,7 @@ export const runtime = 'edge';
 // export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt, decodeCursor, nextCursor } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { getApiKeyFromRequest, checkRateLimit } from '@/lib/api-auth';
 
@@ -15,7 +15,9 @@ import { getApiKeyFromRequest, checkRateLimit } from '@/lib/api-auth';
  * List orders for the authenticated buyer
  * 
  * Query parameters:
- * - page: Page number (default: 1)
+ * - cursor: pagination.nextCursor from the previous page
+ * - page: Page number (default: 1); ignored when cursor is given. Deep pages
+ *   are slower than following nextCursor
  * - limit: Items per page (default: 20, max: 50)
  * - status: Filter by status
  */
@@ -51,31 +53,25 @@ export async function GET(request: NextRequest) {
 
         // Parse query parameters
         const { searchParams } = new URL(request.url);
-        const page = Math.max(1, parseInt(searchParams.get('page') || '1'));
         const limit = Math.min(50, Math.max(1, parseInt(searchParams.get('limit') || '20')));
-        const offset = (page - 1) * limit;
+        const cursorParam = searchParams.get('cursor');
+        const after = decodeCursor(cursorParam);
+        // Clients written before cursors page with ?page=N; keep honouring it
+        const page = cursorParam ? null : Math.max(1, parseInt(searchParams.get('page') || '1') || 1);
+        const offset = page ? (page - 1) * limit : 0;
         const status = searchParams.get('status');
 
-        // Build query
-        let statusCondition = '';
-        const params: unknown[] = [auth.user.id, limit, offset];
-
-        if (status) {
-            statusCondition = 'AND o.status = $4';
-            params.push(status);
-        }
-
         // Get total count
-        const countResult = await sql`
+        const countResult = await sqlAt('q1924e1651868')`
             SELECT COUNT(*) as count 
             FROM orders o
             WHERE o.buyer_id = ${auth.user.id}
-            ${status ? sql`AND o.status = ${status}` : sql``}
+            AND (${status} IS NULL OR o.status = ${status})
         `;
         const total = parseInt(String((countResult.rows[0] as { count: string })?.count || '0'));
 
         // Get orders
-        const result = await sql`
+        const result = await sqlAt('q43f5b2cac2f6')`
             SELECT 
                 o.id,
                 o.order_number,
@@ -101,12 +97,14 @@ export async function GET(request: NextRequest) {
             FROM orders o
             JOIN websites w ON o.website_id = w.id
             WHERE o.buyer_id = ${auth.user.id}
-            ${status ? sql`AND o.status = ${status}` : sql``}
-            ORDER BY o.created_at DESC
+            AND (${status} IS NULL OR o.status = ${status})
+            AND (o.created_at, o.id) < (COALESCE(${after.createdAt}, '~'), COALESCE(${after.id}, '~'))
+            ORDER BY o.created_at DESC, o.id DESC
             LIMIT ${limit} OFFSET ${offset}
         `;
 
         // Format response
+        const cursor = nextCursor(result.rows, limit);
         const orders = result.rows.map((o: Record<string, unknown>) => ({
             id: o.id,
             orderNumber: o.order_number,
@@ -143,11 +141,12 @@ export async function GET(request: NextRequest) {
         return NextResponse.json({
             data: orders,
             pagination: {
-                page,
+                ...(page ? { page } : {}),
                 limit,
                 total,
                 totalPages: Math.ceil(total / limit),
-                hasMore: page * limit < total
+                hasMore: page ? offset + result.rows.length < total : cursor !== null,
+                nextCursor: cursor
             }
         }, { headers });
 
@@ -242,7 +241,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Get website details
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('q2823b3bec2c1')`
             SELECT 
                 id, owner_id, domain, 
                 price_guest_post, price_link_insertion, price_urgent,
@@ -297,7 +296,7 @@ export async function POST(request: NextRequest) {
         deadline.setDate(deadline.getDate() + turnaroundDays);
 
         // Create order
-        const orderResult = await sql`
+        const orderResult = await sqlAt('q943aabe606cf')`
             INSERT INTO orders (
                 order_number, buyer_id, website_id, publisher_id,
                 order_type, content_source, target_url, anchor_text,
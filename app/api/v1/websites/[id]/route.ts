@@ -4,7 +4,7 @@ export const runtime = 'edge';
 // export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { getApiKeyFromRequest, checkRateLimit } from '@/lib/api-auth';
 
@@ -56,7 +56,7 @@ export async function GET(
         }
 
         // Get website details
-        const result = await sql`
+        const result = await sqlAt('q10c96530118a')`
             SELECT 
                 w.id,
                 w.domain,
@@ -4,7 +4,7 @@ export const runtime = 'edge';
 // export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, getDatabase } from '@/lib/db';
+import { sql, getDatabase, ftsMatch, ftsShortTerm } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
 import { getApiKeyFromRequest, checkRateLimit } from '@/lib/api-auth';
 
@@ -119,8 +119,8 @@ export async function GET(request: NextRequest) {
             whereValues.push(priceMax);
         }
         if (search) {
-            whereParts.push(`(w.domain LIKE ? OR w.name LIKE ?)`);
-            whereValues.push(`%${search}%`, `%${search}%`);
+            whereParts.push(`w.rowid IN (SELECT rowid FROM websites_fts WHERE websites_fts MATCH ? UNION SELECT rowid FROM websites WHERE ? AND (domain LIKE ? OR name LIKE ?))`);
+            whereValues.push(ftsMatch(search, ['domain', 'name']), ftsShortTerm(search), `%${search}%`, `%${search}%`);
         }
 
         // Build ORDER BY
@@ -1,26 +1,12 @@
 export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql, generateId } from '@/lib/db';
+import { sqlAt, generateId } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
+import { getSession } from '@/lib/auth';
 
 
 
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const now = new Date().toISOString();
-    const result = await sql`
-        SELECT s.*, u.* FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 /**
  * GET /api/wallet
  * Get current wallet balance
@@ -79,7 +65,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Check if transaction already processed
-        const existingTx = await sql`
+        const existingTx = await sqlAt('qc535236e0c7b')`
             SELECT id FROM balance_transactions WHERE reference_id = ${transaction_id}
         `;
         if (existingTx.rows.length > 0) {
@@ -90,14 +76,14 @@ export async function POST(request: NextRequest) {
         const newBalance = currentBalance + amount;
 
         // Update balance
-        await sql`
+        await sqlAt('q8f12db1f44df')`
             UPDATE users SET buyer_balance = ${newBalance} WHERE id = ${session.user_id}
         `;
 
         // Log transaction
         const txId = generateId();
         const now = new Date().toISOString();
-        await sql`
+        await sqlAt('qb1cc5fc50a62')`
             INSERT INTO balance_transactions (
                 id, user_id, balance_type, transaction_type, amount,
                 balance_before, balance_after, reference_id, description, created_at
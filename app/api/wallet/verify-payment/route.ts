@@ -4,10 +4,10 @@ export const runtime = 'edge';
 // export const runtime = "edge";
 
 import { NextRequest, NextResponse } from 'next/server';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { initializeDatabaseFromContext } from '@/lib/cloudflare';
-import { cookies } from 'next/headers';
 import Stripe from 'stripe';
+import { getSession } from '@/lib/auth';
 
 
 
@@ -15,20 +15,6 @@ const stripe = process.env.STRIPE_SECRET_KEY
     ? new Stripe(process.env.STRIPE_SECRET_KEY)
     : null;
 
-async function getSession() {
-    const cookieStore = await cookies();
-    const sessionId = cookieStore.get('auth_session')?.value;
-    if (!sessionId) return null;
-
-    const now = new Date().toISOString();
-    const result = await sql`
-        SELECT s.*, u.* FROM sessions s
-        JOIN users u ON s.user_id = u.id
-        WHERE s.id = ${sessionId} AND s.expires_at > ${now}
-    `;
-    return result.rows[0] || null;
-}
-
 /**
  * GET /api/wallet/verify-payment
  * Verify a Stripe payment and credit wallet if not already done
@@ -65,7 +51,7 @@ export async function GET(request: NextRequest) {
         }
 
         // Check if this payment was already processed
-        const existingTransaction = await sql`
+        const existingTransaction = await sqlAt('q2b8fb79687aa')`
             SELECT id FROM transactions 
             WHERE stripe_payment_intent_id = ${paymentIntentId}
             LIMIT 1
@@ -93,20 +79,20 @@ export async function GET(request: NextRequest) {
         const totalCredit = amountInCents + bonusAmount;
 
         // Get current balance
-        const userResult = await sql`
+        const userResult = await sqlAt('q73c68e4ce674')`
             SELECT buyer_balance FROM users WHERE id = ${session.user_id}
         `;
         const currentBalance = parseInt(userResult.rows[0]?.buyer_balance as string) || 0;
 
         // Update balance
-        await sql`
+        await sqlAt('qa222f1c02655')`
             UPDATE users 
             SET buyer_balance = buyer_balance + ${totalCredit}
             WHERE id = ${session.user_id}
         `;
 
         // Record the transaction
-        await sql`
+        await sqlAt('q44e7fc1ba97b')`
             INSERT INTO transactions (
                 user_id, type, amount, balance_type, 
                 balance_before, balance_after,
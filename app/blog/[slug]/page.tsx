@@ -1,6 +1,7 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
+import { edgeCached } from '@/lib/edge-cache';
 import { notFound } from 'next/navigation';
 import Link from 'next/link';
 import { Calendar, User, ArrowLeft } from 'lucide-react';
@@ -38,42 +39,51 @@ interface RelatedPost {
 
 async function getPostBySlug(slug: string): Promise<BlogPost | null> {
     try {
-        const result = await sql`
-            SELECT 
-                bp.*,
-                au.name as author_name,
-                au.email as author_email
-            FROM blog_posts bp
-            LEFT JOIN admin_users au ON bp.author_id = au.id
-            WHERE bp.slug = ${slug} AND bp.status = 'published'
-        `;
-
-        return (result.rows[0] as unknown as BlogPost) || null;
+        return await edgeCached('/blog/[slug]', `post:${slug}`, () => loadPostBySlug(slug));
     } catch (error) {
         console.error('Error fetching blog post:', error);
         return null;
     }
 }
 
+// Loaders let D1 errors propagate so edgeCached never stores a failure
+async function loadPostBySlug(slug: string): Promise<BlogPost | null> {
+    const result = await sqlAt('qcf776f5c1288')`
+        SELECT 
+            bp.*,
+            au.name as author_name,
+            au.email as author_email
+        FROM blog_posts bp
+        LEFT JOIN admin_users au ON bp.author_id = au.id
+        WHERE bp.slug = ${slug} AND bp.status = 'published'
+    `;
+
+    return (result.rows[0] as unknown as BlogPost) || null;
+}
+
 async function getRelatedPosts(category: string, excludeId: string): Promise<RelatedPost[]> {
     try {
-        const result = await sql`
-            SELECT id, title, slug, excerpt, cover_image, published_at
-            FROM blog_posts
-            WHERE category = ${category} 
-            AND id != ${excludeId}
-            AND status = 'published'
-            ORDER BY published_at DESC
-            LIMIT 3
-        `;
-
-        return result.rows as unknown as RelatedPost[];
+        return await edgeCached('/blog/[slug]', `related:${category}:${excludeId}`, () => loadRelatedPosts(category, excludeId));
     } catch (error) {
         console.error('Error fetching related posts:', error);
         return [];
     }
 }
 
+async function loadRelatedPosts(category: string, excludeId: string): Promise<RelatedPost[]> {
+    const result = await sqlAt('q22120a34230f')`
+        SELECT id, title, slug, excerpt, cover_image, published_at
+        FROM blog_posts
+        WHERE category = ${category} 
+        AND id != ${excludeId}
+        AND status = 'published'
+        ORDER BY published_at DESC
+        LIMIT 3
+    `;
+
+    return result.rows as unknown as RelatedPost[];
+}
+
 export async function generateMetadata({ params }: { params: Promise<{ slug: string }> }): Promise<Metadata> {
     const { slug } = await params;
     const post = await getPostBySlug(slug);
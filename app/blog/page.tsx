@@ -5,15 +5,25 @@ import { Button } from '@/components/ui/button';
 import { Card, CardContent } from '@/components/ui/card';
 import { Footer } from '@/components/shared/footer';
 import { ArrowRight, Clock, User } from 'lucide-react';
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
+import { edgeCached } from '@/lib/edge-cache';
 
 
 
 async function getBlogPosts(category?: string) {
     try {
-        let query;
-        if (category && category !== 'all') {
-            query = sql`
+        return await edgeCached('/blog', `posts:${category || 'all'}`, () => loadBlogPosts(category));
+    } catch (error) {
+        console.error('Error fetching blog posts:', error);
+        return [];
+    }
+}
+
+// Loaders let D1 errors propagate so edgeCached never stores a failure
+async function loadBlogPosts(category?: string) {
+    let query;
+    if (category && category !== 'all') {
+        query = sqlAt('q46415339e4cc')`
                 SELECT 
                     id, title, slug, excerpt, category, cover_image,
                     published_at, views
@@ -22,8 +32,8 @@ async function getBlogPosts(category?: string) {
                 ORDER BY published_at DESC
                 LIMIT 20
             `;
-        } else {
-            query = sql`
+    } else {
+        query = sqlAt('qf2038a7ee96e')`
                 SELECT 
                     id, title, slug, excerpt, category, cover_image,
                     published_at, views
@@ -32,19 +42,23 @@ async function getBlogPosts(category?: string) {
                 ORDER BY published_at DESC
                 LIMIT 20
             `;
-        }
+    }
 
-        const result = await query;
-        return result.rows;
+    const result = await query;
+    return result.rows;
+}
+
+async function getFeaturedPosts() {
+    try {
+        return await edgeCached('/blog', 'featured', () => loadFeaturedPosts());
     } catch (error) {
-        console.error('Error fetching blog posts:', error);
+        console.error('Error fetching featured posts:', error);
         return [];
     }
 }
 
-async function getFeaturedPosts() {
-    try {
-        const result = await sql`
+async function loadFeaturedPosts() {
+    const result = await sqlAt('qcb65cfe5489c')`
             SELECT 
                 id, title, slug, excerpt, category, cover_image,
                 published_at, views
@@ -53,11 +67,7 @@ async function getFeaturedPosts() {
             ORDER BY views DESC
             LIMIT 3
         `;
-        return result.rows;
-    } catch (error) {
-        console.error('Error fetching featured posts:', error);
-        return [];
-    }
+    return result.rows;
 }
 
 const categories = [
@@ -1,6 +1,7 @@
 export const runtime = "edge";
 
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
+import { edgeCached } from '@/lib/edge-cache';
 import { notFound } from 'next/navigation';
 import Link from 'next/link';
 import { Button } from '@/components/ui/button';
@@ -60,70 +61,83 @@ const COUNTRY_FLAGS: Record<string, string> = {
 
 async function getWebsite(id: string): Promise<Website | null> {
     try {
-        const result = await sql`
-      SELECT 
-        w.id, w.domain, w.name, w.domain_authority, w.domain_rating,
-        w.organic_traffic, w.price_guest_post, w.price_link_insertion,
-        w.link_type, w.turnaround_days, w.max_links, w.countries,
-        w.languages, w.is_featured, w.average_rating, w.rating_count,
-        c.name as category
-      FROM websites w
-      LEFT JOIN categories c ON w.primary_category_id = c.id
-      WHERE w.id = ${id} AND w.is_active = true
-    `;
-        return (result.rows[0] as unknown as Website) || null;
+        return await edgeCached('/marketplace/[id]', `website:${id}`, () => loadWebsite(id));
     } catch {
         return null;
     }
 }
 
+// Loaders let D1 errors propagate so edgeCached never stores a failure
+async function loadWebsite(id: string): Promise<Website | null> {
+    const result = await sqlAt('qc7083bf55f50')`
+  SELECT 
+    w.id, w.domain, w.name, w.domain_authority, w.domain_rating,
+    w.organic_traffic, w.price_guest_post, w.price_link_insertion,
+    w.link_type, w.turnaround_days, w.max_links, w.countries,
+    w.languages, w.is_featured, w.average_rating, w.rating_count,
+    c.name as category
+  FROM websites w
+  LEFT JOIN categories c ON w.primary_category_id = c.id
+  WHERE w.id = ${id} AND w.is_active = true
+`;
+    return (result.rows[0] as unknown as Website) || null;
+}
+
 async function getWebsiteReviews(websiteId: string): Promise<Review[]> {
     try {
-        const result = await sql`
-            SELECT 
-                o.id, o.buyer_rating, o.buyer_review, o.reviewed_at,
-                u.name as buyer_name
-            FROM orders o
-            JOIN users u ON o.buyer_id = u.id
-            WHERE o.website_id = ${websiteId}
-            AND o.buyer_rating IS NOT NULL
-            ORDER BY o.reviewed_at DESC
-            LIMIT 10
-        `;
-        return result.rows as unknown as Review[];
+        return await edgeCached('/marketplace/[id]', `reviews:${websiteId}`, () => loadWebsiteReviews(websiteId));
     } catch {
         return [];
     }
 }
 
+async function loadWebsiteReviews(websiteId: string): Promise<Review[]> {
+    const result = await sqlAt('q9f4c702de58b')`
+        SELECT 
+            o.id, o.buyer_rating, o.buyer_review, o.reviewed_at,
+            u.name as buyer_name
+        FROM orders o
+        JOIN users u ON o.buyer_id = u.id
+        WHERE o.website_id = ${websiteId}
+        AND o.buyer_rating IS NOT NULL
+        ORDER BY o.reviewed_at DESC
+        LIMIT 10
+    `;
+    return result.rows as unknown as Review[];
+}
+
 async function getContributors(websiteId: string): Promise<Contributor[]> {
     try {
-        const result = await sql`
-            SELECT 
-                wc.id,
-                u.name as user_name,
-                wc.display_name,
-                wc.writing_price,
-                wc.bio,
-                wc.specialties,
-                wc.completed_orders,
-                wc.average_rating,
-                wc.rating_count,
-                wc.turnaround_days
-            FROM website_contributors wc
-            JOIN users u ON wc.user_id = u.id
-            WHERE wc.website_id = ${websiteId}
-              AND wc.is_active = true
-              AND wc.is_approved = true
-            ORDER BY wc.average_rating DESC, wc.completed_orders DESC
-            LIMIT 5
-        `;
-        return result.rows as unknown as Contributor[];
+        return await edgeCached('/marketplace/[id]', `contributors:${websiteId}`, () => loadContributors(websiteId));
     } catch {
         return [];
     }
 }
 
+async function loadContributors(websiteId: string): Promise<Contributor[]> {
+    const result = await sqlAt('q69db3f84bafc')`
+        SELECT 
+            wc.id,
+            u.name as user_name,
+            wc.display_name,
+            wc.writing_price,
+            wc.bio,
+            wc.specialties,
+            wc.completed_orders,
+            wc.average_rating,
+            wc.rating_count,
+            wc.turnaround_days
+        FROM website_contributors wc
+        JOIN users u ON wc.user_id = u.id
+        WHERE wc.website_id = ${websiteId}
+          AND wc.is_active = true
+          AND wc.is_approved = true
+        ORDER BY wc.average_rating DESC, wc.completed_orders DESC
+        LIMIT 5
+    `;
+    return result.rows as unknown as Contributor[];
+}
+
 export default async function WebsiteDetailPage({ params }: { params: Promise<{ id: string }> }) {
     const { id } = await params;
     const website = await getWebsite(id);
@@ -1,4 +1,4 @@
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { cookies } from 'next/headers';
 import { cache } from 'react';
 
@@ -72,7 +72,7 @@ export const validateAdminRequest = cache(async (): Promise<ValidateResult> => {
     }
 
     try {
-        const result = await sql`
+        const result = await sqlAt('q60146e27baa3')`
       SELECT 
         s.id as session_id,
         s.admin_id,
@@ -96,7 +96,7 @@ export const validateAdminRequest = cache(async (): Promise<ValidateResult> => {
         const expiresAt = new Date(row.expires_at as string);
 
         if (expiresAt < new Date()) {
-            await sql`DELETE FROM admin_sessions WHERE id = ${sessionId}`;
+            await sqlAt('qf52570202d78')`DELETE FROM admin_sessions WHERE id = ${sessionId}`;
             cookieStore.set(ADMIN_SESSION_COOKIE, '', { maxAge: 0 });
             return { admin: null, session: null };
         }
@@ -127,7 +127,7 @@ export async function createAdminSession(adminId: string): Promise<AdminSession>
     const sessionId = generateSessionId();
     const expiresAt = new Date(Date.now() + SESSION_DURATION_MS);
 
-    await sql`
+    await sqlAt('q7770793c20ea')`
     INSERT INTO admin_sessions (id, admin_id, expires_at)
     VALUES (${sessionId}, ${adminId}, ${expiresAt.toISOString()})
   `;
@@ -155,7 +155,7 @@ export async function invalidateAdminSession(): Promise<void> {
     const { session } = await validateAdminRequest();
     if (!session) return;
 
-    await sql`DELETE FROM admin_sessions WHERE id = ${session.id}`;
+    await sqlAt('qf52570202d78')`DELETE FROM admin_sessions WHERE id = ${session.id}`;
 
     const cookieStore = await cookies();
     cookieStore.set(ADMIN_SESSION_COOKIE, '', { maxAge: 0, path: '/' });
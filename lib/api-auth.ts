@@ -3,7 +3,7 @@
  * Provides key generation, validation, and rate limiting
  */
 
-import { sql } from './db';
+import { sqlAt } from './db';
 import { hashPassword, verifyPassword } from './password';
 
 // Types
@@ -57,7 +57,7 @@ export async function generateApiKey(
         const keyHash = await hashPassword(rawKey);
 
         // Insert into database
-        const result = await sql`
+        const result = await sqlAt('q39dbc9f942d9')`
             INSERT INTO api_keys (user_id, name, key_hash, prefix, permissions)
             VALUES (${userId}, ${name}, ${keyHash}, ${prefix}, ${permissions})
             RETURNING id, user_id, name, prefix, permissions, rate_limit, is_active, created_at
@@ -111,7 +111,7 @@ export async function validateApiKey(rawKey: string): Promise<ApiKeyValidation>
         const prefix = rawKey.substring(0, 15);
 
         // Find keys with matching prefix
-        const result = await sql`
+        const result = await sqlAt('q9d7e2d67a3ba')`
             SELECT 
                 k.id, k.user_id, k.name, k.key_hash, k.prefix, 
                 k.permissions, k.rate_limit, k.is_active,
@@ -143,7 +143,7 @@ export async function validateApiKey(rawKey: string): Promise<ApiKeyValidation>
 
             if (isValid) {
                 // Update last used timestamp
-                await sql`
+                await sqlAt('q2de003ca1f50')`
                     UPDATE api_keys 
                     SET last_used_at = NOW(), request_count = request_count + 1
                     WHERE id = ${row.id}
@@ -196,7 +196,7 @@ export async function checkRateLimit(keyId: string, limit: number = 100): Promis
         const resetAt = new Date(windowStart.getTime() + 60000);
 
         // Upsert rate limit record
-        const result = await sql`
+        const result = await sqlAt('qc89e92bafb9e')`
             INSERT INTO api_rate_limits (api_key_id, window_start, request_count)
             VALUES (${keyId}, ${windowStart.toISOString()}, 1)
             ON CONFLICT (api_key_id, window_start) 
@@ -220,7 +220,7 @@ export async function checkRateLimit(keyId: string, limit: number = 100): Promis
  * Get all API keys for a user (without the actual key)
  */
 export async function getUserApiKeys(userId: string): Promise<ApiKey[]> {
-    const result = await sql`
+    const result = await sqlAt('qe99bde2dc456')`
         SELECT id, user_id, name, prefix, permissions, rate_limit, 
                is_active, last_used_at, created_at
         FROM api_keys
@@ -257,7 +257,7 @@ export async function getUserApiKeys(userId: string): Promise<ApiKey[]> {
  * Revoke an API key
  */
 export async function revokeApiKey(keyId: string, userId: string): Promise<boolean> {
-    const result = await sql`
+    const result = await sqlAt('qcd4eb8bf77d1')`
         UPDATE api_keys 
         SET is_active = false 
         WHERE id = ${keyId} AND user_id = ${userId}
@@ -270,7 +270,7 @@ export async function revokeApiKey(keyId: string, userId: string): Promise<boole
  * Delete an API key permanently
  */
 export async function deleteApiKey(keyId: string, userId: string): Promise<boolean> {
-    const result = await sql`
+    const result = await sqlAt('qb5a5d666f081')`
         DELETE FROM api_keys 
         WHERE id = ${keyId} AND user_id = ${userId}
     `;
@@ -1,6 +1,7 @@
 import { cookies } from 'next/headers';
 import { cache } from 'react';
 import { verifyToken } from '@/lib/jwt';
+import { getSessionById } from '@/lib/db';
 
 // Types
 interface Session {
@@ -25,6 +26,12 @@ interface ValidateResult {
 }
 
 const AUTH_COOKIE_NAME = 'auth_token';
+const SESSION_COOKIE_NAME = 'auth_session';
+
+// Session lookups keyed by the request's cookie store. React's cache() only
+// dedupes within a server component render, so route handlers need this to
+// make a single auth round trip per request.
+const sessionLookups = new WeakMap<object, ReturnType<typeof getSessionById>>();
 
 // Validate JWT token
 export const validateRequest = cache(async (): Promise<ValidateResult> => {
@@ -74,6 +81,20 @@ export const validateRequest = cache(async (): Promise<ValidateResult> => {
     }
 });
 
+// Resolve the auth_session cookie to its session + user row, or null
+export const getSession = cache(async () => {
+    const cookieStore = await cookies();
+    const sessionId = cookieStore.get(SESSION_COOKIE_NAME)?.value;
+    if (!sessionId) return null;
+
+    let lookup = sessionLookups.get(cookieStore);
+    if (!lookup) {
+        lookup = getSessionById(sessionId);
+        sessionLookups.set(cookieStore, lookup);
+    }
+    return lookup;
+});
+
 // Invalidate session (clear JWT cookie)
 export async function invalidateSession(): Promise<void> {
     const cookieStore = await cookies();
@@ -1,3 +1,5 @@
+import { SQL_REGISTRY } from '@/lib/sql-registry';
+
 // Type for D1 Database binding
 export type D1Database = any; // Will be properly typed by Cloudflare Workers
 
@@ -29,6 +31,52 @@ export function parseDate(dateStr: string | null | undefined): Date | null {
     return new Date(dateStr);
 }
 
+// Build an FTS5 MATCH expression that finds `term` anywhere in the given columns.
+// The *_fts tables use the trigram tokenizer, so a quoted phrase behaves like
+// LIKE '%term%' (see sql/migrations/009_search_fts.sql).
+export function ftsMatch(term: string, columns: string[] = []): string {
+    const phrase = `"${term.replace(/"/g, '""')}"`;
+    return columns.length ? `{${columns.join(' ')}} : ${phrase}` : phrase;
+}
+
+// Trigram indexes can't match terms shorter than three characters; queries
+// fall back to a LIKE scan when this returns 1
+export function ftsShortTerm(term: string): number {
+    return Array.from(term).length < 3 ? 1 : 0;
+}
+
+// Keyset pagination on (created_at, id). The cursor names the last row of the
+// previous page; list queries filter with
+//   (created_at, id) < (COALESCE(${after.createdAt}, '~'), COALESCE(${after.id}, '~'))
+// so every page is an index seek instead of skipping OFFSET rows.
+export interface KeysetCursor {
+    createdAt: string | null;
+    id: string | null;
+}
+
+// A missing or unreadable cursor starts from the first page
+export function decodeCursor(value: string | null): KeysetCursor {
+    if (value) {
+        try {
+            const [createdAt, id] = JSON.parse(atob(value.replace(/-/g, '+').replace(/_/g, '/')));
+            if (typeof createdAt === 'string' && typeof id === 'string') {
+                return { createdAt, id };
+            }
+        } catch {
+            // fall through
+        }
+    }
+    return { createdAt: null, id: null };
+}
+
+// Cursor for the page after `rows`, or null when `rows` is the last page
+export function nextCursor(rows: Record<string, unknown>[], limit: number): string | null {
+    if (rows.length < limit) return null;
+    const last = rows[rows.length - 1];
+    return btoa(JSON.stringify([String(last.created_at), String(last.id)]))
+        .replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+}
+
 // Get D1 database instance from environment
 // This will be injected by Cloudflare Workers
 let dbInstance: D1Database | null = null;
@@ -44,6 +92,26 @@ export function getDatabase(): D1Database {
     return dbInstance;
 }
 
+// Run a prepared statement and shape the result like the sql tag
+async function runStatement<T>(
+    statement: any,
+    query: string,
+    params: unknown[]
+): Promise<{ rows: T[]; rowCount: number }> {
+    try {
+        const result = await statement.bind(...params).all();
+        return {
+            rows: (result.results as T[]) || [],
+            rowCount: result.results?.length || 0,
+        };
+    } catch (error) {
+        console.error('Database query error:', error);
+        console.error('Query:', query);
+        console.error('Params:', params);
+        throw error;
+    }
+}
+
 // SQL template tag that works with Cloudflare D1
 export async function sql<T = Record<string, unknown>>(
     strings: TemplateStringsArray,
@@ -63,18 +131,63 @@ export async function sql<T = Record<string, unknown>>(
         }
     });
 
-    try {
-        const result = await db.prepare(query).bind(...params).all();
-        return {
-            rows: (result.results as T[]) || [],
-            rowCount: result.results?.length || 0,
-        };
-    } catch (error) {
-        console.error('Database query error:', error);
-        console.error('Query:', query);
-        console.error('Params:', params);
-        throw error;
+    return runStatement<T>(db.prepare(query), query, params);
+}
+
+// Prepared statements per database binding, keyed by registry ID
+const statementCache = new WeakMap<object, Map<string, any>>();
+
+function preparedStatement(db: D1Database, id: string, query: string) {
+    let statements = statementCache.get(db);
+    if (!statements) {
+        statements = new Map();
+        statementCache.set(db, statements);
+    }
+
+    let statement = statements.get(id);
+    if (!statement) {
+        statement = db.prepare(query);
+        statements.set(id, statement);
     }
+    return statement;
+}
+
+// Whether a call site's template matches its registry entry. A template
+// literal's strings array is the same object on every call, so each call
+// site is checked once per isolate.
+const registryMatches = new WeakMap<TemplateStringsArray, boolean>();
+
+function matchesRegistry(id: string, query: string, strings: TemplateStringsArray): boolean {
+    let matches = registryMatches.get(strings);
+    if (matches === undefined) {
+        matches = query === strings.join('?');
+        registryMatches.set(strings, matches);
+        if (!matches) {
+            console.warn(`SQL registry entry ${id} is stale; run python3 scripts/sql_registry.py`);
+        }
+    }
+    return matches;
+}
+
+// Registry-backed SQL tag for static queries: sqlAt('q…')`SELECT ...`
+// The finished query text comes from lib/sql-registry.ts (generated by
+// scripts/sql_registry.py), so nothing is rebuilt per call and the prepared
+// statement is reused for the life of the isolate. Unknown IDs, and call
+// sites whose text no longer matches their entry, fall back to the plain
+// sql tag.
+export function sqlAt<T = Record<string, unknown>>(id: string) {
+    // async so failures reject the promise, as they do with sql
+    return async (
+        strings: TemplateStringsArray,
+        ...values: unknown[]
+    ): Promise<{ rows: T[]; rowCount: number }> => {
+        const query = SQL_REGISTRY[id];
+        if (query === undefined || !matchesRegistry(id, query, strings)) {
+            return sql<T>(strings, ...values);
+        }
+
+        return runStatement<T>(preparedStatement(getDatabase(), id, query), query, values);
+    };
 }
 
 // Execute a single query (for INSERT, UPDATE, DELETE)
@@ -119,7 +232,7 @@ export async function batch(
 // Helper function to check database connection
 export async function checkDatabaseConnection(): Promise<boolean> {
     try {
-        await sql`SELECT 1`;
+        await sqlAt('q42364a017b73')`SELECT 1`;
         return true;
     } catch (error) {
         console.error('Database connection failed:', error);
@@ -129,7 +242,7 @@ export async function checkDatabaseConnection(): Promise<boolean> {
 
 // Common query helpers
 export async function getUserById(id: string) {
-    const result = await sql<any>`SELECT * FROM users WHERE id = ${id}`;
+    const result = await sqlAt<any>('qd6f3536ac027')`SELECT * FROM users WHERE id = ${id}`;
     if (!result.rows[0]) return null;
 
     const user = result.rows[0];
@@ -149,7 +262,7 @@ export async function getUserById(id: string) {
 }
 
 export async function getUserByEmail(email: string) {
-    const result = await sql<any>`SELECT * FROM users WHERE email = ${email}`;
+    const result = await sqlAt<any>('q307b1f747f61')`SELECT * FROM users WHERE email = ${email}`;
     if (!result.rows[0]) return null;
 
     const user = result.rows[0];
@@ -168,12 +281,13 @@ export async function getUserByEmail(email: string) {
     };
 }
 
-export async function getSessionById(sessionId: string) {
-    const result = await sql<any>`
+// Session joined with its user in one query; null when missing or expired
+export async function getSessionById(sessionId: string, now: string = new Date().toISOString()) {
+    const result = await sqlAt<any>('qd9de22dc444f')`
     SELECT s.*, u.*
     FROM sessions s
     JOIN users u ON s.user_id = u.id
-    WHERE s.id = ${sessionId}
+    WHERE s.id = ${sessionId} AND s.expires_at > ${now}
   `;
     if (!result.rows[0]) return null;
 
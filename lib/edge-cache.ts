@@ -0,0 +1,195 @@
+// Edge cache for public read routes, backed by the Workers Cache API
+//
+// Policies live in lib/edge-cache-policies.json (refreshed by
+// scripts/edge_cache.py). Each policy has a TTL, the query params the
+// response varies by, and purge tags. Purging a tag bumps its version in the
+// cache_tags table; versions are part of every cache key, so entries tagged
+// with it stop matching and age out on their own.
+
+import { sqlAt } from '@/lib/db';
+import { getCloudflareContext, initializeDatabaseFromContext } from '@/lib/cloudflare';
+import policies from '@/lib/edge-cache-policies.json';
+
+export interface EdgeCachePolicy {
+    ttl: number;
+    vary: string[];
+    tags: string[];
+}
+
+export const EDGE_CACHE_POLICIES: Record<string, EdgeCachePolicy> = policies;
+
+// Tag versions are re-read from D1 at most this often per isolate
+const TAG_VERSION_TTL_MS = 5000;
+
+const tagVersions = new Map<string, { version: number; fetchedAt: number }>();
+
+function edgeCache(): Cache | null {
+    const storage = (globalThis as any).caches;
+    return storage?.default ?? null;
+}
+
+async function currentTagVersions(tags: string[]): Promise<string> {
+    const now = Date.now();
+    const missing = tags.filter((tag) => {
+        const cached = tagVersions.get(tag);
+        return !cached || now - cached.fetchedAt > TAG_VERSION_TTL_MS;
+    });
+
+    if (missing.length > 0) {
+        const result = await sqlAt<{ tag: string; version: number }>('qce1067a754b8')`
+            SELECT tag, version FROM cache_tags
+            WHERE tag IN (SELECT value FROM json_each(${JSON.stringify(missing)}))
+        `;
+        for (const tag of missing) {
+            tagVersions.set(tag, { version: 0, fetchedAt: now });
+        }
+        for (const row of result.rows) {
+            tagVersions.set(row.tag, { version: Number(row.version), fetchedAt: now });
+        }
+    }
+
+    return tags.map((tag) => tagVersions.get(tag)?.version ?? 0).join('.');
+}
+
+// Builds the key from tag versions in D1. Runs before the wrapped handler or
+// loader, so it binds the database itself rather than relying on their init.
+async function cacheKey(route: string, policy: EdgeCachePolicy, url: URL, suffix = ''): Promise<string> {
+    await initializeDatabaseFromContext();
+    const key = new URL(url.pathname + suffix, url.origin);
+    for (const name of [...policy.vary].sort()) {
+        const value = url.searchParams.get(name);
+        if (value !== null) key.searchParams.set(name, value);
+    }
+    key.searchParams.set('__route', route);
+    key.searchParams.set('__v', await currentTagVersions(policy.tags));
+    return key.toString();
+}
+
+async function storeInBackground(cache: Cache, key: string, response: Response) {
+    const put = cache.put(key, response);
+    const context = await getCloudflareContext();
+    if (context?.ctx) {
+        context.ctx.waitUntil(put);
+    } else {
+        await put;
+    }
+}
+
+function getPolicy(route: string): EdgeCachePolicy {
+    const policy = EDGE_CACHE_POLICIES[route];
+    if (!policy) {
+        throw new Error(`No edge cache policy for ${route}`);
+    }
+    return policy;
+}
+
+// Wrap a public GET route handler:
+// export const GET = withEdgeCache('/api/marketplace', handleGet);
+export function withEdgeCache<R extends Request, A extends unknown[]>(
+    route: string,
+    handler: (request: R, ...args: A) => Promise<Response>
+) {
+    const policy = getPolicy(route);
+
+    return async (request: R, ...args: A): Promise<Response> => {
+        const cache = edgeCache();
+        if (!cache || request.method !== 'GET') {
+            return handler(request, ...args);
+        }
+
+        let key: string;
+        try {
+            key = await cacheKey(route, policy, new URL(request.url));
+            const hit = await cache.match(key);
+            if (hit) {
+                const response = new Response(hit.body, hit);
+                response.headers.set('X-Edge-Cache', 'HIT');
+                return response;
+            }
+        } catch (error) {
+            console.error('Edge cache lookup failed:', error);
+            return handler(request, ...args);
+        }
+
+        const response = await handler(request, ...args);
+        if (response.status !== 200 || response.headers.has('Set-Cookie')) {
+            return response;
+        }
+
+        const stored = new Response(response.clone().body, response);
+        stored.headers.set('Cache-Control', `public, max-age=${policy.ttl}`);
+        await storeInBackground(cache, key, stored);
+
+        response.headers.set('X-Edge-Cache', 'MISS');
+        return response;
+    };
+}
+
+// Cache the result of a server-component data loader under a policy:
+// const post = await edgeCached('/blog/[slug]', `post:${slug}`, () => loadPost(slug));
+// null/undefined results are not cached, so not-found paths stay live. Loaders
+// must let errors propagate and callers catch around edgeCached; a loader
+// that turns a failure into a fallback value ([] or {}) gets it cached.
+export async function edgeCached<T>(route: string, key: string, loader: () => Promise<T>): Promise<T> {
+    const cache = edgeCache();
+    if (!cache) {
+        return loader();
+    }
+
+    const policy = getPolicy(route);
+    let cacheUrl: string;
+    try {
+        cacheUrl = await cacheKey(route, policy, new URL('https://edge-cache.internal/'), encodeURIComponent(key));
+        const hit = await cache.match(cacheUrl);
+        if (hit) {
+            return (await hit.json()) as T;
+        }
+    } catch (error) {
+        console.error('Edge cache lookup failed:', error);
+        return loader();
+    }
+
+    const value = await loader();
+    if (value !== null && value !== undefined) {
+        await storeInBackground(cache, cacheUrl, new Response(JSON.stringify(value), {
+            headers: {
+                'Content-Type': 'application/json',
+                'Cache-Control': `public, max-age=${policy.ttl}`,
+            },
+        }));
+    }
+    return value;
+}
+
+// Invalidate every cached entry carrying any of the given tags
+export async function purgeCacheTags(tags: string[]): Promise<void> {
+    if (tags.length === 0) return;
+
+    await sqlAt('q253aa69cbb81')`
+        INSERT INTO cache_tags (tag, version, updated_at)
+        SELECT value, 1, datetime('now') FROM json_each(${JSON.stringify(tags)}) WHERE true
+        ON CONFLICT(tag) DO UPDATE SET version = version + 1, updated_at = datetime('now')
+    `;
+    for (const tag of tags) {
+        tagVersions.delete(tag);
+    }
+}
+
+// Wrap a write route handler so successful responses purge the given tags:
+// export const POST = withCachePurge(['websites'], handlePost);
+export function withCachePurge<R extends Request, A extends unknown[]>(
+    tags: string[],
+    handler: (request: R, ...args: A) => Promise<Response>
+) {
+    return async (request: R, ...args: A): Promise<Response> => {
+        const response = await handler(request, ...args);
+        if (response.status < 400) {
+            try {
+                await purgeCacheTags(tags);
+            } catch (error) {
+                console.error('Edge cache purge failed:', error);
+            }
+        }
+        return response;
+    };
+}
@@ -6,7 +6,7 @@
  * Can be upgraded to use Moz/DataForSEO API by setting environment variables.
  */
 
-import { sql } from './db';
+import { sqlAt } from './db';
 
 // Types
 export interface DomainMetrics {
@@ -147,7 +147,7 @@ export async function getDomainMetrics(domain: string): Promise<DomainMetrics> {
 export async function updateWebsiteMetrics(websiteId: string): Promise<MetricsUpdateResult> {
     try {
         // Get website domain
-        const websiteResult = await sql`
+        const websiteResult = await sqlAt('qcacb16ae6725')`
             SELECT id, domain FROM websites WHERE id = ${websiteId}
         `;
 
@@ -164,7 +164,7 @@ export async function updateWebsiteMetrics(websiteId: string): Promise<MetricsUp
         const metrics = await getDomainMetrics(website.domain);
 
         // Update website with new metrics
-        await sql`
+        await sqlAt('q75e409150fa5')`
             UPDATE websites SET
                 domain_authority = ${metrics.domainAuthority},
                 domain_rating = ${metrics.domainRating},
@@ -207,7 +207,7 @@ export async function updateAllMetrics(batchSize: number = 50): Promise<{
     results: MetricsUpdateResult[];
 }> {
     // Get all active websites
-    const websitesResult = await sql`
+    const websitesResult = await sqlAt('q9c75857c00c7')`
         SELECT id, domain FROM websites 
         WHERE is_active = true
         ORDER BY metrics_updated_at ASC NULLS FIRST
@@ -251,7 +251,7 @@ export async function getMetricsFreshness(): Promise<{
     stale: number;      // Updated 1-7 days ago
     outdated: number;   // Older than 7 days or never updated
 }> {
-    const result = await sql`
+    const result = await sqlAt('q2f042e173f21')`
         SELECT 
             COUNT(*) as total,
             COUNT(CASE WHEN metrics_updated_at > NOW() - INTERVAL '24 hours' THEN 1 END) as fresh,
@@ -1,4 +1,4 @@
-import { sql } from '@/lib/db';
+import { sqlAt } from '@/lib/db';
 import { createRefund } from '@/lib/stripe';
 import { sendEmail } from '@/lib/email';
 
@@ -8,7 +8,7 @@ import { sendEmail } from '@/lib/email';
 export async function releasePayment(orderId: string): Promise<void> {
   try {
     // Get order details
-    const orderResult = await sql`
+    const orderResult = await sqlAt('q1403c1504e40')`
       SELECT 
         o.*,
         p.email as publisher_email,
@@ -34,14 +34,14 @@ export async function releasePayment(orderId: string): Promise<void> {
     }
 
     // Credit publisher balance
-    await sql`
+    await sqlAt('qf37d030034ac')`
         UPDATE users 
         SET publisher_balance = publisher_balance + ${order.publisher_earnings as number}
         WHERE id = ${order.publisher_id as string}
       `;
 
     // Create publisher transaction record
-    await sql`
+    await sqlAt('q2763654655f5')`
         INSERT INTO transactions (
           user_id, type, reference_type, reference_id,
           amount, balance_type, description
@@ -58,13 +58,13 @@ export async function releasePayment(orderId: string): Promise<void> {
 
     // Credit affiliate if applicable
     if (order.affiliate_id && order.affiliate_fee && (order.affiliate_fee as number) > 0) {
-      await sql`
+      await sqlAt('q2363c1771807')`
           UPDATE users 
           SET affiliate_balance = affiliate_balance + ${order.affiliate_fee as number}
           WHERE id = ${order.affiliate_id as string}
         `;
 
-      await sql`
+      await sqlAt('q07cbf11e7ee7')`
           INSERT INTO transactions (
             user_id, type, reference_type, reference_id,
             amount, balance_type, description
@@ -81,7 +81,7 @@ export async function releasePayment(orderId: string): Promise<void> {
     }
 
     // Update order payment status
-    await sql`
+    await sqlAt('q58172706d708')`
         UPDATE orders 
         SET 
           payment_status = 'released',
@@ -133,7 +133,7 @@ export async function refundOrder(
 ): Promise<void> {
   try {
     // Get order details
-    const orderResult = await sql`
+    const orderResult = await sqlAt('qea107b29d64a')`
       SELECT 
         o.*,
         b.email as buyer_email,
@@ -163,7 +163,7 @@ export async function refundOrder(
     const refund = await createRefund(order.stripe_payment_intent_id as string);
 
     // Update order status
-    await sql`
+    await sqlAt('q41900eed9ac1')`
       UPDATE orders 
       SET 
         status = 'refunded',
@@ -174,7 +174,7 @@ export async function refundOrder(
     `;
 
     // Create transaction record
-    await sql`
+    await sqlAt('qe48375d35cd1')`
       INSERT INTO transactions (
         user_id, type, reference_type, reference_id,
         amount, balance_type, description,
@@ -0,0 +1,404 @@
+// Generated by scripts/sql_registry.py - do not edit by hand.
+// Finished query text for every static sql`` call site, keyed by the
+// ID passed to sqlAt() in lib/db.ts.
+
+export const SQL_REGISTRY: Record<string, string> = {
+    q004457345846: "\n            SELECT id, email, name, password_hash, is_buyer, is_publisher, is_affiliate, is_active, is_banned\n            FROM users\n            WHERE email = ?\n        ",
+    q007c2c722a1e: "\n      SELECT * FROM campaigns WHERE id = ? AND buyer_id = ?\n    ",
+    q00c038f9eeb1: "\n                SELECT contributor_balance FROM users WHERE id = ?\n            ",
+    q01702e88ea4c: "\n      SELECT id, email, name FROM admin_users WHERE email = ? AND is_active = true\n    ",
+    q01bc676ec46b: "\n                SELECT COUNT(*) as count FROM projects WHERE user_id = ? AND is_active = TRUE\n            ",
+    q020bd63acc2f: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS metrics_updated_at TIMESTAMPTZ",
+    q0245ea18ca88: "SELECT COUNT(*) as count FROM users",
+    q02a4d06c1032: "\n                SELECT COUNT(*) as count FROM notifications\n                WHERE user_id = ?\n            ",
+    q03ef4337752a: "\n                SELECT * FROM notifications\n                WHERE user_id = ? AND is_read = 0\n                AND (created_at, id) < (COALESCE(?, '~'), COALESCE(?, '~'))\n                ORDER BY created_at DESC, id DESC\n                LIMIT ?\n            ",
+    q040d52afd788: "CREATE INDEX IF NOT EXISTS idx_website_contributors_user ON website_contributors(user_id)",
+    q0416d96d96e6: "\n      SELECT w.*, u.name as owner_name, u.email as owner_email\n      FROM websites w\n      JOIN users u ON w.owner_id = u.id\n      ORDER BY w.created_at DESC\n      LIMIT 50\n    ",
+    q04f6e6db33f4: "\n            DELETE FROM blog_posts\n            WHERE id = ?\n            RETURNING id\n        ",
+    q05824ebb03d2: "\n      SELECT w.*, u.email as publisher_email, u.name as publisher_name\n      FROM websites w\n      JOIN users u ON w.owner_id = u.id\n      WHERE w.id = ? AND w.is_active = true\n    ",
+    q073d515cc5fc: "\n            UPDATE websites\n            SET \n                verification_token = ?,\n                verification_method = 'html_file'\n            WHERE id = ?\n        ",
+    q07cbf11e7ee7: "\n          INSERT INTO transactions (\n            user_id, type, reference_type, reference_id,\n            amount, balance_type, description\n          ) VALUES (\n            ?,\n            'affiliate',\n            'order',\n            ?,\n            ?,\n            'affiliate',\n            ?\n          )\n        ",
+    q08f48e71fd32: "CREATE INDEX IF NOT EXISTS idx_payouts_created ON payouts(created_at)",
+    q0940954d7e51: "\n            CREATE TABLE IF NOT EXISTS disputes (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                order_id TEXT NOT NULL REFERENCES orders(id) ON DELETE CASCADE,\n                raised_by TEXT NOT NULL REFERENCES users(id),\n                raised_by_role TEXT NOT NULL CHECK (raised_by_role IN ('buyer', 'publisher')),\n                reason TEXT NOT NULL CHECK (reason IN (\n                    'link_removed', 'content_changed', 'wrong_url', 'nofollow_added',\n                    'terms_violated', 'quality_issues', 'deadline_missed', 'other'\n                )),\n                description TEXT NOT NULL,\n                evidence_urls TEXT[] DEFAULT '{}',\n                status TEXT DEFAULT 'open' CHECK (status IN (\n                    'open', 'under_review', 'awaiting_response', \n                    'resolved_buyer', 'resolved_publisher', 'closed'\n                )),\n                respondent_id TEXT REFERENCES users(id),\n                respondent_comment TEXT,\n                responded_at TIMESTAMPTZ,\n                admin_notes TEXT,\n                resolution TEXT,\n                refund_amount INTEGER DEFAULT 0,\n                resolved_by TEXT REFERENCES users(id),\n                resolved_at TIMESTAMPTZ,\n                created_at TIMESTAMPTZ DEFAULT NOW(),\n                updated_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    q0ada2b0bdfd8: "\n            SELECT * FROM orders WHERE id = ?\n        ",
+    q0b15777d2efa: "\n                INSERT INTO transactions (\n                    id, user_id, type, amount,\n                    balance_type, balance_before, balance_after,\n                    reference_type, reference_id, description, status, created_at\n                ) VALUES (\n                    ?,\n                    ?,\n                    'contributor',\n                    ?,\n                    'contributor',\n                    ?,\n                    ?,\n                    'order',\n                    ?,\n                    ?,\n                    'completed',\n                    ?\n                )\n            ",
+    q0c39c5db9039: "\n                UPDATE orders SET\n                    status = ?,\n                    article_url = ?,\n                    published_at = ?,\n                    buyer_confirmation_deadline = ?,\n                    dispute_protection_until = ?,\n                    updated_at = ?\n                WHERE id = ?\n            ",
+    q0e23719fb72d: "\n          UPDATE users \n          SET password_hash = ?,\n              is_buyer = ?,\n              is_publisher = ?,\n              is_affiliate = ?,\n              buyer_balance = 50000,\n              publisher_balance = 25000,\n              affiliate_balance = 10000\n          WHERE email = ?\n        ",
+    q10c96530118a: "\n            SELECT \n                w.id,\n                w.domain,\n                w.name,\n                w.description,\n                w.domain_authority,\n                w.domain_rating,\n                w.organic_traffic,\n                w.referring_domains,\n                w.spam_score,\n                w.trust_flow,\n                w.citation_flow,\n                w.price_guest_post,\n                w.price_link_insertion,\n                w.price_homepage_link,\n                w.price_content_writing,\n                w.price_extra_link,\n                w.price_urgent,\n                w.link_type,\n                w.turnaround_days,\n                w.offers_urgent,\n                w.max_links,\n                w.min_word_count,\n                w.max_word_count,\n                w.allows_casino,\n                w.allows_cbd,\n                w.allows_crypto,\n                w.allows_adult,\n                w.accepts_buyer_content,\n                w.offers_writing_service,\n                w.sponsored_tag,\n                w.indexed_guarantee,\n                w.sample_post_url,\n                w.average_rating,\n                w.rating_count,\n                w.total_orders,\n                w.completed_orders,\n                w.metrics_updated_at,\n                w.metrics_source,\n                c.name as category_name,\n                c.slug as category_slug,\n                u.name as publisher_name\n            FROM websites w\n            LEFT JOIN categories c ON w.primary_category_id = c.id\n            LEFT JOIN users u ON w.owner_id = u.id\n            WHERE w.id = ? \n              AND w.is_active = true \n              AND w.verification_status = 'approved'\n        ",
+    q11dc548e50d4: "\n            SELECT * FROM orders \n            WHERE id = ? AND buyer_id = ?\n        ",
+    q11df90b9b38b: "\n            CREATE TABLE IF NOT EXISTS conversations (\n              id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n              order_id TEXT NOT NULL REFERENCES orders(id) ON DELETE CASCADE,\n              buyer_id TEXT NOT NULL REFERENCES users(id),\n              publisher_id TEXT NOT NULL REFERENCES users(id),\n              last_message_at TIMESTAMPTZ,\n              created_at TIMESTAMPTZ DEFAULT NOW(),\n              UNIQUE(order_id)\n            )\n        ",
+    q123d833f01d4: "\n            SELECT id FROM favorites \n            WHERE user_id = ? AND website_id = ?\n        ",
+    q12e32caac6dd: "\n                SELECT * FROM projects \n                WHERE user_id = ? AND is_active = 1\n                ORDER BY created_at DESC\n            ",
+    q137f2cf0e316: "\n            ALTER TABLE orders \n            ADD COLUMN IF NOT EXISTS payment_gateway TEXT DEFAULT 'stripe' CHECK (payment_gateway IN ('stripe', 'paypal', 'razorpay')),\n            ADD COLUMN IF NOT EXISTS paypal_order_id TEXT,\n            ADD COLUMN IF NOT EXISTS razorpay_order_id TEXT,\n            ADD COLUMN IF NOT EXISTS razorpay_payment_id TEXT\n        ",
+    q1403c1504e40: "\n      SELECT \n        o.*,\n        p.email as publisher_email,\n        p.name as publisher_name,\n        a.email as affiliate_email,\n        a.name as affiliate_name\n      FROM orders o\n      JOIN users p ON o.publisher_id = p.id\n      LEFT JOIN users a ON o.affiliate_id = a.id\n      WHERE o.id = ?\n    ",
+    q15af011c3d05: "\n            SELECT publisher_balance\n            FROM users\n            WHERE id = ?\n        ",
+    q16d922e61027: "\n            INSERT INTO projects (user_id, name, url, description, favicon)\n            VALUES (?, ?, ?, ?, ?)\n            RETURNING *\n        ",
+    q16f82f0dfa2e: "\n            SELECT \n                buyer_balance as main,\n                COALESCE(balance_reserved, 0) as reserved,\n                COALESCE(balance_bonus, 0) as bonus\n            FROM users\n            WHERE id = ?\n        ",
+    q175ec6252533: "\n            SELECT *\n            FROM payout_settings\n            WHERE user_id = ? AND is_active = 1 = true\n        ",
+    q17a619bb0073: "CREATE INDEX IF NOT EXISTS idx_notifications_user ON notifications(user_id, is_read, created_at DESC)",
+    q17e58658a739: "\n            UPDATE users SET \n                buyer_balance = buyer_balance + ?,\n                is_buyer = true,\n                updated_at = ? \n            WHERE email = ?\n        ",
+    q17e8a456e902: "CREATE INDEX IF NOT EXISTS idx_payouts_user ON payouts(user_id)",
+    q1924e1651868: "\n            SELECT COUNT(*) as count \n            FROM orders o\n            WHERE o.buyer_id = ?\n            AND (? IS NULL OR o.status = ?)\n        ",
+    q195b337aa22a: "CREATE INDEX IF NOT EXISTS idx_admin_sessions_admin ON admin_sessions(admin_id)",
+    q1a6f25d89cc0: "\n            SELECT id, verification_status \n            FROM websites \n            WHERE id = ? \n            AND user_id = ?\n        ",
+    q1a7e7582a666: "\n            SELECT \n                u.id,\n                u.name,\n                CONCAT(LEFT(u.email, 3), '***', SUBSTRING(u.email FROM POSITION('@' IN u.email))) as email,\n                u.created_at as signup_date,\n                COALESCE(order_stats.total_orders, 0) as total_orders,\n                COALESCE(order_stats.total_spent, 0) as total_spent,\n                COALESCE(order_stats.your_commission, 0) as your_commission\n            FROM affiliate_referrals ar\n            JOIN users u ON ar.referred_user_id = u.id\n            LEFT JOIN LATERAL (\n                SELECT \n                    COUNT(*) as total_orders,\n                    SUM(total_amount) as total_spent,\n                    SUM(affiliate_fee) as your_commission\n                FROM orders \n                WHERE buyer_id = u.id \n                  AND affiliate_id = ?\n                  AND payment_status = 'paid'\n            ) order_stats ON true\n            WHERE ar.affiliate_id = ?\n            ORDER BY u.created_at DESC\n        ",
+    q1afac1c4ade4: "\n            INSERT INTO activity_logs (user_id, action, description, model_type, model_id)\n            VALUES (\n                ?, \n                'blacklist_add', \n                ?,\n                'blacklist',\n                ?\n            )\n        ",
+    q1c1cbaee560d: "\n      SELECT user_id FROM website_contributors \n      WHERE id = ? AND website_id = ?\n    ",
+    q1e0ec32f1a4c: "\n      UPDATE users SET password_hash = ?, updated_at = ?\n      WHERE id = ?\n    ",
+    q1e3d8c04f88c: "\n      SELECT \n        COUNT(*) FILTER (WHERE status IN ('pending', 'in_progress')) as pending,\n        COUNT(*) FILTER (WHERE status = 'completed' AND created_at >= date_trunc('month', NOW())) as this_month\n      FROM orders WHERE publisher_id = ?\n    ",
+    q1f54fab14ae6: "\n            UPDATE projects\n            SET is_active = 0, updated_at = NOW()\n            WHERE id = ? AND user_id = ?\n            RETURNING id, name\n        ",
+    q1ffd035eda38: "\n            SELECT id, buyer_id, publisher_id, article_url, target_url, anchor_text, status\n            FROM orders\n            WHERE id = ?\n        ",
+    q20bf1fd04c20: "\n            SELECT buyer_id, publisher_id FROM orders WHERE id = ?\n        ",
+    q210a503ebddf: "\n            SELECT buyer_id, publisher_id\n            FROM conversations\n            WHERE id = ?\n        ",
+    q217b3feb1a94: "\n      UPDATE users SET is_publisher = true WHERE id = ? AND is_publisher = false\n    ",
+    q220ca7d7aa2a: "\n            SELECT \n                f.id,\n                f.website_id,\n                f.notes,\n                f.created_at,\n                w.domain,\n                w.name,\n                w.category,\n                w.domain_authority,\n                w.domain_rating,\n                w.price_guest_post\n            FROM favorites f\n            JOIN websites w ON f.website_id = w.id\n            WHERE f.user_id = ?\n            ORDER BY f.created_at DESC\n        ",
+    q22120a34230f: "\n        SELECT id, title, slug, excerpt, cover_image, published_at\n        FROM blog_posts\n        WHERE category = ? \n        AND id != ?\n        AND status = 'published'\n        ORDER BY published_at DESC\n        LIMIT 3\n    ",
+    q221f8ed3e85b: "CREATE INDEX IF NOT EXISTS idx_websites_ownership_type ON websites(ownership_type)",
+    q22617f02505c: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS anchor_types_allowed TEXT[]",
+    q233f370f250e: "CREATE INDEX IF NOT EXISTS idx_payout_requests_status ON payout_requests(status)",
+    q2363c1771807: "\n          UPDATE users \n          SET affiliate_balance = affiliate_balance + ?\n          WHERE id = ?\n        ",
+    q239a6ff17cc4: "CREATE INDEX IF NOT EXISTS idx_api_rate_limits_window ON api_rate_limits(window_start)",
+    q24d42c99030f: "\n            SELECT w.*, u.email as publisher_email, u.name as publisher_name\n            FROM websites w\n            JOIN users u ON w.owner_id = u.id\n            WHERE w.id = ? AND w.is_active = true\n        ",
+    q253aa69cbb81: "\n        INSERT INTO cache_tags (tag, version, updated_at)\n        SELECT value, 1, datetime('now') FROM json_each(?) WHERE true\n        ON CONFLICT(tag) DO UPDATE SET version = version + 1, updated_at = datetime('now')\n    ",
+    q256a31aa3fdd: "\n            SELECT is_affiliate FROM users WHERE id = ?\n        ",
+    q260a43831fd4: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS acceptance_rate DECIMAL(5,2) DEFAULT 100",
+    q2763654655f5: "\n        INSERT INTO transactions (\n          user_id, type, reference_type, reference_id,\n          amount, balance_type, description\n        ) VALUES (\n          ?,\n          'earning',\n          'order',\n          ?,\n          ?,\n          'publisher',\n          ?\n        )\n      ",
+    q2823b3bec2c1: "\n            SELECT \n                id, owner_id, domain, \n                price_guest_post, price_link_insertion, price_urgent,\n                turnaround_days, offers_urgent\n            FROM websites \n            WHERE id = ? \n              AND is_active = true \n              AND verification_status = 'approved'\n        ",
+    q2b8fb79687aa: "\n            SELECT id FROM transactions \n            WHERE stripe_payment_intent_id = ?\n            LIMIT 1\n        ",
+    q2c29d575d005: "\n      SELECT id, name, email FROM users \n      WHERE id != (SELECT owner_id FROM websites WHERE id = ?)\n      LIMIT 1\n    ",
+    q2c8088c3cc2a: "\n          UPDATE users SET is_publisher = true WHERE id = ? AND is_publisher = false\n        ",
+    q2c9c1657b075: "\n            SELECT publisher_balance FROM users WHERE id = ?\n        ",
+    q2de003ca1f50: "\n                    UPDATE api_keys \n                    SET last_used_at = NOW(), request_count = request_count + 1\n                    WHERE id = ?\n                ",
+    q2f042e173f21: "\n        SELECT \n            COUNT(*) as total,\n            COUNT(CASE WHEN metrics_updated_at > NOW() - INTERVAL '24 hours' THEN 1 END) as fresh,\n            COUNT(CASE WHEN metrics_updated_at > NOW() - INTERVAL '7 days' \n                        AND metrics_updated_at <= NOW() - INTERVAL '24 hours' THEN 1 END) as stale,\n            COUNT(CASE WHEN metrics_updated_at IS NULL \n                        OR metrics_updated_at <= NOW() - INTERVAL '7 days' THEN 1 END) as outdated\n        FROM websites\n        WHERE is_active = true\n    ",
+    q2f2b0ae7f949: "\n            INSERT INTO transactions (\n                id, user_id, type, amount,\n                balance_type, balance_before, balance_after,\n                reference_type, reference_id, description, status, created_at\n            ) VALUES (\n                ?,\n                ?,\n                'purchase',\n                ?,\n                'buyer',\n                ?,\n                ?,\n                'order',\n                ?,\n                ?,\n                'completed',\n                ?\n            )\n        ",
+    q2f8c64804af9: "\n            UPDATE users \n            SET is_affiliate = true, affiliate_code = ?, updated_at = ?\n            WHERE id = ?\n        ",
+    q3022e5a9bd71: "\n            UPDATE users\n            SET publisher_balance = ?, updated_at = ?\n            WHERE id = ?\n        ",
+    q307b1f747f61: "SELECT * FROM users WHERE email = ?",
+    q30b9686bebe4: "\n            INSERT INTO conversations (order_id, buyer_id, publisher_id)\n            SELECT o.id, o.buyer_id, o.publisher_id\n            FROM orders o\n            WHERE NOT EXISTS (\n                SELECT 1 FROM conversations c WHERE c.order_id = o.id\n            )\n        ",
+    q316ccd77042e: "\n      SELECT owner_id, name, domain FROM websites WHERE id = ?\n    ",
+    q33667d9c15d6: "UPDATE admin_users SET last_login_at = ? WHERE id = ?",
+    q336ea17ddf28: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS revision_limit INTEGER DEFAULT 2",
+    q3373786bc347: "\n            CREATE TABLE IF NOT EXISTS activity_logs (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n                action VARCHAR(100) NOT NULL,\n                description TEXT NOT NULL,\n                model_type VARCHAR(100),\n                model_id TEXT,\n                ip_address VARCHAR(45),\n                user_agent TEXT,\n                metadata JSONB DEFAULT '{}',\n                created_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    q344cd2ef0bfc: "\n        SELECT id FROM categories WHERE slug = ? OR id = ?\n      ",
+    q36c5e4241e28: "\n          INSERT INTO websites (\n            domain, name, slug, owner_id, primary_category_id,\n            domain_authority, domain_rating, organic_traffic,\n            price_guest_post, price_link_insertion, turnaround_days,\n            verification_status, is_active\n          ) VALUES (\n            ?,\n            ?,\n            ?,\n            ?,\n            ?,\n            ?,\n            ?,\n            ?,\n            ?,\n            ?,\n            ?,\n            'approved',\n            true\n          )\n        ",
+    q36f1ab1537e6: "\n            SELECT id, domain, verification_token\n            FROM websites\n            WHERE id = ? AND user_id = ?\n        ",
+    q36f6b4427fa6: "\n            CREATE TABLE IF NOT EXISTS notifications (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n                type VARCHAR(100) NOT NULL,\n                title VARCHAR(255) NOT NULL,\n                message TEXT NOT NULL,\n                data JSONB DEFAULT '{}',\n                link VARCHAR(500),\n                is_read BOOLEAN DEFAULT 0,\n                read_at TIMESTAMPTZ,\n                created_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    q37402f0163bb: "SELECT \n            COUNT(*) as total,\n            COUNT(*) FILTER (WHERE verification_status = 'pending') as pending,\n            COUNT(*) FILTER (WHERE verification_status = 'approved') as approved\n          FROM websites",
+    q39dbc9f942d9: "\n            INSERT INTO api_keys (user_id, name, key_hash, prefix, permissions)\n            VALUES (?, ?, ?, ?, ?)\n            RETURNING id, user_id, name, prefix, permissions, rate_limit, is_active, created_at\n        ",
+    q3a107b2a6af3: "\n        SELECT is_buyer, is_publisher, is_affiliate FROM users WHERE id = ?\n    ",
+    q3a99cfde2b9f: "SELECT id FROM users WHERE email = ?",
+    q3ab58bee3b69: "SELECT \n            COUNT(*) as total,\n            COUNT(*) FILTER (WHERE status = 'pending') as pending,\n            COUNT(*) FILTER (WHERE status = 'completed') as completed,\n            COALESCE(SUM(total_amount), 0) as revenue\n          FROM orders",
+    q3d5406d73747: "CREATE INDEX IF NOT EXISTS idx_api_keys_prefix ON api_keys(prefix)",
+    q3dd9265f8f94: "\n      SELECT w.*, sw.created_at as saved_at\n      FROM saved_websites sw\n      JOIN websites w ON sw.website_id = w.id\n      WHERE sw.user_id = ?\n      ORDER BY sw.created_at DESC\n    ",
+    q402d7ca8c699: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS citation_flow INTEGER",
+    q40df02aa9afa: "CREATE INDEX IF NOT EXISTS idx_website_contributors_active ON website_contributors(website_id, is_active, is_approved)",
+    q41900eed9ac1: "\n      UPDATE orders \n      SET \n        status = 'refunded',\n        payment_status = 'refunded',\n        cancelled_at = NOW(),\n        cancellation_reason = ?\n      WHERE id = ?\n    ",
+    q41b70484a050: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS spam_score INTEGER",
+    q41faa77fa460: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS avg_delivery_days DECIMAL(4,1)",
+    q42197dee0307: "CREATE INDEX IF NOT EXISTS idx_disputes_status ON disputes(status)",
+    q42364a017b73: "SELECT 1",
+    q4361e8023a02: "\n        UPDATE website_contributors \n        SET \n          is_active = COALESCE(?, is_active),\n          writing_price = COALESCE(?, writing_price),\n          display_name = COALESCE(?, display_name),\n          bio = COALESCE(?, bio),\n          specialties = COALESCE(?, specialties),\n          sample_work_url = COALESCE(?, sample_work_url),\n          turnaround_days = COALESCE(?, turnaround_days),\n          updated_at = ?\n        WHERE id = ? AND website_id = ?\n        RETURNING *\n      ",
+    q43d510dba7e2: "\n            SELECT \n                id, amount, payout_method, payout_email, status,\n                processed_at, created_at\n            FROM payout_requests\n            WHERE user_id = ?\n            ORDER BY created_at DESC\n            LIMIT 50\n        ",
+    q43f5b2cac2f6: "\n            SELECT \n                o.id,\n                o.order_number,\n                o.order_type,\n                o.status,\n                o.payment_status,\n                o.target_url,\n                o.anchor_text,\n                o.article_title,\n                o.article_url,\n                o.total_amount,\n                o.turnaround_days,\n                o.is_urgent,\n                o.deadline_at,\n                o.created_at,\n                o.accepted_at,\n                o.published_at,\n                o.completed_at,\n                o.buyer_rating,\n                w.id as website_id,\n                w.domain,\n                w.name as website_name\n            FROM orders o\n            JOIN websites w ON o.website_id = w.id\n            WHERE o.buyer_id = ?\n            AND (? IS NULL OR o.status = ?)\n            AND (o.created_at, o.id) < (COALESCE(?, '~'), COALESCE(?, '~'))\n            ORDER BY o.created_at DESC, o.id DESC\n            LIMIT ? OFFSET ?\n        ",
+    q43fd60854e14: "\n        SELECT \n            o.*,\n            w.domain as website_domain,\n            w.domain_authority as website_da,\n            w.domain_rating as website_dr,\n            p.name as publisher_name,\n            p.email as publisher_email\n        FROM orders o\n        JOIN websites w ON o.website_id = w.id\n        JOIN users p ON o.publisher_id = p.id\n        WHERE o.id = ? AND o.buyer_id = ?\n    ",
+    q448d1e036564: "\n            SELECT id FROM blog_posts WHERE slug = ? AND id != ?\n        ",
+    q44e7fc1ba97b: "\n            INSERT INTO transactions (\n                user_id, type, amount, balance_type, \n                balance_before, balance_after,\n                stripe_payment_intent_id, description, status\n            ) VALUES (\n                ?, 'deposit', ?, 'buyer',\n                ?, ?,\n                ?, \n                ?, \n                'completed'\n            )\n        ",
+    q45ae8e65f76d: "\n        SELECT * FROM campaigns WHERE id = ? AND buyer_id = ?\n      ",
+    q45e8fb4768a4: "\n      UPDATE password_reset_tokens SET used_at = ?\n      WHERE id = ?\n    ",
+    q46092d717808: "\n                    UPDATE users SET publisher_balance = ?\n                    WHERE id = ?\n                ",
+    q46415339e4cc: "\n                SELECT \n                    id, title, slug, excerpt, category, cover_image,\n                    published_at, views\n                FROM blog_posts\n                WHERE status = 'published' AND category = ?\n                ORDER BY published_at DESC\n                LIMIT 20\n            ",
+    q47dae652e81f: "\n            UPDATE users\n            SET publisher_balance = publisher_balance - ?\n            WHERE id = ?\n        ",
+    q480819707865: "\n                UPDATE users\n                SET contributor_balance = ?, updated_at = ?\n                WHERE id = ?\n            ",
+    q49c76820b850: "\n            UPDATE websites\n            SET average_rating = ?,\n                rating_count = ?\n            WHERE id = ?\n        ",
+    q4a22588ad4c5: "\n            SELECT \n                COALESCE(SUM(publisher_earnings) FILTER (WHERE status = 'completed'), 0) as total_earned,\n                COALESCE(SUM(publisher_earnings) FILTER (WHERE status IN ('pending', 'accepted', 'writing', 'content_submitted', 'revision_needed', 'approved')), 0) as pending_amount,\n                COALESCE(SUM(publisher_earnings) FILTER (WHERE status = 'completed' AND created_at >= date_trunc('month', CURRENT_DATE)), 0) as this_month,\n                COALESCE(SUM(publisher_earnings) FILTER (WHERE status = 'completed' AND created_at >= date_trunc('month', CURRENT_DATE - INTERVAL '1 month') AND created_at < date_trunc('month', CURRENT_DATE)), 0) as last_month\n            FROM orders\n            WHERE publisher_id = ?\n        ",
+    q4ab326c8e0ce: "\n            SELECT id, transaction_type, amount, description, balance_before, balance_after, created_at\n            FROM balance_transactions\n            WHERE user_id = ? AND balance_type = 'buyer'\n            ORDER BY created_at DESC\n            LIMIT 50\n        ",
+    q4b551f14f500: "\n            SELECT COUNT(*) as count FROM notifications WHERE user_id = ? AND is_read = 0\n        ",
+    q4b87d8446546: "\n            ALTER TABLE blog_posts \n            ADD COLUMN IF NOT EXISTS meta_title TEXT,\n            ADD COLUMN IF NOT EXISTS meta_description TEXT,\n            ADD COLUMN IF NOT EXISTS keywords TEXT\n        ",
+    q4bced88e011f: "\n            UPDATE websites\n            SET \n                verification_status = 'verified',\n                verified_at = ?\n            WHERE id = ?\n        ",
+    q4da9a885c912: "\n            SELECT id FROM projects WHERE id = ? AND user_id = ?\n        ",
+    q4f42d3d9299d: "CREATE INDEX IF NOT EXISTS idx_messages_read ON messages(is_read)",
+    q4f8ac3155a68: "\n            UPDATE orders\n            SET\n                status = 'completed',\n                buyer_confirmed_at = ?,\n                completed_at = ?,\n                payment_status = 'released',\n                released_at = ?,\n                updated_at = ?\n            WHERE id = ?\n        ",
+    q4f8fbaf1466d: "\n      INSERT INTO websites (\n        domain, name, slug, owner_id, primary_category_id,\n        domain_authority, domain_rating, organic_traffic,\n        price_guest_post, price_link_insertion, turnaround_days,\n        verification_status, is_active\n      ) VALUES (\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        'approved',\n        true\n      )\n      RETURNING id, domain, name\n    ",
+    q4f9b31646af2: "ALTER TABLE users ADD COLUMN IF NOT EXISTS paypal_email TEXT",
+    q4fef2419a711: "\n            SELECT COALESCE(SUM(o.affiliate_fee), 0) as pending\n            FROM orders o\n            WHERE o.affiliate_id = ?\n              AND o.status NOT IN ('completed', 'published', 'cancelled', 'refunded')\n        ",
+    q50e1fc608fb5: "\n      SELECT id, email, name, password_hash, is_buyer, is_publisher, is_affiliate, is_active, is_banned\n      FROM users \n      WHERE email = ?\n    ",
+    q51d3e9c93fba: "\n            SELECT \n                c.*,\n                o.id as order_id,\n                o.order_number,\n                o.order_type,\n                o.status as order_status,\n                o.total_amount,\n                o.website_id,\n                w.domain as website_domain,\n                buyer.name as buyer_name,\n                buyer.avatar_url as buyer_avatar,\n                publisher.name as publisher_name,\n                publisher.avatar_url as publisher_avatar\n            FROM conversations c\n            JOIN orders o ON c.order_id = o.id\n            JOIN websites w ON o.website_id = w.id\n            JOIN users buyer ON c.buyer_id = buyer.id\n            JOIN users publisher ON c.publisher_id = publisher.id\n            WHERE c.id = ?\n            AND (c.buyer_id = ? OR c.publisher_id = ?)\n        ",
+    q5245ebebacb2: "\n            SELECT\n                o.id, o.order_number, o.order_type, o.status, o.total_amount, o.created_at,\n                w.domain as website_domain,\n                p.name as publisher_name\n            FROM orders o\n            LEFT JOIN websites w ON o.website_id = w.id\n            LEFT JOIN users p ON o.publisher_id = p.id\n            WHERE o.buyer_id = ?\n            ORDER BY o.created_at DESC\n            LIMIT 5\n        ",
+    q5551c31ce75c: "ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_rejected_at TIMESTAMPTZ",
+    q55dbb614fdbc: "\n            UPDATE websites\n            SET \n                verification_status = 'rejected',\n                reviewed_by = ?,\n                admin_review_notes = ?\n            WHERE id = ?\n        ",
+    q55ff307a39ca: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS homepage_link_available BOOLEAN DEFAULT false",
+    q560e502d9dda: "\n            UPDATE orders\n            SET buyer_rating = ?,\n                buyer_review = ?,\n                reviewed_at = ?\n            WHERE id = ?\n        ",
+    q56df6a643f4a: "SELECT * FROM orders WHERE id = ?",
+    q58172706d708: "\n        UPDATE orders \n        SET \n          payment_status = 'released',\n          released_at = NOW()\n        WHERE id = ?\n      ",
+    q58ab3e8582fe: "\n      UPDATE admin_users SET password_hash = ?, updated_at = ?\n      WHERE id = ?\n    ",
+    q58cc8d6615ec: "CREATE INDEX IF NOT EXISTS idx_messages_unread ON messages(conversation_id, is_read) WHERE is_read = false",
+    q58cd9ad9f05e: "\n      SELECT bp.*, au.name as author_name\n      FROM blog_posts bp\n      JOIN admin_users au ON bp.author_id = au.id\n      ORDER BY bp.created_at DESC\n      LIMIT 50\n    ",
+    q5a0eef9b9992: "\n            SELECT \n                o.*,\n                buyer.email as buyer_email,\n                buyer.name as buyer_name,\n                publisher.email as publisher_email,\n                publisher.name as publisher_name,\n                w.domain as website_domain\n            FROM orders o\n            JOIN users buyer ON o.buyer_id = buyer.id\n            JOIN users publisher ON o.publisher_id = publisher.id\n            JOIN websites w ON o.website_id = w.id\n            WHERE o.id = ?\n        ",
+    q5a27dab7da75: "\n      SELECT id, domain, domain_authority as da, price_guest_post as price, \n             CASE WHEN is_active AND verification_status = 'approved' THEN 'active' ELSE 'pending' END as status\n      FROM websites \n      WHERE owner_id = ?\n      ORDER BY domain_authority DESC NULLS LAST\n      LIMIT 5\n    ",
+    q5a78d2716f0a: "\n      SELECT id FROM websites WHERE domain = ? AND owner_id = ?\n    ",
+    q5ae1900b96c9: "\n            CREATE TABLE IF NOT EXISTS payouts (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n                amount INTEGER NOT NULL,\n                payout_method TEXT NOT NULL CHECK (payout_method IN ('paypal', 'payoneer', 'wallet_transfer', 'bank_transfer')),\n                payout_email TEXT,\n                balance_type TEXT NOT NULL CHECK (balance_type IN ('publisher', 'affiliate', 'contributor')),\n                status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'processing', 'completed', 'failed', 'cancelled')),\n                transaction_id TEXT,\n                notes TEXT,\n                processed_at TIMESTAMPTZ,\n                created_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    q5c2b33ae949e: "\n            SELECT \n                c.*,\n                o.id as order_id,\n                o.order_number,\n                o.order_type,\n                o.status as order_status,\n                o.total_amount,\n                o.website_id,\n                w.domain as website_domain,\n                buyer.name as buyer_name,\n                buyer.avatar_url as buyer_avatar,\n                publisher.name as publisher_name,\n                publisher.avatar_url as publisher_avatar\n            FROM conversations c\n            JOIN orders o ON c.order_id = o.id\n            JOIN websites w ON o.website_id = w.id\n            JOIN users buyer ON c.buyer_id = buyer.id\n            JOIN users publisher ON c.publisher_id = publisher.id\n            WHERE c.id = ?\n        ",
+    q5f02d1b79c59: "\n        SELECT id, email FROM users WHERE email = ?\n      ",
+    q5f77c79ea643: "\n                SELECT \n                    p.*,\n                    COUNT(DISTINCT o.id) as order_count,\n                    COUNT(DISTINCT o.id) FILTER (WHERE o.status IN ('approved', 'published', 'completed')) as completed_count,\n                    COALESCE(SUM(o.total_amount), 0) as total_spent\n                FROM projects p\n                LEFT JOIN orders o ON o.project_id = p.id\n                WHERE p.user_id = ? AND p.is_active = 1\n                GROUP BY p.id\n                ORDER BY p.created_at DESC\n            ",
+    q5f8360504b05: "\n      INSERT INTO websites (\n        id, owner_id, domain, name, domain_authority, domain_rating,\n        organic_traffic, link_type, turnaround_days, price_guest_post,\n        sample_post_url, is_active, verification_status, created_at\n      ) VALUES (\n        gen_random_uuid()::text,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        false,\n        'pending',\n        NOW()\n      )\n    ",
+    q60146e27baa3: "\n      SELECT \n        s.id as session_id,\n        s.admin_id,\n        s.expires_at,\n        a.id,\n        a.email,\n        a.name,\n        a.role,\n        a.avatar_url\n      FROM admin_sessions s\n      JOIN admin_users a ON s.admin_id = a.id\n      WHERE s.id = ? AND a.is_active = true\n    ",
+    q60acf35de6e5: "\n            INSERT INTO transactions (\n                id, user_id, type, amount,\n                balance_type, balance_before, balance_after,\n                reference_type, reference_id, description, status, created_at\n            ) VALUES (\n                ?,\n                ?,\n                'earning',\n                ?,\n                'publisher',\n                ?,\n                ?,\n                'order',\n                ?,\n                ?,\n                'completed',\n                ?\n            )\n        ",
+    q615fc36c075a: "\n            SELECT \n                w.id,\n                w.domain,\n                w.contributor_application,\n                w.verification_status,\n                w.admin_review_notes,\n                w.created_at,\n                u.name as applicant_name,\n                u.email as applicant_email,\n                u.id as applicant_id\n            FROM websites w\n            JOIN users u ON w.user_id = u.id\n            WHERE w.id = ?\n            AND w.ownership_type = 'contributor'\n        ",
+    q62f4d2e17c83: "\n            SELECT\n                COALESCE(SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END), 0) as not_started,\n                COALESCE(SUM(CASE WHEN status IN ('accepted', 'writing') THEN 1 ELSE 0 END), 0) as in_progress,\n                COALESCE(SUM(CASE WHEN status = 'content_submitted' THEN 1 ELSE 0 END), 0) as pending_approval,\n                COALESCE(SUM(CASE WHEN status = 'revision_needed' THEN 1 ELSE 0 END), 0) as in_improvement,\n                COALESCE(SUM(CASE WHEN status IN ('approved', 'published', 'completed') THEN 1 ELSE 0 END), 0) as completed,\n                COALESCE(SUM(CASE WHEN status IN ('cancelled', 'refunded', 'disputed') THEN 1 ELSE 0 END), 0) as rejected,\n                COUNT(*) as total_orders,\n                COALESCE(SUM(total_amount), 0) as total_spent\n            FROM orders\n            WHERE buyer_id = ?\n        ",
+    q638727f00aa5: "\n                UPDATE orders SET status = ?, cancellation_reason = ?, cancelled_at = ?, updated_at = ?\n                WHERE id = ?\n            ",
+    q63c232c4ebf4: "\n      INSERT INTO website_contributors (\n        website_id,\n        user_id,\n        writing_price,\n        display_name,\n        bio,\n        specialties,\n        sample_work_url,\n        turnaround_days,\n        is_approved,\n        approved_at\n      ) VALUES (\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?\n      )\n      RETURNING *\n    ",
+    q63dad64f9bf6: "\n            INSERT INTO transactions (\n                user_id, type, amount, status, description, created_at\n            )\n            VALUES (\n                ?, 'withdrawal', ?, 'completed',\n                'Publisher payout via ' || ?, NOW()\n            )\n        ",
+    q64791e3f02aa: "\n                        INSERT INTO transactions (\n                            id, user_id, type, amount,\n                            balance_type, balance_before, balance_after,\n                            reference_type, reference_id, description, status, created_at\n                        ) VALUES (\n                            gen_random_uuid()::text,\n                            ?,\n                            'contributor',\n                            ?,\n                            'contributor',\n                            ?,\n                            ?,\n                            'order',\n                            ?,\n                            ?,\n                            'completed',\n                            NOW()\n                        )\n                    ",
+    q64daf48becf1: "\n            ALTER TABLE websites\n            ADD COLUMN IF NOT EXISTS ownership_type TEXT DEFAULT 'owner' CHECK (ownership_type IN ('owner', 'contributor')),\n            ADD COLUMN IF NOT EXISTS verification_status TEXT DEFAULT 'pending' CHECK (verification_status IN ('pending', 'verified', 'rejected')),\n            ADD COLUMN IF NOT EXISTS verification_method TEXT CHECK (verification_method IN ('google_analytics', 'html_file', 'dns_txt', 'admin_approved')),\n            ADD COLUMN IF NOT EXISTS verification_token TEXT,\n            ADD COLUMN IF NOT EXISTS contributor_application TEXT,\n            ADD COLUMN IF NOT EXISTS admin_review_notes TEXT,\n            ADD COLUMN IF NOT EXISTS verified_at TIMESTAMPTZ,\n            ADD COLUMN IF NOT EXISTS reviewed_by TEXT REFERENCES admin_users(id)\n        ",
+    q64ef0412550b: "\n            CREATE TABLE IF NOT EXISTS favorites (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n                project_id TEXT REFERENCES projects(id) ON DELETE CASCADE,\n                website_id TEXT NOT NULL REFERENCES websites(id) ON DELETE CASCADE,\n                notes TEXT,\n                created_at TIMESTAMPTZ DEFAULT NOW(),\n                UNIQUE(user_id, project_id, website_id)\n            )\n        ",
+    q6512acef0e21: "CREATE INDEX IF NOT EXISTS idx_conversations_publisher ON conversations(publisher_id)",
+    q659e9240895f: "CREATE INDEX IF NOT EXISTS idx_websites_verification_status ON websites(verification_status)",
+    q6825b3d45974: "\n            SELECT\n                link_verified,\n                link_verified_at,\n                link_verification_error,\n                article_url,\n                target_url\n            FROM orders\n            WHERE id = ?\n        ",
+    q69419c2a3891: "\n            UPDATE websites\n            SET \n                verification_status = 'verified',\n                verification_method = 'admin_approved',\n                verified_at = ?,\n                reviewed_by = ?,\n                admin_review_notes = ?\n            WHERE id = ?\n        ",
+    q69b8ca70cebe: "\n      SELECT \n        w.*,\n        c.name as category\n      FROM websites w\n      LEFT JOIN categories c ON w.primary_category_id = c.id\n      WHERE w.id = ? AND w.is_active = true\n    ",
+    q69db3f84bafc: "\n        SELECT \n            wc.id,\n            u.name as user_name,\n            wc.display_name,\n            wc.writing_price,\n            wc.bio,\n            wc.specialties,\n            wc.completed_orders,\n            wc.average_rating,\n            wc.rating_count,\n            wc.turnaround_days\n        FROM website_contributors wc\n        JOIN users u ON wc.user_id = u.id\n        WHERE wc.website_id = ?\n          AND wc.is_active = true\n          AND wc.is_approved = true\n        ORDER BY wc.average_rating DESC, wc.completed_orders DESC\n        LIMIT 5\n    ",
+    q6a208dbbcb09: "\n            SELECT \n                to_char(created_at, 'Month') as month,\n                SUM(publisher_earnings) as amount,\n                COUNT(*) as orders\n            FROM orders\n            WHERE publisher_id = ? AND status = 'completed'\n            GROUP BY to_char(created_at, 'Month'), date_trunc('month', created_at)\n            ORDER BY date_trunc('month', created_at) DESC\n            LIMIT 6\n        ",
+    q6a42a53fb687: "\n            CREATE TABLE IF NOT EXISTS api_keys (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n                name TEXT NOT NULL,\n                key_hash TEXT NOT NULL,\n                prefix TEXT NOT NULL,\n                permissions TEXT[] DEFAULT ARRAY['read']::TEXT[],\n                rate_limit INTEGER DEFAULT 100,\n                is_active BOOLEAN DEFAULT true,\n                last_used_at TIMESTAMPTZ,\n                request_count INTEGER DEFAULT 0,\n                created_at TIMESTAMPTZ DEFAULT NOW(),\n                expires_at TIMESTAMPTZ\n            )\n        ",
+    q6ac10f6cd4f0: "\n            SELECT affiliate_code, affiliate_balance, is_affiliate, referred_by\n            FROM users WHERE id = ?\n        ",
+    q6ae98178c1ee: "\n            UPDATE blog_posts\n            SET\n                title = ?,\n                slug = ?,\n                content = ?,\n                excerpt = ?,\n                cover_image = ?,\n                status = ?,\n                category = ?,\n                tags = ?,\n                meta_title = ?,\n                meta_description = ?,\n                keywords = ?,\n                ?\n                updated_at = ?\n            WHERE id = ?\n            RETURNING *\n        ",
+    q6cc2ad0a63d0: "ALTER TABLE users ADD COLUMN balance_bonus INTEGER DEFAULT 0",
+    q6d3143dfbb39: "\n      SELECT \n        w.id,\n        w.domain,\n        w.domain_authority as da,\n        w.domain_rating as dr,\n        w.organic_traffic as traffic,\n        w.price_guest_post,\n        w.price_link_insertion,\n        w.is_active,\n        w.verification_status as status,\n        c.name as category\n      FROM websites w\n      LEFT JOIN categories c ON w.primary_category_id = c.id\n      WHERE w.owner_id = ?\n      ORDER BY w.domain_authority DESC NULLS LAST\n    ",
+    q6dabd038cbe0: "\n      SELECT prt.*, a.email, a.name\n      FROM admin_password_reset_tokens prt\n      JOIN admin_users a ON prt.admin_id = a.id\n      WHERE prt.token = ?\n        AND prt.expires_at > ?\n        AND prt.used_at IS NULL\n    ",
+    q6ef5eac99c17: "\n            UPDATE orders\n            SET status = 'disputed', updated_at = ?\n            WHERE id = ?\n        ",
+    q6ef9c8519300: "CREATE INDEX IF NOT EXISTS idx_website_contributors_rating ON website_contributors(website_id, average_rating DESC)",
+    q70a0c3e8d498: "\n    SELECT s.*, a.* FROM admin_sessions s\n    JOIN admin_users a ON s.admin_id = a.id\n    WHERE s.id = ? AND s.expires_at > ?\n  ",
+    q73107c769746: "\n      SELECT id, email, name, role, is_active, last_login_at, created_at\n      FROM admin_users\n      ORDER BY \n        CASE role \n          WHEN 'super_admin' THEN 1 \n          WHEN 'admin' THEN 2 \n          WHEN 'finance_manager' THEN 3 \n          WHEN 'content_manager' THEN 4 \n          WHEN 'support_agent' THEN 5 \n          WHEN 'editor' THEN 6 \n        END,\n        created_at DESC\n    ",
+    q73b37e2008cb: "\n            SELECT \n                o.id,\n                o.order_number,\n                o.order_type,\n                o.content_source,\n                o.status,\n                o.payment_status,\n                o.target_url,\n                o.anchor_text,\n                o.article_title,\n                o.article_content,\n                o.article_url,\n                o.buyer_notes,\n                o.base_price,\n                o.writing_fee,\n                o.extra_links_fee,\n                o.urgent_fee,\n                o.subtotal,\n                o.platform_fee,\n                o.total_amount,\n                o.turnaround_days,\n                o.is_urgent,\n                o.deadline_at,\n                o.created_at,\n                o.accepted_at,\n                o.content_submitted_at,\n                o.approved_at,\n                o.published_at,\n                o.completed_at,\n                o.cancelled_at,\n                o.cancellation_reason,\n                o.buyer_rating,\n                o.buyer_review,\n                o.reviewed_at,\n                w.id as website_id,\n                w.domain,\n                w.name as website_name,\n                w.domain_authority,\n                w.domain_rating,\n                p.name as publisher_name\n            FROM orders o\n            JOIN websites w ON o.website_id = w.id\n            JOIN users p ON o.publisher_id = p.id\n            WHERE o.id = ? AND o.buyer_id = ?\n        ",
+    q73c68e4ce674: "\n            SELECT buyer_balance FROM users WHERE id = ?\n        ",
+    q75874d96e5ce: "CREATE INDEX IF NOT EXISTS idx_payout_requests_created_at ON payout_requests(created_at DESC)",
+    q75e226251511: "ALTER TABLE orders ADD COLUMN IF NOT EXISTS dispute_protection_until TIMESTAMPTZ",
+    q75e409150fa5: "\n            UPDATE websites SET\n                domain_authority = ?,\n                domain_rating = ?,\n                organic_traffic = ?,\n                referring_domains = ?,\n                spam_score = ?,\n                trust_flow = ?,\n                citation_flow = ?,\n                metrics_source = ?,\n                metrics_updated_at = NOW(),\n                updated_at = NOW()\n            WHERE id = ?\n        ",
+    q76aadc77bdc2: "\n            INSERT INTO favorites (id, user_id, website_id, notes)\n            VALUES (?, ?, ?, ?)\n        ",
+    q76c419af8c4d: "\n            CREATE TABLE IF NOT EXISTS payout_settings (\n              id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n              user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n              payout_method TEXT NOT NULL CHECK (payout_method IN ('paypal', 'payoneer')),\n              paypal_email TEXT,\n              payoneer_email TEXT,\n              is_active BOOLEAN DEFAULT true,\n              created_at TIMESTAMPTZ DEFAULT NOW(),\n              updated_at TIMESTAMPTZ DEFAULT NOW(),\n              UNIQUE(user_id)\n            )\n        ",
+    q76fdcd9f307e: "CREATE INDEX IF NOT EXISTS idx_website_contributors_website ON website_contributors(website_id)",
+    q7770793c20ea: "\n    INSERT INTO admin_sessions (id, admin_id, expires_at)\n    VALUES (?, ?, ?)\n  ",
+    q78f2b634034f: "UPDATE users SET last_login_at = ? WHERE id = ?",
+    q791c14524697: "\n                INSERT INTO conversations (\n                    id, order_id, buyer_id, publisher_id, created_at\n                )\n                VALUES (\n                    ?, ?, ?, ?, ?\n                )\n            ",
+    q799ac85e4690: "\n            SELECT COUNT(*) as count\n            FROM websites w\n            LEFT JOIN categories c ON w.primary_category_id = c.id\n            WHERE w.is_active = true\n            AND (\n                ? = '' \n                OR (w.rowid IN (SELECT rowid FROM websites_fts WHERE websites_fts MATCH ? UNION SELECT rowid FROM websites WHERE ? AND (domain LIKE ? OR name LIKE ?)) OR c.rowid IN (SELECT rowid FROM categories_fts WHERE categories_fts MATCH ? UNION SELECT rowid FROM categories WHERE ? AND name LIKE ?))\n            )\n            AND (? = '' OR c.slug = ?)\n            AND (? OR w.link_type = ANY(?))\n            AND (? OR w.domain_authority >= ?)\n            AND (? OR w.domain_authority <= ?)\n            AND (? OR w.domain_rating >= ?)\n            AND (? OR w.domain_rating <= ?)\n            AND (? OR w.price_guest_post >= ?)\n            AND (? OR w.price_guest_post <= ?)\n            AND (? OR w.turnaround_days <= ?)\n            AND (? OR w.verification_status = 'verified')\n        ",
+    q7bffec26b99c: "\n            SELECT \n                pr.*,\n                u.name as publisher_name,\n                u.email as publisher_email\n            FROM payout_requests pr\n            JOIN users u ON pr.user_id = u.id\n            WHERE pr.id = ?\n        ",
+    q7cd7b47f2cf9: "CREATE INDEX IF NOT EXISTS idx_projects_user ON projects(user_id, is_active)",
+    q7cf17a262255: "\n            SELECT buyer_rating, buyer_review, reviewed_at\n            FROM orders\n            WHERE id = ?\n        ",
+    q7e6dec8b1cac: "\n                        UPDATE users \n                        SET contributor_balance = ?, updated_at = ?\n                        WHERE id = ?\n                    ",
+    q7edeffba6650: "\n          INSERT INTO users (\n            email, password_hash, name, \n            is_buyer, is_publisher, is_affiliate,\n            affiliate_code, is_verified, email_verified,\n            buyer_balance, publisher_balance, affiliate_balance\n          ) VALUES (\n            ?, ?, ?,\n            ?, ?, ?,\n            ?, true, true,\n            50000, 25000, 10000\n          )\n          RETURNING id\n        ",
+    q7eeca610e8e3: "\n          SELECT id FROM users WHERE email = ?\n        ",
+    q7ef324325ae1: "\n                    UPDATE users SET \n                        publisher_balance = ?,\n                        buyer_balance = ?\n                    WHERE id = ?\n                ",
+    q7fcd52a7d79a: "\n                INSERT INTO balance_transactions (id, user_id, balance_type, transaction_type, amount, balance_before, balance_after, description, created_at)\n                VALUES (gen_random_uuid()::text, ?, ?, 'debit', ?, ?, ?, ?, NOW())\n            ",
+    q7ff3bd6a4995: "CREATE INDEX IF NOT EXISTS idx_conversations_buyer ON conversations(buyer_id)",
+    q81224b457375: "\n            SELECT\n                buyer_balance as main,\n                created_at\n            FROM users\n            WHERE id = ?\n        ",
+    q828e1e2e69a3: "\n            SELECT id FROM websites WHERE id = ?\n        ",
+    q841a12704484: "\n                SELECT \n                    m.*,\n                    u.name as sender_name,\n                    u.avatar_url as sender_avatar\n                FROM messages m\n                JOIN users u ON m.sender_id = u.id\n                WHERE m.conversation_id = ?\n                AND m.created_at < (SELECT created_at FROM messages WHERE id = ?)\n                ORDER BY m.created_at DESC\n                LIMIT ?\n            ",
+    q8490d1ced3c4: "\n      SELECT id FROM users WHERE email = ?\n    ",
+    q84f5f0b1e76b: "\n            SELECT \n                o.id, o.order_type, o.status, o.total_amount, o.created_at, \n                o.deadline_at, o.completed_at, o.article_url, o.anchor_text, o.target_url,\n                o.buyer_rating, o.link_verified, o.link_verified_at,\n                w.domain as website_domain, w.domain_authority as website_da, w.domain_rating as website_dr,\n                p.name as publisher_name, p.email as publisher_email\n            FROM orders o\n            JOIN websites w ON o.website_id = w.id\n            JOIN users p ON o.publisher_id = p.id\n            WHERE o.buyer_id = ?\n            ORDER BY o.created_at DESC\n        ",
+    q856e8b01ded1: "CREATE INDEX IF NOT EXISTS idx_payout_requests_user_id ON payout_requests(user_id)",
+    q86fe27a02ae6: "\n                SELECT id FROM users WHERE affiliate_code = ?\n            ",
+    q87639a2b5058: "\n            SELECT id, action, description, model_type, model_id, created_at\n            FROM activity_logs\n            WHERE user_id = ?\n            ORDER BY created_at DESC\n            LIMIT 10\n        ",
+    q88a1a15762e0: "\n            SELECT buyer_id, publisher_id\n            FROM orders\n            WHERE id = ?\n        ",
+    q89340bb70ac3: "\n      CREATE TABLE IF NOT EXISTS website_contributors (\n        id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n        website_id TEXT NOT NULL REFERENCES websites(id) ON DELETE CASCADE,\n        user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n        \n        writing_price INTEGER NOT NULL,\n        display_name TEXT,\n        bio TEXT,\n        specialties TEXT[] DEFAULT '{}',\n        sample_work_url TEXT,\n        \n        total_orders INTEGER DEFAULT 0,\n        completed_orders INTEGER DEFAULT 0,\n        average_rating DECIMAL(2,1) DEFAULT 0,\n        rating_count INTEGER DEFAULT 0,\n        \n        is_active BOOLEAN DEFAULT true,\n        is_approved BOOLEAN DEFAULT false,\n        approved_at TIMESTAMPTZ,\n        rejected_at TIMESTAMPTZ,\n        rejection_reason TEXT,\n        \n        turnaround_days INTEGER DEFAULT 5,\n        \n        created_at TIMESTAMPTZ DEFAULT NOW(),\n        updated_at TIMESTAMPTZ DEFAULT NOW(),\n        \n        UNIQUE(website_id, user_id)\n      )\n    ",
+    q89e7127c0061: "\n            SELECT id FROM conversations WHERE order_id = ?\n        ",
+    q8a21c83ae833: "\n      SELECT id, email, name, is_buyer, is_publisher, is_affiliate, \n             is_active, is_banned, created_at, last_login_at\n      FROM users\n      ORDER BY created_at DESC\n      LIMIT 50\n    ",
+    q8b0df686fe4d: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS is_indexed BOOLEAN DEFAULT true",
+    q8c8658cec525: "\n            SELECT *\n            FROM payout_settings\n            WHERE user_id = ?\n        ",
+    q8cda50348343: "CREATE INDEX IF NOT EXISTS idx_payouts_status ON payouts(status)",
+    q8ebf08b04fbb: "\n                CREATE TABLE IF NOT EXISTS admin_users (\n                  id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                  email TEXT UNIQUE NOT NULL,\n                  password_hash TEXT NOT NULL,\n                  name TEXT NOT NULL,\n                  role TEXT NOT NULL CHECK (role IN (\n                    'super_admin', 'admin', 'finance_manager', \n                    'content_manager', 'support_agent', 'editor'\n                  )),\n                  avatar_url TEXT,\n                  is_active BOOLEAN DEFAULT true,\n                  last_login_at TIMESTAMPTZ,\n                  created_at TIMESTAMPTZ DEFAULT NOW(),\n                  updated_at TIMESTAMPTZ DEFAULT NOW()\n                )\n            ",
+    q8efc7e0a3c50: "\n      SELECT \n        wc.id,\n        wc.user_id,\n        wc.writing_price,\n        wc.display_name,\n        wc.bio,\n        wc.specialties,\n        wc.sample_work_url,\n        wc.total_orders,\n        wc.completed_orders,\n        wc.average_rating,\n        wc.rating_count,\n        wc.is_active,\n        wc.is_approved,\n        wc.approved_at,\n        wc.rejection_reason,\n        wc.turnaround_days,\n        wc.created_at,\n        u.name as user_name,\n        u.email as user_email,\n        u.avatar_url\n      FROM website_contributors wc\n      JOIN users u ON wc.user_id = u.id\n      WHERE wc.website_id = ?\n      ORDER BY \n        wc.is_approved DESC,\n        wc.average_rating DESC,\n        wc.created_at DESC\n    ",
+    q8f12db1f44df: "\n            UPDATE users SET buyer_balance = ? WHERE id = ?\n        ",
+    q8f49d1cad79f: "\n            UPDATE payout_requests\n            SET \n                status = 'completed',\n                processed_by = ?,\n                processed_at = ?,\n                admin_notes = ?,\n                updated_at = ?\n            WHERE id = ?\n        ",
+    q8f7b56697fa7: "\n                    UPDATE orders \n                    SET \n                        status = 'completed',\n                        buyer_confirmed_at = ?,\n                        completed_at = ?,\n                        payment_status = 'released',\n                        released_at = ?,\n                        updated_at = ?\n                    WHERE id = ?\n                ",
+    q8f976f82fa12: "\n            SELECT \n                c.*,\n                o.order_number,\n                o.website_id,\n                w.domain as website_domain,\n                buyer.name as buyer_name,\n                buyer.avatar_url as buyer_avatar,\n                publisher.name as publisher_name,\n                publisher.avatar_url as publisher_avatar,\n                (\n                    SELECT COUNT(*)\n                    FROM messages m\n                    WHERE m.conversation_id = c.id \n                    AND m.is_read = false \n                    AND m.sender_id != ?\n                ) as unread_count,\n                (\n                    SELECT message\n                    FROM messages m\n                    WHERE m.conversation_id = c.id\n                    ORDER BY m.created_at DESC\n                    LIMIT 1\n                ) as last_message\n            FROM conversations c\n            JOIN orders o ON c.order_id = o.id\n            JOIN websites w ON o.website_id = w.id\n            JOIN users buyer ON c.buyer_id = buyer.id\n            JOIN users publisher ON c.publisher_id = publisher.id\n            WHERE c.buyer_id = ? OR c.publisher_id = ?\n            ORDER BY c.last_message_at DESC NULLS LAST, c.created_at DESC\n        ",
+    q9044d089e234: "\n      SELECT c.*, COUNT(o.id) as order_count \n      FROM campaigns c\n      LEFT JOIN orders o ON c.id = o.campaign_id\n      WHERE c.buyer_id = ?\n      GROUP BY c.id\n      ORDER BY c.created_at DESC\n    ",
+    q914e06e499f6: "\n        SELECT id, domain FROM websites LIMIT 1\n      ",
+    q91a396dfaed9: "CREATE INDEX IF NOT EXISTS idx_orders_paypal_order_id ON orders(paypal_order_id)",
+    q91b903b8117a: "\n            INSERT INTO activity_logs (user_id, action, description, model_type, model_id)\n            VALUES (?, 'project_created', ?, 'project', ?)\n        ",
+    q91d1fd18f3a0: "ALTER TABLE orders ADD COLUMN IF NOT EXISTS selected_contributor_id TEXT REFERENCES website_contributors(id)",
+    q91d2f3a5e148: "\n            DELETE FROM blacklists \n            WHERE user_id = ? \n            AND (id = ? OR website_id = ?)\n            RETURNING id\n        ",
+    q921ea9733e6c: "\n            SELECT COUNT(*) as count\n            FROM payout_requests\n            WHERE user_id = ? \n            AND status IN ('pending', 'processing')\n        ",
+    q934c1b79efc6: "\n            CREATE TABLE IF NOT EXISTS messages (\n              id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n              conversation_id TEXT NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,\n              sender_id TEXT NOT NULL REFERENCES users(id),\n              message TEXT NOT NULL,\n              is_read BOOLEAN DEFAULT false,\n              attachments JSONB DEFAULT '[]',\n              created_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    q9375841239d2: "\n                UPDATE users SET \n                    password_hash = ?, \n                    is_buyer = true,\n                    buyer_balance = 100000,\n                    email_verified = true,\n                    is_active = true,\n                    updated_at = ? \n                WHERE email = ?\n            ",
+    q93b8d5908f5f: "\n        SELECT \n            o.*,\n            w.domain as website_domain,\n            w.domain_authority as website_da,\n            w.domain_rating as website_dr,\n            b.name as buyer_name,\n            b.email as buyer_email\n        FROM orders o\n        JOIN websites w ON o.website_id = w.id\n        JOIN users b ON o.buyer_id = b.id\n        WHERE o.id = ? AND o.publisher_id = ?\n    ",
+    q93e4cdf0d718: "CREATE INDEX IF NOT EXISTS idx_api_keys_active ON api_keys(is_active)",
+    q943aabe606cf: "\n            INSERT INTO orders (\n                order_number, buyer_id, website_id, publisher_id,\n                order_type, content_source, target_url, anchor_text,\n                article_content, buyer_notes,\n                base_price, urgent_fee, subtotal, platform_fee, \n                total_amount, publisher_earnings,\n                turnaround_days, is_urgent, deadline_at,\n                status, payment_status\n            ) VALUES (\n                ?, ?, ?, ?,\n                ?, ?, ?, ?,\n                ?, ?,\n                ?, ?, ?, ?,\n                ?, ?,\n                ?, ?, ?,\n                'pending', 'pending'\n            )\n            RETURNING id, order_number, status, total_amount, created_at\n        ",
+    q94b36378aa06: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS trust_flow INTEGER",
+    q94f4bd41e5f0: "\n      SELECT created_at, token\n      FROM password_reset_tokens\n      WHERE user_id = ?\n      AND datetime(created_at) > datetime('now', '-2 minutes')\n    ",
+    q964ce1b64d46: "ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_confirmed_at TIMESTAMPTZ",
+    q96fa5b12b428: "\n            SELECT \n                c.*,\n                o.order_number,\n                o.order_type,\n                o.status as order_status,\n                o.website_id,\n                w.domain as website_domain,\n                buyer.name as buyer_name,\n                buyer.avatar_url as buyer_avatar,\n                publisher.name as publisher_name,\n                publisher.avatar_url as publisher_avatar\n            FROM conversations c\n            JOIN orders o ON c.order_id = o.id\n            JOIN websites w ON o.website_id = w.id\n            JOIN users buyer ON c.buyer_id = buyer.id\n            JOIN users publisher ON c.publisher_id = publisher.id\n            WHERE c.id = ?\n            AND (c.buyer_id = ? OR c.publisher_id = ?)\n        ",
+    q98427eb96c50: "CREATE INDEX IF NOT EXISTS idx_websites_boost ON websites(admin_boost_score DESC, is_featured DESC)",
+    q992542e4a108: "\n            SELECT \n                COUNT(*) FILTER (WHERE verification_status = 'pending') as pending_count,\n                COUNT(*) FILTER (WHERE verification_status = 'verified') as approved_count,\n                COUNT(*) FILTER (WHERE verification_status = 'rejected') as rejected_count\n            FROM websites\n            WHERE ownership_type = 'contributor'\n        ",
+    q99ce652cb7ee: "CREATE INDEX IF NOT EXISTS idx_api_keys_user ON api_keys(user_id)",
+    q9a1baef29607: "SELECT * FROM messages WHERE id = ?",
+    q9a2202d057ed: "ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_rejection_reason TEXT",
+    q9a7aed49422c: "\n      SELECT owner_id FROM websites WHERE id = ?\n    ",
+    q9af9492f2f5f: "\n      SELECT id, email, name, password_hash, role, is_active\n      FROM admin_users \n      WHERE LOWER(email) = LOWER(?)\n    ",
+    q9bf3a93e94c8: "\n            INSERT INTO messages (\n                id, conversation_id, sender_id, message, created_at\n            )\n            VALUES (\n                ?, ?, ?, ?, ?\n            )\n        ",
+    q9c75857c00c7: "\n        SELECT id, domain FROM websites \n        WHERE is_active = true\n        ORDER BY metrics_updated_at ASC NULLS FIRST\n        LIMIT ?\n    ",
+    q9d7e2d67a3ba: "\n            SELECT \n                k.id, k.user_id, k.name, k.key_hash, k.prefix, \n                k.permissions, k.rate_limit, k.is_active,\n                u.email, u.name as user_name, u.is_buyer\n            FROM api_keys k\n            JOIN users u ON k.user_id = u.id\n            WHERE k.prefix = ? AND k.is_active = true\n        ",
+    q9e037513aa39: "\n            SELECT \n                pr.*,\n                u.name as publisher_name,\n                u.email as publisher_email\n            FROM payout_requests pr\n            JOIN users u ON pr.user_id = u.id\n            ORDER BY \n                CASE pr.status\n                    WHEN 'pending' THEN 1\n                    WHEN 'processing' THEN 2\n                    WHEN 'completed' THEN 3\n                    ELSE 4\n                END,\n                pr.created_at DESC\n            LIMIT 100\n        ",
+    q9e81780e429b: "CREATE INDEX IF NOT EXISTS idx_payout_settings_user_id ON payout_settings(user_id)",
+    q9ed721547d26: "CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id)",
+    q9f4c702de58b: "\n        SELECT \n            o.id, o.buyer_rating, o.buyer_review, o.reviewed_at,\n            u.name as buyer_name\n        FROM orders o\n        JOIN users u ON o.buyer_id = u.id\n        WHERE o.website_id = ?\n        AND o.buyer_rating IS NOT NULL\n        ORDER BY o.reviewed_at DESC\n        LIMIT 10\n    ",
+    qa009c1444fc5: "\n        UPDATE website_contributors \n        SET is_approved = true, \n            is_active = true, \n            approved_at = ?,\n            writing_price = 5000,\n            display_name = 'Pro Content Writer',\n            bio = 'Experienced tech and business writer with 5+ years of expertise in SEO-optimized content.',\n            specialties = ARRAY['technology', 'business', 'marketing'],\n            average_rating = 4.8,\n            rating_count = 15,\n            turnaround_days = 3\n        WHERE website_id = ? AND user_id = ?\n      ",
+    qa02dadc4c838: "\n            UPDATE conversations\n            SET last_message_at = ?\n            WHERE id = ?\n        ",
+    qa222f1c02655: "\n            UPDATE users \n            SET buyer_balance = buyer_balance + ?\n            WHERE id = ?\n        ",
+    qa2b6833630d7: "\n            SELECT o.*, w.domain as website_domain, w.id as website_id,\n                   p.email as publisher_email, p.name as publisher_name\n            FROM orders o\n            JOIN websites w ON o.website_id = w.id\n            JOIN users p ON o.publisher_id = p.id\n            WHERE o.id = ?\n        ",
+    qa2c0a160af48: "CREATE INDEX IF NOT EXISTS idx_api_rate_limits_key ON api_rate_limits(api_key_id)",
+    qa34b863d5ae2: "\n      SELECT publisher_balance FROM users WHERE id = ?\n    ",
+    qa376035913fa: "CREATE INDEX IF NOT EXISTS idx_websites_quality ON websites(completion_rate DESC, average_rating DESC)",
+    qa41ee12a0a75: "\n            SELECT COUNT(*) as total FROM blog_posts\n            WHERE (? IS NULL OR category = ?)\n            AND (? IS NULL OR status = ?)\n            AND (? = '' OR blog_posts.rowid IN (SELECT rowid FROM blog_posts_fts WHERE blog_posts_fts MATCH ? UNION SELECT rowid FROM blog_posts WHERE ? AND (title LIKE ? OR content LIKE ?)))\n        ",
+    qa48c91b5f9b8: "\n            INSERT INTO payout_settings (\n                user_id, payout_method, paypal_email, payoneer_email, updated_at\n            )\n            VALUES (\n                ?, ?, ?, ?, NOW()\n            )\n            ON CONFLICT (user_id)\n            DO UPDATE SET\n                payout_method = ?,\n                paypal_email = ?,\n                payoneer_email = ?,\n                updated_at = ?\n        ",
+    qa5f1edc7f802: "\n        UPDATE website_contributors \n        SET is_approved = false, rejected_at = ?, rejection_reason = ?, updated_at = ?\n        WHERE id = ? AND website_id = ?\n        RETURNING *\n      ",
+    qa64f3f0483c6: "ALTER TABLE users ADD COLUMN IF NOT EXISTS payoneer_email TEXT",
+    qa662ad4715c4: "\n      SELECT id, domain, owner_id FROM websites \n      WHERE id = ? AND is_active = true\n    ",
+    qa6a7efb76b9d: "\n                INSERT INTO users (email, password_hash, name, is_buyer, buyer_balance, email_verified, is_active)\n                VALUES (?, ?, ?, true, 100000, true, true)\n            ",
+    qa9996c7045dd: "\n                UPDATE conversations\n                SET last_message_at = ?\n                WHERE id = ?\n            ",
+    qaa3a72636051: "CREATE INDEX IF NOT EXISTS idx_websites_pending_verification ON websites(verification_status) WHERE verification_status = 'pending'",
+    qac3070c9ce7f: "CREATE INDEX IF NOT EXISTS idx_favorites_user ON favorites(user_id, project_id)",
+    qac4db473e698: "\n            SELECT \n                COUNT(*) FILTER (WHERE status = 'pending') as not_started,\n                COUNT(*) FILTER (WHERE status IN ('accepted', 'writing')) as in_progress,\n                COUNT(*) FILTER (WHERE status = 'content_submitted') as pending_approval,\n                COUNT(*) FILTER (WHERE status = 'revision_needed') as in_improvement,\n                COUNT(*) FILTER (WHERE status IN ('approved', 'published', 'completed')) as completed,\n                COUNT(*) FILTER (WHERE status IN ('cancelled', 'refunded', 'disputed')) as rejected,\n                COUNT(*) as total_orders,\n                COALESCE(SUM(total_amount), 0) as total_spent\n            FROM orders\n            WHERE buyer_id = ?\n        ",
+    qae1ff1ec1d53: "\n            SELECT * FROM conversations WHERE order_id = ?\n        ",
+    qae44e9dd4979: "\n      SELECT prt.*, u.email, u.name\n      FROM password_reset_tokens prt\n      JOIN users u ON prt.user_id = u.id\n      WHERE prt.token = ?\n        AND prt.expires_at > ?\n        AND prt.used_at IS NULL\n    ",
+    qae9677e74ad5: "\n          SELECT id FROM websites WHERE domain = ?\n        ",
+    qaf7a3315340b: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS admin_boost_score INTEGER DEFAULT 0",
+    qaff059291937: "CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages(conversation_id, created_at DESC)",
+    qb00466d09968: "\n      SELECT id FROM websites WHERE domain = ?\n    ",
+    qb0f3ff91848f: "CREATE INDEX IF NOT EXISTS idx_disputes_order_id ON disputes(order_id)",
+    qb18d8677657e: "\n            SELECT id FROM categories WHERE slug = ? OR id = ?\n          ",
+    qb1a0f9d3cf60: "\n      SELECT id, email, name FROM users WHERE email = ?\n    ",
+    qb1cc5fc50a62: "\n            INSERT INTO balance_transactions (\n                id, user_id, balance_type, transaction_type, amount,\n                balance_before, balance_after, reference_id, description, created_at\n            ) VALUES (\n                ?,\n                ?,\n                'buyer',\n                'credit',\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?\n            )\n        ",
+    qb23566f5e8c9: "ALTER TABLE orders ADD COLUMN IF NOT EXISTS buyer_confirmation_deadline TIMESTAMPTZ",
+    qb33c8e26c3de: "\n                INSERT INTO messages (\n                    id, conversation_id, sender_id, message, created_at\n                ) VALUES (\n                    ?,\n                    ?,\n                    ?,\n                    ?,\n                    ?\n                )\n            ",
+    qb361d9e321f8: "\n            SELECT COUNT(*) as total FROM affiliate_referrals \n            WHERE affiliate_id = ?\n        ",
+    qb403b7d71258: "\n      SELECT id, email, name, is_buyer, is_publisher, is_affiliate\n      FROM users WHERE id = ?\n    ",
+    qb44b0c8b8ddd: "DELETE FROM admin_sessions WHERE admin_id = ?",
+    qb52330215027: "\n      INSERT INTO campaigns (buyer_id, name, url)\n      VALUES (?, ?, ?)\n      RETURNING *\n    ",
+    qb58940a97739: "\n            CREATE TABLE IF NOT EXISTS api_rate_limits (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                api_key_id TEXT NOT NULL REFERENCES api_keys(id) ON DELETE CASCADE,\n                window_start TIMESTAMPTZ NOT NULL,\n                request_count INTEGER DEFAULT 0,\n                UNIQUE(api_key_id, window_start)\n            )\n        ",
+    qb5a5d666f081: "\n        DELETE FROM api_keys \n        WHERE id = ? AND user_id = ?\n    ",
+    qb67bcc6fb734: "\n            UPDATE payout_requests\n            SET \n                status = 'rejected',\n                processed_by = ?,\n                processed_at = ?,\n                admin_notes = ?,\n                updated_at = ?\n            WHERE id = ?\n        ",
+    qb6d4d68512ab: "ALTER TABLE orders ADD COLUMN project_id TEXT REFERENCES projects(id) ON DELETE SET NULL",
+    qb747fd6a8310: "\n                    UPDATE users \n                    SET publisher_balance = ?, updated_at = ?\n                    WHERE id = ?\n                ",
+    qb7a00f126d40: "\n            SELECT id FROM disputes \n            WHERE order_id = ? AND status IN ('open', 'under_review', 'awaiting_response')\n        ",
+    qb89982ca9509: "\n            INSERT INTO disputes (\n                id, order_id, raised_by, raised_by_role,\n                reason, description, evidence_urls,\n                status, created_at\n            ) VALUES (\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                'open',\n                ?\n            )\n        ",
+    qb8e539ef42db: "\n      UPDATE order_messages \n      SET \n        status = ?,\n        rejection_reason = ?,\n        reviewed_by = ?,\n        reviewed_at = ?,\n        delivered_at = ?\n      WHERE id = ?\n    ",
+    qba5e0e8adcd5: "\n            SELECT id FROM blacklists \n            WHERE user_id = ? \n            AND (website_id = ? OR domain = ?)\n        ",
+    qbb6e6f9190e3: "\n        INSERT INTO affiliate_referrals (id, affiliate_id, referred_user_id, referral_code)\n        VALUES (?, ?, ?, ?)\n      ",
+    qbc1d450f96fd: "\n      INSERT INTO admin_password_reset_tokens (admin_id, token, expires_at)\n      VALUES (?, ?, ?)\n    ",
+    qbc8e33d837b2: "\n            SELECT \n                o.id, o.order_type, o.status, o.total_amount, o.publisher_earnings, o.created_at, \n                o.deadline_at, o.completed_at, o.article_url, o.anchor_text,\n                w.domain as website_domain,\n                u.name as buyer_name\n            FROM orders o\n            JOIN websites w ON o.website_id = w.id\n            JOIN users u ON o.buyer_id = u.id\n            WHERE o.publisher_id = ?\n            ORDER BY o.created_at DESC\n        ",
+    qbc9abd8d8dc4: "DELETE FROM sessions WHERE user_id = ?",
+    qbcfda8b063d3: "CREATE INDEX IF NOT EXISTS idx_conversations_order ON conversations(order_id)",
+    qbd240ce8e783: "\n            SELECT id, email, name, buyer_balance, is_buyer \n            FROM users \n            WHERE email = ?\n        ",
+    qbd6aca3c3399: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS metrics_source TEXT DEFAULT 'manual'",
+    qbdcec222c24d: "\n        INSERT INTO website_contributors (\n          website_id, user_id, writing_price, display_name, bio, \n          specialties, is_active, is_approved, approved_at,\n          average_rating, rating_count, turnaround_days\n        ) VALUES (\n          ?, ?, 5000, 'Pro Content Writer',\n          'Experienced tech and business writer with 5+ years of expertise in SEO-optimized content.',\n          ARRAY['technology', 'business', 'marketing'], true, true, NOW(),\n          4.8, 15, 3\n        )\n        RETURNING id\n      ",
+    qbe1e0b897a79: "SELECT status FROM blog_posts WHERE id = ?",
+    qbe919fd96f99: "\n      UPDATE admin_password_reset_tokens SET used_at = ?\n      WHERE id = ?\n    ",
+    qbec084be01ca: "CREATE INDEX IF NOT EXISTS idx_admin_users_role ON admin_users(role)",
+    qbf043bda5691: "\n            SELECT bp.*, au.name as author_name\n            FROM blog_posts bp\n            JOIN admin_users au ON bp.author_id = au.id\n            WHERE (? IS NULL OR bp.category = ?)\n            AND (? IS NULL OR bp.status = ?)\n            AND (? = '' OR bp.rowid IN (SELECT rowid FROM blog_posts_fts WHERE blog_posts_fts MATCH ? UNION SELECT rowid FROM blog_posts WHERE ? AND (title LIKE ? OR content LIKE ?)))\n            ORDER BY bp.created_at DESC\n            LIMIT ? OFFSET ?\n        ",
+    qc2349f23ba74: "\n            SELECT is_affiliate, affiliate_code, name FROM users WHERE id = ?\n        ",
+    qc25180508c65: "\n            SELECT domain, slug, owner_id FROM websites\n            WHERE domain IN (SELECT value FROM json_each(?))\n            OR slug IN (SELECT value FROM json_each(?))\n        ",
+    qc302f1ac1b06: "CREATE INDEX IF NOT EXISTS idx_activity_user ON activity_logs(user_id, created_at DESC)",
+    qc413d4761094: "\n            UPDATE notifications\n            SET is_read = 1, read_at = ?\n            WHERE id = ? AND user_id = ?\n            RETURNING *\n        ",
+    qc4590bdea8a6: "\n                    UPDATE users SET \n                        affiliate_balance = ?,\n                        buyer_balance = ?\n                    WHERE id = ?\n                ",
+    qc535236e0c7b: "\n            SELECT id FROM balance_transactions WHERE reference_id = ?\n        ",
+    qc5874f51135d: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS link_positions TEXT[]",
+    qc5c7d90df071: "\n      SELECT * FROM website_contributors \n      WHERE id = ? AND website_id = ?\n    ",
+    qc6615d194458: "ALTER TABLE users ADD COLUMN balance_reserved INTEGER DEFAULT 0",
+    qc7083bf55f50: "\n  SELECT \n    w.id, w.domain, w.name, w.domain_authority, w.domain_rating,\n    w.organic_traffic, w.price_guest_post, w.price_link_insertion,\n    w.link_type, w.turnaround_days, w.max_links, w.countries,\n    w.languages, w.is_featured, w.average_rating, w.rating_count,\n    c.name as category\n  FROM websites w\n  LEFT JOIN categories c ON w.primary_category_id = c.id\n  WHERE w.id = ? AND w.is_active = true\n",
+    qc7651c8d43f4: "\n            SELECT buyer_balance FROM users WHERE email = ?\n        ",
+    qc781bb84bba0: "\n                SELECT * FROM notifications\n                WHERE user_id = ?\n                AND (created_at, id) < (COALESCE(?, '~'), COALESCE(?, '~'))\n                ORDER BY created_at DESC, id DESC\n                LIMIT ?\n            ",
+    qc78b355b12ba: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS traffic_trend TEXT DEFAULT 'stable'",
+    qc7b9d1a1c0cc: "\n            UPDATE orders\n            SET\n                status = 'revision_needed',\n                buyer_rejected_at = ?,\n                buyer_rejection_reason = ?,\n                buyer_confirmation_deadline = NULL,\n                updated_at = ?\n            WHERE id = ?\n        ",
+    qc83bb96b5249: "\n      SELECT COUNT(*) as count FROM orders \n      WHERE selected_contributor_id = ?\n      AND status NOT IN ('completed', 'cancelled', 'refunded')\n    ",
+    qc86d21cea6ba: "\n            CREATE TABLE IF NOT EXISTS payout_requests (\n              id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n              user_id TEXT NOT NULL REFERENCES users(id),\n              amount INTEGER NOT NULL,\n              payout_method TEXT NOT NULL CHECK (payout_method IN ('paypal', 'payoneer')),\n              payout_email TEXT NOT NULL,\n              status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'processing', 'completed', 'cancelled', 'rejected')),\n              processed_by TEXT REFERENCES admin_users(id),\n              processed_at TIMESTAMPTZ,\n              admin_notes TEXT,\n              created_at TIMESTAMPTZ DEFAULT NOW(),\n              updated_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    qc8981e008b06: "\n            UPDATE messages\n            SET is_read = 1\n            WHERE conversation_id = ?\n            AND sender_id != ?\n            AND is_read = 0\n        ",
+    qc89e92bafb9e: "\n            INSERT INTO api_rate_limits (api_key_id, window_start, request_count)\n            VALUES (?, ?, 1)\n            ON CONFLICT (api_key_id, window_start) \n            DO UPDATE SET request_count = api_rate_limits.request_count + 1\n            RETURNING request_count\n        ",
+    qc90d66b66223: "\n          SELECT \n            wc.id,\n            wc.user_id,\n            wc.writing_price,\n            wc.display_name,\n            wc.bio,\n            wc.specialties,\n            wc.sample_work_url,\n            wc.completed_orders,\n            wc.average_rating,\n            wc.rating_count,\n            wc.turnaround_days,\n            u.name as user_name,\n            u.avatar_url\n          FROM website_contributors wc\n          JOIN users u ON wc.user_id = u.id\n          WHERE wc.website_id = ?\n            AND wc.is_active = true \n            AND wc.is_approved = true\n          ORDER BY wc.average_rating DESC, wc.completed_orders DESC\n        ",
+    qcacb16ae6725: "\n            SELECT id, domain FROM websites WHERE id = ?\n        ",
+    qcb65cfe5489c: "\n            SELECT \n                id, title, slug, excerpt, category, cover_image,\n                published_at, views\n            FROM blog_posts\n            WHERE status = 'published'\n            ORDER BY views DESC\n            LIMIT 3\n        ",
+    qcbc89bdf3b94: "\n            SELECT COUNT(*) as count FROM projects WHERE user_id = ? AND is_active = 1\n        ",
+    qcd4eb8bf77d1: "\n        UPDATE api_keys \n        SET is_active = false \n        WHERE id = ? AND user_id = ?\n    ",
+    qcdd4d93997db: "\n                SELECT COUNT(*) as count FROM notifications\n                WHERE user_id = ? AND is_read = 0\n            ",
+    qce1067a754b8: "\n            SELECT tag, version FROM cache_tags\n            WHERE tag IN (SELECT value FROM json_each(?))\n        ",
+    qce396639af25: "\n            SELECT \n                c.*,\n                o.order_number,\n                o.website_id,\n                w.domain as website_domain,\n                buyer.name as buyer_name,\n                buyer.avatar_url as buyer_avatar,\n                publisher.name as publisher_name,\n                publisher.avatar_url as publisher_avatar,\n                (\n                    SELECT COUNT(*)\n                    FROM messages m\n                    WHERE m.conversation_id = c.id \n                    AND m.is_read = false\n                ) as unread_count,\n                (\n                    SELECT message\n                    FROM messages m\n                    WHERE m.conversation_id = c.id\n                    ORDER BY m.created_at DESC\n                    LIMIT 1\n                ) as last_message\n            FROM conversations c\n            JOIN orders o ON c.order_id = o.id\n            JOIN websites w ON o.website_id = w.id\n            JOIN users buyer ON c.buyer_id = buyer.id\n            JOIN users publisher ON c.publisher_id = publisher.id\n            ORDER BY c.last_message_at DESC NULLS LAST, c.created_at DESC\n        ",
+    qce555d5fbeb2: "\n            UPDATE projects\n            SET \n                name = COALESCE(?, name),\n                url = COALESCE(?, url),\n                description = COALESCE(?, description),\n                favicon = COALESCE(?, favicon),\n                updated_at = NOW()\n            WHERE id = ? AND user_id = ?\n            RETURNING *\n        ",
+    qcf776f5c1288: "\n        SELECT \n            bp.*,\n            au.name as author_name,\n            au.email as author_email\n        FROM blog_posts bp\n        LEFT JOIN admin_users au ON bp.author_id = au.id\n        WHERE bp.slug = ? AND bp.status = 'published'\n    ",
+    qcf7e41a93981: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS referring_domains INTEGER",
+    qcf886a765680: "SELECT domain FROM websites WHERE id = ?",
+    qcfae2ecf5a47: "\n      SELECT COUNT(*) as count FROM websites WHERE owner_id = ?\n    ",
+    qd00e1b0e9371: "\n            SELECT EXISTS (\n                SELECT FROM information_schema.tables \n                WHERE table_name = 'admin_users'\n            )\n        ",
+    qd163617722b0: "\n            UPDATE users\n            SET publisher_balance = publisher_balance + ?\n            WHERE id = ?\n        ",
+    qd1705e318fb6: "\n            SELECT \n                p.*,\n                COUNT(DISTINCT o.id) as order_count,\n                COUNT(DISTINCT o.id) FILTER (WHERE o.status IN ('approved', 'published', 'completed')) as completed_count,\n                COUNT(DISTINCT o.id) FILTER (WHERE o.status = 'pending') as pending_count,\n                COALESCE(SUM(o.total_amount), 0) as total_spent\n            FROM projects p\n            LEFT JOIN orders o ON o.project_id = p.id\n            WHERE p.id = ? AND p.user_id = ?\n            GROUP BY p.id\n        ",
+    qd1b4863101d7: "\n            SELECT COALESCE(SUM(o.affiliate_fee), 0) as total_earnings\n            FROM orders o\n            WHERE o.affiliate_id = ?\n              AND o.status IN ('completed', 'published')\n        ",
+    qd35bc88cd440: "CREATE INDEX IF NOT EXISTS idx_orders_contributor ON orders(selected_contributor_id) WHERE selected_contributor_id IS NOT NULL",
+    qd36bd792386f: "\n            DELETE FROM favorites \n            WHERE user_id = ? \n            AND (id = ? OR website_id = ?)\n            RETURNING id\n        ",
+    qd57c9cc990ef: "\n            INSERT INTO blacklists (user_id, website_id, domain, reason)\n            VALUES (?, ?, ?, ?)\n            RETURNING id\n        ",
+    qd6f3536ac027: "SELECT * FROM users WHERE id = ?",
+    qd767a0047f7e: "\n                    UPDATE users SET affiliate_balance = ?\n                    WHERE id = ?\n                ",
+    qd76930c22760: "\n            INSERT INTO orders (\n                id, order_number, buyer_id, website_id, publisher_id,\n                order_type, status, payment_status,\n                base_price, subtotal, platform_fee, total_amount, publisher_earnings,\n                article_title, article_content, anchor_text, target_url, buyer_notes,\n                turnaround_days, content_source, created_at, paid_at\n            ) VALUES (\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                'pending',\n                'paid',\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                ?,\n                'buyer_provided',\n                ?,\n                ?\n            )\n        ",
+    qd774a295a453: "CREATE INDEX IF NOT EXISTS idx_messages_sender ON messages(sender_id)",
+    qd77da72af234: "\n            CREATE TABLE IF NOT EXISTS messages (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                conversation_id TEXT NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,\n                sender_id TEXT NOT NULL REFERENCES users(id),\n                message TEXT NOT NULL,\n                is_read BOOLEAN DEFAULT false,\n                created_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    qd7fb0b8b0539: "\n      SELECT rr.*, \n             o.order_number, o.total_amount as order_total,\n             u.name as buyer_name, u.email as buyer_email\n      FROM refund_requests rr\n      JOIN orders o ON rr.order_id = o.id\n      JOIN users u ON rr.buyer_id = u.id\n      ORDER BY rr.created_at DESC\n      LIMIT 50\n    ",
+    qd86c0e6b5ff7: "\n            CREATE TABLE IF NOT EXISTS conversations (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                order_id TEXT NOT NULL REFERENCES orders(id) ON DELETE CASCADE,\n                buyer_id TEXT NOT NULL REFERENCES users(id),\n                publisher_id TEXT NOT NULL REFERENCES users(id),\n                created_at TIMESTAMPTZ DEFAULT NOW(),\n                last_message_at TIMESTAMPTZ DEFAULT NOW(),\n                UNIQUE(order_id)\n            )\n        ",
+    qd95d7dea5fa5: "\n            SELECT \n                COUNT(*) FILTER (WHERE status = 'pending') as pending_count,\n                COUNT(*) FILTER (WHERE status = 'processing') as processing_count,\n                COUNT(*) FILTER (WHERE status = 'completed') as completed_count,\n                COALESCE(SUM(amount) FILTER (WHERE status = 'pending'), 0) as pending_amount,\n                COALESCE(SUM(amount) FILTER (WHERE status = 'completed'), 0) as total_paid\n            FROM payout_requests\n        ",
+    qd9de22dc444f: "\n    SELECT s.*, u.*\n    FROM sessions s\n    JOIN users u ON s.user_id = u.id\n    WHERE s.id = ? AND s.expires_at > ?\n  ",
+    qda26372caf89: "SELECT id FROM users WHERE affiliate_code = ?",
+    qdae8291ec8f8: "\n            SELECT bp.*, au.name as author_name, au.email as author_email\n            FROM blog_posts bp\n            JOIN admin_users au ON bp.author_id = au.id\n            WHERE bp.id = ?\n        ",
+    qdaf3b8878d0a: "\n            UPDATE notifications\n            SET is_read = 1, read_at = ?\n            WHERE user_id = ? AND is_read = 0\n        ",
+    qdc58c6c45aae: "\n            SELECT \n                b.id,\n                b.website_id,\n                b.domain,\n                b.reason,\n                b.created_at,\n                w.name,\n                w.category\n            FROM blacklists b\n            LEFT JOIN websites w ON b.website_id = w.id\n            WHERE b.user_id = ?\n            ORDER BY b.created_at DESC\n        ",
+    qdd77dd39516e: "\n      INSERT INTO orders (\n        id, order_number, buyer_id, website_id, publisher_id,\n        order_type, status, base_price, subtotal, platform_fee, total_amount, publisher_earnings,\n        article_title, article_content, anchor_text, target_url,\n        turnaround_days, campaign_id, created_at,\n        content_source, selected_contributor_id, contributor_id, contributor_earnings\n      ) VALUES (\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        'pending',\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?,\n        ?\n      )\n    ",
+    qdda6f745432b: "\n      SELECT id, domain FROM websites WHERE verification_status = 'approved' AND is_active = true LIMIT 1\n    ",
+    qddad7bd78190: "\n                UPDATE orders SET status = ?, updated_at = ?\n                WHERE id = ?\n            ",
+    qde19aa4b60e8: "\n                SELECT \n                    m.*,\n                    u.name as sender_name,\n                    u.avatar_url as sender_avatar\n                FROM messages m\n                JOIN users u ON m.sender_id = u.id\n                WHERE m.conversation_id = ?\n                ORDER BY m.created_at DESC\n                LIMIT ?\n            ",
+    qde384d2f9fba: "\n            SELECT id, domain FROM websites\n            WHERE id = ? AND user_id = ?\n        ",
+    qdf1282e3151d: "\n            SELECT buyer_rating FROM orders\n            WHERE website_id = ?\n            AND buyer_rating IS NOT NULL\n        ",
+    qdf8ed9f3c2e0: "CREATE INDEX IF NOT EXISTS idx_orders_payment_gateway ON orders(payment_gateway)",
+    qdff2a66c4a94: "\n                CREATE TABLE IF NOT EXISTS admin_sessions (\n                  id TEXT PRIMARY KEY,\n                  admin_id TEXT NOT NULL REFERENCES admin_users(id) ON DELETE CASCADE,\n                  expires_at TIMESTAMPTZ NOT NULL,\n                  ip_address TEXT,\n                  user_agent TEXT,\n                  created_at TIMESTAMPTZ DEFAULT NOW()\n                )\n            ",
+    qe0b9f5a67fee: "\n            CREATE TABLE IF NOT EXISTS blacklists (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n                project_id TEXT REFERENCES projects(id) ON DELETE CASCADE,\n                website_id TEXT REFERENCES websites(id) ON DELETE CASCADE,\n                domain VARCHAR(255),\n                reason TEXT,\n                created_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    qe0bf55c1700e: "\n      INSERT INTO password_reset_tokens (user_id, token, expires_at)\n      VALUES (?, ?, ?)\n    ",
+    qe19a03af1507: "\n            SELECT \n                c.*,\n                o.order_number,\n                o.website_id,\n                w.domain as website_domain,\n                buyer.name as buyer_name,\n                buyer.avatar_url as buyer_avatar,\n                publisher.name as publisher_name,\n                publisher.avatar_url as publisher_avatar,\n                (\n                    SELECT COUNT(*)\n                    FROM messages m\n                    WHERE m.conversation_id = c.id\n                    AND m.is_read = 0\n                    AND m.sender_id != ?\n                ) as unread_count\n            FROM conversations c\n            JOIN orders o ON c.order_id = o.id\n            JOIN websites w ON o.website_id = w.id\n            JOIN users buyer ON c.buyer_id = buyer.id\n            JOIN users publisher ON c.publisher_id = publisher.id\n            WHERE c.buyer_id = ? OR c.publisher_id = ?\n            ORDER BY c.last_message_at DESC NULLS LAST, c.created_at DESC\n        ",
+    qe330a8768870: "\n            SELECT \n                w.id, w.domain, w.name, w.description,\n                w.domain_authority, w.domain_rating, w.organic_traffic,\n                w.price_guest_post, w.price_link_insertion, w.price_content_writing,\n                w.price_extra_link, w.price_homepage_link, w.price_urgent,\n                w.link_type, w.turnaround_days, w.is_featured,\n                w.traffic_country_1,\n                w.primary_language,\n                w.max_links, w.min_word_count, w.max_word_count,\n                w.allows_casino, w.allows_cbd, w.allows_adult, w.allows_crypto,\n                w.sample_post_url,\n                w.average_rating, w.rating_count, \n                COALESCE(w.completed_orders, 0) as completed_orders,\n                COALESCE(w.total_orders, 0) as total_orders,\n                COALESCE(w.completion_rate, 100) as completion_rate,\n                w.verification_status,\n                COALESCE(w.is_indexed, true) as is_indexed,\n                c.name as category\n            FROM websites w\n            LEFT JOIN categories c ON w.primary_category_id = c.id\n            WHERE w.is_active = true\n            AND (\n                ? = '' \n                OR (w.rowid IN (SELECT rowid FROM websites_fts WHERE websites_fts MATCH ? UNION SELECT rowid FROM websites WHERE ? AND (domain LIKE ? OR name LIKE ?)) OR c.rowid IN (SELECT rowid FROM categories_fts WHERE categories_fts MATCH ? UNION SELECT rowid FROM categories WHERE ? AND name LIKE ?))\n            )\n            AND (? = '' OR c.slug = ?)\n            AND (? OR w.link_type = ANY(?))\n            AND (? OR w.domain_authority >= ?)\n            AND (? OR w.domain_authority <= ?)\n            AND (? OR w.domain_rating >= ?)\n            AND (? OR w.domain_rating <= ?)\n            AND (? OR w.price_guest_post >= ?)\n            AND (? OR w.price_guest_post <= ?)\n            AND (? OR w.turnaround_days <= ?)\n            AND (? OR w.verification_status = 'verified')\n            ORDER BY \n                w.is_featured DESC,\n                COALESCE(w.admin_boost_score, 0) DESC,\n                CASE ?\n                    WHEN 'da_desc' THEN w.domain_authority\n                    WHEN 'dr_desc' THEN w.domain_rating\n                    WHEN 'traffic_desc' THEN w.organic_traffic\n                    WHEN 'rating_desc' THEN w.average_rating\n                    ELSE w.domain_authority\n                END DESC NULLS LAST,\n                CASE ?\n                    WHEN 'da_asc' THEN w.domain_authority\n                    WHEN 'price_asc' THEN w.price_guest_post\n                    ELSE NULL\n                END ASC NULLS LAST,\n                CASE ?\n                    WHEN 'price_desc' THEN w.price_guest_post\n                    ELSE NULL\n                END DESC NULLS LAST,\n                CASE ?\n                    WHEN 'newest' THEN EXTRACT(EPOCH FROM w.created_at)\n                    ELSE NULL\n                END DESC NULLS LAST\n            LIMIT ? OFFSET ?\n        ",
+    qe38c711204ba: "\n      SELECT o.*, \n             b.name as buyer_name, b.email as buyer_email,\n             w.domain as website_domain,\n             p.name as publisher_name, p.email as publisher_email\n      FROM orders o\n      JOIN users b ON o.buyer_id = b.id\n      JOIN websites w ON o.website_id = w.id\n      JOIN users p ON o.publisher_id = p.id\n      ORDER BY o.created_at DESC\n      LIMIT 50\n    ",
+    qe48375d35cd1: "\n      INSERT INTO transactions (\n        user_id, type, reference_type, reference_id,\n        amount, balance_type, description,\n        stripe_payment_intent_id\n      ) VALUES (\n        ?,\n        'refund',\n        'order',\n        ?,\n        ?,\n        'buyer',\n        ?,\n        ?\n      )\n    ",
+    qe516b97cf3db: "\n      SELECT be.*, au.name as banned_by_name\n      FROM banned_emails be\n      LEFT JOIN admin_users au ON be.banned_by = au.id\n      WHERE be.is_active = true\n      ORDER BY be.created_at DESC\n    ",
+    qe55699459731: "\n      SELECT o.id, o.order_type, o.total_amount, o.status, o.created_at, w.domain as website_domain\n      FROM orders o\n      JOIN websites w ON o.website_id = w.id\n      WHERE o.publisher_id = ?\n      ORDER BY o.created_at DESC\n      LIMIT 5\n    ",
+    qe5a4d2a60888: "\n                UPDATE orders SET status = ?, completed_at = ?, updated_at = ?\n                WHERE id = ?\n            ",
+    qe70875c2b799: "\n            SELECT *\n            FROM payout_requests\n            WHERE id = ?\n        ",
+    qe732a17fc01f: "\n            SELECT \n                o.*,\n                p.publisher_balance,\n                c.contributor_balance\n            FROM orders o\n            LEFT JOIN users p ON o.publisher_id = p.id\n            LEFT JOIN users c ON o.contributor_id = c.id\n            WHERE o.status = 'published'\n            AND o.buyer_confirmation_deadline < NOW()\n            AND o.buyer_confirmed_at IS NULL\n            AND o.buyer_rejected_at IS NULL\n        ",
+    qe78e330b405f: "\n                INSERT INTO balance_transactions (id, user_id, balance_type, transaction_type, amount, balance_before, balance_after, description, created_at)\n                VALUES \n                    (gen_random_uuid()::text, ?, ?, 'debit', ?, ?, ?, 'Transfer to buyer wallet', NOW()),\n                    (gen_random_uuid()::text, ?, 'buyer', 'credit', ?, ?, ?, ?, NOW())\n            ",
+    qe8b362e25a00: "\n                UPDATE orders SET status = ?, accepted_at = ?, updated_at = ?\n                WHERE id = ?\n            ",
+    qe99bde2dc456: "\n        SELECT id, user_id, name, prefix, permissions, rate_limit, \n               is_active, last_used_at, created_at\n        FROM api_keys\n        WHERE user_id = ?\n        ORDER BY created_at DESC\n    ",
+    qe9b9ad5d4571: "ALTER TABLE websites ADD COLUMN IF NOT EXISTS completion_rate DECIMAL(5,2) DEFAULT 100",
+    qea107b29d64a: "\n      SELECT \n        o.*,\n        b.email as buyer_email,\n        b.name as buyer_name\n      FROM orders o\n      JOIN users b ON o.buyer_id = b.id\n      WHERE o.id = ?\n    ",
+    qeaf36c5b2901: "\n            SELECT * FROM websites\n            WHERE id = ?\n            AND ownership_type = 'contributor'\n        ",
+    qeb106222a959: "\n            SELECT id FROM blog_posts WHERE slug = ?\n        ",
+    qec5585a3c5d6: "\n            INSERT INTO conversations (id, order_id, buyer_id, publisher_id)\n            VALUES (\n                ?,\n                ?,\n                ?,\n                ?\n            )\n            ON CONFLICT (order_id) DO NOTHING\n        ",
+    qed0680875dd8: "\n            UPDATE orders\n            SET\n                link_verified = ?,\n                link_verified_at = ?,\n                link_verification_error = ?\n            WHERE id = ?\n        ",
+    qed9059884862: "DELETE FROM admin_password_reset_tokens WHERE admin_id = ?",
+    qed9b881b5f2f: "CREATE INDEX IF NOT EXISTS idx_admin_users_email ON admin_users(email)",
+    qee16213f89a4: "\n      INSERT INTO users (\n        id, email, password_hash, name,\n        is_buyer, is_publisher, is_affiliate,\n        affiliate_code, referred_by\n      )\n      VALUES (\n        ?, ?, ?, ?,\n        ?, ?, ?,\n        ?, ?\n      )\n    ",
+    qee6f1f1e96c6: "\n                    INSERT INTO transactions (\n                        id, user_id, type, amount,\n                        balance_type, balance_before, balance_after,\n                        reference_type, reference_id, description, status, created_at\n                    ) VALUES (\n                        gen_random_uuid()::text,\n                        ?,\n                        'earning',\n                        ?,\n                        'publisher',\n                        ?,\n                        ?,\n                        'order',\n                        ?,\n                        ?,\n                        'completed',\n                        NOW()\n                    )\n                ",
+    qef2a9f330c9f: "\n        UPDATE website_contributors \n        SET is_approved = true, approved_at = ?, rejected_at = NULL, rejection_reason = NULL, updated_at = ?\n        WHERE id = ? AND website_id = ?\n        RETURNING *\n      ",
+    qef51792e312f: "\n            INSERT INTO blog_posts (\n                title, slug, content, excerpt, cover_image,\n                author_id, status, category, tags,\n                meta_title, meta_description, keywords,\n                ? created_at, updated_at\n            )\n            VALUES (\n                ?, ?, ?, ?, ?,\n                ?, ?, ?, ?,\n                ?, ?, ?,\n                ? NOW(), NOW()\n            )\n            RETURNING *\n        ",
+    qef94fed0fe57: "\n      DELETE FROM website_contributors \n      WHERE id = ? AND website_id = ?\n    ",
+    qf2038a7ee96e: "\n                SELECT \n                    id, title, slug, excerpt, category, cover_image,\n                    published_at, views\n                FROM blog_posts\n                WHERE status = 'published'\n                ORDER BY published_at DESC\n                LIMIT 20\n            ",
+    qf21f156bb44f: "\n            SELECT COUNT(DISTINCT ar.referred_user_id) as converted\n            FROM affiliate_referrals ar\n            JOIN orders o ON o.buyer_id = ar.referred_user_id\n            WHERE ar.affiliate_id = ?\n              AND o.payment_status = 'paid'\n        ",
+    qf27763a45796: "\n            INSERT INTO admin_users (email, password_hash, name, role, is_active)\n            VALUES (?, ?, ?, ?, true)\n            ON CONFLICT (email) \n            DO UPDATE SET \n                password_hash = EXCLUDED.password_hash,\n                name = EXCLUDED.name,\n                role = EXCLUDED.role,\n                is_active = true,\n                updated_at = ?\n            RETURNING id, email\n        ",
+    qf30198651035: "DELETE FROM password_reset_tokens WHERE user_id = ?",
+    qf3292119ef97: "\n            SELECT COUNT(*) as count FROM notifications\n            WHERE user_id = ? AND is_read = 0\n        ",
+    qf37d030034ac: "\n        UPDATE users \n        SET publisher_balance = publisher_balance + ?\n        WHERE id = ?\n      ",
+    qf3ce300e7fbf: "\n            CREATE TABLE IF NOT EXISTS projects (\n                id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,\n                user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,\n                name VARCHAR(100) NOT NULL,\n                url VARCHAR(500) NOT NULL,\n                description TEXT,\n                favicon VARCHAR(500),\n                budget_spent INTEGER DEFAULT 0,\n                order_count INTEGER DEFAULT 0,\n                completed_order_count INTEGER DEFAULT 0,\n                last_order_at TIMESTAMPTZ,\n                is_active BOOLEAN DEFAULT 1,\n                created_at TIMESTAMPTZ DEFAULT NOW(),\n                updated_at TIMESTAMPTZ DEFAULT NOW()\n            )\n        ",
+    qf45726883230: "CREATE INDEX IF NOT EXISTS idx_blacklists_user ON blacklists(user_id, project_id)",
+    qf46c5f32a854: "SELECT * FROM disputes WHERE id = ?",
+    qf4f0f7761449: "\n            INSERT INTO payout_requests (\n                user_id, amount, payout_method, payout_email, status, created_at\n            )\n            VALUES (\n                ?, ?, ?, ?, 'pending', NOW()\n            )\n            RETURNING id\n        ",
+    qf52570202d78: "DELETE FROM admin_sessions WHERE id = ?",
+    qf564deaee6f2: "CREATE INDEX IF NOT EXISTS idx_orders_razorpay_order_id ON orders(razorpay_order_id)",
+    qf6ab07a6a6b8: "\n                INSERT INTO payouts (\n                    id, user_id, amount, payout_method, payout_email,\n                    balance_type, status, created_at\n                ) VALUES (\n                    gen_random_uuid()::text,\n                    ?,\n                    ?,\n                    ?,\n                    ?,\n                    ?,\n                    'pending',\n                    NOW()\n                )\n            ",
+    qf6b160a57a72: "\n        SELECT \n            o.id, o.order_type, o.status, o.total_amount, o.created_at, \n            w.domain as website_domain\n        FROM orders o\n        JOIN websites w ON o.website_id = w.id\n        WHERE o.campaign_id = ? AND o.buyer_id = ?\n        ORDER BY o.created_at DESC\n    ",
+    qf72a4e7e9feb: "\n            SELECT \n                o.id, o.order_number, o.order_type, o.status, o.total_amount, o.created_at,\n                w.domain as website_domain, w.domain_authority as website_da,\n                p.name as publisher_name\n            FROM orders o\n            JOIN websites w ON o.website_id = w.id\n            JOIN users p ON o.publisher_id = p.id\n            WHERE o.buyer_id = ?\n            ORDER BY o.created_at DESC\n            LIMIT 5\n        ",
+    qf7573b662da4: "\n            INSERT INTO activity_logs (user_id, action, description, model_type, model_id)\n            VALUES (?, 'project_deleted', ?, 'project', ?)\n        ",
+    qf7cb0973dbd1: "\n            INSERT INTO websites (\n                user_id,\n                domain,\n                ownership_type,\n                verification_status,\n                contributor_application,\n                created_at\n            )\n            SELECT \n                ?,\n                domain,\n                'contributor',\n                'pending',\n                ?,\n                NOW()\n            FROM websites\n            WHERE id = ?\n        ",
+    qfd742864cd1a: "\n      SELECT id FROM website_contributors \n      WHERE website_id = ? AND user_id = ?\n    ",
+    qfebc9c6ba7c8: "\n        SELECT wc.*, u.name as contributor_name, u.email as contributor_email\n        FROM website_contributors wc\n        JOIN users u ON wc.user_id = u.id\n        WHERE wc.id = ? \n          AND wc.website_id = ?\n          AND wc.is_active = true \n          AND wc.is_approved = true\n      ",
+    qff1b9f86cc61: "\n            SELECT \n                w.id,\n                w.domain,\n                w.contributor_application,\n                w.created_at,\n                w.verification_status,\n                u.name as applicant_name,\n                u.email as applicant_email,\n                u.id as applicant_id\n            FROM websites w\n            JOIN users u ON w.user_id = u.id\n            WHERE w.ownership_type = 'contributor'\n            ORDER BY \n                CASE w.verification_status\n                    WHEN 'pending' THEN 1\n                    WHEN 'verified' THEN 2\n                    WHEN 'rejected' THEN 3\n                END,\n                w.created_at DESC\n            LIMIT 100\n        ",
+    qff920ea52de0: "\n            SELECT d.*, u.name as raised_by_name\n            FROM disputes d\n            JOIN users u ON d.raised_by = u.id\n            WHERE d.order_id = ?\n            ORDER BY d.created_at DESC\n        ",
+};
@@ -2,16 +2,20 @@
 """
 Automated D1 migration script for API routes
 Adds necessary imports and D1 initialization to all route files
+
+Rewrites go through the codemod journal (codemod_journal.py), so a run can
+be undone.
 """
 
-import os
 import re
-from pathlib import Path
 
-def migrate_route_file(file_path):
+from codemod_journal import open_run
+from sql_extract import REPO_ROOT
+
+def migrate_route_file(file_path, journal):
     """Migrate a single route file to D1"""
     with open(file_path, 'r') as f:
-        content = f.content()
+        content = f.read()
 
     # Skip if already migrated
     if 'initializeDatabaseFromContext' in content:
@@ -47,26 +51,25 @@ def migrate_route_file(file_path):
             content = re.sub(pattern2, replacement2, content, count=1)
 
     # Write back
-    with open(file_path, 'w') as f:
-        f.write(content)
+    journal.write_text(file_path, content)
 
     print(f"✓ Migrated: {file_path}")
     return True
 
 def main():
     """Migrate all route files"""
-    base_dir = Path("/sessions/busy-blissful-mccarthy/mnt/Desktop/PressScape D1")
-    api_dir = base_dir / "app" / "api"
+    api_dir = REPO_ROOT / "app" / "api"
 
     migrated = 0
     skipped = 0
 
     # Find all route.ts files
-    for route_file in api_dir.rglob("route.ts"):
-        if migrate_route_file(route_file):
-            migrated += 1
-        else:
-            skipped += 1
+    with open_run("auto-migrate-routes") as journal:
+        for route_file in api_dir.rglob("route.ts"):
+            if migrate_route_file(route_file, journal):
+                migrated += 1
+            else:
+                skipped += 1
 
     print(f"\n✅ Migration complete!")
     print(f"   Migrated: {migrated} files")
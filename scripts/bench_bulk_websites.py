@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Benchmark the publisher bulk website upload on a local SQLite stand-in.
+
+Replays one upload against the D1 schema (see local_d1.py) twice:
+
+  before   the old per-row loop: an existence SELECT and an INSERT per row
+  after    app/api/publisher/websites/bulk/route.ts: json_each probes of
+           domains and slugs, then multi-row INSERTs split to D1's parameter
+           limit and sent as one batch, retried per chunk if it fails
+
+Each statement, or batch of statements, counts as one D1 round trip. Latency
+is the local execution time plus --rtt-ms per round trip, since the network
+hop to D1 is what dominates in a Worker. Both runs must insert the same rows
+and reject the same number; the messages differ only for slug collisions,
+which the batched path reports before inserting. --fail-batch makes the
+batch fail once, as a write racing the upload would, to time the retry.
+
+Usage: python3 scripts/bench_bulk_websites.py [--rows 500] [--rtt-ms 5] [--fail-batch]
+"""
+
+import argparse
+import json
+import random
+import re
+import sqlite3
+import sys
+import time
+import uuid
+
+from local_d1 import open_local_db
+
+OWNER_ID = "bench-owner"
+OTHER_OWNER_ID = "bench-other-owner"
+
+# Mirrors of the constants in the route
+D1_MAX_PARAMS = 100
+PROBE_CHUNK_SIZE = 500
+INSERT_COLUMNS = """
+    INSERT INTO websites (
+        id, owner_id, domain, name, slug, domain_authority, domain_rating,
+        organic_traffic, link_type, turnaround_days, price_guest_post,
+        sample_post_url, is_active, verification_status, created_at
+    ) VALUES """
+INSERT_ROW = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, false, 'pending', ?)"
+INSERT_ROW_PARAMS = 13
+ROWS_PER_INSERT = D1_MAX_PARAMS // INSERT_ROW_PARAMS
+
+
+class LocalD1:
+    """A SQLite connection that counts D1 round trips."""
+
+    def __init__(self, conn, fail_batch=False):
+        self.conn = conn
+        self.round_trips = 0
+        self.fail_batch = fail_batch
+
+    def query(self, sql, params=()):
+        self.round_trips += 1
+        return self.conn.execute(sql, params).fetchall()
+
+    def execute(self, sql, params=()):
+        """Run one write; returns the rows it changed."""
+        self.round_trips += 1
+        return self.conn.execute(sql, params).rowcount
+
+    def batch(self, statements):
+        """Run statements atomically, as D1's batch() does."""
+        self.round_trips += 1
+        if self.fail_batch:
+            self.fail_batch = False
+            raise sqlite3.OperationalError("simulated batch failure")
+        self.conn.execute("SAVEPOINT batch")
+        try:
+            for sql, params in statements:
+                self.conn.execute(sql, params)
+        except sqlite3.Error:
+            self.conn.execute("ROLLBACK TO batch")
+            self.conn.execute("RELEASE batch")
+            raise
+        self.conn.execute("RELEASE batch")
+        return True
+
+
+def make_upload(rows, seed=1):
+    """Rows as the CSV upload sends them, with the usual mess mixed in."""
+    rng = random.Random(seed)
+    upload = []
+    for i in range(rows):
+        roll = rng.random()
+        domain = f"site-{i}.example.com"
+        if roll < 0.05:
+            domain = f"site-{rng.randrange(max(i, 1))}.example.com"  # repeated in the upload
+        elif roll < 0.10:
+            domain = f"mine-{i % 20}.example.com"  # already listed by this user
+        elif roll < 0.12:
+            domain = f"theirs-{i % 5}.example.com"  # listed by someone else
+        elif roll < 0.14:
+            # same slug as an earlier row or an existing listing
+            domain = f"site.{rng.randrange(max(i, 1))}.example.com"
+        row = {
+            "Domain": f"https://www.{domain}/",
+            "DA": str(rng.randint(10, 90)),
+            "DR": str(rng.randint(10, 90)),
+            "Traffic": f"{rng.randint(1, 900)}k",
+            "Link": "Dofollow" if rng.random() < 0.7 else "Nofollow",
+            "TaT": f"{rng.randint(1, 10)} days",
+            "Price in USD": f"${rng.randint(20, 500)}",
+        }
+        if roll > 0.97:
+            row["Price in USD"] = ""  # fails validation
+        upload.append(row)
+    return upload
+
+
+def seed(conn):
+    now = "2024-01-01T00:00:00Z"
+    for i in range(20):
+        conn.execute(
+            "INSERT INTO websites (id, owner_id, domain, name, slug, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (str(uuid.uuid4()), OWNER_ID, f"mine-{i}.example.com", "mine", f"mine-{i}-example-com", now),
+        )
+    for i in range(5):
+        conn.execute(
+            "INSERT INTO websites (id, owner_id, domain, name, slug, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (str(uuid.uuid4()), OTHER_OWNER_ID, f"theirs-{i}.example.com", "theirs",
+             f"theirs-{i}-example-com", now),
+        )
+    for i in range(5):
+        conn.execute(
+            "INSERT INTO websites (id, owner_id, domain, name, slug, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (str(uuid.uuid4()), OTHER_OWNER_ID, f"old-{i}.example.org", "old",
+             f"site-{i * 40}-example-com", now),
+        )
+
+
+# Python mirrors of the route's row helpers
+def slugify(text):
+    text = re.sub(r"[^\w\s-]", "", text.lower())
+    return re.sub(r"[\s_-]+", "-", text).strip("-")
+
+
+def clean_domain(url):
+    url = url if url.startswith("http") else f"https://{url}"
+    host = url.split("://", 1)[1].split("/", 1)[0].lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def parse_row(row, now):
+    domain = clean_domain(row.get("Domain", ""))
+    da = int(row.get("DA") or 0)
+    price = int(row.get("Price in USD", "").replace("$", "") or 0) * 100
+    if not domain or not da or not price:
+        return None
+    traffic = int(row["Traffic"].rstrip("k")) * 1000
+    link_type = "dofollow" if "dofollow" in row["Link"].lower() else "nofollow"
+    turnaround = int(row["TaT"].split()[0])
+    return [str(uuid.uuid4()), OWNER_ID, domain, domain, slugify(domain.replace(".", "-")),
+            da, int(row["DR"]) or None, traffic, link_type, turnaround, price, None, now]
+
+
+def upload_before(db, upload, now):
+    """The old loop: one SELECT and one INSERT per row."""
+    count, errors = 0, []
+    for row in upload:
+        params = parse_row(row, now)
+        if params is None:
+            errors.append("Skipped row: missing domain, DA, or price")
+            continue
+        domain = params[2]
+        try:
+            if db.query("SELECT id FROM websites WHERE domain = ? AND owner_id = ?", (domain, OWNER_ID)):
+                errors.append(f"{domain}: already exists")
+                continue
+            db.query(INSERT_COLUMNS + INSERT_ROW, params)
+            count += 1
+        except sqlite3.Error as err:
+            errors.append(f"Error processing row: {err}")
+    return count, errors
+
+
+def insert_one_by_one(db, rows, row_errors):
+    count, inserted = 0, set()
+    for index, domain, params in rows:
+        if domain in inserted:
+            row_errors[index] = f"{domain}: already exists"
+            continue
+        try:
+            if db.execute(INSERT_COLUMNS + INSERT_ROW, params) > 0:
+                inserted.add(domain)
+                count += 1
+        except sqlite3.Error as err:
+            row_errors[index] = f"Error processing row: {err}"
+    return count
+
+
+def insert_statement(rows):
+    return (INSERT_COLUMNS + ", ".join(INSERT_ROW for _ in rows),
+            [p for _, _, params in rows for p in params])
+
+
+def insert_websites(db, rows, row_errors):
+    chunks = [rows[i:i + ROWS_PER_INSERT] for i in range(0, len(rows), ROWS_PER_INSERT)]
+    if not chunks:
+        return 0
+    try:
+        if db.batch([insert_statement(chunk) for chunk in chunks]):
+            return len(rows)
+    except sqlite3.Error:
+        pass
+    count = 0
+    for chunk in chunks:
+        try:
+            count += db.execute(*insert_statement(chunk))
+        except sqlite3.Error:
+            count += insert_one_by_one(db, chunk, row_errors)
+    return count
+
+
+def upload_after(db, upload, now):
+    """The batched path in the route."""
+    row_errors = [None] * len(upload)
+    parsed = []
+    for index, row in enumerate(upload):
+        params = parse_row(row, now)
+        if params is None:
+            row_errors[index] = "Skipped row: missing domain, DA, or price"
+        else:
+            parsed.append((index, params[2], params))
+
+    owners, slugs = {}, set()
+    for i in range(0, len(parsed), PROBE_CHUNK_SIZE):
+        chunk = parsed[i:i + PROBE_CHUNK_SIZE]
+        for domain, slug, owner in db.query(
+            "SELECT domain, slug, owner_id FROM websites "
+            "WHERE domain IN (SELECT value FROM json_each(?)) OR slug IN (SELECT value FROM json_each(?))",
+            (json.dumps([d for _, d, _ in chunk]), json.dumps([p[4] for _, _, p in chunk])),
+        ):
+            owners.setdefault(domain, []).append(owner)
+            slugs.add(slug)
+
+    batched, one_by_one, added = [], [], set()
+    for index, domain, params in parsed:
+        existing = owners.get(domain, [])
+        if OWNER_ID in existing or domain in added:
+            row_errors[index] = f"{domain}: already exists"
+        elif existing:
+            one_by_one.append((index, domain, params))
+        elif params[4] in slugs:
+            row_errors[index] = f"{domain}: slug {params[4]} is already in use"
+        else:
+            added.add(domain)
+            slugs.add(params[4])
+            batched.append((index, domain, params))
+
+    count = insert_websites(db, batched, row_errors)
+    count += insert_one_by_one(db, one_by_one, row_errors)
+    return count, [e for e in row_errors if e is not None]
+
+
+def run(method, upload, fail_batch=False):
+    conn, _ = open_local_db()
+    seed(conn)
+    db = LocalD1(conn, fail_batch)
+    started = time.perf_counter()
+    count, errors = method(db, upload, "2024-06-01T00:00:00Z")
+    elapsed = (time.perf_counter() - started) * 1000
+    stored = conn.execute("SELECT domain, slug, owner_id FROM websites ORDER BY domain").fetchall()
+    conn.close()
+    return count, errors, db.round_trips, elapsed, stored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=500, help="rows in the upload")
+    parser.add_argument("--rtt-ms", type=float, default=5.0, help="simulated D1 round-trip time")
+    parser.add_argument("--fail-batch", action="store_true", help="make the batched insert fail once")
+    args = parser.parse_args()
+
+    upload = make_upload(args.rows)
+    results = {name: run(method, upload, args.fail_batch)
+               for name, method in (("before", upload_before), ("after", upload_after))}
+
+    per_100 = 100 / args.rows
+    print(f"{args.rows} rows, {args.rtt_ms:g}ms per round trip\n")
+    print(f"{'':8} {'inserted':>9} {'errors':>7} {'round trips':>12} {'trips/100':>10} "
+          f"{'local ms/100':>13} {'ms/100 w/ RTT':>14}")
+    for name, (count, errors, trips, elapsed, _) in results.items():
+        with_rtt = elapsed + trips * args.rtt_ms
+        print(f"{name:8} {count:>9} {len(errors):>7} {trips:>12} {trips * per_100:>10.1f} "
+              f"{elapsed * per_100:>13.2f} {with_rtt * per_100:>14.1f}")
+
+    before, after = results["before"], results["after"]
+    if (before[0], len(before[1]), before[4]) != (after[0], len(after[1]), after[4]):
+        print("\n✗ The batched path stored different rows from the per-row loop")
+        sys.exit(1)
+    print("\n✓ Same rows stored, same insert and error counts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Undo journal for the codemods in this directory.
+
+Every run that rewrites files records one manifest under
+.codemod-journal/runs/ mapping each path to the hash of its content
+before and after the run. The original content is kept once per distinct
+hash in .codemod-journal/objects/, so a run costs about as much I/O as the
+files it changes and repeated runs over the same content store nothing new.
+
+Files are rewritten by writing a temporary file and renaming it over the
+original, which leaves the original inode untouched; where the filesystem
+allows, the object store keeps that inode through a hard link instead of
+copying the bytes. Shell codemods may edit in place, so files snapshotted
+by `begin` are copied into the store instead, and no working file is left
+sharing an inode with a stored object.
+
+The Python codemods write through open_run():
+
+    with open_run("fts_index") as journal:
+        journal.write_text(path, source)
+
+Shell codemods snapshot the files they are about to edit and finish the
+run afterwards (see migrate-route.sh):
+
+    RUN_ID=$(python3 scripts/codemod_journal.py begin migrate-route FILE...)
+    ... edit FILE ...
+    python3 scripts/codemod_journal.py finish "$RUN_ID"
+
+Usage:
+    python3 scripts/codemod_journal.py list
+    python3 scripts/codemod_journal.py show RUN_ID
+    python3 scripts/codemod_journal.py undo RUN_ID [--skip-edited]
+    python3 scripts/codemod_journal.py gc [--keep N]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sql_extract import REPO_ROOT
+
+JOURNAL_DIR = REPO_ROOT / ".codemod-journal"
+OBJECTS_DIR = JOURNAL_DIR / "objects"
+RUNS_DIR = JOURNAL_DIR / "runs"
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def object_path(digest):
+    return OBJECTS_DIR / digest[:2] / digest[2:]
+
+
+def file_hash(path):
+    """Hash of a file's content, or None when it does not exist."""
+    try:
+        return content_hash(Path(path).read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomic(path, data, mode=None):
+    """Write data to a temporary file beside path and rename it into place."""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def store_object(path, digest, data, link=True):
+    """Keep path's current content (data) under its hash.
+
+    With link, the file's inode is hard-linked into the store when the
+    filesystem allows it; otherwise the bytes are copied. Nothing is written
+    when the object exists.
+    """
+    target = object_path(digest)
+    if target.exists():
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if link:
+        try:
+            os.link(path, target)
+            return
+        except OSError:
+            pass
+    _write_atomic(target, data)
+
+
+def detach(path, digest, data):
+    """Give path an inode of its own if it shares one with the stored object,
+    so editing it in place cannot alter what the journal holds."""
+    target = object_path(digest)
+    if target.exists() and os.path.samefile(target, path):
+        _write_atomic(path, data, Path(path).stat().st_mode & 0o7777)
+
+
+def read_object(digest):
+    """Stored content for a hash; raises ValueError if it is missing or damaged."""
+    try:
+        data = object_path(digest).read_bytes()
+    except FileNotFoundError:
+        raise ValueError(f"object {digest[:12]} is missing from the journal") from None
+    if content_hash(data) != digest:
+        raise ValueError(f"object {digest[:12]} was modified after it was stored")
+    return data
+
+
+def _rel(path):
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _abs(rel):
+    return Path(rel) if os.path.isabs(rel) else REPO_ROOT / rel
+
+
+def _timestamp():
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def new_run_id(tool):
+    base = f"{time.strftime('%Y%m%d-%H%M%S')}-{tool}"
+    run_id, n = base, 1
+    while (RUNS_DIR / f"{run_id}.json").exists():
+        n += 1
+        run_id = f"{base}-{n}"
+    return run_id
+
+
+class Run:
+    """One codemod run: the files it touched and their before/after hashes."""
+
+    def __init__(self, tool, run_id=None, manifest=None):
+        self.manifest = manifest or {
+            "id": run_id or new_run_id(tool),
+            "tool": tool,
+            "created": _timestamp(),
+            "finished": None,
+            "undone": None,
+            "files": {},
+        }
+
+    @property
+    def id(self):
+        return self.manifest["id"]
+
+    @property
+    def files(self):
+        return self.manifest["files"]
+
+    @classmethod
+    def load(cls, run_id):
+        path = RUNS_DIR / f"{run_id}.json"
+        if not path.exists():
+            raise ValueError(f"no journal run {run_id}")
+        return cls(None, manifest=json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self):
+        RUNS_DIR.mkdir(parents=True, exist_ok=True)
+        _write_atomic(RUNS_DIR / f"{self.id}.json",
+                      (json.dumps(self.manifest, indent=2) + "\n").encode("utf-8"))
+
+    def snapshot(self, path, data=None, link=True):
+        """Record path's content before the run first changes it.
+
+        Pass link=False when the file will be edited in place rather than
+        through write_bytes: the content is copied into the store and the
+        file is detached from any stored inode.
+        """
+        rel = _rel(path)
+        if rel in self.files:
+            return
+        path = _abs(rel)
+        if data is None:
+            data = path.read_bytes() if path.exists() else None
+        if data is None:
+            self.files[rel] = {"before": None, "after": None}
+            return
+        digest = content_hash(data)
+        store_object(path, digest, data, link)
+        if not link:
+            detach(path, digest, data)
+        self.files[rel] = {"before": digest, "after": None}
+
+    def write_bytes(self, path, data):
+        path = Path(path)
+        current = path.read_bytes() if path.exists() else None
+        if current == data:
+            return
+        self.snapshot(path, current)
+        mode = path.stat().st_mode & 0o7777 if current is not None else None
+        _write_atomic(path, data, mode)
+        self.files[_rel(path)]["after"] = content_hash(data)
+
+    def write_text(self, path, text, encoding="utf-8"):
+        self.write_bytes(path, text.encode(encoding))
+
+    def finish(self):
+        """Hash the files as the run left them and save the manifest.
+
+        Files the run did not end up changing are dropped. If such a file still
+        shares its inode with the stored object, the link is removed, or the
+        file detached when another run needs the object, so a later in-place
+        edit cannot alter what the journal holds.
+        """
+        for rel, entry in list(self.files.items()):
+            path = _abs(rel)
+            after = file_hash(path)
+            if after == entry["before"]:
+                del self.files[rel]
+                target = object_path(after) if after else None
+                if target and target.exists() and os.path.samefile(target, path):
+                    if _referenced(after, exclude=self.id):
+                        detach(path, after, path.read_bytes())
+                    else:
+                        target.unlink()
+                continue
+            entry["after"] = after
+        self.manifest["finished"] = _timestamp()
+        if self.files:
+            self.save()
+        else:
+            (RUNS_DIR / f"{self.id}.json").unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # A run that failed part-way is still recorded, so it can be undone
+        self.finish()
+        if self.files:
+            print(f"↺ Journal run {self.id}: {len(self.files)} file(s); "
+                  f"undo with python3 scripts/codemod_journal.py undo {self.id}")
+        return False
+
+
+def open_run(tool):
+    """Start a journaled run; use as a context manager around the writes."""
+    return Run(tool)
+
+
+def iter_runs():
+    """Saved runs, oldest first."""
+    if not RUNS_DIR.exists():
+        return []
+    return [Run.load(p.stem) for p in sorted(RUNS_DIR.glob("*.json"))]
+
+
+def _referenced(digest, exclude=None):
+    return any(run.id != exclude and any(e["before"] == digest for e in run.files.values())
+               for run in iter_runs())
+
+
+def undo(run_id, skip_edited=False):
+    """Restore every file of a run to its content before the run.
+
+    Refuses, changing nothing, when any file was edited after the run,
+    unless skip_edited is set, in which case those files are left alone.
+    """
+    run = Run.load(run_id)
+    if run.manifest["undone"]:
+        print(f"✗ {run_id} was already undone at {run.manifest['undone']}")
+        return False
+    if not run.manifest["finished"]:
+        print(f"✗ {run_id} was never finished; run `finish {run_id}` if its edits are complete")
+        return False
+
+    edited = [rel for rel, e in run.files.items() if file_hash(_abs(rel)) != e["after"]]
+    if edited and not skip_edited:
+        print(f"✗ {len(edited)} file(s) changed since {run_id}; nothing restored:")
+        for rel in edited:
+            print(f"  {rel}")
+        print("  (--skip-edited restores the others and leaves these alone)")
+        return False
+
+    restore = {rel: e for rel, e in run.files.items() if rel not in edited}
+    try:
+        contents = {rel: read_object(e["before"]) if e["before"] else None for rel, e in restore.items()}
+    except ValueError as err:
+        print(f"✗ {err}; nothing restored")
+        return False
+
+    for rel, data in contents.items():
+        path = _abs(rel)
+        if data is None:
+            path.unlink(missing_ok=True)
+            print(f"✓ {rel}: removed (created by the run)")
+        else:
+            mode = path.stat().st_mode & 0o7777 if path.exists() else None
+            _write_atomic(path, data, mode)
+            print(f"✓ {rel}: restored")
+    for rel in edited:
+        print(f"⊘ {rel}: edited since the run, left alone")
+
+    run.manifest["undone"] = _timestamp()
+    run.save()
+    return True
+
+
+def gc(keep=None):
+    """Drop runs beyond the newest `keep` and objects no run refers to."""
+    runs = iter_runs()
+    if keep is not None:
+        for run in runs[:max(0, len(runs) - keep)]:
+            (RUNS_DIR / f"{run.id}.json").unlink()
+        runs = runs[max(0, len(runs) - keep):]
+    live = {e["before"] for run in runs for e in run.files.values() if e["before"]}
+    removed = 0
+    if OBJECTS_DIR.exists():
+        for path in OBJECTS_DIR.glob("*/*"):
+            if path.parent.name + path.name not in live:
+                path.unlink()
+                removed += 1
+    return len(runs), removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list recorded runs")
+    show = commands.add_parser("show", help="list the files of a run")
+    show.add_argument("run_id")
+    undo_cmd = commands.add_parser("undo", help="restore the files of a run")
+    undo_cmd.add_argument("run_id")
+    undo_cmd.add_argument("--skip-edited", action="store_true",
+                          help="restore the files not edited since the run, leave the rest")
+    begin = commands.add_parser("begin", help="start a run and snapshot files (prints the run id)")
+    begin.add_argument("tool")
+    begin.add_argument("files", nargs="+")
+    finish = commands.add_parser("finish", help="record the after state of a begun run")
+    finish.add_argument("run_id")
+    gc_cmd = commands.add_parser("gc", help="drop old runs and unreferenced objects")
+    gc_cmd.add_argument("--keep", type=int, help="keep only the newest N runs")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "list":
+            for run in iter_runs():
+                state = f"undone {run.manifest['undone']}" if run.manifest["undone"] else \
+                    ("open" if not run.manifest["finished"] else "")
+                print(f"{run.id}  {run.manifest['tool']}  {len(run.files)} file(s)  {state}".rstrip())
+        elif args.command == "show":
+            run = Run.load(args.run_id)
+            for rel, entry in run.files.items():
+                current = file_hash(_abs(rel))
+                flag = "✓" if current == entry["after"] else "⚠️ edited since"
+                before = (entry["before"] or "(new)")[:12]
+                after = (entry["after"] or "(removed)")[:12]
+                print(f"  {before} → {after}  {flag}  {rel}")
+        elif args.command == "undo":
+            if not undo(args.run_id, args.skip_edited):
+                sys.exit(1)
+        elif args.command == "begin":
+            run = Run(args.tool)
+            for name in args.files:
+                run.snapshot(Path(name), link=False)
+            run.save()
+            print(run.id)
+        elif args.command == "finish":
+            run = Run.load(args.run_id)
+            run.finish()
+        elif args.command == "gc":
+            runs, removed = gc(args.keep)
+            print(f"✓ {runs} run(s) kept, {removed} unreferenced object(s) removed")
+    except ValueError as err:
+        print(f"✗ {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
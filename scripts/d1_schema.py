@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Parse the D1 schema files into a table/column model.
+
+Only the subset of SQL used by sql/*.sql is understood: CREATE TABLE,
+CREATE INDEX and the column/constraint forms that appear in those files
+(PRIMARY KEY, UNIQUE, NOT NULL, DEFAULT, REFERENCES, and table-level
+PRIMARY KEY / FOREIGN KEY / UNIQUE lists).
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_SCHEMA_FILES = ["sql/d1-schema.sql", "sql/admin-schema.sql"]
+
+CONSTRAINT_KEYWORDS = ("PRIMARY", "FOREIGN", "UNIQUE", "CHECK", "CONSTRAINT")
+
+CREATE_TABLE = re.compile(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\(", re.I)
+CREATE_INDEX = re.compile(
+    r"CREATE\s+(UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s+ON\s+(\w+)\s*\(([^)]*)\)",
+    re.I,
+)
+
+
+FOREIGN_KEY = re.compile(
+    r"FOREIGN\s+KEY\s*\(([^)]*)\)\s*REFERENCES\s+(\w+)\s*\(([^)]*)\)(?:\s+ON\s+DELETE\s+(\w+(?:\s+NULL)?))?",
+    re.I,
+)
+INLINE_REFERENCE = re.compile(
+    r"\bREFERENCES\s+(\w+)\s*\(\s*(\w+)\s*\)(?:\s+ON\s+DELETE\s+(\w+(?:\s+NULL)?))?", re.I
+)
+KEY_LIST = re.compile(r"^(?:CONSTRAINT\s+\w+\s+)?(PRIMARY\s+KEY|UNIQUE)\s*\(([^)]*)\)", re.I)
+
+
+@dataclass
+class Column:
+    name: str
+    type: str
+    primary_key: bool = False
+    unique: bool = False
+    not_null: bool = False
+    default: str = None  # SQL text of the DEFAULT expression
+
+    @property
+    def is_text(self):
+        return "TEXT" in self.type.upper() or "CHAR" in self.type.upper()
+
+
+@dataclass
+class ForeignKey:
+    columns: list
+    table: str  # referenced table
+    references: list  # referenced columns
+    on_delete: str = None
+
+
+@dataclass
+class Index:
+    name: str
+    table: str
+    columns: list  # column names, sort direction stripped
+    unique: bool = False
+
+
+@dataclass
+class Table:
+    name: str
+    columns: dict = field(default_factory=dict)  # name -> Column, in order
+    indexes: list = field(default_factory=list)
+    primary_key: list = field(default_factory=list)
+    foreign_keys: list = field(default_factory=list)
+    unique: list = field(default_factory=list)  # column lists of UNIQUE constraints
+
+
+def strip_comments(sql):
+    """Remove -- line comments, leaving string literals alone."""
+    out = []
+    for line in sql.splitlines():
+        in_string = False
+        for i, ch in enumerate(line):
+            if ch == "'":
+                in_string = not in_string
+            elif not in_string and line.startswith("--", i):
+                line = line[:i]
+                break
+        out.append(line)
+    return "\n".join(out)
+
+
+def _closing_paren(sql, i):
+    """Return the index of the `)` matching the `(` at i."""
+    depth = 0
+    in_string = False
+    for j in range(i, len(sql)):
+        ch = sql[j]
+        if ch == "'":
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                return j
+    raise ValueError("unbalanced parentheses")
+
+
+def split_top_level(body):
+    """Split a comma-separated list, ignoring commas inside parens or strings."""
+    parts, depth, in_string, start = [], 0, False, 0
+    for i, ch in enumerate(body):
+        if ch == "'":
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(body[start:i].strip())
+            start = i + 1
+    parts.append(body[start:].strip())
+    return [p for p in parts if p]
+
+
+def _default_expr(definition):
+    """SQL text after DEFAULT: a literal, a word, or a parenthesised expression."""
+    match = re.search(r"\bDEFAULT\s+", definition, re.I)
+    if not match:
+        return None
+    rest = definition[match.end():]
+    if rest.startswith("("):
+        return rest[:_closing_paren(rest, 0) + 1]
+    if rest.startswith("'"):
+        literal = re.match(r"'(?:[^']|'')*'", rest)
+        return literal.group(0) if literal else rest
+    return re.match(r"[^\s,]+", rest).group(0)
+
+
+def _parse_column(definition):
+    tokens = definition.split()
+    name = tokens[0].strip('"')
+    type_tokens = []
+    for token in tokens[1:]:
+        if token.upper() in ("PRIMARY", "NOT", "NULL", "DEFAULT", "UNIQUE",
+                             "CHECK", "REFERENCES", "COLLATE"):
+            break
+        type_tokens.append(token)
+    # Keywords are only looked for outside CHECK (...) and DEFAULT (...) bodies
+    flat = re.sub(r"\([^()]*\)|'(?:[^']|'')*'", " ", definition)
+    upper = flat.upper().split()
+    return Column(
+        name=name,
+        type=" ".join(type_tokens) or "TEXT",
+        primary_key="PRIMARY" in upper,
+        unique="UNIQUE" in upper,
+        not_null=bool(re.search(r"\bNOT\s+NULL\b", flat, re.I)),
+        default=_default_expr(definition),
+    )
+
+
+def _names(column_list):
+    return [c.split()[0].strip('"') for c in split_top_level(column_list)]
+
+
+def parse_schema_sql(sql, tables=None):
+    """Parse schema text into {table name: Table}, merging into `tables`."""
+    tables = {} if tables is None else tables
+    sql = strip_comments(sql)
+
+    for match in CREATE_TABLE.finditer(sql):
+        open_paren = match.end() - 1
+        body = sql[open_paren + 1:_closing_paren(sql, open_paren)]
+        table = tables.setdefault(match.group(1), Table(name=match.group(1)))
+        for definition in split_top_level(body):
+            if re.match(r"\w+", definition).group(0).upper() in CONSTRAINT_KEYWORDS:
+                keys = KEY_LIST.match(definition)
+                foreign = FOREIGN_KEY.search(definition)
+                if keys and keys.group(1).upper().startswith("PRIMARY"):
+                    table.primary_key = _names(keys.group(2))
+                elif keys:
+                    table.unique.append(_names(keys.group(2)))
+                elif foreign:
+                    table.foreign_keys.append(ForeignKey(
+                        columns=_names(foreign.group(1)),
+                        table=foreign.group(2),
+                        references=_names(foreign.group(3)),
+                        on_delete=foreign.group(4) and foreign.group(4).upper(),
+                    ))
+                continue
+            column = _parse_column(definition)
+            table.columns[column.name] = column
+            if column.primary_key:
+                table.primary_key = [column.name]
+            reference = INLINE_REFERENCE.search(definition)
+            if reference:
+                table.foreign_keys.append(ForeignKey(
+                    columns=[column.name],
+                    table=reference.group(1),
+                    references=[reference.group(2)],
+                    on_delete=reference.group(3) and reference.group(3).upper(),
+                ))
+
+    for match in CREATE_INDEX.finditer(sql):
+        table = tables.get(match.group(3))
+        if table is None:
+            continue
+        columns = _names(match.group(4))
+        table.indexes.append(Index(
+            name=match.group(2),
+            table=table.name,
+            columns=columns,
+            unique=bool(match.group(1)),
+        ))
+
+    return tables
+
+
+def load_schema(files=None, base=REPO_ROOT):
+    """Parse the given schema files (relative to the repo root)."""
+    tables = {}
+    for name in files or DEFAULT_SCHEMA_FILES:
+        parse_schema_sql((base / name).read_text(encoding="utf-8"), tables)
+    return tables
+
+
+# Postgres-isms that still appear in some schema files, mapped to SQLite
+PG_TO_SQLITE = [
+    (re.compile(r"\s+DEFAULT\s+gen_random_uuid\(\)(::text)?", re.I), ""),
+    (re.compile(r"DEFAULT\s+NOW\(\)", re.I), "DEFAULT (datetime('now'))"),
+    (re.compile(r"\bTIMESTAMPTZ\b", re.I), "TEXT"),
+    (re.compile(r"\bJSONB\b", re.I), "TEXT"),
+    (re.compile(r"\bBOOLEAN\s+DEFAULT\s+true\b", re.I), "INTEGER DEFAULT 1"),
+    (re.compile(r"\bBOOLEAN\s+DEFAULT\s+false\b", re.I), "INTEGER DEFAULT 0"),
+    (re.compile(r"\bBOOLEAN\b", re.I), "INTEGER"),
+    (re.compile(r"\bDECIMAL\(\d+\s*,\s*\d+\)", re.I), "REAL"),
+    (re.compile(r"\bTEXT\[\]\s+DEFAULT\s+'\{\}'", re.I), "TEXT DEFAULT '[]'"),
+    (re.compile(r"\bTEXT\[\]", re.I), "TEXT"),
+]
+
+
+def to_sqlite(sql):
+    """Rewrite the Postgres-flavoured schema files so SQLite accepts them."""
+    for pattern, replacement in PG_TO_SQLITE:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+
+def main():
+    """Print the parsed model."""
+    for table in load_schema().values():
+        print(f"{table.name}: {len(table.columns)} columns, {len(table.indexes)} indexes")
+
+
+if __name__ == "__main__":
+    main()
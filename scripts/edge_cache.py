@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Generate edge cache policies and wire lib/edge-cache.ts into the routes.
+
+The manifest (lib/edge-cache-policies.json) lists the cached routes with a
+TTL, the query params each response varies by, and its purge tags. This tool:
+
+  --generate   refreshes `vary` (from searchParams.get calls) and `tags`
+               (tables the route reads) for every manifest entry
+  --add ROUTE  adds a route to the manifest, e.g. --add /api/marketplace
+  --apply      wraps the listed GET handlers in withEdgeCache, and wraps
+               API write handlers that modify tagged tables, directly or
+               through the lib/ functions they call, in withCachePurge
+
+Routes that authenticate the caller are never wrapped for caching. Page
+entries (page.tsx) get policies too; their data loaders opt in by hand with
+edgeCached(route, key, loader).
+
+Usage: python3 scripts/edge_cache.py [--add ROUTE [--ttl SECONDS]] [--generate] [--apply]
+"""
+
+import argparse
+import json
+import re
+
+from codemod_journal import open_run
+from sql_extract import (
+    REPO_ROOT, extract_queries, function_body_start, iter_source_files, matching_bracket,
+    route_for, tables_read, tables_written,
+)
+
+MANIFEST = REPO_ROOT / "lib" / "edge-cache-policies.json"
+DEFAULT_TTL = 300
+
+# Write routes that purge tags when they succeed: any API route writing a
+# tagged table, not just the publisher and admin ones (order reviews update
+# websites.average_rating, for example)
+PURGE_ROOTS = ["app/api"]
+
+# Tables that change on almost every request (logins, balances, order
+# status) or hold private data; tagging by them would purge constantly.
+# Public fields read from them (names, review text) may lag by up to a TTL.
+UNTAGGED_TABLES = {"users", "sessions", "admin_users", "admin_sessions", "orders", "cache_tags"}
+
+# Calls that mean the response depends on who is asking
+AUTH_MARKERS = re.compile(
+    r"\b(getSession|validateRequest|validateAdminRequest|getApiKeyFromRequest|cookies)\s*\("
+)
+
+HANDLER = re.compile(r"export\s+async\s+function\s+(GET|POST|PUT|PATCH|DELETE)\s*\(")
+SEARCH_PARAM = re.compile(r"searchParams\.get\(\s*['\"]([\w-]+)['\"]\s*\)")
+IMPORT_LINE = re.compile(r"^import\s[^;]*;", re.M)
+LIB_IMPORT = re.compile(r"import\s*\{([^}]*)\}\s*from\s*['\"]@/(lib/[\w/.-]+)['\"]")
+FUNCTION = re.compile(r"(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*(?:<[^(]*>)?\s*\(")
+
+
+def load_manifest():
+    if MANIFEST.exists():
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_manifest(manifest, journal):
+    journal.write_text(MANIFEST, json.dumps(dict(sorted(manifest.items())), indent=2) + "\n")
+
+
+def route_file(route):
+    """The route.ts or page.tsx serving a manifest route."""
+    for root in (REPO_ROOT / "app").rglob("*"):
+        if root.name in ("route.ts", "page.tsx") and route_for(root) == route:
+            return root
+    return None
+
+
+def handlers(source):
+    """Yield (method, start, body_start, body_end) for exported handlers."""
+    for match in HANDLER.finditer(source):
+        params_end = matching_bracket(source, match.end() - 1)
+        body_start = source.index("{", params_end)
+        yield match.group(1), match.start(), body_start, matching_bracket(source, body_start)
+
+
+def generate_policy(route, policy):
+    path = route_file(route)
+    if path is None:
+        print(f"✗ {route}: no route.ts or page.tsx found")
+        return policy
+    source = path.read_text(encoding="utf-8")
+    tags = []
+    for call in extract_queries(path, source):
+        for table in tables_read(call.text):
+            # FTS tables are kept in sync by triggers on their base table
+            table = table[:-len("_fts")] if table.endswith("_fts") else table
+            if table not in UNTAGGED_TABLES and table not in tags:
+                tags.append(table)
+    return {
+        "ttl": policy.get("ttl", DEFAULT_TTL),
+        "vary": sorted(set(SEARCH_PARAM.findall(source))),
+        "tags": sorted(tags),
+    }
+
+
+def add_import(source, statement):
+    if statement in source:
+        return source
+    imports = list(IMPORT_LINE.finditer(source))
+    at = imports[-1].end() if imports else 0
+    return source[:at] + "\n" + statement + source[at:]
+
+
+def wrap_handler(source, method, start, wrapper):
+    """Turn `export async function GET(` into a local handler.
+
+    Returns the new source and the wrapped export line to append.
+    """
+    local = f"handle{method.capitalize()}"
+    header = HANDLER.match(source, start).group(0)
+    source = source[:start] + header.replace(f"export async function {method}", f"async function {local}") + \
+        source[start + len(header):]
+    return source, f"export const {method} = {wrapper.format(handler=local)};"
+
+
+def append_exports(source, exports):
+    return source.rstrip("\n") + "".join(f"\n\n{line}" for line in exports) + "\n"
+
+
+def apply_cache(manifest, journal):
+    for route in manifest:
+        path = route_file(route)
+        if path is None or path.name != "route.ts":
+            continue
+        rel = path.relative_to(REPO_ROOT)
+        source = path.read_text(encoding="utf-8")
+        if AUTH_MARKERS.search(source):
+            print(f"⊘ {rel}: authenticated route, not cached")
+            continue
+        gets = [h for h in handlers(source) if h[0] == "GET"]
+        if not gets:
+            print(f"⊙ {rel}: no GET handler to wrap")
+            continue
+        source, export = wrap_handler(source, "GET", gets[0][1], f"withEdgeCache('{route}', {{handler}})")
+        source = append_exports(source, [export])
+        source = add_import(source, "import { withEdgeCache } from '@/lib/edge-cache';")
+        journal.write_text(path, source)
+        print(f"✓ Cached GET {route}")
+
+
+def lib_writes():
+    """{(module, function): tables} for the functions under lib/.
+
+    A function's tables include those of the functions it calls in the same
+    module, e.g. updateAllMetrics through updateWebsiteMetrics.
+    """
+    writes = {}
+    for path in iter_source_files(["lib"]):
+        source = path.read_text(encoding="utf-8")
+        queries = extract_queries(path, source)
+        bodies = {}
+        for match in FUNCTION.finditer(source):
+            try:
+                body_start = function_body_start(source, matching_bracket(source, match.end() - 1))
+                bodies[match.group(1)] = (body_start, matching_bracket(source, body_start))
+            except ValueError:
+                continue  # a declaration without a body, or one in a comment or string
+        tables = {name: {t for call in queries if start < call.start < end for t in tables_written(call.text)}
+                  for name, (start, end) in bodies.items()}
+        changed = True
+        while changed:
+            changed = False
+            for name, (start, end) in bodies.items():
+                for other in bodies:
+                    if other != name and not tables[other] <= tables[name] and \
+                            re.search(rf"\b{other}\s*\(", source[start:end]):
+                        tables[name] |= tables[other]
+                        changed = True
+        module = path.relative_to(REPO_ROOT).with_suffix("").as_posix()
+        for name, written in tables.items():
+            writes[(module, name)] = written
+    return writes
+
+
+def imported_lib_functions(source):
+    """{local name: (module, function)} for the named imports from @/lib."""
+    imported = {}
+    for match in LIB_IMPORT.finditer(source):
+        for name in match.group(1).split(","):
+            original, _, local = name.strip().partition(" as ")
+            if original:
+                imported[(local or original).strip()] = (match.group(2), original.strip())
+    return imported
+
+
+def apply_purges(manifest, journal):
+    cached_tags = {tag for policy in manifest.values() for tag in policy["tags"]}
+    helpers = lib_writes()
+    for path in iter_source_files(PURGE_ROOTS):
+        source = path.read_text(encoding="utf-8")
+        queries = extract_queries(path, source)
+        imported = imported_lib_functions(source)
+        wraps = []
+        for method, start, body_start, body_end in handlers(source):
+            if method == "GET":
+                continue
+            written = []
+            for call in queries:
+                if body_start < call.start < body_end:
+                    written += [t for t in tables_written(call.text) if t in cached_tags and t not in written]
+            # Writes made through lib/ helpers the handler calls
+            body = source[body_start:body_end]
+            for local, key in imported.items():
+                if re.search(rf"\b{local}\s*\(", body):
+                    written += [t for t in sorted(helpers.get(key, ())) if t in cached_tags and t not in written]
+            if written:
+                wraps.append((method, start, sorted(written)))
+        if not wraps:
+            continue
+        exports = []
+        for method, start, tags in sorted(wraps, key=lambda w: w[1], reverse=True):
+            tag_list = ", ".join(f"'{t}'" for t in tags)
+            source, export = wrap_handler(source, method, start, f"withCachePurge([{tag_list}], {{handler}})")
+            exports.insert(0, export)
+            print(f"✓ {path.relative_to(REPO_ROOT)}: {method} purges {', '.join(tags)}")
+        source = append_exports(source, exports)
+        source = add_import(source, "import { withCachePurge } from '@/lib/edge-cache';")
+        journal.write_text(path, source)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--add", metavar="ROUTE", action="append", default=[],
+                        help="add a route to the manifest")
+    parser.add_argument("--ttl", type=int, default=DEFAULT_TTL, help="TTL for routes added with --add")
+    parser.add_argument("--generate", action="store_true", help="refresh vary params and tags")
+    parser.add_argument("--apply", action="store_true", help="wrap handlers in the routes")
+    args = parser.parse_args()
+
+    manifest = load_manifest()
+    for route in args.add:
+        manifest.setdefault(route, {"ttl": args.ttl, "vary": [], "tags": []})
+    with open_run("edge_cache") as journal:
+        if args.add or args.generate:
+            for route, policy in manifest.items():
+                manifest[route] = generate_policy(route, policy)
+            save_manifest(manifest, journal)
+
+        for route, policy in sorted(manifest.items()):
+            print(f"{route}: ttl={policy['ttl']}s vary={policy['vary']} tags={policy['tags']}")
+        print()
+
+        if args.apply:
+            apply_cache(manifest, journal)
+            apply_purges(manifest, journal)
+
+
+if __name__ == "__main__":
+    main()
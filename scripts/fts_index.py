@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Replace substring LIKE/ILIKE searches with FTS5 trigram indexes.
+
+Finds `col ILIKE '%term%'` predicates in the sql`` / sqlAt`` queries under app/api,
+generates FTS5 virtual tables and sync triggers for the columns they search,
+rewrites the predicates into MATCH lookups against those tables, and checks
+that the rewritten predicates return the same rows as the originals on a
+local SQLite loaded with migration-data.
+
+Usage:
+    python3 scripts/fts_index.py                      # report only
+    python3 scripts/fts_index.py --write-migration    # write the migration
+    python3 scripts/fts_index.py --rewrite            # rewrite the routes
+    python3 scripts/fts_index.py --verify             # compare FTS and LIKE results locally
+
+    python3 scripts/fts_index.py --rebuild            # print the rebuild statements
+
+Flags combine; --verify runs first and stops before writing anything if a
+rewritten predicate disagrees with the original. Rewritten call sites are
+skipped on later runs but still count towards the FTS tables they use, and
+sql/migrations is read for the tables already created, so a re-run only
+writes a new numbered migration for searches added since (recreating a
+table whose column list grew) and never rewrites an applied one.
+
+The FTS tables index the implicit rowid of their content tables. VACUUM, or
+a `wrangler d1 export` and re-import, can renumber the rowids of tables
+without an INTEGER PRIMARY KEY; run the --rebuild statements after either.
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+from d1_schema import REPO_ROOT, load_schema
+from codemod_journal import open_run
+from local_d1 import open_local_db
+from sql_extract import (
+    MARKER, MARKER_PATTERN, add_db_imports, extract_queries, iter_source_files, table_refs, unmark,
+)
+
+SCAN_ROOTS = ["app/api"]
+MIGRATIONS_DIR = "sql/migrations"
+MIGRATION_NAME = "search_fts"
+
+# Trigram tokens are three characters; shorter terms fall back to LIKE
+TRIGRAM_LENGTH = 3
+
+LIKE_PREDICATE = re.compile(r"(?:(\w+)\.)?(\w+)\s+I?LIKE\s+\x00(\d+)\x00", re.I)
+OR_GAP = re.compile(r"\s+OR\s+", re.I)
+
+# `%${term}%` or '%' + term + '%'
+CONTAINS_PATTERNS = [
+    re.compile(r"^\s*`%\$\{(.+)\}%`\s*$", re.S),
+    re.compile(r"^\s*'%'\s*\+\s*(.+?)\s*\+\s*'%'\s*$", re.S),
+]
+
+# Raw query strings built outside the sql tag, e.g. whereParts.push('x LIKE ?')
+RAW_LIKE = re.compile(r"""['"`][^'"`\n]*\bI?LIKE\s+\?[^'"`\n]*['"`]""", re.I)
+# ...and the same search once rewritten
+RAW_FTS = re.compile(r"FROM (\w+)_fts WHERE \1_fts MATCH \? UNION SELECT rowid FROM \1 WHERE \? AND ([^'\"`\n]*)")
+RAW_LIKE_COLUMN = re.compile(r"(\w+)\s+I?LIKE\s+\?", re.I)
+
+FTS_CREATE = re.compile(r"CREATE VIRTUAL TABLE IF NOT EXISTS (\w+)_fts USING fts5\(\s*([\w\s,]+?),\s*content=", re.I)
+MIGRATION_NUMBER = re.compile(r"^(\d+)_")
+
+
+@dataclass
+class SearchGroup:
+    """The LIKE predicates of one chain that hit the same table and term."""
+
+    table: str
+    qualifier: str  # alias or table name used in the query
+    columns: list
+    term: str  # TypeScript expression of the search term
+    pattern: str  # TypeScript expression of the original LIKE pattern
+
+
+@dataclass
+class Rewrite:
+    call: object
+    span: tuple  # (start, end) in call.marked_text
+    groups: list
+
+
+def contains_term(expr):
+    """Return the search term of a '%term%' pattern expression, if it is one."""
+    for pattern in CONTAINS_PATTERNS:
+        match = pattern.match(expr)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def resolve_table(alias, column, local_refs, file_refs, schema):
+    """Work out which table a (possibly unqualified) column belongs to."""
+    if alias:
+        table = local_refs.get(alias) or file_refs.get(alias)
+        return table if table in schema else None
+    for refs in (local_refs, file_refs):
+        owners = {t for t in refs.values() if t in schema and column in schema[t].columns}
+        if len(owners) == 1:
+            return owners.pop()
+    return None
+
+
+def _like_chains(text):
+    """Group LIKE predicates joined only by OR into chains."""
+    chains, current = [], []
+    for match in LIKE_PREDICATE.finditer(text):
+        if current and OR_GAP.fullmatch(text[current[-1].end():match.start()]):
+            current.append(match)
+        else:
+            if current:
+                chains.append(current)
+            current = [match]
+    if current:
+        chains.append(current)
+    return chains
+
+
+def _chain_is_isolated(text, start, end, length):
+    """True when replacing the chain with one parenthesised term is safe."""
+    if length == 1:
+        return True
+    before = text[:start].rstrip()
+    after = text[end:].lstrip()
+    return (before.endswith("(") or re.search(r"\bOR$", before, re.I)) and \
+        (after.startswith(")") or re.match(r"OR\b", after, re.I))
+
+
+def _short_term_fallback(text, start):
+    """The table of a predicate this tool already rewrote, when the LIKE
+    chain at start is its fallback branch, otherwise None."""
+    fallback = text.rfind("UNION SELECT rowid FROM", 0, start)
+    if fallback == -1 or ")" in text[fallback:start]:
+        return None
+    return re.match(r"UNION SELECT rowid FROM (\w+)", text[fallback:]).group(1)
+
+
+def _add_columns(targets, table, columns):
+    for column in columns:
+        if column not in targets[table]:
+            targets[table].append(column)
+
+
+def _add_search(searches, table, columns):
+    if (table, tuple(columns)) not in searches:
+        searches.append((table, tuple(columns)))
+
+
+def find_rewrites(schema, roots=None):
+    """Return (rewrites, problems, indexed) for every substring search found.
+
+    indexed lists the (table, columns) searches of the call sites already
+    rewritten to FTS, in first-seen order.
+    """
+    rewrites, problems = [], []
+    indexed = []
+    for path in iter_source_files(roots or SCAN_ROOTS):
+        calls = extract_queries(path)
+        file_refs = {}
+        for call in calls:
+            file_refs.update(table_refs(call.marked_text))
+
+        for call in calls:
+            text = call.marked_text
+            local_refs = table_refs(text)
+            for chain in _like_chains(text):
+                where = f"{call.rel_path}:{call.line}"
+                start, end = chain[0].start(), chain[-1].end()
+                rewritten = _short_term_fallback(text, start)
+                if rewritten:
+                    _add_search(indexed, rewritten, [m.group(2) for m in chain])
+                    continue
+                if not _chain_is_isolated(text, start, end, len(chain)):
+                    problems.append(f"{where}: LIKE chain mixed with AND, left as is")
+                    continue
+
+                groups = {}
+                for match in chain:
+                    alias, column, index = match.group(1), match.group(2), int(match.group(3))
+                    pattern = call.exprs[index]
+                    term = contains_term(pattern)
+                    table = resolve_table(alias, column, local_refs, file_refs, schema)
+                    if term is None or table is None or not schema[table].columns[column].is_text:
+                        groups = None
+                        predicate = MARKER_PATTERN.sub("?", match.group(0))
+                        problems.append(f"{where}: cannot index `{predicate}`, left as is")
+                        break
+                    key = (table, alias or table, term)
+                    group = groups.setdefault(key, SearchGroup(table, alias or table, [], term, pattern))
+                    if column not in group.columns:
+                        group.columns.append(column)
+                if groups:
+                    rewrites.append(Rewrite(call, (start, end), list(groups.values())))
+
+        source = path.read_text(encoding="utf-8")
+        for match in RAW_FTS.finditer(source):
+            _add_search(indexed, match.group(1), RAW_LIKE_COLUMN.findall(match.group(2)))
+        for match in RAW_LIKE.finditer(source):
+            if "_fts" in match.group(0):
+                continue
+            line = source.count("\n", 0, match.start()) + 1
+            problems.append(
+                f"{path.relative_to(REPO_ROOT)}:{line}: LIKE built outside sql``, needs a manual rewrite"
+            )
+    return rewrites, problems, indexed
+
+
+def fts_targets(rewrites, indexed=None):
+    """Columns to index per table, in first-seen order: those the rewritten
+    call sites already search, then those of the pending rewrites."""
+    targets = defaultdict(list)
+    for table, columns in indexed or []:
+        _add_columns(targets, table, columns)
+    for rewrite in rewrites:
+        for group in rewrite.groups:
+            _add_columns(targets, group.table, group.columns)
+    return dict(sorted(targets.items()))
+
+
+def migrated_fts():
+    """({table: indexed columns}, highest migration number) from sql/migrations.
+
+    A later migration that recreates a table's FTS index replaces its columns.
+    """
+    migrated, last = {}, 0
+    for path in sorted((REPO_ROOT / MIGRATIONS_DIR).glob("*.sql")):
+        number = MIGRATION_NUMBER.match(path.name)
+        if number:
+            last = max(last, int(number.group(1)))
+        for match in FTS_CREATE.finditer(path.read_text(encoding="utf-8")):
+            migrated[match.group(1)] = [c.strip() for c in match.group(2).split(",")]
+    return migrated, last
+
+
+def pending_targets(targets, migrated):
+    """Tables whose FTS index is missing or lacks columns, with the full
+    column list to (re)create it with."""
+    pending = {}
+    for table, columns in targets.items():
+        have = migrated.get(table, [])
+        if not set(columns) <= set(have):
+            pending[table] = have + [c for c in columns if c not in have]
+    return pending
+
+
+def fts_table_sql(table, columns, replace=False):
+    """FTS5 external-content table, sync triggers and initial build.
+
+    With replace, an existing index of the table is dropped first: FTS5
+    tables cannot gain columns in place.
+    """
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    drop = f"""\
+DROP TRIGGER IF EXISTS {fts}_ai;
+DROP TRIGGER IF EXISTS {fts}_ad;
+DROP TRIGGER IF EXISTS {fts}_au;
+DROP TABLE IF EXISTS {fts};
+
+""" if replace else ""
+    return f"""\
+-- =====================================================
+-- {table.upper()}: {cols}
+-- =====================================================
+
+{drop}CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+  {cols},
+  content='{table}',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+  INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new});
+END;
+
+CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+  INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old});
+END;
+
+CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN
+  INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old});
+  INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new});
+END;
+
+INSERT INTO {fts}({fts}) VALUES ('rebuild');
+"""
+
+
+def migration_sql(targets, name, replace=()):
+    header = f"""\
+-- Migration: {name}
+-- FTS5 trigram indexes for substring search (generated by scripts/fts_index.py)
+--
+-- Each table gets an external-content FTS5 table kept in sync by triggers.
+-- Queries use `rowid IN (SELECT rowid FROM <table>_fts WHERE ... MATCH ...)`
+-- instead of `col LIKE '%term%'`, which had to scan every row.
+--
+-- The index is keyed on the content table's implicit rowid. VACUUM, or a
+-- `wrangler d1 export` and re-import, can renumber those rowids; afterwards
+-- rebuild every index (`python3 scripts/fts_index.py --rebuild` prints the
+-- statements), e.g. INSERT INTO <table>_fts(<table>_fts) VALUES ('rebuild');
+
+"""
+    return header + "\n".join(fts_table_sql(t, cols, t in replace) for t, cols in targets.items())
+
+
+def rebuild_sql(tables):
+    return "\n".join(f"INSERT INTO {t}_fts({t}_fts) VALUES ('rebuild');" for t in tables)
+
+
+def group_sql(group):
+    """Marked-up SQL replacing one group of LIKE predicates."""
+    columns = ", ".join(f"'{c}'" for c in group.columns)
+    likes = " OR ".join(f"{c} LIKE ${{{group.pattern}}}" for c in group.columns)
+    if len(group.columns) > 1:
+        likes = f"({likes})"
+    return (
+        f"{group.qualifier}.rowid IN ("
+        f"SELECT rowid FROM {group.table}_fts WHERE {group.table}_fts MATCH "
+        f"${{ftsMatch({group.term}, [{columns}])}} "
+        f"UNION SELECT rowid FROM {group.table} WHERE ${{ftsShortTerm({group.term})}} AND {likes})"
+    )
+
+
+def _render_group(group, exprs):
+    """Append the group's expressions to exprs and return its marked SQL."""
+    def mark(match):
+        exprs.append(match.group(1))
+        return MARKER.format(len(exprs) - 1)
+    return re.sub(r"\$\{((?:[^{}]|\{[^{}]*\})*)\}", mark, group_sql(group))
+
+
+def rewritten_call(call, rewrites):
+    """Return the new source of a call with its LIKE chains replaced."""
+    text = call.marked_text
+    exprs = list(call.exprs)
+    for rewrite in sorted(rewrites, key=lambda r: r.span[0], reverse=True):
+        start, end = rewrite.span
+        parts = [_render_group(g, exprs) for g in rewrite.groups]
+        replacement = parts[0] if len(parts) == 1 else "(" + " OR ".join(parts) + ")"
+        text = text[:start] + replacement + text[end:]
+    strings, used = unmark(text, exprs)
+    return call.render(strings, used)
+
+
+def apply_rewrites(rewrites, journal):
+    by_file = defaultdict(lambda: defaultdict(list))
+    for rewrite in rewrites:
+        by_file[rewrite.call.path][rewrite.call.start].append(rewrite)
+
+    for path, per_call in by_file.items():
+        source = path.read_text(encoding="utf-8")
+        calls = {c.start: c for c in extract_queries(path, source)}
+        for start in sorted(per_call, reverse=True):
+            call = calls[start]
+            source = source[:call.start] + rewritten_call(call, per_call[start]) + source[call.end:]
+        source = add_db_imports(source, ["ftsMatch", "ftsShortTerm"])
+        journal.write_text(path, source)
+        print(f"✓ Rewrote {sum(len(r) for r in per_call.values())} search(es): {path.relative_to(REPO_ROOT)}")
+    if by_file:
+        print("  Run `npm run sql:registry` to re-point rewritten sqlAt call sites")
+
+
+# Python mirrors of the lib/db.ts helpers, used for verification
+def fts_match(term, columns):
+    phrase = '"' + term.replace('"', '""') + '"'
+    return "{" + " ".join(columns) + "} : " + phrase if columns else phrase
+
+
+def fts_short_term(term):
+    return 1 if len(term) < TRIGRAM_LENGTH else 0
+
+
+def sample_terms(conn, table, columns, limit=25):
+    """Substrings of stored values, case variants, short terms and a miss."""
+    terms = {"zqxj", "a", "e", "", "%"}
+    for column in columns:
+        rows = conn.execute(
+            f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL LIMIT ?", (limit,)
+        ).fetchall()
+        for (value,) in rows:
+            value = str(value)
+            middle = len(value) // 2
+            for size in (3, 5, 8):
+                piece = value[max(0, middle - size // 2):][:size]
+                if piece:
+                    terms.update({piece, piece.upper(), piece.lower()})
+            terms.add(value[:2])
+    return sorted(terms)
+
+
+def verify(searches, targets, db_path=None):
+    """Compare FTS predicates with the LIKE predicates they stand for.
+
+    searches are (table, columns) pairs: those of the pending rewrites and
+    those already in the tree, so the check still means something after
+    --rewrite. Uses migration-data by default; db_path points at a local copy
+    of a fuller database (e.g. from `wrangler d1 export`) when one is
+    available. Fails when there was nothing to compare.
+    """
+    if db_path:
+        conn = sqlite3.connect(db_path)
+        conn.executescript(migration_sql(targets, "verify"))
+    else:
+        conn, _ = open_local_db(extra_sql=[migration_sql(targets, "verify")])
+    failures, checks = 0, 0
+    for table, columns in searches:
+        rows = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        if rows == 0:
+            print(f"⊘ {table}: no rows in migration-data, nothing to compare")
+            continue
+        likes = " OR ".join(f"{c} LIKE :pattern" for c in columns)
+        original = f"SELECT rowid FROM {table} WHERE {likes}"
+        rewritten = (
+            f"SELECT rowid FROM {table} WHERE rowid IN ("
+            f"SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH :match "
+            f"UNION SELECT rowid FROM {table} WHERE :short AND ({likes}))"
+        )
+        mismatched = []
+        for term in sample_terms(conn, table, columns):
+            params = {
+                "pattern": f"%{term}%",
+                "match": fts_match(term, columns),
+                "short": fts_short_term(term),
+            }
+            checks += 1
+            before = {r[0] for r in conn.execute(original, params)}
+            after = {r[0] for r in conn.execute(rewritten, params)}
+            if before != after:
+                mismatched.append(term)
+        status = "✓" if not mismatched else "✗"
+        print(f"{status} {table}({', '.join(columns)}): {rows} rows, "
+              f"{len(mismatched)} mismatched term(s) {mismatched[:5] if mismatched else ''}")
+        failures += len(mismatched)
+    print(f"\n{checks} comparisons, {failures} mismatches")
+    if checks == 0:
+        print("✗ Nothing was compared; pass --db with a database that has rows in the searched tables")
+    return checks > 0 and failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--write-migration", action="store_true",
+                        help=f"write a new {MIGRATIONS_DIR}/NNN_{MIGRATION_NAME}.sql for unindexed searches")
+    parser.add_argument("--rewrite", action="store_true", help="rewrite the sql`` call sites")
+    parser.add_argument("--verify", action="store_true", help="compare results on local SQLite")
+    parser.add_argument("--db", help="verify against this SQLite file instead of migration-data")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="print the statements rebuilding every migrated FTS table")
+    args = parser.parse_args()
+
+    migrated, last = migrated_fts()
+    if args.rebuild:
+        print(rebuild_sql(migrated))
+        return
+
+    schema = load_schema()
+    rewrites, problems, indexed = find_rewrites(schema)
+    targets = fts_targets(rewrites, indexed)
+    pending = pending_targets(targets, migrated)
+
+    print("Substring searches:")
+    for rewrite in rewrites:
+        call = rewrite.call
+        groups = "; ".join(f"{g.table}({', '.join(g.columns)}) by {g.term}" for g in rewrite.groups)
+        print(f"  {call.rel_path}:{call.line}  {groups}")
+    for problem in problems:
+        print(f"  ⚠️  {problem}")
+    print("\nFTS5 tables:")
+    for table, columns in targets.items():
+        state = "new" if table not in migrated else (
+            "recreate with more columns" if table in pending else "migrated")
+        print(f"  {table}_fts({', '.join(pending.get(table, columns))})  {state}")
+
+    # Pending rewrites and the FTS searches already in the tree
+    searches = list(dict.fromkeys([(g.table, tuple(g.columns)) for r in rewrites for g in r.groups] + indexed))
+    if args.verify and not verify(searches, targets, args.db):
+        sys.exit(1)
+    with open_run("fts_index") as journal:
+        if args.write_migration and not pending:
+            print("\n⊘ Every search is covered by an existing migration, nothing written")
+        elif args.write_migration:
+            name = f"{last + 1:03d}_{MIGRATION_NAME}.sql"
+            replace = {t for t in pending if t in migrated}
+            journal.write_text(REPO_ROOT / MIGRATIONS_DIR / name, migration_sql(pending, name, replace))
+            print(f"\n✓ Wrote {MIGRATIONS_DIR}/{name}")
+        if args.rewrite:
+            print()
+            apply_rewrites(rewrites, journal)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,555 @@
+#!/usr/bin/env python3
+"""
+Find unbounded list queries and convert OFFSET pagination to keyset.
+
+Scans the sql`` / sqlAt`` queries under app/ and lib/ and reports:
+
+  unbounded   SELECTs that return a list with no LIMIT (point lookups,
+              aggregates and results only read through .rows[0] or
+              .rows.length are left out)
+  offset      LIMIT/OFFSET pagination, which reads and discards every
+              skipped row, so each page is slower than the last
+
+OFFSET queries ordered by `created_at` alone can be rewritten to keyset
+pagination on (created_at, id): the query gains a
+`(created_at, id) < (cursor)` predicate and an `id` tie-breaker, the
+handler reads a `cursor` param instead of computing an offset, and the
+response's pagination object gains the cursor of the next page
+(decodeCursor/nextCursor in lib/db.ts).
+
+Usage:
+    python3 scripts/list_queries.py                      # report only
+    python3 scripts/list_queries.py --keyset             # rewrite eligible queries
+    python3 scripts/list_queries.py --write-migration    # indexes for the sort keys
+    python3 scripts/list_queries.py --verify             # compare and time on SQLite
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from codemod_journal import open_run
+from d1_schema import DEFAULT_SCHEMA_FILES, REPO_ROOT, load_schema
+from sql_extract import (
+    MARKER, MARKER_PATTERN, SQL_KEYWORDS, add_db_imports, blank_nested, extract_queries,
+    iter_source_files, unmark,
+)
+
+SCAN_ROOTS = ["app", "lib"]
+MIGRATION_FILE = "sql/migrations/011_keyset_indexes.sql"
+
+# Tables that grow with every order, payment or message; unbounded reads of
+# these are listed first
+GROWING_TABLES = {
+    "orders", "transactions", "website_contributors", "notifications", "messages",
+    "conversations", "link_verifications", "payouts", "affiliate_commissions",
+    "affiliate_referrals", "disputes", "dispute_messages", "activity_logs",
+    "refund_requests",
+}
+
+AGGREGATE = re.compile(r"\b(COUNT|SUM|AVG|MIN|MAX|TOTAL|GROUP_CONCAT)\s*\(", re.I)
+MAIN_TABLE = re.compile(r"\bFROM\s+(\w+)\b(?![.(])(?:\s+(?:AS\s+)?(\w+))?", re.I)
+CLAUSE_END = r"(?=\bGROUP\s+BY\b|\bHAVING\b|\bORDER\s+BY\b|\bLIMIT\b|\bUNION\b|$)"
+WHERE_CLAUSE = re.compile(r"\bWHERE\b(.*?)" + CLAUSE_END, re.I | re.S)
+ORDER_CLAUSE = re.compile(r"\bORDER\s+BY\b(.*?)(?=\bLIMIT\b|$)", re.I | re.S)
+LIMIT_CLAUSE = re.compile(r"\bLIMIT\s+(\x00\d+\x00|\d+)(\s+OFFSET\s+(\x00\d+\x00|\d+))?", re.I)
+EQUALITY = re.compile(r"(?:(\w+)\.)?(\w+)\s*=\s*(?:\x00\d+\x00|'[^']*'|\d+|true|false)", re.I)
+KEYSET_ORDER = re.compile(r"^\s*(?:(\w+)\.)?created_at(?:\s+(ASC|DESC))?\s*$", re.I)
+
+# LIMIT/OFFSET in query strings built outside the sql tag: quoted strings, or
+# template literals spanning lines (db.prepare(`... LIMIT ? OFFSET ?`))
+RAW_OFFSET = re.compile(r"""(?:['"][^'"`\n]*|`[^`]*?)\b(?P<offset>OFFSET\s+(?:\?|\$\d+))""", re.I)
+
+CURSOR_VAR = "after"
+
+
+@dataclass
+class Finding:
+    call: object
+    kind: str  # "unbounded" or "offset"
+    table: str
+    detail: str = ""
+    keyset: object = None  # KeysetPlan when the query can be converted
+
+
+@dataclass
+class KeysetPlan:
+    call: object
+    table: str
+    qualifier: str  # "alias." or ""
+    descending: bool
+    order_span: tuple  # span of the ORDER BY expression in marked text
+    offset_span: tuple  # span of " OFFSET ${offset}"
+    insert_at: int  # where the cursor predicate goes
+    has_where: bool
+    limit_expr: str
+    offset_expr: str
+    scope_columns: list = field(default_factory=list)  # equality-filtered columns
+
+
+def load_models():
+    """Schema files plus the migrations, which add tables such as notifications."""
+    migrations = sorted(p.relative_to(REPO_ROOT).as_posix()
+                        for p in (REPO_ROOT / "sql" / "migrations").glob("*.sql"))
+    return load_schema(DEFAULT_SCHEMA_FILES + migrations)
+
+
+def select_list(top):
+    match = re.match(r"\s*SELECT\s+(?:DISTINCT\s+)?(.*?)\bFROM\b", top, re.I | re.S)
+    return match.group(1) if match else ""
+
+
+def select_columns(text, top):
+    """Result column names of the top-level select list ('*' for star)."""
+    match = re.match(r"\s*SELECT\s+(?:DISTINCT\s+)?", top, re.I)
+    if not match:
+        return set()
+    start = match.end()
+    listing = select_list(top)
+    names, pos = set(), start
+    for item in listing.split(","):
+        original = text[pos:pos + len(item)].strip()
+        pos += len(item) + 1
+        alias = re.search(r"\bAS\s+(\w+)\s*$", original, re.I)
+        if alias:
+            names.add(alias.group(1))
+        elif re.fullmatch(r"(?:\w+\.)?\*", original):
+            names.add("*")
+        elif re.fullmatch(r"(?:\w+\.)?(\w+)", original):
+            names.add(original.split(".")[-1])
+    return names
+
+
+def result_variable(call):
+    """Name the awaited result is assigned to, if any."""
+    before = call.source[max(0, call.start - 200):call.start]
+    match = re.search(r"(\w+)\s*=\s*await\s*$", before)
+    return match.group(1) if match else None
+
+
+def single_row_usage(call):
+    """True when the result is only read through .rows[0] or .rows.length."""
+    name = result_variable(call)
+    if not name:
+        return False
+    uses = re.findall(rf"\b{name}\.rows\b(\[0\]|\.length)?", call.source[call.end:])
+    return bool(uses) and all(uses)
+
+
+def point_lookup(where, table, qualifier, schema):
+    """True when the WHERE clause pins a primary key or unique column."""
+    model = schema.get(table)
+    if model is None:
+        return False
+    for alias, column in EQUALITY.findall(where):
+        if alias and alias != qualifier:
+            continue
+        col = model.columns.get(column)
+        if col is not None and (col.primary_key or col.unique):
+            return True
+        if any(i.unique and i.columns == [column] for i in model.indexes):
+            return True
+    return False
+
+
+def main_table(top):
+    match = MAIN_TABLE.search(top)
+    if not match:
+        return None, None
+    table, alias = match.group(1), match.group(2)
+    if alias and alias.upper() in SQL_KEYWORDS:
+        alias = None
+    return table.lower(), alias
+
+
+def keyset_plan(call, text, top, table, alias, limit_match, schema):
+    """Work out the rewrite for one OFFSET query, or say why there is none."""
+    if f"{CURSOR_VAR}.createdAt" in call.exprs:
+        return None, "already keyset; OFFSET kept for page= clients"
+    model = schema.get(table)
+    if model is None or not {"id", "created_at"} <= set(model.columns):
+        return None, f"{table} has no (created_at, id) sort key"
+    if re.search(r"\b(GROUP\s+BY|HAVING|UNION|DISTINCT)\b", top, re.I):
+        return None, "grouped or compound query"
+    order = ORDER_CLAUSE.search(top)
+    if not order:
+        return None, "no ORDER BY"
+    order_match = KEYSET_ORDER.match(order.group(1))
+    if not order_match or (order_match.group(1) or alias or table) != (alias or table):
+        first_key = " ".join(MARKER_PATTERN.sub("?", text[order.start(1):order.end(1)]).split(",")[0].split())
+        return None, f"ordered by {first_key}, not created_at alone"
+    columns = select_columns(text, top)
+    if "*" not in columns and not {"id", "created_at"} <= columns:
+        return None, "select list lacks id or created_at, so no cursor can be built"
+    where = WHERE_CLAUSE.search(top)
+    if where and re.search(r"\bOR\b", where.group(1), re.I):
+        return None, "top-level OR in WHERE"
+    if not (MARKER_PATTERN.fullmatch(limit_match.group(1)) and
+            MARKER_PATTERN.fullmatch(limit_match.group(3))):
+        return None, "literal LIMIT/OFFSET"
+
+    qualifier = f"{alias}." if alias else ""
+    order_start = order.start(1) + len(order.group(1)) - len(order.group(1).lstrip())
+    order_end = order.start(1) + len(order.group(1).rstrip())
+    scope = [c for a, c in EQUALITY.findall(where.group(1)) if (a or alias) == alias
+             and c in model.columns] if where else []
+    return KeysetPlan(
+        call=call,
+        table=table,
+        qualifier=qualifier,
+        descending=(order_match.group(2) or "ASC").upper() == "DESC",
+        order_span=(order_start, order_end),
+        offset_span=(limit_match.start(2), limit_match.end(2)),
+        insert_at=order.start(),
+        has_where=bool(where),
+        limit_expr=call.exprs[int(MARKER_PATTERN.fullmatch(limit_match.group(1)).group(1))].strip(),
+        offset_expr=call.exprs[int(MARKER_PATTERN.fullmatch(limit_match.group(3)).group(1))].strip(),
+        scope_columns=list(dict.fromkeys(scope)),
+    ), ""
+
+
+def analyse(schema, roots=None):
+    """Return (findings, raw) for every query under the roots."""
+    findings, raw = [], []
+    for path in iter_source_files(roots or SCAN_ROOTS):
+        if path.name == "sql-registry.ts":
+            continue
+        source = path.read_text(encoding="utf-8")
+        for call in extract_queries(path, source):
+            text = call.marked_text
+            top = blank_nested(text)
+            if call.composed and MARKER_PATTERN.match(text.lstrip()):
+                if re.search(r"\bOFFSET\b", top, re.I):
+                    findings.append(Finding(call, "offset", "?", "appends to another query, convert by hand"))
+                continue
+            if not re.match(r"\s*(SELECT|WITH)\b", top, re.I):
+                continue
+            table, alias = main_table(top)
+            if table is None:
+                continue
+
+            limit = LIMIT_CLAUSE.search(top)
+            if limit and limit.group(2):
+                plan, reason = keyset_plan(call, text, top, table, alias, limit, schema)
+                findings.append(Finding(call, "offset", table, reason, plan))
+                continue
+            if limit:
+                continue
+
+            listing = select_list(top)
+            if AGGREGATE.search(listing) and not re.search(r"\bGROUP\s+BY\b", top, re.I):
+                continue
+            where = WHERE_CLAUSE.search(top)
+            if where and point_lookup(where.group(1), table, alias or table, schema):
+                continue
+            if single_row_usage(call):
+                continue
+            findings.append(Finding(call, "unbounded", table))
+
+        for match in RAW_OFFSET.finditer(source):
+            line = source.count("\n", 0, match.start("offset")) + 1
+            raw.append(f"{path.relative_to(REPO_ROOT)}:{line}  built outside sql``, convert by hand")
+    return findings, raw
+
+
+# --- keyset rewrite ---------------------------------------------------------
+
+def keyset_predicate(qualifier, descending):
+    """Cursor predicate with ${...} interpolations, as written into queries.
+
+    With no cursor the values are null and fall back to a bound past every
+    timestamp. An `IS NULL OR ...` guard would read the same, but SQLite can
+    then no longer use the predicate as an index range.
+    """
+    op, bound = ("<", "'~'") if descending else (">", "''")
+    return (f"({qualifier}created_at, {qualifier}id) {op} "
+            f"(COALESCE(${{{CURSOR_VAR}.createdAt}}, {bound}), COALESCE(${{{CURSOR_VAR}.id}}, {bound}))")
+
+
+def _mark(snippet, exprs):
+    def mark(match):
+        exprs.append(match.group(1))
+        return MARKER.format(len(exprs) - 1)
+    return re.sub(r"\$\{([^{}]*)\}", mark, snippet)
+
+
+def rewritten_call(plan):
+    """New source for a call converted to keyset pagination."""
+    call = plan.call
+    text = call.marked_text
+    exprs = list(call.exprs)
+    direction = "DESC" if plan.descending else "ASC"
+
+    start, end = plan.offset_span
+    text = text[:start] + text[end:]
+    start, end = plan.order_span
+    text = text[:end] + f", {plan.qualifier}id {direction}" + text[end:]
+
+    line_start = text.rfind("\n", 0, plan.insert_at) + 1
+    indent = text[line_start:plan.insert_at]
+    indent = indent if not indent.strip() else " "
+    keyword = "AND" if plan.has_where else "WHERE"
+    predicate = _mark(keyset_predicate(plan.qualifier, plan.descending), exprs)
+    text = text[:plan.insert_at] + f"{keyword} {predicate}\n{indent}" + text[plan.insert_at:]
+
+    strings, used = unmark(text, exprs)
+    return call.render(strings, used, tag=call.tag)
+
+
+def _uses_outside(source, name, spans):
+    """Lines referencing an identifier outside the given (start, end) spans."""
+    lines = []
+    for match in re.finditer(rf"(?<![\w.$]){re.escape(name)}\b", source):
+        if not any(s <= match.start() < e for s, e in spans):
+            lines.append(source.count("\n", 0, match.start()) + 1)
+    return lines
+
+
+def rewrite_handler(source, plans, path):
+    """Swap the offset for a cursor param and return the next cursor.
+
+    Returns (source, problems); source is unchanged if a step can't be done.
+    """
+    offset_names = {p.offset_expr for p in plans}
+    if len(offset_names) != 1 or not re.fullmatch(r"\w+", next(iter(offset_names))):
+        return source, ["offset is not a single variable"]
+    offset = offset_names.pop()
+    declaration = re.search(rf"^([ \t]*)(?:const|let)\s+{offset}\s*=[^;]*;\n", source, re.M)
+    if not declaration:
+        return source, [f"no declaration of {offset}"]
+    spans = [(declaration.start(), declaration.end())] + [(p.call.start, p.call.end) for p in plans]
+    others = _uses_outside(source, offset, spans)
+    if others:
+        return source, [f"{offset} is also used on line(s) {', '.join(map(str, others))}"]
+    if "searchParams" not in source[:declaration.start()]:
+        return source, ["no searchParams in scope for the cursor param"]
+
+    result_names = {result_variable(p.call) for p in plans}
+    if len(result_names) != 1 or None in result_names:
+        return source, ["query results are not assigned to one variable"]
+    result = result_names.pop()
+    limit = plans[0].limit_expr
+    last_call = max(p.call.end for p in plans)
+    pagination = re.compile(r"^([ \t]*)pagination:\s*\{\n", re.M).search(source, last_call)
+    if not pagination:
+        return source, ["no pagination object in the response"]
+
+    body_start = pagination.end()
+    body = source[body_start:source.index("}", body_start)]
+    key = "nextCursor" if re.search(r"\b[a-z]+[A-Z]\w*\s*:", body) else "next_cursor"
+    entry_indent = re.match(r"[ \t]*", body).group(0)
+    last_entry = body.rstrip()
+    insert_at = body_start + len(last_entry)
+    comma = "" if last_entry.endswith(",") else ","
+    source = (source[:insert_at] + f"{comma}\n{entry_indent}{key}: nextCursor({result}.rows, {limit})"
+              + ("," if comma == "" else "") + source[insert_at:])
+
+    indent = declaration.group(1)
+    page_names = re.findall(r"\b(\w+)\s*-\s*1\b", declaration.group(0))
+    source = (source[:declaration.start()]
+              + f"{indent}const {CURSOR_VAR} = decodeCursor(searchParams.get('cursor'));\n"
+              + source[declaration.end():])
+    return drop_page_param(source, page_names[0]) if page_names else source, []
+
+
+def drop_page_param(source, page):
+    """Remove a page number that is now only echoed back in the response."""
+    declaration = re.search(rf"^[ \t]*(?:const|let)\s+{page}\s*=[^;]*;\n", source, re.M)
+    echo = re.search(rf"^[ \t]*{page},\n", source, re.M)
+    if not declaration or not echo:
+        return source
+    spans = [(declaration.start(), declaration.end()), (echo.start(), echo.end())]
+    if _uses_outside(source, page, spans):
+        return source
+    for start, end in sorted(spans, reverse=True):
+        source = source[:start] + source[end:]
+    return source
+
+
+def apply_keyset(plans, journal):
+    by_file = defaultdict(list)
+    for plan in plans:
+        by_file[plan.call.path].append(plan)
+
+    for path, file_plans in by_file.items():
+        original = path.read_text(encoding="utf-8")
+        rel = path.relative_to(REPO_ROOT)
+        if re.search(rf"(?<![\w.$]){CURSOR_VAR}\b", original):
+            print(f"✗ {rel}: `{CURSOR_VAR}` is already defined; left unchanged")
+            continue
+        source = original
+        for plan in sorted(file_plans, key=lambda p: p.call.start, reverse=True):
+            source = source[:plan.call.start] + rewritten_call(plan) + source[plan.call.end:]
+        # Re-extract so the handler rewrite sees the new call positions
+        before = [c.start for c in extract_queries(path, original)]
+        after = extract_queries(path, source)
+        for plan in file_plans:
+            plan.call = after[before.index(plan.call.start)]
+        source, problems = rewrite_handler(source, file_plans, path)
+        if problems:
+            for problem in problems:
+                print(f"✗ {rel}: {problem}; left unchanged")
+            continue
+        source = add_db_imports(source, ["decodeCursor", "nextCursor"])
+        journal.write_text(path, source)
+        print(f"✓ Keyset pagination: {rel} ({len(file_plans)} query(ies))")
+
+
+# --- indexes ----------------------------------------------------------------
+
+def covering_index(plan, schema):
+    """True when an index seeks on the scope columns and then created_at."""
+    model = schema[plan.table]
+    for index in model.indexes:
+        columns = index.columns
+        prefix = 0
+        while prefix < len(columns) and columns[prefix] in plan.scope_columns:
+            prefix += 1
+        if (prefix or not plan.scope_columns) and columns[prefix:prefix + 1] == ["created_at"]:
+            return True
+    return False
+
+
+def missing_indexes(plans, schema):
+    """{index name: (table, columns)} for keyset queries with no usable index."""
+    indexes = {}
+    for plan in plans:
+        if covering_index(plan, schema):
+            continue
+        columns = plan.scope_columns[:1] + ["created_at", "id"]
+        name = f"idx_{plan.table}_{'_'.join(plan.scope_columns[:1] + ['keyset'])}"
+        indexes[name] = (plan.table, columns)
+    return dict(sorted(indexes.items()))
+
+
+def migration_sql(indexes):
+    lines = [
+        f"-- Migration: {MIGRATION_FILE.rsplit('/', 1)[-1]}",
+        "-- Indexes for keyset pagination (generated by scripts/list_queries.py)",
+        "--",
+        "-- Each index leads with the column a paginated list is scoped to, then",
+        "-- (created_at, id), so `(created_at, id) < (cursor)` is a range seek.",
+        "",
+    ]
+    for name, (table, columns) in indexes.items():
+        lines.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({', '.join(columns)});")
+    return "\n".join(lines) + "\n"
+
+
+# --- verification -----------------------------------------------------------
+
+def _predicate_sql(descending):
+    """keyset_predicate() with named parameters, for SQLite."""
+    text = keyset_predicate("", descending)
+    return text.replace(f"${{{CURSOR_VAR}.createdAt}}", ":created_at").replace(f"${{{CURSOR_VAR}.id}}", ":id")
+
+
+def verify(rows=50000, page_size=20):
+    """Page through a synthetic table with OFFSET and with the keyset predicate.
+
+    Checks the keyset pages visit every row once, in (created_at, id) order,
+    including rows that share a created_at, and times pages at increasing depth.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id TEXT PRIMARY KEY, scope TEXT, created_at TEXT)")
+    conn.execute("CREATE INDEX idx_items_keyset ON items(scope, created_at, id)")
+    # Three rows per second, so a third of the page boundaries fall on a tie
+    conn.executemany(
+        "INSERT INTO items VALUES (?, 's', datetime('2024-01-01', '+' || ? || ' seconds'))",
+        ((f"{(i * 7919) % rows:08x}", i // 3) for i in range(rows)),
+    )
+    ok = True
+    for descending in (True, False):
+        direction = "DESC" if descending else "ASC"
+        order = f"ORDER BY created_at {direction}, id {direction}"
+        expected = [r[0] for r in conn.execute(f"SELECT id FROM items WHERE scope = 's' {order}")]
+        keyset_sql = (f"SELECT id, created_at FROM items WHERE scope = 's' "
+                      f"AND {_predicate_sql(descending)} {order} LIMIT :limit")
+        seen, cursor = [], {"created_at": None, "id": None}
+        while True:
+            page = conn.execute(keyset_sql, {**cursor, "limit": page_size}).fetchall()
+            seen += [r[0] for r in page]
+            if len(page) < page_size:
+                break
+            cursor = {"id": page[-1][0], "created_at": page[-1][1]}
+        status = "✓" if seen == expected else "✗"
+        ok &= seen == expected
+        print(f"{status} {direction}: keyset visited {len(seen)}/{len(expected)} rows in order")
+
+    offset_sql = "SELECT id, created_at FROM items WHERE scope = 's' ORDER BY created_at DESC LIMIT ? OFFSET ?"
+    keyset_sql = (f"SELECT id, created_at FROM items WHERE scope = 's' AND {_predicate_sql(True)} "
+                  f"ORDER BY created_at DESC, id DESC LIMIT :limit")
+    ordered = conn.execute("SELECT id, created_at FROM items ORDER BY created_at DESC, id DESC").fetchall()
+    plan = " ".join(r[-1] for r in conn.execute("EXPLAIN QUERY PLAN " + keyset_sql,
+                                                  {"id": None, "created_at": None, "limit": 1}))
+    seeks = "(created_at,id)<" in plan
+    ok &= seeks
+    print(f"{'✓' if seeks else '✗'} keyset query plan: {plan}")
+
+    print(f"\n{'page':>8} {'OFFSET ms':>10} {'keyset ms':>10}")
+    for page in (1, 10, 100, 1000, rows // page_size - 1):
+        skip = (page - 1) * page_size
+        last = ordered[skip - 1] if skip else (None, None)
+        timings = []
+        for sql, params in ((offset_sql, (page_size, skip)),
+                            (keyset_sql, {"id": last[0], "created_at": last[1], "limit": page_size})):
+            started = time.perf_counter()
+            for _ in range(20):
+                conn.execute(sql, params).fetchall()
+            timings.append((time.perf_counter() - started) / 20 * 1000)
+        print(f"{page:>8} {timings[0]:>10.3f} {timings[1]:>10.3f}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keyset", action="store_true", help="rewrite eligible OFFSET queries")
+    parser.add_argument("--write-migration", action="store_true", help=f"write {MIGRATION_FILE}")
+    parser.add_argument("--verify", action="store_true",
+                        help="check the keyset predicate and time it against OFFSET on SQLite")
+    parser.add_argument("--rows", type=int, default=50000, help="rows in the --verify table")
+    args = parser.parse_args()
+
+    schema = load_models()
+    findings, raw = analyse(schema)
+    unbounded = sorted((f for f in findings if f.kind == "unbounded"),
+                       key=lambda f: (f.table not in GROWING_TABLES, str(f.call.rel_path), f.call.line))
+    offsets = [f for f in findings if f.kind == "offset"]
+    plans = [f.keyset for f in offsets if f.keyset]
+
+    print(f"Unbounded list queries ({len(unbounded)}):")
+    for finding in unbounded:
+        flag = "⚠️ " if finding.table in GROWING_TABLES else "  "
+        print(f"  {flag}{finding.call.rel_path}:{finding.call.line}  {finding.table}")
+    print(f"\nOFFSET pagination ({len(offsets) + len(raw)}):")
+    for finding in offsets:
+        status = "→ keyset" if finding.keyset else f"✗ {finding.detail}"
+        print(f"  {finding.call.rel_path}:{finding.call.line}  {finding.table}  {status}")
+    for line in raw:
+        print(f"  {line}")
+
+    indexes = missing_indexes(plans, schema)
+    if indexes:
+        print("\nIndexes needed for keyset pagination:")
+        for name, (table, columns) in indexes.items():
+            print(f"  {name} ON {table}({', '.join(columns)})")
+
+    if args.verify:
+        print()
+        if not verify(args.rows):
+            sys.exit(1)
+    with open_run("list_queries") as journal:
+        if args.write_migration and indexes:
+            journal.write_text(REPO_ROOT / MIGRATION_FILE, migration_sql(indexes))
+            print(f"\n✓ Wrote {MIGRATION_FILE}")
+        if args.keyset:
+            print()
+            apply_keyset(plans, journal)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Build a local SQLite stand-in for D1 from the schema files and migration-data.
+
+Usage: python3 scripts/local_d1.py [output.db]
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+from d1_schema import DEFAULT_SCHEMA_FILES, REPO_ROOT, to_sqlite
+from schema_compiler import compiled_schema, convert_rows, read_export
+
+MIGRATION_DATA = REPO_ROOT / "migration-data"
+
+
+def load_rows(conn, table, rows, columns, schema_files=None):
+    """Insert export rows through the table's compiled converter.
+
+    Export columns the schema lacks are skipped (schema_compiler.py reports
+    them). Returns the number of rows actually stored.
+    """
+    if not rows:
+        return 0
+    before = conn.total_changes
+    tuples, project = convert_rows(table, rows, columns, schema_files)
+    conn.executemany(project.insert_sql("INSERT OR IGNORE"), tuples)
+    return conn.total_changes - before
+
+
+def open_local_db(path=":memory:", schema_files=None, data_dir=MIGRATION_DATA, extra_sql=()):
+    """Create the schema, apply any extra SQL, then load migration-data.
+
+    Returns (connection, {table: rows loaded}).
+    """
+    conn = sqlite3.connect(path)
+    for name in schema_files or DEFAULT_SCHEMA_FILES:
+        conn.executescript(to_sqlite((REPO_ROOT / name).read_text(encoding="utf-8")))
+    for sql in extra_sql:
+        conn.executescript(sql)
+    # The exports are partial, so referenced rows may be missing
+    conn.execute("PRAGMA foreign_keys = OFF")
+
+    tables = compiled_schema(schema_files)
+    loaded = {}
+    for json_file in sorted(Path(data_dir).glob("*.json")):
+        table = tables.get(json_file.stem)
+        if table is None:
+            continue
+        rows, columns = read_export(table.name, Path(data_dir))
+        loaded[table.name] = load_rows(conn, table.name, rows, columns, schema_files)
+    conn.commit()
+    return conn, loaded
+
+
+def short_loads(conn, loaded, data_dir=MIGRATION_DATA):
+    """(table, rows stored, rows exported) for exports that did not load in full.
+
+    Rows already present (the schema seeds some categories) count as loaded.
+    """
+    short = []
+    for table in loaded:
+        exported = len(read_export(table, Path(data_dir))[0])
+        stored = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        if stored < exported:
+            short.append((table, stored, exported))
+    return short
+
+
+def print_short_loads(short):
+    for table, stored, exported in short:
+        print(f"⚠️  {table}: {stored} of {exported} exported rows loaded "
+              f"(python3 scripts/schema_compiler.py shows why)")
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else ":memory:"
+    conn, loaded = open_local_db(path)
+    for table, count in loaded.items():
+        print(f"  {table.ljust(25)} {count} rows")
+    print_short_loads(short_loads(conn, loaded))
+
+
+if __name__ == "__main__":
+    main()
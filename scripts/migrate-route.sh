@@ -22,8 +22,16 @@ if grep -q "initializeDatabaseFromContext" "$FILE"; then
     exit 0
 fi
 
-# Backup
-cp "$FILE" "$FILE.backup"
+# Record the original in the codemod journal (scripts/codemod_journal.py)
+SCRIPT_DIR=$(dirname "$0")
+journal() {
+    python3 "$SCRIPT_DIR/codemod_journal.py" "$@"
+}
+RUN_ID=$(journal begin migrate-route "$FILE") || exit 1
+
+# Finish the run however the script exits, so a failed edit can still be undone
+trap 'journal finish "$RUN_ID"' EXIT
+set -e
 
 # Add import if not present
 if ! grep -q "initializeDatabaseFromContext" "$FILE"; then
@@ -44,5 +52,5 @@ a\
 }' "$FILE"
 
 echo "Migrated: $FILE"
-echo "Backup saved: $FILE.backup"
+echo "Undo with: python3 \"$SCRIPT_DIR/codemod_journal.py\" undo $RUN_ID"
 echo "Please review the changes manually!"
@@ -0,0 +1,861 @@
+#!/usr/bin/env python3
+"""
+Estimate rows read and rows returned per route from table cardinalities.
+
+Statistics come from the local SQLite stand-in (migration-data, see
+local_d1.py) or from --db, a fuller copy such as a `wrangler d1 export`
+loaded into SQLite:
+
+  rows       COUNT(*) per table
+  ndv        COUNT(DISTINCT col) per column, which sets how many rows an
+             equality on that column matches
+  width      average stored bytes per column value
+  nulls      fraction of NULLs, used for IS NULL filters
+
+Every table with rows is measured, and --scale projects from those
+counts: all tables (--scale 100) or one at a time (--scale orders=50000
+sets an absolute count); key-like columns grow with the table,
+low-cardinality ones such as status keep their counts. Empty tables, and
+tables missing from the database, get --default-rows and heuristic
+distinct counts. A table with fewer than --min-sample rows is a sample,
+not a size: from migration-data it is projected to --default-rows
+(measured widths and NULL fractions kept, distinct counts at least the
+heuristic ones), so a 1-row orders table does not rank below an empty
+one. With --db the counts are taken as real, though flag and status-like
+columns count at least the values such columns usually have. Either way
+such tables are listed with a warning, and --scale TABLE=ROWS sets their
+size. Exports that do not load in full are reported.
+
+Each sql`` / sqlAt`` query under app/ and lib/ is costed the way SQLite
+would run it: the best index prefix on the driving table, an index lookup
+or automatic index per join, residual filters, GROUP BY and aggregates,
+and LIMIT (an early stop when nothing has to be sorted). Correlated
+subqueries are charged once per outer row and queries inside loops once
+per --loop-iterations. Queries are summed per handler (GET, POST, page
+loader, ...), ranked by rows read, and handlers over a threshold are
+flagged.
+
+Usage:
+    python3 scripts/query_cost.py                          # ranked report
+    python3 scripts/query_cost.py --scale 1000 --details   # per-query breakdown
+    python3 scripts/query_cost.py --scale orders=100000 --max-scanned 5000
+"""
+
+import argparse
+import math
+import re
+import sqlite3
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from d1_schema import REPO_ROOT
+from list_queries import (
+    AGGREGATE, LIMIT_CLAUSE, ORDER_CLAUSE, SCAN_ROOTS, WHERE_CLAUSE, load_models, main_table,
+    select_list,
+)
+from local_d1 import open_local_db, print_short_loads, short_loads
+from sql_extract import (
+    MARKER_PATTERN, blank_nested, extract_queries, function_body_start, iter_source_files,
+    matching_bracket, route_for, table_refs,
+)
+
+DEFAULT_ROWS = 1000
+MIN_SAMPLE = 100
+LOOP_ITERATIONS = 10
+
+# Selectivity of filters that no statistic covers, as SQLite's planner assumes
+RANGE_SELECTIVITY = 1 / 3
+LIKE_SELECTIVITY = 1 / 10
+FTS_SELECTIVITY = 1 / 20
+OTHER_SELECTIVITY = 1 / 2
+
+# Heuristic distinct counts when a table has too few rows to measure
+FLAG_COLUMN = re.compile(r"^(is_|has_|allows_)")
+LOW_CARDINALITY = re.compile(r"(status|type|role|kind|method|currency|tier|priority)$")
+TEXT_WIDTH = 32
+NUMBER_WIDTH = 8
+
+VALUE = r"(?:\x00\d+\x00|'[^']*'|-?\d+(?:\.\d+)?|true|false|\w+\.\w+)"
+EQUALITY = re.compile(rf"^(?:(\w+)\.)?(\w+)\s*=\s*({VALUE})$", re.I)
+REVERSED_EQUALITY = re.compile(rf"^({VALUE})\s*=\s*(?:(\w+)\.)?(\w+)$", re.I)
+IN_LIST = re.compile(r"^(?:(\w+)\.)?(\w+)\s+IN\s*\(", re.I)
+RANGE = re.compile(r"^(?:(\w+)\.)?(\w+)\s*(?:<=?|>=?|\bBETWEEN\b)", re.I)
+ROW_RANGE = re.compile(r"^\(\s*(?:(\w+)\.)?(\w+)\s*,[^)]*\)\s*[<>]", re.I)
+IS_NULL = re.compile(r"^(?:(\w+)\.)?(\w+)\s+IS\s+NULL$", re.I)
+LIKE = re.compile(r"^(?:(\w+)\.)?(\w+)\s+(?:NOT\s+)?LIKE\b", re.I)
+# LOWER(email) = LOWER(?) and the like: one match per value, but no index seek
+FUNCTION_EQUALITY = re.compile(r"^\w+\(\s*(?:(\w+)\.)?(\w+)\s*\)\s*=", re.I)
+# (${flag} OR ...), (${x} IS NULL OR ...), (${x} = '' OR ...): off unless the request sets it
+OPTIONAL_FILTER = re.compile(r"^\x00\d+\x00(?:\s*(?:=\s*''|IS\s+NULL|=\s*0))?\s+OR\b", re.I)
+FTS_PROBE = re.compile(r"\browid\s+IN\s*\(\s*SELECT\s+rowid\s+FROM\s+\w+_fts\b", re.I)
+JOIN = re.compile(
+    r"\b(LEFT\s+(?:OUTER\s+)?|INNER\s+|CROSS\s+)?JOIN\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?\s+ON\b(.*?)"
+    r"(?=\b(?:LEFT|INNER|CROSS|JOIN|WHERE|GROUP|ORDER|LIMIT|HAVING|UNION)\b|$)",
+    re.I | re.S,
+)
+GROUP_CLAUSE = re.compile(r"\bGROUP\s+BY\b(.*?)(?=\bHAVING\b|\bORDER\s+BY\b|\bLIMIT\b|$)", re.I | re.S)
+SUBQUERY = re.compile(r"\(\s*SELECT\b", re.I)
+HANDLER = re.compile(r"(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s+(\w+)\s*\(")
+LOOP_HEAD = re.compile(
+    r"(?:\bfor\s*\(.*\)|\bwhile\s*\(.*\)|\.(?:map|forEach|flatMap)\s*\(\s*(?:async\s*)?"
+    r"(?:\([^()]*\)|\w+)\s*=>)\s*$",
+    re.S,
+)
+
+
+@dataclass
+class TableStats:
+    name: str
+    rows: float
+    ndv: dict = field(default_factory=dict)  # column -> distinct values
+    width: dict = field(default_factory=dict)  # column -> average bytes
+    nulls: dict = field(default_factory=dict)  # column -> NULL fraction
+    measured: bool = False
+    sample: int = 0  # rows measured, when fewer than --min-sample
+    projected: bool = False  # sample grown to default_rows
+
+    def distinct(self, column):
+        return max(1.0, min(self.ndv.get(column, self.rows / 10), self.rows))
+
+    def row_width(self):
+        return sum(self.width.values()) or NUMBER_WIDTH
+
+
+@dataclass
+class Estimate:
+    scanned: float = 0.0
+    returned: float = 0.0
+    bytes: float = 0.0
+    notes: list = field(default_factory=list)
+
+
+@dataclass
+class QueryCost:
+    call: object
+    route: str
+    handler: str
+    estimate: Estimate
+    repeat: int = 1
+
+    @property
+    def label(self):
+        return f"{self.call.rel_path}:{self.call.line}"
+
+
+# --- statistics -------------------------------------------------------------
+
+def _is_flag(column):
+    return "BOOL" in column.type.upper() or bool(FLAG_COLUMN.search(column.name))
+
+
+def _heuristic_ndv(column, rows):
+    if column.primary_key or column.unique:
+        return rows
+    if _is_flag(column):
+        return min(rows, 2)
+    if LOW_CARDINALITY.search(column.name):
+        return min(rows, 5)
+    return max(1.0, rows / 10)
+
+
+def _small_sample_floor(column):
+    """Distinct values a flag or status-like column is assumed to have at least."""
+    if column.primary_key or column.unique:
+        return 1
+    if _is_flag(column):
+        return 2
+    if LOW_CARDINALITY.search(column.name):
+        return 5
+    return 1
+
+
+def _default_width(column):
+    if column.name == "id" or column.name.endswith("_id"):
+        return 36
+    return TEXT_WIDTH if column.is_text else NUMBER_WIDTH
+
+
+def _heuristic_stats(table, rows):
+    return TableStats(
+        name=table.name,
+        rows=rows,
+        ndv={c.name: _heuristic_ndv(c, rows) for c in table.columns.values()},
+        width={c.name: _default_width(c) for c in table.columns.values()},
+        nulls={},
+    )
+
+
+def _project_sample(table_stats, table, rows):
+    """Grow a small sample to rows; key columns scale, the rest get heuristic floors."""
+    ratio = rows / table_stats.rows
+    for column, ndv in table_stats.ndv.items():
+        model = table.columns[column]
+        if model.primary_key or model.unique or column.endswith("_id"):
+            table_stats.ndv[column] = max(1.0, ndv * ratio)
+        else:
+            table_stats.ndv[column] = max(ndv, _heuristic_ndv(model, rows))
+    table_stats.rows = rows
+    table_stats.projected = True
+
+
+def collect_stats(conn, schema, default_rows=DEFAULT_ROWS, min_sample=MIN_SAMPLE, project=True):
+    """TableStats for every table in the schema model.
+
+    Tables with rows are measured; empty and missing ones get default_rows
+    and heuristic distinct counts. Tables with fewer than min_sample rows
+    are projected to default_rows when project is set.
+    """
+    present = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    stats = {}
+    for table in schema.values():
+        if table.name not in present:
+            stats[table.name] = _heuristic_stats(table, default_rows)
+            continue
+        rows = conn.execute(f"SELECT COUNT(*) FROM {table.name}").fetchone()[0]
+        if rows == 0:
+            stats[table.name] = _heuristic_stats(table, default_rows)
+            continue
+        existing = {r[1] for r in conn.execute(f"PRAGMA table_info({table.name})")}
+        columns = [c for c in table.columns if c in existing]
+        parts = []
+        for c in columns:
+            parts += [f"COUNT(DISTINCT {c})", f"AVG(LENGTH({c}))", f"SUM({c} IS NULL)"]
+        values = conn.execute(f"SELECT {', '.join(parts)} FROM {table.name}").fetchone()
+        table_stats = TableStats(name=table.name, rows=rows, measured=True)
+        for i, column in enumerate(columns):
+            ndv, width, nulls = values[3 * i:3 * i + 3]
+            table_stats.ndv[column] = max(1, ndv)
+            if rows < min_sample:
+                table_stats.ndv[column] = max(table_stats.ndv[column],
+                                              _small_sample_floor(table.columns[column]))
+            table_stats.width[column] = width or 0
+            table_stats.nulls[column] = (nulls or 0) / rows
+        if rows < min_sample:
+            table_stats.sample = rows
+            if project and rows < default_rows:
+                _project_sample(table_stats, table, default_rows)
+        stats[table.name] = table_stats
+    return stats
+
+
+def parse_scale(values):
+    """--scale arguments into (global factor, {table: rows})."""
+    factor, per_table = 1.0, {}
+    for value in values or []:
+        if "=" in value:
+            table, rows = value.split("=", 1)
+            per_table[table.strip()] = float(rows)
+        else:
+            factor *= float(value)
+    return factor, per_table
+
+
+def apply_scale(stats, schema, factor, per_table):
+    """Grow row counts; key-like columns grow with them, the rest keep their ndv."""
+    for name, table_stats in stats.items():
+        target = per_table.get(name, table_stats.rows * factor)
+        ratio = target / table_stats.rows if table_stats.rows else 0
+        columns = schema[name].columns if name in schema else {}
+        for column, ndv in table_stats.ndv.items():
+            model = columns.get(column)
+            keyed = (model is not None and (model.primary_key or model.unique)) \
+                or column.endswith("_id") or ndv >= table_stats.rows / 2
+            if keyed and not (FLAG_COLUMN.search(column) or LOW_CARDINALITY.search(column)):
+                table_stats.ndv[column] = max(1.0, ndv * ratio)
+        table_stats.rows = target
+
+
+# --- per-query estimate -----------------------------------------------------
+
+def conjuncts(text):
+    """Split a WHERE/ON clause on top-level AND (BETWEEN's AND is kept)."""
+    top = blank_nested(text)
+    parts, start, pos = [], 0, 0
+    for match in re.finditer(r"\bAND\b", top, re.I):
+        if re.search(r"\bBETWEEN\s+\S+\s*$", top[pos:match.start()], re.I):
+            pos = match.end()
+            continue
+        parts.append(text[start:match.start()].strip())
+        start = pos = match.end()
+    parts.append(text[start:].strip())
+    return [p for p in parts if p]
+
+
+def _strip_parens(text):
+    while text.startswith("(") and text.endswith(")") and matching_bracket(text, 0) == len(text) - 1:
+        text = text[1:-1].strip()
+    return text
+
+
+def classify(predicate, refs, default_alias):
+    """(kind, alias, column, selectivity hint) for one conjunct."""
+    predicate = _strip_parens(predicate)
+    top = blank_nested(predicate)
+    if OPTIONAL_FILTER.match(predicate):
+        return "optional", default_alias, None
+    if re.search(r"\bOR\b", top, re.I):
+        return "other", None, None
+    if FTS_PROBE.search(predicate):
+        return "fts", default_alias, "rowid"
+    for pattern, kind in ((EQUALITY, "eq"), (IN_LIST, "in"), (IS_NULL, "null"),
+                          (LIKE, "like"), (FUNCTION_EQUALITY, "expr_eq"), (ROW_RANGE, "range"), (RANGE, "range")):
+        match = pattern.match(predicate)
+        if match:
+            alias, column = match.group(1), match.group(2)
+            if kind == "eq" and alias is None and column.lower() in ("true", "false"):
+                break
+            if kind == "eq":
+                rhs = match.group(3)
+                rhs_alias = rhs.split(".")[0] if re.fullmatch(r"\w+\.\w+", rhs) else None
+                if rhs_alias and rhs_alias in refs:
+                    return "join", alias or default_alias, column
+            return kind, alias or default_alias, column
+    match = REVERSED_EQUALITY.match(predicate)
+    if match:
+        return "eq", match.group(2) or default_alias, match.group(3)
+    return "other", None, None
+
+
+def _in_list_size(predicate):
+    match = re.search(r"\bIN\s*\((.*)\)\s*$", predicate, re.I | re.S)
+    if not match or re.match(r"\s*SELECT\b", match.group(1), re.I):
+        return None
+    if "json_each" in match.group(1):
+        return 10
+    return len([p for p in match.group(1).split(",") if p.strip()])
+
+
+def filter_selectivity(kind, table_stats, column, predicate):
+    if kind == "optional":
+        return 1.0
+    if kind in ("eq", "expr_eq"):
+        return 1 / table_stats.distinct(column)
+    if kind == "in":
+        size = _in_list_size(predicate)
+        return min(1.0, (size or 10) / table_stats.distinct(column))
+    if kind == "null":
+        return table_stats.nulls.get(column, 0.1) or 0.1
+    if kind == "range":
+        return RANGE_SELECTIVITY
+    if kind == "like":
+        return LIKE_SELECTIVITY
+    if kind == "fts":
+        return FTS_SELECTIVITY
+    return OTHER_SELECTIVITY
+
+
+def index_prefixes(table, stats_columns):
+    """Column lists SQLite can seek on: declared indexes plus PK/unique columns."""
+    prefixes = [(i.columns, i.unique) for i in table.indexes]
+    for column in table.columns.values():
+        if column.primary_key or column.unique:
+            prefixes.append(([column.name], True))
+    prefixes.append((["rowid"], True))
+    return prefixes
+
+
+def access_path(table, table_stats, filters):
+    """Best index seek for the filters on one table.
+
+    filters: [(kind, column, predicate)]. Returns (rows read, index columns used,
+    filters left to check per row).
+    """
+    by_column = defaultdict(list)
+    for kind, column, predicate in filters:
+        by_column[column].append((kind, predicate))
+    best = (table_stats.rows, [], filters)
+    for columns, unique in index_prefixes(table, table_stats.ndv):
+        used, rows = [], table_stats.rows
+        for column in columns:
+            kinds = [k for k, _ in by_column.get(column, [])]
+            if "eq" in kinds or "in" in kinds:
+                kind = "eq" if "eq" in kinds else "in"
+                predicate = next(p for k, p in by_column[column] if k == kind)
+                rows *= filter_selectivity(kind, table_stats, column, predicate)
+                used.append(column)
+                continue
+            if "range" in kinds or "fts" in kinds:
+                rows *= filter_selectivity("fts" if "fts" in kinds else "range", table_stats, column, "")
+                used.append(column)
+            break
+        if not used:
+            continue
+        if unique and len(used) == len(columns) and not any(
+                k in ("range", "fts") for c in used for k, _ in by_column.get(c, [])):
+            rows = min(rows, 1)
+        rows = max(rows, 1)
+        if rows < best[0] or (rows == best[0] and not best[1]):
+            left = [f for f in filters if f[1] not in used]
+            best = (rows, used, left)
+    return best
+
+
+def or_access(table, table_stats, predicate, alias):
+    """Rows read by SQLite's OR optimization: one index seek per OR term.
+
+    None when some term has no index to seek on.
+    """
+    text = _strip_parens(predicate)
+    top = blank_nested(text)
+    if not re.search(r"\bOR\b", top, re.I) or re.search(r"\bAND\b", top, re.I):
+        return None
+    total, start = 0.0, 0
+    bounds = [m.start() for m in re.finditer(r"\bOR\b", top, re.I)] + [len(text)]
+    for end in bounds:
+        term = text[start:end].strip()
+        start = end + 2
+        kind, term_alias, column = classify(term, {alias}, alias)
+        if kind == "other" or term_alias != alias:
+            return None
+        rows, used, _ = access_path(table, table_stats, [(kind, column, term)])
+        if not used:
+            return None
+        total += rows
+    return min(total, table_stats.rows)
+
+
+def _nested_subqueries(text):
+    """Spans of the (SELECT ...) subqueries directly inside this query."""
+    top = blank_nested(text)
+    spans, pos = [], 0
+    while True:
+        match = SUBQUERY.search(text, pos)
+        if not match:
+            break
+        start = match.start()
+        end = matching_bracket(text, start)
+        # Only subqueries one level down, i.e. blanked in `top` but opened at depth 0
+        if top[start] == "(":
+            spans.append((start, end + 1))
+        pos = end + 1
+    return spans
+
+
+def _limit_value(expr, call):
+    """Resolve a LIMIT expression to a number, from the handler if need be."""
+    expr = expr.strip()
+    if re.fullmatch(r"\d+", expr):
+        return int(expr), None
+    name = re.match(r"[\w.]+", expr)
+    if not name:
+        return None, f"LIMIT {expr} not resolved"
+    name = name.group(0).split(".")[0]
+    before = call.source[:call.start]
+    declarations = list(re.finditer(
+        rf"\b(?:const|let|var)\s+{name}\b\s*=\s*([^;\n]*)|[(,]\s*{name}\s*(?::[^=,)]*)?=\s*(\d+)", before))
+    if not declarations:
+        return None, f"LIMIT {expr} not resolved"
+    declaration = declarations[-1].group(1) or declarations[-1].group(2)
+    numbers = [int(n) for n in re.findall(r"\b\d+\b", declaration)]
+    if not numbers:
+        return None, f"LIMIT {expr} not resolved"
+    if "searchParams" in declaration and not re.search(r"Math\.min\b", declaration):
+        return max(numbers), f"LIMIT {name} comes from the request uncapped"
+    return max(numbers), None
+
+
+def _select_width(listing, refs, schema, stats):
+    """Average bytes per result row for a select list."""
+    width = 0.0
+    for item in (i.strip() for i in listing.split(",")):
+        star = re.fullmatch(r"(?:(\w+)\.)?\*", item)
+        if star:
+            tables = [refs[star.group(1)]] if star.group(1) in refs else set(refs.values())
+            width += sum(stats[t].row_width() for t in tables if t in stats)
+            continue
+        column = re.fullmatch(r"(?:(\w+)\.)?(\w+)(?:\s+(?:AS\s+)?\w+)?", item, re.I)
+        if column:
+            alias, name = column.group(1), column.group(2)
+            tables = [refs[alias]] if alias in refs else list(refs.values())
+            found = [stats[t].width[name] for t in tables if t in stats and name in stats[t].width]
+            width += found[0] if found else NUMBER_WIDTH
+        else:
+            width += NUMBER_WIDTH
+    return width
+
+
+def _order_from_index(order_text, alias, used, table):
+    """True when ORDER BY is served by the index used to read the driving table."""
+    keys = [re.sub(r"\s+(ASC|DESC)$", "", k.strip(), flags=re.I) for k in order_text.split(",")]
+    keys = [k.split(".")[-1] for k in keys if k.split(".")[0] in (alias, k)]
+    if not keys:
+        return False
+    for index in table.indexes:
+        columns = index.columns
+        if columns[:len(used)] == used and columns[len(used):len(used) + len(keys)] == keys:
+            return True
+    return False
+
+
+def estimate_select(text, call, schema, stats, outer_refs=()):
+    """Estimate one SELECT (marked text), recursing into its subqueries."""
+    result = Estimate()
+    top = blank_nested(text)
+    table_name, alias = main_table(top)
+    subqueries = _nested_subqueries(text)
+
+    if table_name is None or table_name not in schema:
+        derived = [s for s in subqueries if re.match(r"\s*FROM\s*$", top[:s[0]][-20:], re.I)]
+        if derived:
+            inner = estimate_select(text[derived[0][0] + 1:derived[0][1] - 1], call, schema, stats)
+            result.scanned, result.returned = inner.scanned, inner.returned
+            result.notes += inner.notes
+        elif table_name is not None:
+            result.notes.append(f"{table_name} is not in the schema model")
+        if table_name is None and not derived:
+            result.returned = 1
+        return result
+
+    table = schema[table_name]
+    table_stats = stats[table_name]
+    alias = alias or table_name
+    refs = table_refs(top)
+    local_aliases = set(refs)
+
+    where = WHERE_CLAUSE.search(top)
+    filters = defaultdict(list)  # alias -> [(kind, column, predicate)]
+    residual_other = []
+    correlated_refs = set(outer_refs) - local_aliases
+    if where:
+        for predicate in conjuncts(text[where.start(1):where.end(1)]):
+            kind, pred_alias, column = classify(predicate, set(outer_refs) | local_aliases, alias)
+            if kind == "join" and pred_alias in local_aliases:
+                rhs_alias = predicate.split("=")[1].strip().split(".")[0]
+                kind = "eq" if rhs_alias in correlated_refs else "other"
+            if kind == "other" or pred_alias not in local_aliases:
+                residual_other.append(predicate)
+            else:
+                filters[pred_alias].append((kind, column, predicate))
+
+    rows, used, left = access_path(table, table_stats, filters.get(alias, []))
+    for predicate in list(residual_other):
+        union = or_access(table, table_stats, predicate, alias)
+        if union is not None and union < rows:
+            rows, used, left = union, ["(OR)"], filters.get(alias, [])
+            residual_other.remove(predicate)
+    scanned = rows
+    if not used:
+        result.notes.append(f"full scan of {table_name}")
+    for kind, column, predicate in left:
+        rows *= filter_selectivity(kind, table_stats, column, predicate)
+        if kind == "expr_eq" and not used:
+            result.notes.append(f"function call on {table_name}.{column} rules out its index")
+    rows *= OTHER_SELECTIVITY ** len(residual_other)
+
+    for join in JOIN.finditer(top):
+        kind_word, joined, joined_alias = join.group(1) or "", join.group(2), join.group(3)
+        if joined_alias and joined_alias.upper() in ("ON", "WHERE"):
+            joined_alias = None
+        joined_alias = joined_alias or joined
+        if joined not in schema:
+            continue
+        joined_stats = stats[joined]
+        on_filters = []
+        for predicate in conjuncts(text[join.start(4):join.end(4)]):
+            kind, pred_alias, column = classify(predicate, local_aliases, joined_alias)
+            if kind == "join":
+                left_side, right_side = (s.strip() for s in predicate.split("=", 1))
+                other = right_side if left_side.split(".")[0] == joined_alias else left_side
+                mine = left_side if other is right_side else right_side
+                if mine.split(".")[0] != joined_alias:
+                    continue
+                on_filters.append(("eq", mine.split(".")[-1], predicate))
+            elif pred_alias == joined_alias:
+                on_filters.append((kind, column, predicate))
+        on_filters += filters.get(joined_alias, [])
+        per_row, join_used, join_left = access_path(schema[joined], joined_stats, on_filters)
+        if not join_used:
+            # SQLite builds an automatic index once, reading the whole table
+            scanned += joined_stats.rows
+            per_row = joined_stats.rows / max(1, joined_stats.distinct(on_filters[0][1])) \
+                if on_filters else joined_stats.rows
+            result.notes.append(f"no index for the join to {joined}")
+        matches = per_row
+        for kind, column, predicate in join_left:
+            matches *= filter_selectivity(kind, joined_stats, column, predicate)
+        scanned += rows * per_row
+        rows = rows * (max(1, matches) if kind_word.upper().startswith("LEFT") else matches)
+
+    listing = select_list(top)
+    group = GROUP_CLAUSE.search(top)
+    aggregated = bool(AGGREGATE.search(listing))
+    if group:
+        groups = 1.0
+        for key in group.group(1).split(","):
+            key_alias, _, key_column = key.strip().rpartition(".")
+            key_table = refs.get(key_alias or alias, table_name)
+            groups *= stats[key_table].distinct(key_column) if key_table in stats else 10
+        rows = min(rows, groups)
+    elif aggregated:
+        rows = min(rows, 1)
+
+    limit = LIMIT_CLAUSE.search(top)
+    if limit:
+        marker = MARKER_PATTERN.fullmatch(limit.group(1))
+        expr = call.exprs[int(marker.group(1))] if marker else limit.group(1)
+        value, note = _limit_value(expr, call)
+        if note:
+            result.notes.append(note)
+        if value is not None:
+            order = ORDER_CLAUSE.search(top)
+            streams = not group and not aggregated and (
+                not order or _order_from_index(order.group(1), alias, used, table))
+            if streams and rows > value:
+                scanned *= value / rows
+            rows = min(rows, value)
+
+    rows = max(rows, 0.0)
+    result.scanned, result.returned = scanned, rows
+    result.bytes = rows * _select_width(listing, refs, schema, stats)
+
+    for start, end in subqueries:
+        inner_text = text[start + 1:end - 1]
+        inner = estimate_select(inner_text, call, schema, stats, local_aliases | set(outer_refs))
+        inner_refs = set(table_refs(blank_nested(inner_text)))
+        correlated = any(re.search(rf"\b{re.escape(a)}\.\w", inner_text) for a in local_aliases - inner_refs)
+        in_select = start < top.upper().find("FROM")
+        if FTS_PROBE.search(text[max(0, start - 40):end]):
+            continue  # costed as the driving table's access path
+        if correlated:
+            outer_rows = rows if in_select else scanned
+            result.scanned += inner.scanned * outer_rows
+            if inner.scanned * outer_rows > 1000:
+                result.notes.append(f"correlated subquery runs {math.ceil(outer_rows)}×")
+        else:
+            result.scanned += inner.scanned
+        result.notes += [n for n in inner.notes if n not in result.notes]
+    return result
+
+
+def estimate_write(text, call, schema, stats):
+    """Rows touched by INSERT / UPDATE / DELETE."""
+    result = Estimate()
+    top = blank_nested(text)
+    insert = re.match(r"\s*INSERT\s+(?:OR\s+\w+\s+)?INTO\s+(\w+)", top, re.I)
+    if insert:
+        select = re.search(r"\bSELECT\b", top, re.I)
+        if select:
+            inner = estimate_select(text[select.start():], call, schema, stats)
+            result.scanned, result.notes = inner.scanned + inner.returned, inner.notes
+        else:
+            result.scanned = max(1, len(re.findall(r"\)\s*,\s*\(", top)) + 1)
+        return result
+    match = re.match(r"\s*(?:UPDATE|DELETE\s+FROM)\s+(\w+)", top, re.I)
+    if not match or match.group(1) not in schema:
+        return result
+    table_name = match.group(1)
+    where = WHERE_CLAUSE.search(top)
+    filters, ors = [], []
+    if where:
+        clause = re.split(r"\bRETURNING\b", text[where.start(1):where.end(1)], flags=re.I)[0]
+        for predicate in conjuncts(clause):
+            kind, _, column = classify(predicate, {table_name}, table_name)
+            if kind != "other":
+                filters.append((kind, column, predicate))
+            else:
+                ors.append(predicate)
+    rows, used, _ = access_path(schema[table_name], stats[table_name], filters)
+    for predicate in ors:
+        union = or_access(schema[table_name], stats[table_name], predicate, table_name)
+        if union is not None and union < rows:
+            rows, used = union, ["(OR)"]
+    if not used:
+        result.notes.append(f"full scan of {table_name}")
+    result.scanned = rows
+    if re.search(r"\bRETURNING\b", top, re.I):
+        result.returned = rows
+    return result
+
+
+def estimate(call, schema, stats):
+    text = call.marked_text
+    top = blank_nested(text).lstrip()
+    if re.match(r"(SELECT|WITH)\b", top, re.I):
+        return estimate_select(text, call, schema, stats)
+    if re.match(r"(INSERT|UPDATE|DELETE)\b", top, re.I):
+        return estimate_write(text, call, schema, stats)
+    return Estimate()  # DDL and PRAGMAs read no table rows
+
+
+# --- call-site context ------------------------------------------------------
+
+def enclosing_handler(source, pos):
+    """Name of the function a call sits in (GET, POST, a page loader, ...)."""
+    name = "(module)"
+    for match in HANDLER.finditer(source, 0, pos):
+        try:
+            body = function_body_start(source, matching_bracket(source, source.index("(", match.start())))
+            end = matching_bracket(source, body)
+        except ValueError:
+            continue
+        if body < pos < end:
+            name = match.group(1)
+    return name
+
+
+def loop_depth(source, pos):
+    """How many for/while/.map loops enclose the offset."""
+    depth, level, i = 0, 0, pos
+    while i > 0:
+        i -= 1
+        ch = source[i]
+        if ch == "}":
+            level += 1
+        elif ch == "{":
+            if level:
+                level -= 1
+                continue
+            head = source[max(0, i - 200):i]
+            if LOOP_HEAD.search(head):
+                depth += 1
+            elif re.search(r"\bfunction\b[^{]*$", head):
+                break
+    # `.map(async (x) => sql...)` without braces
+    if re.search(r"\.(?:map|forEach)\s*\(\s*(?:async\s*)?(?:\([^()]*\)|\w+)\s*=>\s*(?:await\s*)?$",
+                 source[max(0, pos - 120):pos]):
+        depth += 1
+    return depth
+
+
+def route_label(path):
+    rel = path.relative_to(REPO_ROOT)
+    if rel.parts[0] == "app":
+        return route_for(path) or "/"
+    return str(rel)
+
+
+def cost_queries(schema, stats, loop_iterations=LOOP_ITERATIONS, roots=None):
+    """(costs, skipped) for every query under the roots."""
+    costs, skipped = [], []
+    for path in iter_source_files(roots or SCAN_ROOTS):
+        if path.name == "sql-registry.ts":
+            continue
+        source = path.read_text(encoding="utf-8")
+        for call in extract_queries(path, source):
+            if call.composed:
+                skipped.append(f"{call.rel_path}:{call.line}  composed from other queries")
+                continue
+            try:
+                result = estimate(call, schema, stats)
+            except (ValueError, KeyError, IndexError) as err:
+                skipped.append(f"{call.rel_path}:{call.line}  could not be costed ({err})")
+                continue
+            repeat = loop_iterations ** loop_depth(source, call.start)
+            if repeat > 1:
+                result.notes.append(f"inside a loop, counted {repeat}×")
+            costs.append(QueryCost(call, route_label(path), enclosing_handler(source, call.start),
+                                   result, repeat))
+    return costs, skipped
+
+
+# --- report -----------------------------------------------------------------
+
+def _fmt(value):
+    for unit, size in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if value >= size:
+            return f"{value / size:.1f}{unit}"
+    return f"{value:.0f}"
+
+
+def report(costs, args):
+    """Print the ranked per-handler report; returns the number flagged."""
+    handlers = defaultdict(list)
+    for cost in costs:
+        handlers[(cost.route, cost.handler)].append(cost)
+
+    totals = []
+    for key, items in handlers.items():
+        scanned = sum(c.estimate.scanned * c.repeat for c in items)
+        returned = sum(c.estimate.returned * c.repeat for c in items)
+        size = sum(c.estimate.bytes * c.repeat for c in items)
+        over = [name for name, value, limit in (("scanned", scanned, args.max_scanned),
+                                                ("returned", returned, args.max_returned),
+                                                ("bytes", size, args.max_bytes)) if value > limit]
+        totals.append((key, items, scanned, returned, size, over))
+    totals.sort(key=lambda t: (-t[2], -t[4]))
+
+    print(f"{'':3}{'rows read':>10} {'returned':>9} {'bytes':>8} {'queries':>8}  handler")
+    shown = totals if args.all else totals[:args.top]
+    for (route, handler), items, scanned, returned, size, over in shown:
+        flag = "✗" if over else " "
+        print(f"{flag:3}{_fmt(scanned):>10} {_fmt(returned):>9} {_fmt(size):>8} {len(items):>8}  "
+              f"{handler} {route}" + (f"  (over {', '.join(over)})" if over else ""))
+        if args.details or over:
+            for cost in sorted(items, key=lambda c: -c.estimate.scanned * c.repeat)[:args.details_per]:
+                notes = "; ".join(dict.fromkeys(cost.estimate.notes))
+                print(f"{'':3}{_fmt(cost.estimate.scanned * cost.repeat):>10} "
+                      f"{_fmt(cost.estimate.returned * cost.repeat):>9} {'':17}  {cost.label}"
+                      + (f"  {notes}" if notes else ""))
+    if len(shown) < len(totals):
+        print(f"   ... {len(totals) - len(shown)} more handlers (--all to list them)")
+    return sum(1 for t in totals if t[5])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db", help="take statistics from this SQLite file instead of migration-data")
+    parser.add_argument("--scale", action="append", metavar="N|TABLE=ROWS",
+                        help="multiply every table's rows by N, or set one table's row count")
+    parser.add_argument("--default-rows", type=float, default=DEFAULT_ROWS,
+                        help="rows assumed for empty or missing tables")
+    parser.add_argument("--min-sample", type=int, default=MIN_SAMPLE,
+                        help="tables with fewer rows are samples: projected to --default-rows "
+                             "unless --db is given")
+    parser.add_argument("--loop-iterations", type=int, default=LOOP_ITERATIONS,
+                        help="times a query inside a loop is assumed to run")
+    parser.add_argument("--max-scanned", type=float, default=10000, help="flag handlers reading more rows")
+    parser.add_argument("--max-returned", type=float, default=1000, help="flag handlers returning more rows")
+    parser.add_argument("--max-bytes", type=float, default=1_000_000, help="flag handlers returning more bytes")
+    parser.add_argument("--top", type=int, default=30, help="handlers to list")
+    parser.add_argument("--all", action="store_true", help="list every handler")
+    parser.add_argument("--details", action="store_true", help="list the queries of every handler shown")
+    parser.add_argument("--details-per", type=int, default=5, help="queries listed per handler")
+    args = parser.parse_args()
+
+    schema = load_models()
+    if args.db:
+        conn = sqlite3.connect(args.db)
+    else:
+        conn, loaded = open_local_db()
+        print_short_loads(short_loads(conn, loaded))
+    stats = collect_stats(conn, schema, args.default_rows, args.min_sample, project=not args.db)
+    conn.close()
+    factor, per_table = parse_scale(args.scale)
+    unknown = sorted(set(per_table) - set(stats))
+    if unknown:
+        parser.error(f"unknown table(s) in --scale: {', '.join(unknown)}")
+    apply_scale(stats, schema, factor, per_table)
+
+    measured = sorted(s.name for s in stats.values() if s.measured)
+    samples = sorted((s for s in stats.values() if s.sample and s.name not in per_table),
+                     key=lambda s: s.name)
+    if samples:
+        listing = ", ".join(f"{s.name} {s.sample}" for s in samples)
+        if args.db:
+            print(f"⚠️  {len(samples)} table(s) under {args.min_sample} rows taken as their real size "
+                  f"({listing}); set real sizes with --scale TABLE=ROWS")
+        else:
+            print(f"⚠️  {len(samples)} table(s) under {args.min_sample} rows are samples ({listing}); "
+                  f"projected to {args.default_rows:g} rows, set real sizes with --scale TABLE=ROWS "
+                  f"or pass --db")
+    print(f"Statistics: {len(measured)} tables measured ({', '.join(measured) or 'none'}), "
+          f"{len(stats) - len(measured)} empty or missing assumed at {args.default_rows:g} rows"
+          + (f", scaled ×{factor:g}" if factor != 1 else "")
+          + (f", {len(per_table)} table(s) set by --scale" if per_table else "") + "\n")
+
+    costs, skipped = cost_queries(schema, stats, args.loop_iterations)
+    flagged = report(costs, args)
+    if skipped:
+        print(f"\n⊘ {len(skipped)} queries not costed:")
+        for line in skipped:
+            print(f"  {line}")
+    print(f"\n{len(costs)} queries costed; {flagged} handlers over the thresholds "
+          f"(rows read > {_fmt(args.max_scanned)}, returned > {_fmt(args.max_returned)}, "
+          f"bytes > {_fmt(args.max_bytes)})")
+    if flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Compile the D1 schema into per-table row converters and report export drift.
+
+sql/d1-schema.sql and sql/admin-schema.sql are parsed once per process
+(d1_schema.py: columns, types, defaults, primary and foreign keys, indexes)
+and the model is cached on the files' content. For each table and set of
+export columns a projection function is generated that builds the INSERT
+tuple in schema order, with each column's coercion decided up front:
+
+  flag        boolToInt: true/false -> 1/0, NULL -> the column default
+  timestamp   formatDate: ISO 8601 in UTC as Date.toISOString() writes it
+              (Postgres `2024-01-01 12:00:00+00` text included)
+  json        objects and arrays -> JSON text (JSONB, TEXT[] and TEXT
+              columns defaulting to '[]' / '{}')
+  integer     true/false -> 1/0
+  other       passed through
+
+NOT NULL columns with a literal default take it when the export has NULL.
+
+Drift between migration-data/*.json and the schema is reported instead of
+being dropped silently: export columns the schema lacks, and required
+columns the export lacks (which would reject every row).
+
+Usage:
+    python3 scripts/schema_compiler.py                      # drift report
+    python3 scripts/schema_compiler.py --show users         # generated converter
+    python3 scripts/schema_compiler.py --write-sql users    # migration-data/_users_mapped.sql
+    python3 scripts/schema_compiler.py --strict             # exit 1 on drift
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from d1_schema import DEFAULT_SCHEMA_FILES, REPO_ROOT, load_schema
+
+MIGRATION_DATA = REPO_ROOT / "migration-data"
+
+# INTEGER columns holding booleans in the D1 schema (which has no BOOLEAN)
+FLAG_NAME = re.compile(
+    r"^(is|has|can|allows|offers|accepts|notification)_|_(verified|enabled|urgent|guarantee|tag)$"
+)
+TIMESTAMP_NAME = re.compile(r"_(at|until|deadline)$")
+TIMESTAMP_DEFAULT = re.compile(r"datetime\s*\(|\bNOW\s*\(|CURRENT_TIMESTAMP", re.I)
+JSON_DEFAULT = re.compile(r"^'(\[\]|\{\})'$")
+
+NOW = object()  # a default that is evaluated at conversion time
+
+
+# --- coercions, mirroring the helpers in lib/db.ts --------------------------
+
+def bool_to_int(value, default=0):
+    """boolToInt; NULL takes the column default instead of becoming 0."""
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return 1 if value.strip().lower() in ("1", "t", "true", "yes", "y") else 0
+    return 1 if value else 0
+
+
+def format_date(value):
+    """formatDate: ISO 8601 UTC with milliseconds, as Date.toISOString()."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return value  # not a timestamp we understand; keep it as exported
+    if not isinstance(value, datetime):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def to_json(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def to_int(value):
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def coalesce(value, default):
+    if value is not None:
+        return value
+    return format_date(datetime.now(timezone.utc)) if default is NOW else default
+
+
+COERCIONS = {
+    "bool_to_int": bool_to_int,
+    "format_date": format_date,
+    "to_json": to_json,
+    "to_int": to_int,
+    "coalesce": coalesce,
+    "NOW": NOW,
+}
+
+
+# --- schema model -----------------------------------------------------------
+
+def _digest(files):
+    digest = hashlib.sha256()
+    for name in files:
+        digest.update((REPO_ROOT / name).read_bytes())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _parse(files, digest):
+    return load_schema(list(files))
+
+
+def compiled_schema(files=None):
+    """The parsed schema, cached until one of the files changes. Read-only."""
+    files = tuple(files or DEFAULT_SCHEMA_FILES)
+    return _parse(files, _digest(files))
+
+
+def column_kind(column):
+    """How values for a column are coerced: flag, timestamp, json, integer or other."""
+    type_ = column.type.upper()
+    default = column.default or ""
+    if "BOOL" in type_ or ("INT" in type_ and default.lower() in ("0", "1", "true", "false")
+                           and FLAG_NAME.search(column.name)):
+        return "flag"
+    if "TIMESTAMP" in type_ or "DATE" in type_ or (
+            column.is_text and (TIMESTAMP_DEFAULT.search(default) or TIMESTAMP_NAME.search(column.name))):
+        return "timestamp"
+    if "JSON" in type_ or type_.endswith("[]") or JSON_DEFAULT.match(default):
+        return "json"
+    if "INT" in type_:
+        return "integer"
+    return "other"
+
+
+def literal_default(column):
+    """Python value of a column's DEFAULT, NOW for clock defaults, or None."""
+    default = (column.default or "").strip()
+    if not default:
+        return None
+    if TIMESTAMP_DEFAULT.search(default):
+        return NOW
+    if default.lower() in ("true", "false"):
+        return int(default.lower() == "true")
+    if re.fullmatch(r"-?\d+", default):
+        return int(default)
+    if re.fullmatch(r"-?\d*\.\d+", default):
+        return float(default)
+    if re.fullmatch(r"'(?:[^']|'')*'", default):
+        text = default[1:-1].replace("''", "'")
+        return "[]" if text == "{}" and column.type.upper().endswith("[]") else text
+    return None
+
+
+def coercion_expr(column, value):
+    """Source of the expression converting `value` for one column."""
+    kind = column_kind(column)
+    default = literal_default(column)
+    if kind == "flag":
+        return f"bool_to_int({value}, {default if isinstance(default, int) else 0})"
+    expr = {
+        "timestamp": f"format_date({value})",
+        "json": f"to_json({value})",
+        "integer": f"to_int({value})",
+    }.get(kind, value)
+    if column.not_null and default is not None:
+        expr = f"coalesce({expr}, {'NOW' if default is NOW else repr(default)})"
+    return expr
+
+
+# --- generated converters ---------------------------------------------------
+
+@dataclass
+class Projection:
+    table: str
+    columns: tuple  # schema columns the converter fills, in schema order
+    source: str
+    convert: object = field(repr=False)
+
+    def insert_sql(self, verb="INSERT"):
+        placeholders = ", ".join("?" for _ in self.columns)
+        return f"{verb} INTO {self.table} ({', '.join(self.columns)}) VALUES ({placeholders})"
+
+
+def projection_source(table, columns):
+    lines = [f"def project_{table.name}(row):", "    get = row.get", "    return ("]
+    for name in columns:
+        lines.append(f"        {coercion_expr(table.columns[name], f'get({name!r})')},")
+    lines.append("    )")
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(files, digest, table_name, columns):
+    table = _parse(files, digest)[table_name]
+    source = projection_source(table, columns)
+    namespace = dict(COERCIONS)
+    exec(compile(source, f"<projection {table_name}>", "exec"), namespace)
+    return Projection(table_name, columns, source, namespace[f"project_{table_name}"])
+
+
+def projection(table_name, export_columns=None, files=None):
+    """Converter from export rows to INSERT tuples for one table.
+
+    With export_columns, only schema columns the export carries are filled,
+    so the others keep their database defaults.
+    """
+    files = tuple(files or DEFAULT_SCHEMA_FILES)
+    digest = _digest(files)
+    table = _parse(files, digest)[table_name]
+    present = set(export_columns) if export_columns is not None else set(table.columns)
+    columns = tuple(c for c in table.columns if c in present)
+    return _compile(files, digest, table_name, columns)
+
+
+# --- exports and drift ------------------------------------------------------
+
+@dataclass
+class Drift:
+    table: str
+    rows: int
+    dropped: list  # export columns with no schema column
+    missing: list  # schema columns the export lacks (database defaults apply)
+    required: list  # missing columns that are NOT NULL with no default, or the key
+
+    @property
+    def clean(self):
+        return not self.dropped and not self.required
+
+
+def read_export(table_name, data_dir=MIGRATION_DATA):
+    """(rows, columns in first-seen order) of migration-data/<table>.json, or None."""
+    path = data_dir / f"{table_name}.json"
+    if not path.exists():
+        return None
+    rows = json.loads(path.read_text(encoding="utf-8"))
+    columns = list(dict.fromkeys(k for row in rows for k in row))
+    return rows, columns
+
+
+def drift(table, export_columns, rows=0):
+    present = set(export_columns)
+    missing = [c for c in table.columns if c not in present]
+    required = [c for c in missing
+                if c in table.primary_key
+                or (table.columns[c].not_null and table.columns[c].default is None)]
+    return Drift(
+        table=table.name,
+        rows=rows,
+        dropped=[c for c in export_columns if c not in table.columns],
+        missing=missing,
+        required=required,
+    )
+
+
+def convert_rows(table_name, rows, columns, files=None):
+    """Rows as INSERT tuples, plus the Projection that built them."""
+    project = projection(table_name, columns, files)
+    convert = project.convert
+    return [convert(row) for row in rows], project
+
+
+def sql_literal(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def write_insert_sql(table_name, rows, columns, path):
+    """One INSERT per row, for `wrangler d1 execute --file`."""
+    tuples, project = convert_rows(table_name, rows, columns)
+    head = f"INSERT INTO {table_name} ({', '.join(project.columns)}) VALUES ("
+    path.write_text("\n".join(head + ", ".join(map(sql_literal, t)) + ");" for t in tuples),
+                    encoding="utf-8")
+    return len(tuples)
+
+
+def print_drift(report):
+    status = "✓" if report.clean else ("✗" if report.required else "⚠️ ")
+    print(f"{status} {report.table}: {report.rows} rows")
+    if report.dropped:
+        print(f"    not in the schema, dropped: {', '.join(report.dropped)}")
+    if report.required:
+        print(f"    required but missing from the export: {', '.join(report.required)}")
+    defaults = [c for c in report.missing if c not in report.required]
+    if defaults:
+        print(f"    missing from the export, database defaults apply: {', '.join(defaults)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--show", metavar="TABLE", help="print the converter generated for a table")
+    parser.add_argument("--write-sql", metavar="TABLE", action="append", default=[],
+                        help="write migration-data/_TABLE_mapped.sql from TABLE.json")
+    parser.add_argument("--strict", action="store_true", help="exit non-zero when any export drifts")
+    args = parser.parse_args()
+
+    schema = compiled_schema()
+    if args.show:
+        if args.show not in schema:
+            parser.error(f"unknown table {args.show}")
+        export = read_export(args.show)
+        print(projection(args.show, export[1] if export else None).source, end="")
+        return
+
+    tables = args.write_sql or sorted(p.stem for p in MIGRATION_DATA.glob("*.json"))
+    drifted = False
+    for name in tables:
+        export = read_export(name)
+        if export is None:
+            print(f"⊘ {name}: no migration-data/{name}.json")
+            continue
+        if name not in schema:
+            print(f"✗ {name}: export has no table in the schema")
+            drifted = True
+            continue
+        rows, columns = export
+        report = drift(schema[name], columns, len(rows))
+        print_drift(report)
+        drifted |= not report.clean
+        if name in args.write_sql and not (args.strict and not report.clean):
+            path = MIGRATION_DATA / f"_{name}_mapped.sql"
+            count = write_insert_sql(name, rows, columns, path)
+            print(f"    ✓ wrote {path.relative_to(REPO_ROOT)} ({count} rows)")
+    if args.strict and drifted:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Find copy-pasted local helper functions and replace them with shared ones.
+
+Local `async function name(...)` definitions under app/ are grouped by
+normalized body (comments, whitespace and sqlAt IDs ignored). Groups of two
+or more are reported. Helpers listed in SHARED are replaced by an import of
+the shared implementation when every definition passes its shape check:
+
+  getSession   per-route auth_session cookie + sessions lookups, replaced by
+               getSession() from lib/auth.ts (one joined session/user query,
+               memoized per request)
+
+Imports left unused by the removal (cookies, sql, sqlAt) are dropped.
+
+Usage:
+    python3 scripts/shared_helpers.py           # report duplicated helpers
+    python3 scripts/shared_helpers.py --apply   # replace the SHARED ones
+"""
+
+import argparse
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+
+from codemod_journal import open_run
+from sql_extract import REPO_ROOT, function_body_start, iter_source_files, matching_bracket
+
+SCAN_ROOTS = ["app"]
+
+LOCAL_FUNCTION = re.compile(r"^(?:async\s+)?function\s+(\w+)\s*\(", re.M)
+REGISTERED_TAG = re.compile(r"sqlAt(<(?:[^<>`]|<[^<>`]*>)*>)?\(\s*'\w+'\s*\)")
+
+
+def _is_session_lookup(body):
+    """Reads the auth_session cookie and looks the session up by id."""
+    return ("'auth_session'" in body and re.search(r"\bFROM\s+sessions\s+s\b", body)
+            and re.search(r"s\.id\s*=\s*\$\{sessionId\}", body)
+            and re.search(r"return\s+result\.rows\[0\]\s*\|\|\s*null", body))
+
+
+# name -> (module, shape check, note for the report)
+SHARED = {
+    "getSession": ("@/lib/auth", _is_session_lookup,
+                   "one joined session + user query per request"),
+}
+
+
+@dataclass
+class Definition:
+    path: object
+    name: str
+    start: int  # includes any comment lines directly above
+    end: int
+    body: str
+    line: int
+
+    @property
+    def rel_path(self):
+        return self.path.relative_to(REPO_ROOT)
+
+
+def normalize(body):
+    """Body text with comments, layout and registry IDs stripped."""
+    body = re.sub(r"//[^\n]*|/\*.*?\*/", "", body, flags=re.S)
+    body = REGISTERED_TAG.sub(r"sql\1", body)
+    return " ".join(body.split())
+
+
+def definitions(path, source):
+    """Top-level (unexported) function definitions in a file."""
+    for match in LOCAL_FUNCTION.finditer(source):
+        try:
+            params_end = matching_bracket(source, source.index("(", match.start()))
+            body_start = function_body_start(source, params_end)
+            end = matching_bracket(source, body_start) + 1
+        except ValueError:
+            # JSX text with apostrophes defeats the bracket matcher
+            continue
+        start = match.start()
+        # Take along `// Helper to ...` comment lines that introduce it
+        while True:
+            previous = source.rfind("\n", 0, start - 1) + 1
+            if start == 0 or not source[previous:start].lstrip().startswith("//"):
+                break
+            start = previous
+        yield Definition(
+            path=path,
+            name=match.group(1),
+            start=start,
+            end=end,
+            body=source[match.start():end],
+            line=source.count("\n", 0, match.start()) + 1,
+        )
+
+
+def find_duplicates(roots=None):
+    """{name: {normalized body: [Definition]}} for copy-pasted helpers."""
+    by_name = defaultdict(lambda: defaultdict(list))
+    for path in iter_source_files(roots or SCAN_ROOTS):
+        source = path.read_text(encoding="utf-8")
+        for definition in definitions(path, source):
+            by_name[definition.name][normalize(definition.body)].append(definition)
+    return {
+        name: variants for name, variants in by_name.items()
+        if name in SHARED or any(len(d) > 1 for d in variants.values())
+    }
+
+
+def _drop_import_names(source, module, names):
+    """Remove names from `import { ... } from module` when no longer used."""
+    pattern = re.compile(r"import\s*\{([^}]*)\}\s*from\s*['\"]" + re.escape(module) + r"['\"];?\n?")
+    match = pattern.search(source)
+    if not match:
+        return source
+    rest = source[:match.start()] + source[match.end():]
+    kept = [n.strip() for n in match.group(1).split(",") if n.strip()]
+    kept = [n for n in kept if n not in names or re.search(rf"(?<![\w.$]){n}\b", rest)]
+    if not kept:
+        return rest
+    return source[:match.start(1)] + " " + ", ".join(kept) + " " + source[match.end(1):]
+
+
+def _add_import(source, name, module):
+    pattern = re.compile(r"import\s*\{([^}]*)\}\s*from\s*['\"]" + re.escape(module) + r"['\"]")
+    match = pattern.search(source)
+    if match:
+        names = [n.strip() for n in match.group(1).split(",") if n.strip()]
+        if name in names:
+            return source
+        return source[:match.start(1)] + " " + ", ".join(names + [name]) + " " + source[match.end(1):]
+    imports = list(re.finditer(r"^import\s[^;]*;\n", source, re.M))
+    at = imports[-1].end() if imports else 0
+    return source[:at] + f"import {{ {name} }} from '{module}';\n" + source[at:]
+
+
+def replace_definition(definition, module, journal):
+    path = definition.path
+    source = path.read_text(encoding="utf-8")
+    start, end = definition.start, definition.end
+    # Swallow the blank line the definition leaves behind
+    if source[end:end + 2] == "\n\n":
+        end += 1
+    source = source[:start] + source[end + 1:] if source[end:end + 1] == "\n" else \
+        source[:start] + source[end:]
+    source = _drop_import_names(source, "next/headers", {"cookies"})
+    source = _drop_import_names(source, "@/lib/db", {"sql", "sqlAt"})
+    source = _add_import(source, definition.name, module)
+    journal.write_text(path, source)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--apply", action="store_true",
+                        help="replace the shared helpers with imports")
+    args = parser.parse_args()
+
+    duplicates = find_duplicates()
+    for name, variants in sorted(duplicates.items(), key=lambda kv: -sum(map(len, kv[1].values()))):
+        count = sum(len(d) for d in variants.values())
+        shared = SHARED.get(name)
+        target = f" → {shared[0]} ({shared[2]})" if shared else ""
+        print(f"{name}: {count} definitions, {len(variants)} distinct bodies{target}")
+        for defs in sorted(variants.values(), key=len, reverse=True):
+            print(f"  {len(defs):>3}× {defs[0].rel_path}:{defs[0].line}"
+                  + (f" (+{len(defs) - 1} more)" if len(defs) > 1 else ""))
+    if not args.apply:
+        return
+
+    print()
+    with open_run("shared_helpers") as journal:
+        for name, (module, check, _) in SHARED.items():
+            defs = [d for variant in duplicates.get(name, {}).values() for d in variant]
+            mismatched = [d for d in defs if not check(d.body)]
+            for definition in mismatched:
+                print(f"✗ {definition.rel_path}:{definition.line}: {name} does something else; left alone")
+            replaced = [d for d in defs if d not in mismatched]
+            for definition in replaced:
+                replace_definition(definition, module, journal)
+            print(f"✓ Replaced {len(replaced)} local {name}() with the import from {module}")
+
+
+if __name__ == "__main__":
+    main()
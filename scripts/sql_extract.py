@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Extract sql`` tagged-template call sites from the TypeScript sources.
+
+Shared by the query tooling in this directory. Each call site is returned
+with its raw template pieces, so tools can both analyse the finished query
+text and rewrite the call in place.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Directories scanned by default
+SOURCE_ROOTS = ["app", "lib", "components"]
+EXTENSIONS = (".ts", ".tsx")
+
+# `sql` or `sql<Type>` immediately followed by a template literal
+TAG_PATTERN = re.compile(r"(?<![\w.$])sql\s*(<(?:[^<>`]|<[^<>`]*>)*>)?\s*`")
+
+# Either tag: sql`...` or the registry-backed sqlAt('id')`...` (lib/db.ts)
+QUERY_TAG_PATTERN = re.compile(
+    r"(?<![\w.$])sql(?:At)?\s*(<(?:[^<>`]|<[^<>`]*>)*>)?\s*(?:\(\s*'\w+'\s*\)\s*)?`"
+)
+
+TABLES_READ = re.compile(r"\b(?:FROM|JOIN)\s+([a-z_]\w*)\b(?![.(])", re.I)
+TABLES_WRITTEN = re.compile(r"\b(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|UPDATE|DELETE\s+FROM)\s+([a-z_]\w*)", re.I)
+
+TABLE_REF = re.compile(r"\b(?:FROM|JOIN|UPDATE)\s+(\w+)\b(?![.(])(?:\s+(?:AS\s+)?(\w+))?", re.I)
+
+# Words that can follow a table name where an alias would otherwise be
+SQL_KEYWORDS = {
+    "WHERE", "ON", "LEFT", "RIGHT", "INNER", "OUTER", "CROSS", "JOIN", "ORDER",
+    "GROUP", "LIMIT", "SET", "USING", "HAVING", "UNION", "VALUES", "AND", "OR", "AS",
+}
+
+# Placeholder used in place of an interpolation when analysing query text
+MARKER = "\x00{}\x00"
+MARKER_PATTERN = re.compile(r"\x00(\d+)\x00")
+
+
+@dataclass
+class SqlCall:
+    """One sql`` call site."""
+
+    path: Path
+    line: int
+    start: int  # offset of the `sql` tag
+    end: int  # offset just past the closing backtick
+    generic: str  # e.g. "<any>" or ""
+    tag: str  # tag source before the backtick, e.g. "sql<any>"
+    strings: list  # raw template pieces, escapes preserved
+    exprs: list  # source text of each ${...}
+    composed: bool = False  # interpolates another sql`` query
+    source: str = field(default="", repr=False)
+
+    @property
+    def rel_path(self):
+        try:
+            return self.path.relative_to(REPO_ROOT)
+        except ValueError:
+            return self.path
+
+    @property
+    def text(self):
+        """Finished query text as the sql tag sends it to D1."""
+        return "?".join(cook(s) for s in self.strings)
+
+    @property
+    def marked_text(self):
+        """Query text with each interpolation replaced by a numbered marker."""
+        out = [cook(self.strings[0])]
+        for i, s in enumerate(self.strings[1:]):
+            out.append(MARKER.format(i))
+            out.append(cook(s))
+        return "".join(out)
+
+    @property
+    def normalized_text(self):
+        """Whitespace-collapsed query text, used for hashing and reports."""
+        return " ".join(self.text.split())
+
+    def render(self, strings=None, exprs=None, tag=None):
+        """Rebuild the call-site source from (possibly edited) pieces."""
+        strings = self.strings if strings is None else strings
+        exprs = self.exprs if exprs is None else exprs
+        tag = f"sql{self.generic}" if tag is None else tag
+        body = strings[0]
+        for expr, s in zip(exprs, strings[1:]):
+            body += "${" + expr + "}" + s
+        return f"{tag}`{body}`"
+
+
+def cook(raw):
+    """Apply the template-literal escapes that appear in SQL text."""
+    return raw.replace("\\`", "`").replace("\\$", "$").replace("\\\\", "\\")
+
+
+def unmark(text, exprs):
+    """Turn marked text back into raw template pieces."""
+    strings, used, pos = [], [], 0
+    for match in MARKER_PATTERN.finditer(text):
+        strings.append(_raw(text[pos:match.start()]))
+        used.append(exprs[int(match.group(1))])
+        pos = match.end()
+    strings.append(_raw(text[pos:]))
+    return strings, used
+
+
+def _raw(cooked):
+    return cooked.replace("\\", "\\\\").replace("`", "\\`").replace("${", "\\${")
+
+
+def _skip_string(src, i, quote):
+    """Return the index just past a '...' or "..." literal starting at i."""
+    i += 1
+    while i < len(src):
+        if src[i] == "\\":
+            i += 2
+            continue
+        if src[i] == quote:
+            return i + 1
+        i += 1
+    return i
+
+
+def _skip_comment(src, i):
+    if src.startswith("//", i):
+        end = src.find("\n", i)
+        return len(src) if end == -1 else end
+    end = src.find("*/", i + 2)
+    return len(src) if end == -1 else end + 2
+
+
+def _skip_expression(src, i):
+    """Return the index of the `}` closing an interpolation starting at i."""
+    depth = 0
+    while i < len(src):
+        ch = src[i]
+        if ch in "'\"":
+            i = _skip_string(src, i, ch)
+            continue
+        if ch == "`":
+            i = _parse_template(src, i)[2]
+            continue
+        if src.startswith("//", i) or src.startswith("/*", i):
+            i = _skip_comment(src, i)
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            if depth == 0:
+                return i
+            depth -= 1
+        i += 1
+    raise ValueError("unterminated template expression")
+
+
+def _parse_template(src, i):
+    """Parse a template literal whose opening backtick is at i.
+
+    Returns (strings, exprs, end) with end just past the closing backtick.
+    """
+    strings, exprs = [], []
+    i += 1
+    piece_start = i
+    while i < len(src):
+        ch = src[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "`":
+            strings.append(src[piece_start:i])
+            return strings, exprs, i + 1
+        if src.startswith("${", i):
+            strings.append(src[piece_start:i])
+            close = _skip_expression(src, i + 2)
+            exprs.append(src[i + 2:close])
+            i = close + 1
+            piece_start = i
+            continue
+        i += 1
+    raise ValueError("unterminated template literal")
+
+
+def matching_bracket(src, i):
+    """Return the index of the bracket closing the one at src[i].
+
+    Strings, template literals and comments in between are skipped.
+    """
+    pairs = {"(": ")", "{": "}", "[": "]"}
+    stack = [pairs[src[i]]]
+    i += 1
+    while i < len(src):
+        ch = src[i]
+        if ch in "'\"":
+            i = _skip_string(src, i, ch)
+            continue
+        if ch == "`":
+            i = _parse_template(src, i)[2]
+            continue
+        if src.startswith("//", i) or src.startswith("/*", i):
+            i = _skip_comment(src, i)
+            continue
+        if ch in pairs:
+            stack.append(pairs[ch])
+        elif ch in ")}]":
+            if ch != stack.pop():
+                raise ValueError("mismatched brackets")
+            if not stack:
+                return i
+        i += 1
+    raise ValueError("unbalanced brackets")
+
+
+def function_body_start(source, params_end):
+    """The `{` opening a function body, skipping object types in the return type."""
+    i = source.index("{", params_end)
+    while source[:i].rstrip()[-1:] in ("<", ":", "|", "&", ","):
+        i = source.index("{", matching_bracket(source, i))
+    return i
+
+
+def tables_read(text):
+    """Tables a query reads from (FROM/JOIN), lower-cased, in order."""
+    return list(dict.fromkeys(t.lower() for t in TABLES_READ.findall(text)))
+
+
+def tables_written(text):
+    """Tables a query inserts into, updates or deletes from."""
+    return list(dict.fromkeys(t.lower() for t in TABLES_WRITTEN.findall(text)))
+
+
+def table_refs(text):
+    """Map aliases (and bare table names) to tables for one query text."""
+    refs = {}
+    for match in TABLE_REF.finditer(text):
+        table, alias = match.group(1), match.group(2)
+        if table.upper() in SQL_KEYWORDS:
+            continue
+        refs[table] = table
+        if alias and alias.upper() not in SQL_KEYWORDS:
+            refs[alias] = table
+    return refs
+
+
+def blank_nested(text):
+    """Blank out parenthesised sub-expressions and string literals.
+
+    Positions are kept, so matches against the result index the original.
+    """
+    out, depth, in_string = [], 0, False
+    for ch in text:
+        if in_string:
+            out.append(" " if ch != "'" else ch)
+            in_string = ch != "'"
+        elif ch == "'":
+            in_string = True
+            out.append(ch if depth == 0 else " ")
+        elif ch == "(":
+            out.append(ch if depth == 0 else " ")
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            out.append(ch if depth == 0 else " ")
+        else:
+            out.append(ch if depth == 0 else " ")
+    return "".join(out)
+
+
+def _assigned_query_names(calls):
+    """Names of variables holding an un-awaited sql`` call in the same file."""
+    names = set()
+    for call in calls:
+        before = call.source[max(0, call.start - 200):call.start]
+        match = re.search(r"(\w+)\s*=\s*$", before)
+        if match:
+            names.add(match.group(1))
+    return names
+
+
+def add_db_imports(source, names):
+    """Add names to the file's `@/lib/db` import."""
+    match = re.search(r"import\s*\{([^}]*)\}\s*from\s*['\"]@/lib/db['\"]", source)
+    if not match:
+        return f"import {{ {', '.join(names)} }} from '@/lib/db';\n" + source
+    existing = [n.strip() for n in match.group(1).split(",") if n.strip()]
+    merged = existing + [n for n in names if n not in existing]
+    return source[:match.start(1)] + " " + ", ".join(merged) + " " + source[match.end(1):]
+
+
+def extract_calls(path, source=None, tag_pattern=TAG_PATTERN):
+    """Return every sql`` call site in a file, in source order.
+
+    tag_pattern must end at the opening backtick and capture any generic
+    arguments as group 1; it lets tools find their own wrapped tags.
+    """
+    path = Path(path)
+    if source is None:
+        source = path.read_text(encoding="utf-8")
+
+    calls = []
+    pos = 0
+    while True:
+        match = tag_pattern.search(source, pos)
+        if not match:
+            break
+        tick = match.end() - 1
+        try:
+            strings, exprs, end = _parse_template(source, tick)
+        except ValueError:
+            break
+        calls.append(SqlCall(
+            path=path,
+            line=source.count("\n", 0, match.start()) + 1,
+            start=match.start(),
+            end=end,
+            generic=match.group(1) or "",
+            tag=source[match.start():tick],
+            strings=strings,
+            exprs=exprs,
+            source=source,
+        ))
+        pos = end
+
+    # Calls nested inside another call's interpolation are reported once
+    calls = [c for c in calls if not any(o.start < c.start < o.end for o in calls)]
+
+    query_names = _assigned_query_names(calls)
+    for call in calls:
+        call.composed = any(
+            expr.strip() in query_names or TAG_PATTERN.search(expr)
+            for expr in call.exprs
+        )
+    return calls
+
+
+def iter_source_files(roots=None, base=REPO_ROOT):
+    """Yield the TypeScript files under the given roots."""
+    for root in roots or SOURCE_ROOTS:
+        root_path = base / root
+        if root_path.is_file():
+            yield root_path
+            continue
+        for path in sorted(root_path.rglob("*")):
+            if path.suffix in EXTENSIONS and path.is_file():
+                yield path
+
+
+def iter_calls(roots=None, base=REPO_ROOT, tag_pattern=TAG_PATTERN):
+    """Yield every sql`` call site under the given roots."""
+    for path in iter_source_files(roots, base):
+        yield from extract_calls(path, tag_pattern=tag_pattern)
+
+
+def extract_queries(path, source=None):
+    """Every query call site in a file, whether on sql or sqlAt."""
+    return extract_calls(path, source, tag_pattern=QUERY_TAG_PATTERN)
+
+
+def route_for(path):
+    """Map a route file to the URL path it serves."""
+    rel = Path(path).resolve().relative_to(REPO_ROOT)
+    parts = [p for p in rel.parts[1:-1] if not (p.startswith("(") and p.endswith(")"))]
+    return "/" + "/".join(parts)
+
+
+def main():
+    """Print a summary of every call site."""
+    total = composed = 0
+    for call in iter_calls(tag_pattern=QUERY_TAG_PATTERN):
+        total += 1
+        flag = " [composed]" if call.composed else ""
+        composed += call.composed
+        print(f"{call.rel_path}:{call.line}{flag}  {call.normalized_text[:100]}")
+    print(f"\n{total} query call sites, {composed} composed from other queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Precompile static sql`` queries into lib/sql-registry.ts.
+
+Every sql`` call site whose text is fixed gets a stable ID (a hash of the
+finished query text). The finished strings are written to a generated
+registry module and the call sites are rewritten to the registry-backed
+`sqlAt(id)` tag from lib/db.ts, which skips rebuilding the query text and
+reuses prepared statements within an isolate.
+
+Queries composed from other queries (sql`${query} AND ...`) stay on the
+plain `sql` tag and are listed in the report, as do the rare templates that
+contain backslash escapes.
+
+Usage:
+    python3 scripts/sql_registry.py            # rewrite call sites, regenerate registry
+    python3 scripts/sql_registry.py --check    # fail if the registry is out of date
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+
+from codemod_journal import open_run
+from sql_extract import REPO_ROOT, extract_calls, iter_source_files
+
+SOURCE_ROOTS = ["app", "lib"]
+REGISTRY_FILE = REPO_ROOT / "lib" / "sql-registry.ts"
+DB_MODULE = REPO_ROOT / "lib" / "db.ts"
+
+# sqlAt<T>('id')`...` call sites that were already rewritten
+REGISTERED_TAG = re.compile(r"sqlAt(<(?:[^<>`]|<[^<>`]*>)*>)?\(\s*'(\w+)'\s*\)\s*`")
+
+DB_IMPORT = re.compile(r"import\s*\{([^}]*)\}\s*from\s*(['\"](?:@/lib/db|\./db)['\"])")
+
+
+def query_id(text):
+    """Stable ID for a finished query text."""
+    return "q" + hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def registered_calls(path, source):
+    """Yield (id, call) for the sqlAt call sites in a file."""
+    for call in extract_calls(path, source, tag_pattern=REGISTERED_TAG):
+        yield REGISTERED_TAG.match(call.tag + "`").group(2), call
+
+
+def collect(roots=None):
+    """Scan the sources; return (registry, static, composed, stale)."""
+    registry, static, composed, stale = {}, [], [], []
+    for path in iter_source_files(roots or SOURCE_ROOTS):
+        if path == REGISTRY_FILE:
+            continue
+        source = path.read_text(encoding="utf-8")
+        for call in extract_calls(path, source):
+            # Escapes other than \` and \$ are not reproduced by cook()
+            if call.composed or any("\\" in s for s in call.strings):
+                composed.append(call)
+            else:
+                static.append(call)
+                registry[query_id(call.text)] = call.text
+        for qid, call in registered_calls(path, source):
+            registry[query_id(call.text)] = call.text
+            if qid != query_id(call.text):
+                stale.append((qid, call))
+    return dict(sorted(registry.items())), static, composed, stale
+
+
+def render_registry(registry):
+    lines = [
+        "// Generated by scripts/sql_registry.py - do not edit by hand.",
+        "// Finished query text for every static sql`` call site, keyed by the",
+        "// ID passed to sqlAt() in lib/db.ts.",
+        "",
+        "export const SQL_REGISTRY: Record<string, string> = {",
+    ]
+    for qid, text in registry.items():
+        lines.append(f"    {qid}: {json.dumps(text, ensure_ascii=False)},")
+    lines += ["};", ""]
+    return "\n".join(lines)
+
+
+def update_imports(source, path):
+    """Import sqlAt, dropping sql when no plain call sites remain."""
+    if path == DB_MODULE:
+        return source
+    match = DB_IMPORT.search(source)
+    if not match:
+        return source
+    names = [n.strip() for n in match.group(1).split(",") if n.strip()]
+    if not extract_calls(path, source) and "sql" in names:
+        names.remove("sql")
+    if "sqlAt" not in names:
+        names.insert(names.index("sql") + 1 if "sql" in names else 0, "sqlAt")
+    return source[:match.start(1)] + " " + ", ".join(names) + " " + source[match.end(1):]
+
+
+def rewrite_file(path, calls, journal):
+    source = path.read_text(encoding="utf-8")
+    for call in sorted(calls, key=lambda c: c.start, reverse=True):
+        tag = f"sqlAt{call.generic}('{query_id(call.text)}')"
+        source = source[:call.start] + call.render(tag=tag) + source[call.end:]
+    journal.write_text(path, update_imports(source, path))
+
+
+def refresh_stale(stale, journal):
+    """Point sqlAt call sites whose text changed at their new ID."""
+    by_path = {}
+    for qid, call in stale:
+        by_path.setdefault(call.path, []).append((qid, call))
+    for path, entries in by_path.items():
+        source = path.read_text(encoding="utf-8")
+        for qid, call in sorted(entries, key=lambda e: e[1].start, reverse=True):
+            tag = call.tag.replace(f"'{qid}'", f"'{query_id(call.text)}'")
+            source = source[:call.start] + call.render(tag=tag) + source[call.end:]
+        journal.write_text(path, source)
+
+
+def report(static, composed, stale):
+    print(f"Registered {len(static)} static call site(s).")
+    if stale:
+        print(f"\n{len(stale)} sqlAt call site(s) whose text no longer matches their ID:")
+        for qid, call in stale:
+            print(f"  {call.rel_path}:{call.line}  {qid}")
+    print(f"\n{len(composed)} composed call site(s) left on the sql tag:")
+    for call in composed:
+        print(f"  {call.rel_path}:{call.line}  {call.normalized_text[:90]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--check", action="store_true",
+                        help="exit non-zero if call sites or the registry are out of date")
+    args = parser.parse_args()
+
+    registry, static, composed, stale = collect()
+    report(static, composed, stale)
+
+    if args.check:
+        current = REGISTRY_FILE.read_text(encoding="utf-8") if REGISTRY_FILE.exists() else ""
+        if static or stale or current != render_registry(registry):
+            print("\n✗ SQL registry is out of date; run python3 scripts/sql_registry.py")
+            sys.exit(1)
+        print("\n✓ SQL registry is up to date")
+        return
+
+    by_path = {}
+    for call in static:
+        by_path.setdefault(call.path, []).append(call)
+    with open_run("sql_registry") as journal:
+        for path, calls in by_path.items():
+            rewrite_file(path, calls, journal)
+        refresh_stale(stale, journal)
+        journal.write_text(REGISTRY_FILE, render_registry(registry))
+    print(f"\n✓ Rewrote {len(by_path)} file(s), wrote {REGISTRY_FILE.relative_to(REPO_ROOT)} "
+          f"({len(registry)} queries)")
+
+
+if __name__ == "__main__":
+    main()
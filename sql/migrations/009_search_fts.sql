@@ -0,0 +1,84 @@
+-- Migration: 009_search_fts.sql
+-- FTS5 trigram indexes for substring search (generated by scripts/fts_index.py)
+--
+-- Each table gets an external-content FTS5 table kept in sync by triggers.
+-- Queries use `rowid IN (SELECT rowid FROM <table>_fts WHERE ... MATCH ...)`
+-- instead of `col LIKE '%term%'`, which had to scan every row.
+
+-- =====================================================
+-- BLOG_POSTS: title, content
+-- =====================================================
+
+CREATE VIRTUAL TABLE IF NOT EXISTS blog_posts_fts USING fts5(
+  title, content,
+  content='blog_posts',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS blog_posts_fts_ai AFTER INSERT ON blog_posts BEGIN
+  INSERT INTO blog_posts_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS blog_posts_fts_ad AFTER DELETE ON blog_posts BEGIN
+  INSERT INTO blog_posts_fts(blog_posts_fts, rowid, title, content) VALUES ('delete', old.rowid, old.title, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS blog_posts_fts_au AFTER UPDATE OF title, content ON blog_posts BEGIN
+  INSERT INTO blog_posts_fts(blog_posts_fts, rowid, title, content) VALUES ('delete', old.rowid, old.title, old.content);
+  INSERT INTO blog_posts_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+
+INSERT INTO blog_posts_fts(blog_posts_fts) VALUES ('rebuild');
+
+-- =====================================================
+-- CATEGORIES: name
+-- =====================================================
+
+CREATE VIRTUAL TABLE IF NOT EXISTS categories_fts USING fts5(
+  name,
+  content='categories',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS categories_fts_ai AFTER INSERT ON categories BEGIN
+  INSERT INTO categories_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS categories_fts_ad AFTER DELETE ON categories BEGIN
+  INSERT INTO categories_fts(categories_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS categories_fts_au AFTER UPDATE OF name ON categories BEGIN
+  INSERT INTO categories_fts(categories_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+  INSERT INTO categories_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+
+INSERT INTO categories_fts(categories_fts) VALUES ('rebuild');
+
+-- =====================================================
+-- WEBSITES: domain, name
+-- =====================================================
+
+CREATE VIRTUAL TABLE IF NOT EXISTS websites_fts USING fts5(
+  domain, name,
+  content='websites',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS websites_fts_ai AFTER INSERT ON websites BEGIN
+  INSERT INTO websites_fts(rowid, domain, name) VALUES (new.rowid, new.domain, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS websites_fts_ad AFTER DELETE ON websites BEGIN
+  INSERT INTO websites_fts(websites_fts, rowid, domain, name) VALUES ('delete', old.rowid, old.domain, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS websites_fts_au AFTER UPDATE OF domain, name ON websites BEGIN
+  INSERT INTO websites_fts(websites_fts, rowid, domain, name) VALUES ('delete', old.rowid, old.domain, old.name);
+  INSERT INTO websites_fts(rowid, domain, name) VALUES (new.rowid, new.domain, new.name);
+END;
+
+INSERT INTO websites_fts(websites_fts) VALUES ('rebuild');
@@ -0,0 +1,15 @@
+-- Migration: 010_cache_tags.sql
+-- Purge tags for the edge cache (lib/edge-cache.ts)
+
+-- =====================================================
+-- CACHE TAG VERSIONS
+-- =====================================================
+
+-- Every edge cache key includes the versions of its policy's tags.
+-- purgeCacheTags() bumps a version, so entries cached under the old
+-- version are never matched again and expire by TTL.
+CREATE TABLE IF NOT EXISTS cache_tags (
+  tag TEXT PRIMARY KEY,
+  version INTEGER NOT NULL DEFAULT 0,
+  updated_at TEXT DEFAULT (datetime('now'))
+);
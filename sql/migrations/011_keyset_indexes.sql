@@ -0,0 +1,8 @@
+-- Migration: 011_keyset_indexes.sql
+-- Indexes for keyset pagination (generated by scripts/list_queries.py)
+--
+-- Each index leads with the column a paginated list is scoped to, then
+-- (created_at, id), so `(created_at, id) < (cursor)` is a range seek.
+
+CREATE INDEX IF NOT EXISTS idx_notifications_user_id_keyset ON notifications(user_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_orders_buyer_id_keyset ON orders(buyer_id, created_at, id);